@@ -0,0 +1,68 @@
+"""
+Measures a backtest over 20 years of daily closes of dozens of symbols, and fails when
+a rebalancing policy exceeds its budget.
+
+    python -m benchmarks.bench_backtest
+"""
+
+import sys
+import timeit
+
+import numpy as np
+
+from pyrb.enums import RebalanceFrequency
+from pyrb.repositories.history import PriceMatrix
+from pyrb.services.backtest import Backtester
+from pyrb.services.strategy.explicit_target import ExplicitTargetRebalanceStrategy
+
+YEARS = 20
+SYMBOL_COUNT = 50
+REPEAT = 5
+BUDGET_MS = 1000
+
+POLICIES: dict[str, tuple[RebalanceFrequency | None, float | None]] = {
+    "buy and hold": (None, None),
+    "monthly": (RebalanceFrequency.MONTHLY, None),
+    "daily": (RebalanceFrequency.DAILY, None),
+    "band 5%": (None, 0.05),
+    "quarterly band 2%": (RebalanceFrequency.QUARTERLY, 0.02),
+}
+
+
+def create_prices(years: int, symbol_count: int, seed: int = 0) -> PriceMatrix:
+    """Geometric random walks on business days."""
+    rng = np.random.default_rng(seed)
+    dates = np.arange(np.datetime64("2005-01-03"), np.datetime64(f"{2005 + years}-01-01"))
+    dates = dates[np.is_busday(dates)]
+    returns = rng.normal(0.0003, 0.015, size=(len(dates), symbol_count))
+    closes = np.round(10_000 * np.exp(np.cumsum(returns, axis=0)))
+    return PriceMatrix(dates, [f"{i:06d}" for i in range(symbol_count)], closes)
+
+
+def main() -> None:
+    prices = create_prices(YEARS, SYMBOL_COUNT)
+    backtester = Backtester(prices)
+    strategy = ExplicitTargetRebalanceStrategy(dict.fromkeys(prices.symbols, 1 / SYMBOL_COUNT))
+    print(f"{len(prices.dates):,} days x {SYMBOL_COUNT} symbols")
+
+    failed = False
+    for name, (frequency, band) in POLICIES.items():
+
+        def run() -> None:
+            backtester.run(strategy, 100_000_000, frequency, band, cost_rate=0.00015)  # noqa: B023
+
+        elapsed_ms = min(timeit.repeat(run, number=1, repeat=REPEAT)) * 1000
+        report = backtester.run(strategy, 100_000_000, frequency, band, cost_rate=0.00015).report
+        print(
+            f"{name:<18} {elapsed_ms:7.1f} ms  rebalances {report.rebalance_count:5d}"
+            f"  cagr {report.cagr:6.2%}  mdd {report.max_drawdown:7.2%}"
+            f"  turnover {report.turnover:6.2f}"
+        )
+        failed |= elapsed_ms > BUDGET_MS
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
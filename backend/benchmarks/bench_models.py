@@ -0,0 +1,72 @@
+"""
+Measures the cost of parsing brokerage payloads into models and serializing them back,
+per 1,000 positions.
+
+    python -m benchmarks.bench_models
+"""
+
+import timeit
+from typing import Any
+
+from pyrb.models.position import Position
+from pyrb.repositories.brokerages.ebest.client import EbestAPIClient
+from pyrb.repositories.brokerages.ebest.portfolio import EbestPortfolio, positions_adapter
+
+POSITION_COUNT = 1_000
+REPEAT = 20
+
+
+def create_payload(position_count: int) -> dict[str, Any]:
+    """A t0424/CSPAQ12200 payload with the given number of positions."""
+    return {
+        "t0424OutBlock": {"sunamt": 100_000_000},
+        "t0424OutBlock1": [
+            {
+                "expcode": f"{i:06d}",
+                "hname": f"종목{i}",
+                "janqty": 100 + i,
+                "mdposqt": 100 + i,
+                "pamt": 10_000,
+                "appamt": 1_000_000 + i,
+                "sunikrt": "1.23",
+                "dtsunik": 12_300,
+            }
+            for i in range(position_count)
+        ],
+        "CSPAQ12200OutBlock2": {"D2Dps": 1_000_000},
+    }
+
+
+class PayloadPortfolio(EbestPortfolio):
+    def __init__(self, payload: dict[str, Any]) -> None:
+        super().__init__(EbestAPIClient.__new__(EbestAPIClient))
+        self._payload = payload
+
+    def _fetch_portfolio(self) -> dict[str, Any]:
+        return self._payload
+
+
+def main() -> None:
+    portfolio = PayloadPortfolio(create_payload(POSITION_COUNT))
+
+    def parse() -> list[Position]:
+        portfolio.refresh()
+        return portfolio.positions
+
+    def lookup() -> None:
+        portfolio.refresh()
+        for symbol in portfolio.holding_symbols[:100]:
+            portfolio.get_position_amount(symbol)
+
+    positions = parse()
+
+    def serialize() -> bytes:
+        return positions_adapter.dump_json(positions)
+
+    for name, func in [("parse", parse), ("serialize", serialize), ("100 lookups", lookup)]:
+        seconds = min(timeit.repeat(func, number=1, repeat=REPEAT))
+        print(f"{name:>12}: {seconds * 1000:8.2f} ms per {POSITION_COUNT:,} positions")
+
+
+if __name__ == "__main__":
+    main()
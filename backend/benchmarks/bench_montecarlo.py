@@ -0,0 +1,87 @@
+"""
+Measures the Monte Carlo simulation of rebalance policies: the throughput and the peak
+memory of a batch of paths per batch size, and the throughput of the whole simulation per
+number of worker processes.
+
+    python -m benchmarks.bench_montecarlo
+"""
+
+import os
+import time
+import tracemalloc
+
+import numpy as np
+
+from benchmarks.bench_backtest import create_prices
+from pyrb.enums import RebalanceFrequency
+from pyrb.models.montecarlo import MonteCarloSpec, RebalancePolicy
+from pyrb.services.backtest import TRADING_DAYS_PER_YEAR, fill_closes
+from pyrb.services.montecarlo import MonteCarloSimulator, bootstrap_prices, evaluate_policies
+
+HISTORY_YEARS = 20
+SYMBOL_COUNT = 10
+YEARS = 10
+PATH_COUNT = 2000
+BATCH_SIZES = [64, 256, 1024]
+
+POLICIES = [
+    RebalancePolicy(),
+    RebalancePolicy(frequency=RebalanceFrequency.MONTHLY),
+    RebalancePolicy(frequency=RebalanceFrequency.QUARTERLY),
+    RebalancePolicy(band=0.05),
+    RebalancePolicy(frequency=RebalanceFrequency.MONTHLY, band=0.02),
+]
+
+
+def main() -> None:
+    prices = create_prices(HISTORY_YEARS, SYMBOL_COUNT)
+    spec = MonteCarloSpec(
+        weights=dict.fromkeys(prices.symbols, 1.0),
+        policies=POLICIES,
+        investment_amount=100_000_000,
+        cost_rate=0.00015,
+        path_count=PATH_COUNT,
+        years=YEARS,
+    )
+    dates, closes = fill_closes(prices)
+    returns = np.diff(np.log(closes), axis=0)
+    day_count = YEARS * TRADING_DAYS_PER_YEAR
+    simulated_dates = np.busday_offset(
+        dates[-1].astype("datetime64[D]"), np.arange(day_count + 1), roll="backward"
+    )
+    target = np.full(SYMBOL_COUNT, 1 / SYMBOL_COUNT)
+    print(f"{len(POLICIES)} policies, {YEARS} years x {SYMBOL_COUNT} symbols per path")
+
+    for batch_size in BATCH_SIZES:
+        rng = np.random.default_rng(0)
+        tracemalloc.start()
+        started_at = time.perf_counter()
+        evaluate_policies(
+            bootstrap_prices(returns, closes[-1], batch_size, day_count, spec.block_size, rng),
+            simulated_dates,
+            target,
+            POLICIES,
+            spec.investment_amount,
+            spec.cost_rate,
+        )
+        elapsed = time.perf_counter() - started_at
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f"batch {batch_size:5d} paths  {batch_size / elapsed:8.1f} paths/s"
+            f"  peak {peak / 1024 / 1024:7.1f} MiB"
+        )
+
+    cpu_count = os.cpu_count() or 1
+    for worker_count in sorted({1, cpu_count}):
+        started_at = time.perf_counter()
+        MonteCarloSimulator(prices, max_workers=worker_count).run(spec)
+        elapsed = time.perf_counter() - started_at
+        print(
+            f"{worker_count:3d} workers {PATH_COUNT} paths {elapsed:7.2f} s"
+            f"  {PATH_COUNT / elapsed:8.1f} paths/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
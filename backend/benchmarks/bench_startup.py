@@ -0,0 +1,133 @@
+"""
+Measures the cold-start latency of the CLI with `python -X importtime`, and fails when
+a command exceeds its budget. The commands run against a temporary app directory with a
+registered account, so they never read or write the configuration of the user.
+
+    python -m benchmarks.bench_startup
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import NamedTuple
+
+REPEAT = 5
+
+# 명령별 시작 시간 예산(밀리초). import 시간의 합계로 비교합니다.
+STARTUP_BUDGETS_MS: dict[tuple[str, ...], float] = {
+    ("--help",): 400,
+    (
+        "account",
+        "list",
+    ): 400,  # 계좌 저장소를 열고 목록을 출력합니다. 증권사 API 는 호출하지 않습니다.
+    ("strategies",): 400,  # 전략 코드를 import 하지 않고 목록을 출력합니다.
+}
+
+# 무거운 의존성을 import 하지 않아야 하는 명령
+LIGHTWEIGHT_COMMANDS: list[tuple[str, ...]] = [("--help",), ("strategies",)]
+HEAVY_MODULES = ["pydantic", "requests", "websockets", "yaml", "fastapi", "numpy"]
+
+# 측정 전에 임시 앱 디렉터리에 등록하는 계좌
+SEED_ACCOUNT_ARGS = ("account", "set", "--app-key", "bench", "--app-secret", "bench", "--default")
+
+ENTRY_POINT = "from pyrb.controllers.cli.main import app; app()"
+
+
+class StartupMeasurement(NamedTuple):
+    import_ms: float  # -X importtime 으로 측정한 모듈 import 시간의 합계
+    wall_ms: float  # 프로세스 시작부터 종료까지의 시간
+    cumulative_ms: dict[str, float]  # 모듈별 누적 import 시간
+
+
+@contextmanager
+def isolated_app_dir() -> Iterator[dict[str, str]]:
+    """
+    Yields the environment of a temporary home directory with a registered account.
+
+    The app directory of the CLI is derived from the home directory, so every command run
+    with the environment reads and writes only the temporary directory.
+    """
+    with tempfile.TemporaryDirectory() as home:
+        env = {key: value for key, value in os.environ.items() if key != "XDG_CONFIG_HOME"}
+        env["HOME"] = home
+        subprocess.run(
+            [sys.executable, "-c", ENTRY_POINT, *SEED_ACCOUNT_ARGS],
+            env=env,
+            capture_output=True,
+            check=True,
+        )
+        yield env
+
+
+def measure_startup(args: tuple[str, ...], env: dict[str, str] | None = None) -> StartupMeasurement:
+    """Runs the CLI with the given arguments in a new interpreter and measures its startup."""
+    started_at = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", ENTRY_POINT, *args],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    wall_ms = (time.perf_counter() - started_at) * 1000
+
+    # 형식: "import time: self [us] | cumulative | imported package"
+    import_us = 0
+    cumulative_ms: dict[str, float] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+
+        self_us, cumulative_us, module = line.removeprefix("import time:").split("|")
+        import_us += int(self_us)
+        cumulative_ms[module.strip()] = int(cumulative_us) / 1000
+
+    return StartupMeasurement(import_us / 1000, wall_ms, cumulative_ms)
+
+
+def best_of(
+    args: tuple[str, ...], env: dict[str, str] | None = None, repeat: int = REPEAT
+) -> StartupMeasurement:
+    """The fastest of several runs, which is the least affected by the noise of the machine."""
+    return min((measure_startup(args, env) for _ in range(repeat)), key=lambda m: m.import_ms)
+
+
+def heavy_modules_of(args: tuple[str, ...], measurement: StartupMeasurement) -> list[str]:
+    """The heavy modules imported by a command that should not import them."""
+    if args not in LIGHTWEIGHT_COMMANDS:
+        return []
+    return [module for module in HEAVY_MODULES if module in measurement.cumulative_ms]
+
+
+def main() -> None:
+    failed = False
+    with isolated_app_dir() as env:
+        measurements = {args: best_of(args, env) for args in STARTUP_BUDGETS_MS}
+
+    for args, measurement in measurements.items():
+        budget_ms = STARTUP_BUDGETS_MS[args]
+        heavy_modules = heavy_modules_of(args, measurement)
+        command = " ".join(["pyrb", *args])
+        print(
+            f"{command:<28} import {measurement.import_ms:7.1f} ms"
+            f"  wall {measurement.wall_ms:7.1f} ms  budget {budget_ms:.0f} ms"
+        )
+
+        if measurement.import_ms > budget_ms or heavy_modules:
+            failed = True
+            slowest = sorted(measurement.cumulative_ms.items(), key=lambda item: -item[1])[:10]
+            for module, cumulative_ms in slowest:
+                print(f"    {cumulative_ms:7.1f} ms  {module}")
+            if heavy_modules:
+                print(f"    heavy modules imported: {', '.join(heavy_modules)}")
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Measures the throughput of a parameter sweep over 20 years of daily closes per number of
+worker processes, and fails when the sweep scales clearly worse than linearly with cores.
+
+    python -m benchmarks.bench_sweep
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.bench_backtest import create_prices
+from pyrb.enums import RebalanceFrequency
+from pyrb.models.sweep import SweepSpec
+from pyrb.services.sweep import SweepRunner
+
+YEARS = 20
+SYMBOL_COUNT = 50
+MIN_EFFICIENCY = 0.7  # 작업 프로세스 수 대비 최소 속도 향상 비율
+
+
+def create_spec(symbols: list[str]) -> SweepSpec:
+    return SweepSpec(
+        weights=[dict.fromkeys(symbols[:count], 1.0) for count in (5, 10, 20, 50)],
+        frequencies=[
+            RebalanceFrequency.MONTHLY,
+            RebalanceFrequency.QUARTERLY,
+            RebalanceFrequency.YEARLY,
+            None,
+        ],
+        bands=[None, 0.02, 0.05, 0.1],
+        investment_amounts=[10_000_000, 100_000_000],
+        cost_rate=0.00015,
+    )
+
+
+def main() -> None:
+    prices = create_prices(YEARS, SYMBOL_COUNT)
+    cases = create_spec(prices.symbols).cases()
+    cpu_count = os.cpu_count() or 1
+    worker_counts = sorted({1, *(n for n in (2, 4, 8, 16) if n < cpu_count), cpu_count})
+    print(f"{len(cases)} cases, {len(prices.dates):,} days x {SYMBOL_COUNT} symbols")
+
+    failed = False
+    base_elapsed = 0.0
+    for worker_count in worker_counts:
+        with tempfile.TemporaryDirectory() as directory:
+            sweep_runner = SweepRunner(prices, max_workers=worker_count)
+            started_at = time.perf_counter()
+            for _ in sweep_runner.run(cases, Path(directory) / "sweep.jsonl"):
+                pass
+            elapsed = time.perf_counter() - started_at
+
+        base_elapsed = base_elapsed or elapsed
+        efficiency = base_elapsed / elapsed / worker_count
+        print(
+            f"{worker_count:3d} workers {elapsed:7.2f} s  {len(cases) / elapsed:7.1f} cases/s"
+            f"  speedup {base_elapsed / elapsed:5.2f}  efficiency {efficiency:5.0%}"
+        )
+        failed |= efficiency < MIN_EFFICIENCY
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Measures the time and the peak memory of reading target files per format, against parsing
+the whole file at once, and the time of loading them from the `TargetCache` once cached.
+
+    python -m benchmarks.bench_targets
+"""
+
+import csv
+import json
+import tempfile
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from pyrb.repositories.target_cache import TargetCache
+from pyrb.services.strategy.explicit_target import read_targets_from_source
+
+SYMBOL_COUNTS = [30, 10_000]  # 일반적인 포트폴리오, 지수 복제
+REPEAT = 5
+
+
+def create_targets(symbol_count: int) -> dict[str, float]:
+    return {f"{i:06d}": 1.0 / (i + 1) for i in range(symbol_count)}
+
+
+def write_sources(directory: Path, targets: dict[str, float]) -> list[Path]:
+    """Writes the targets in every supported format, skipping the columnar ones without pyarrow."""
+    sources = [directory / "targets.csv", directory / "targets.json", directory / "targets.yaml"]
+    with open(sources[0], "w", newline="") as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(["symbol", "weight"])
+        writer.writerows(targets.items())
+    sources[1].write_text(json.dumps(targets, indent=4))
+    sources[2].write_text(yaml.safe_dump(targets))
+
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        return sources
+
+    table = pyarrow.table({"symbol": list(targets), "weight": list(targets.values())})
+    pyarrow.parquet.write_table(table, directory / "targets.parquet")
+    with pyarrow.ipc.new_file(directory / "targets.arrow", table.schema) as arrow_writer:
+        arrow_writer.write_table(table)
+    return [*sources, directory / "targets.parquet", directory / "targets.arrow"]
+
+
+def load_whole(source: Path) -> Any:
+    """Parses the whole file at once, as the readers did before streaming."""
+    with open(source, newline="") as file:
+        match source.suffix:
+            case ".csv":
+                return {row["symbol"]: float(row["weight"]) for row in csv.DictReader(file)}
+            case ".json":
+                return json.load(file)
+            case ".yaml":
+                return yaml.safe_load(file)
+            case _:
+                return None
+
+
+def measure(read: Callable[[], Any]) -> tuple[float, float]:
+    """The best time in milliseconds and the peak of the allocated memory in KiB."""
+    elapsed_ms = min(timeit.repeat(read, number=1, repeat=REPEAT)) * 1000
+    tracemalloc.start()
+    read()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed_ms, peak / 1024
+
+
+def main() -> None:
+    for symbol_count in SYMBOL_COUNTS:
+        with tempfile.TemporaryDirectory() as directory:
+            sources = write_sources(Path(directory), create_targets(symbol_count))
+            target_cache = TargetCache(Path(directory) / "cache")
+            print(f"{symbol_count:,} symbols")
+            for source in sources:
+                size_kib = source.stat().st_size / 1024
+                elapsed_ms, peak_kib = measure(lambda: read_targets_from_source(source))  # noqa: B023
+                print(
+                    f"{source.suffix:<9} {size_kib:7.0f} KiB  "
+                    f"stream {elapsed_ms:8.2f} ms {peak_kib:8.0f} KiB peak",
+                    end="",
+                )
+                target_cache.read(source, read_targets_from_source)
+                elapsed_ms, _ = measure(
+                    lambda: target_cache.read(source, read_targets_from_source)  # noqa: B023
+                )
+                print(f"  cached {elapsed_ms * 1000:8.0f} us", end="")
+                if source.suffix in (".csv", ".json", ".yaml"):
+                    elapsed_ms, peak_kib = measure(lambda: load_whole(source))  # noqa: B023
+                    print(f"  whole {elapsed_ms:8.2f} ms {peak_kib:8.0f} KiB peak", end="")
+                print()
+
+
+if __name__ == "__main__":
+    main()
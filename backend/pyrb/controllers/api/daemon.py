@@ -0,0 +1,59 @@
+import os
+import socket
+from collections.abc import Callable
+from pathlib import Path
+
+import uvicorn
+from fastapi import FastAPI
+
+from pyrb.controllers.api.deps import (
+    context_dep,
+    context_factory_dep,
+    context_pool_dep,
+    pooled_context_dep,
+)
+from pyrb.controllers.api.main import app
+from pyrb.models.account import Account
+from pyrb.repositories.brokerages.context import RebalanceContext
+
+
+def _pooled_context_factory_dep() -> Callable[[Account], RebalanceContext]:
+    return context_pool_dep().get
+
+
+def create_daemon_app() -> FastAPI:
+    """The API app, serving every request from the warm contexts of the `ContextPool`."""
+    app.dependency_overrides[context_dep] = pooled_context_dep
+    app.dependency_overrides[context_factory_dep] = _pooled_context_factory_dep
+    return app
+
+
+def bind_unix_socket(path: Path) -> socket.socket:
+    """Binds a Unix socket only the current user can connect to, replacing a stale one."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.unlink(missing_ok=True)
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    # 데몬은 계좌 권한으로 주문을 낼 수 있으므로 다른 사용자가 접속하지 못하도록 합니다.
+    umask = os.umask(0o177)
+    try:
+        sock.bind(str(path))
+    finally:
+        os.umask(umask)
+
+    return sock
+
+
+def create_daemon_server() -> uvicorn.Server:
+    return uvicorn.Server(uvicorn.Config(create_daemon_app(), log_level="warning"))
+
+
+def serve(socket_path: Path) -> None:
+    """Serves the daemon on the Unix socket until it is interrupted or terminated."""
+    sock = bind_unix_socket(socket_path)
+    server = create_daemon_server()
+    try:
+        server.run(sockets=[sock])
+    finally:
+        sock.close()
+        socket_path.unlink(missing_ok=True)
@@ -1,16 +1,63 @@
+import logging
+import threading
+from collections.abc import Callable
+from functools import cache
 from typing import Annotated
+from uuid import UUID
 
-from fastapi import Depends, HTTPException
+from fastapi import Depends, HTTPException, Query
 
-from pyrb.controllers.constants import ACCOUNTS_CONFIG_PATH
-from pyrb.exceptions import InitializationError
-from pyrb.repositories.account import AccountRepository, LocalConfigAccountRepository
-from pyrb.repositories.brokerages.context import RebalanceContext, create_rebalance_context
+from pyrb.controllers.constants import (
+    ACCOUNTS_CONFIG_PATH,
+    ACCOUNTS_DB_PATH,
+    PRICE_HISTORY_DIR,
+    SCHEDULES_PATH,
+    STRATEGY_PLUGIN_DIR,
+    SYMBOL_MASTER_PATH,
+    TARGET_CACHE_DIR,
+)
+from pyrb.exceptions import AccountNotFoundError, InitializationError
+from pyrb.models.account import Account
+from pyrb.repositories.account import AccountRepository, SQLiteAccountRepository
+from pyrb.repositories.brokerages.context import (
+    RebalanceContext,
+    create_rebalance_context,
+    create_streaming_price_fetcher,
+    create_symbol_list_fetcher,
+)
+from pyrb.repositories.brokerages.pool import ContextPool
+from pyrb.repositories.brokerages.stream import StreamingPriceFetcher
+from pyrb.repositories.history import (
+    PriceHistoryRepository,
+    configure_price_history,
+    get_price_history,
+)
+from pyrb.repositories.schedule import LocalScheduleRepository, ScheduleRepository
+from pyrb.repositories.symbol_master import (
+    SymbolMaster,
+    configure_symbol_master,
+    get_symbol_master,
+)
+from pyrb.repositories.target_cache import TargetCache, configure_target_cache, get_target_cache
 from pyrb.services.account import AccountService
+from pyrb.services.aggregate import PortfolioAggregator
+from pyrb.services.plan import RebalancePlanCache
+from pyrb.services.strategy.registry import (
+    StrategyRegistry,
+    configure_strategy_registry,
+    get_strategy_registry,
+)
+from pyrb.services.symbol_master import SymbolMasterService
+from pyrb.services.twap import TWAPScheduler
+from pyrb.services.valuation import ValuationBroadcaster
 
+logger = logging.getLogger(__name__)
 
+
+@cache
 def account_repo_dep() -> AccountRepository:
-    return LocalConfigAccountRepository(config_path=ACCOUNTS_CONFIG_PATH)
+    # 계좌 캐시를 요청 간에 공유하도록 하나의 저장소 인스턴스를 사용합니다.
+    return SQLiteAccountRepository(ACCOUNTS_DB_PATH, legacy_config_path=ACCOUNTS_CONFIG_PATH)
 
 
 AccountRepoDep = Annotated[AccountRepository, Depends(account_repo_dep)]
@@ -23,12 +70,179 @@ def account_service_dep(account_repo: AccountRepoDep) -> AccountService:
 AccountServiceDep = Annotated[AccountService, Depends(account_service_dep)]
 
 
-def context_dep(account_repo: AccountRepoDep) -> RebalanceContext:
+def account_dep(
+    account_repo: AccountRepoDep,
+    account_id: UUID | None = Query(
+        default=None, description="The account to use. Defaults to the default account"
+    ),
+) -> Account:
     try:
-        account = account_repo.get()
-        return create_rebalance_context(account)
-    except InitializationError as e:  # account is not set
+        return account_repo.get(account_id)
+    except (InitializationError, AccountNotFoundError) as e:  # account is not set or unknown
         raise HTTPException(status_code=404, detail=str(e)) from e
 
 
+AccountDep = Annotated[Account, Depends(account_dep)]
+
+
+def context_dep(account: AccountDep) -> RebalanceContext:
+    return create_rebalance_context(account)
+
+
+def context_factory_dep() -> Callable[[Account], RebalanceContext]:
+    return create_rebalance_context
+
+
+ContextFactoryDep = Annotated[Callable[[Account], RebalanceContext], Depends(context_factory_dep)]
+
+
 RebalanceContextDep = Annotated[RebalanceContext, Depends(context_dep)]
+
+
+@cache
+def context_pool_dep() -> ContextPool:
+    return ContextPool(create_rebalance_context)
+
+
+ContextPoolDep = Annotated[ContextPool, Depends(context_pool_dep)]
+
+
+def pooled_context_dep(account: AccountDep, context_pool: ContextPoolDep) -> RebalanceContext:
+    """Used instead of `context_dep` by the daemon, which keeps the contexts warm."""
+    return context_pool.get(account)
+
+
+# 요청은 작업 스레드에서 의존성을 만들므로, 계좌별 공유 객체는 잠금 안에서 만듭니다.
+_streams_lock = threading.Lock()
+_streaming_price_fetchers: dict[UUID, StreamingPriceFetcher] = {}
+
+
+def streaming_price_fetcher_dep(account: AccountDep) -> StreamingPriceFetcher:
+    # 실시간 시세 연결은 계좌별로 하나만 열고, 모든 요청이 공유합니다.
+    with _streams_lock:
+        streaming_price_fetcher = _streaming_price_fetchers.get(account.id)
+        if streaming_price_fetcher is None:
+            streaming_price_fetcher = create_streaming_price_fetcher(account)
+            streaming_price_fetcher.start()
+            _streaming_price_fetchers[account.id] = streaming_price_fetcher
+
+    return streaming_price_fetcher
+
+
+StreamingPriceFetcherDep = Annotated[StreamingPriceFetcher, Depends(streaming_price_fetcher_dep)]
+
+
+_valuation_broadcasters: dict[UUID, ValuationBroadcaster] = {}
+
+
+def valuation_broadcaster_dep(account: AccountDep) -> ValuationBroadcaster:
+    # 계좌별 평가금액 갱신 루프 하나를 모든 클라이언트가 공유합니다.
+    with _streams_lock:
+        valuation_broadcaster = _valuation_broadcasters.get(account.id)
+        if valuation_broadcaster is None:
+            valuation_broadcaster = ValuationBroadcaster(create_rebalance_context(account))
+            _valuation_broadcasters[account.id] = valuation_broadcaster
+
+    return valuation_broadcaster
+
+
+def close_streams() -> None:
+    """
+    Stops the streaming price fetchers and the valuation loops shared by the requests.
+    Must be called on the event loop, when the server shuts down.
+    """
+    with _streams_lock:
+        streaming_price_fetchers = list(_streaming_price_fetchers.values())
+        valuation_broadcasters = list(_valuation_broadcasters.values())
+        _streaming_price_fetchers.clear()
+        _valuation_broadcasters.clear()
+
+    for valuation_broadcaster in valuation_broadcasters:
+        valuation_broadcaster.close()
+    for streaming_price_fetcher in streaming_price_fetchers:
+        streaming_price_fetcher.stop()
+
+
+ValuationBroadcasterDep = Annotated[ValuationBroadcaster, Depends(valuation_broadcaster_dep)]
+
+
+@cache
+def portfolio_aggregator_dep() -> PortfolioAggregator:
+    # 계좌별 컨텍스트와 작업 스레드를 요청 간에 재사용하도록 하나의 인스턴스를 사용합니다.
+    return PortfolioAggregator(create_rebalance_context)
+
+
+PortfolioAggregatorDep = Annotated[PortfolioAggregator, Depends(portfolio_aggregator_dep)]
+
+
+def schedule_repo_dep() -> ScheduleRepository:
+    return LocalScheduleRepository(SCHEDULES_PATH)
+
+
+ScheduleRepoDep = Annotated[ScheduleRepository, Depends(schedule_repo_dep)]
+
+
+def twap_scheduler_dep(
+    context: RebalanceContextDep, schedule_repo: ScheduleRepoDep
+) -> TWAPScheduler:
+    return TWAPScheduler(context, schedule_repo)
+
+
+TWAPSchedulerDep = Annotated[TWAPScheduler, Depends(twap_scheduler_dep)]
+
+_plan_cache = RebalancePlanCache()
+
+
+def plan_cache_dep() -> RebalancePlanCache:
+    return _plan_cache
+
+
+PlanCacheDep = Annotated[RebalancePlanCache, Depends(plan_cache_dep)]
+
+
+def symbol_master_dep() -> SymbolMaster:
+    return get_symbol_master() or configure_symbol_master(SYMBOL_MASTER_PATH)
+
+
+SymbolMasterDep = Annotated[SymbolMaster, Depends(symbol_master_dep)]
+
+
+def update_symbol_master() -> bool:
+    """
+    Rebuilds the symbol master from the listing downloaded with the default account, if the
+    master was not built today. A failure is only logged, as the previous master stays usable.
+
+    Returns:
+        bool: Whether the master was rebuilt.
+    """
+    try:
+        account = account_repo_dep().get()
+    except InitializationError:
+        return False  # 계좌를 등록하기 전에는 내려받을 수 없습니다.
+
+    try:
+        symbol_master_service = SymbolMasterService(
+            symbol_master_dep(), create_symbol_list_fetcher(account)
+        )
+        return symbol_master_service.update()
+    except Exception:
+        logger.warning("Failed to update the symbol master", exc_info=True)
+        return False
+
+
+def target_cache_dep() -> TargetCache:
+    return get_target_cache() or configure_target_cache(TARGET_CACHE_DIR)
+
+
+def price_history_dep() -> PriceHistoryRepository:
+    return get_price_history() or configure_price_history(PRICE_HISTORY_DIR)
+
+
+PriceHistoryDep = Annotated[PriceHistoryRepository, Depends(price_history_dep)]
+
+
+def strategy_registry_dep() -> StrategyRegistry:
+    return get_strategy_registry() or configure_strategy_registry(STRATEGY_PLUGIN_DIR)
+
+
+StrategyRegistryDep = Annotated[StrategyRegistry, Depends(strategy_registry_dep)]
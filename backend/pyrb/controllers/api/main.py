@@ -1,23 +1,101 @@
+import asyncio
 import datetime
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
 from uuid import UUID
 from zoneinfo import ZoneInfo
 
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import AwareDatetime, BaseModel
+from fastapi.responses import StreamingResponse
+from pydantic import (
+    AwareDatetime,
+    BaseModel,
+    Field,
+    PositiveFloat,
+    PositiveInt,
+    model_validator,
+)
 from starlette.status import HTTP_201_CREATED
 
-from pyrb.controllers.api.deps import AccountServiceDep, RebalanceContextDep
-from pyrb.enums import AssetAllocationStrategyEnum, BrokerageType
-from pyrb.exceptions import InitializationError
+from pyrb.controllers.api.deps import (
+    AccountDep,
+    AccountServiceDep,
+    ContextFactoryDep,
+    PlanCacheDep,
+    PortfolioAggregatorDep,
+    RebalanceContextDep,
+    ScheduleRepoDep,
+    StrategyRegistryDep,
+    StreamingPriceFetcherDep,
+    SymbolMasterDep,
+    TWAPSchedulerDep,
+    ValuationBroadcasterDep,
+    close_streams,
+    price_history_dep,
+    strategy_registry_dep,
+    symbol_master_dep,
+    target_cache_dep,
+    update_symbol_master,
+)
+from pyrb.enums import BrokerageType, SliceSpacing
+from pyrb.exceptions import (
+    AccountNotFoundError,
+    InitializationError,
+    InsufficientFundsException,
+    PlanMismatchError,
+    PlanNotFoundError,
+    ScheduleConflictError,
+    ScheduleNotFoundError,
+    StalePlanError,
+    StrategyNotFoundError,
+)
 from pyrb.models.account import Account, AccountFactory
-from pyrb.models.order import Order, OrderPlacementResult
-from pyrb.models.portfolio import PortfolioReturn
+from pyrb.models.batch import BatchRebalanceReport
+from pyrb.models.drift import DriftEvent
+from pyrb.models.order import Order, OrderPlacementResult, PreTradeCheckResult
+from pyrb.models.plan import PlanPreview, PortfolioSnapshot, RebalancePlan
+from pyrb.models.portfolio import AggregatedPortfolio, PortfolioReturn
 from pyrb.models.position import Position
+from pyrb.models.schedule import TWAPSchedule
+from pyrb.models.symbol import SymbolInfo
+from pyrb.repositories.brokerages.context import RebalanceContext
+from pyrb.repositories.brokerages.stream import PriceBoard
+from pyrb.services.batch import BatchRebalancer
+from pyrb.services.drift import DriftMonitor
 from pyrb.services.rebalance import Rebalancer
-from pyrb.services.strategy.asset_allocate import AssetAllocationStrategyFactory
+from pyrb.services.strategy.base import Strategy
+from pyrb.services.strategy.registry import StrategyRegistry
+from pyrb.services.valuation import ValuationBroadcaster
+
+SSE_KEEP_ALIVE_INTERVAL = 15.0  # 이벤트가 없을 때 연결 유지를 위해 주석을 보내는 주기(초)
+SYMBOL_MASTER_CHECK_INTERVAL = 60 * 60.0  # 종목 마스터가 오늘 만들어졌는지 확인하는 주기(초)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # 자산군 분류와 목표 종목 검증에 사용할 종목 마스터와 목표 비중 캐시, 전략 목록을
+    # import 시점이 아니라 서버가 시작될 때 등록합니다.
+    price_history_dep()
+    symbol_master_dep()
+    target_cache_dep()
+    strategy_registry_dep()
+    # 종목 마스터는 하루에 한 번 내려받습니다. 서버 시작을 늦추지 않도록 백그라운드에서 갱신합니다.
+    symbol_master_updates = asyncio.create_task(_keep_symbol_master_updated())
+    yield
+    symbol_master_updates.cancel()
+    # 계좌별로 공유하던 실시간 시세 연결과 평가금액 갱신 루프를 닫습니다.
+    close_streams()
+
 
-app = FastAPI()
+async def _keep_symbol_master_updated() -> None:
+    while True:
+        await asyncio.to_thread(update_symbol_master)
+        await asyncio.sleep(SYMBOL_MASTER_CHECK_INTERVAL)
+
+
+app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -37,6 +115,10 @@ class AccountResponse(BaseModel):
     account: Account
 
 
+class AccountsResponse(BaseModel):
+    accounts: list[Account]
+
+
 class AccountCreateRequest(BaseModel):
     brokerage: BrokerageType
     app_key: str
@@ -60,11 +142,60 @@ class PortfolioReturnsResponse(BaseModel):
 
 
 class OrdersPrepareResponse(BaseModel):
+    plan_id: UUID
     orders: list[Order]
 
 
+class OrdersPreviewRequest(BaseModel):
+    strategies: list[str]
+    # 생략 시 총 자산의 99%를 투자금액으로 사용합니다.
+    investment_amounts: list[PositiveFloat] | None = None
+
+
+class StrategyParameterInfo(BaseModel):
+    name: str
+    default: Any = None
+    required: bool
+
+
+class StrategyInfo(BaseModel):
+    name: str
+    description: str
+    parameters: list[StrategyParameterInfo]
+    requires: list[str]  # 전략이 사용하는 데이터 (예: price_history)
+    source: str  # "builtin", 배포 패키지 이름 또는 플러그인 파일 경로
+
+
+class StrategiesResponse(BaseModel):
+    strategies: list[StrategyInfo]
+
+
+class OrdersPreviewResponse(BaseModel):
+    previews: list[PlanPreview]
+
+
+class BatchRebalanceRequest(BaseModel):
+    account_ids: list[UUID] | None = None  # 생략 시 등록된 모든 계좌
+    investment_ratio: float = Field(default=0.99, gt=0, le=1)
+    place: bool = False  # False 이면 주문을 산출만 합니다.
+
+
 class OrdersPlaceRequest(BaseModel):
+    orders: list[Order] | None = None
+    plan_id: UUID | None = None
+    release_buys_on_sell_fills: bool = False
+    pre_trade_check: bool = False
+
+    @model_validator(mode="after")
+    def check_orders_or_plan_id(self) -> "OrdersPlaceRequest":
+        if (self.orders is None) == (self.plan_id is None):
+            raise ValueError("Either orders or plan_id must be given")
+        return self
+
+
+class OrdersCheckRequest(BaseModel):
     orders: list[Order]
+    clip_to_sellable: bool = False
 
 
 class OrdersPlaceResponse(BaseModel):
@@ -72,6 +203,17 @@ class OrdersPlaceResponse(BaseModel):
     placed_orders: list[OrderPlacementResult]
 
 
+class TWAPScheduleCreateRequest(BaseModel):
+    order: Order
+    window_minutes: PositiveFloat
+    slices: PositiveInt = 10
+    spacing: SliceSpacing = SliceSpacing.EVEN
+
+
+class TWAPSchedulesResponse(BaseModel):
+    schedules: list[TWAPSchedule]
+
+
 @app.get("/accounts/default", response_model=AccountResponse)
 async def get_default_account(account_service: AccountServiceDep) -> AccountResponse:
     try:
@@ -82,6 +224,42 @@ async def get_default_account(account_service: AccountServiceDep) -> AccountResp
     return AccountResponse(account=account)
 
 
+@app.get("/symbols/{symbol}", response_model=SymbolInfo)
+async def get_symbol(symbol_master: SymbolMasterDep, symbol: str) -> SymbolInfo:
+    symbol_info = symbol_master.get(symbol)
+    if symbol_info is None:
+        raise HTTPException(status_code=404, detail=f"Unknown symbol: {symbol}")
+
+    return symbol_info
+
+
+@app.get("/accounts", response_model=AccountsResponse)
+async def get_accounts(account_service: AccountServiceDep) -> AccountsResponse:
+    return AccountsResponse(accounts=account_service.get_all())
+
+
+@app.get("/accounts/{account_id}", response_model=AccountResponse)
+async def get_account(account_service: AccountServiceDep, account_id: UUID) -> AccountResponse:
+    try:
+        account = account_service.get(account_id)
+    except AccountNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+
+    return AccountResponse(account=account)
+
+
+@app.put("/accounts/{account_id}/default", response_model=AccountResponse)
+async def set_default_account(
+    account_service: AccountServiceDep, account_id: UUID
+) -> AccountResponse:
+    try:
+        account_service.set_default(account_id)
+    except AccountNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+
+    return AccountResponse(account=account_service.get(account_id))
+
+
 @app.post("/accounts", response_model=AccountCreateResponse, status_code=HTTP_201_CREATED)
 async def create_account(
     account_service: AccountServiceDep, body: AccountCreateRequest
@@ -105,6 +283,144 @@ async def get_portfolio(context: RebalanceContextDep) -> PortfolioResponse:
     )
 
 
+@app.get("/portfolio/stream")
+async def stream_portfolio(valuation_broadcaster: ValuationBroadcasterDep) -> StreamingResponse:
+    """
+    Streams the valuation of the portfolio as server-sent events: a `snapshot` with the whole
+    portfolio first, then `valuation` events with only the changed positions, cash and total
+    value. A failed refresh is sent as an `error` event, and the recovery as a new `snapshot`.
+    """
+    return StreamingResponse(
+        _stream_valuations(valuation_broadcaster), media_type="text/event-stream"
+    )
+
+
+async def _stream_valuations(valuation_broadcaster: ValuationBroadcaster) -> AsyncIterator[str]:
+    queue = valuation_broadcaster.subscribe()
+    try:
+        while True:
+            try:
+                event = await asyncio.wait_for(queue.get(), timeout=SSE_KEEP_ALIVE_INTERVAL)
+            except TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+
+            yield _server_sent_event(event.event, event.data)
+    finally:
+        valuation_broadcaster.unsubscribe(queue)
+
+
+@app.get("/portfolio/aggregate", response_model=AggregatedPortfolio)
+async def get_aggregated_portfolio(
+    account_service: AccountServiceDep,
+    portfolio_aggregator: PortfolioAggregatorDep,
+    account_ids: list[UUID] | None = Query(
+        default=None, description="The accounts to aggregate. Defaults to all accounts"
+    ),
+) -> AggregatedPortfolio:
+    try:
+        accounts = (
+            [account_service.get(account_id) for account_id in account_ids]
+            if account_ids
+            else account_service.get_all()
+        )
+    except AccountNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+
+    return await asyncio.to_thread(portfolio_aggregator.aggregate, accounts)
+
+
+@app.get("/strategies", response_model=StrategiesResponse)
+async def list_strategies(strategy_registry: StrategyRegistryDep) -> StrategiesResponse:
+    """Lists the asset allocation strategies without importing their code."""
+    return StrategiesResponse(
+        strategies=[
+            StrategyInfo(
+                name=metadata.name,
+                description=metadata.description,
+                parameters=[
+                    StrategyParameterInfo(
+                        name=parameter.name, default=parameter.default, required=parameter.required
+                    )
+                    for parameter in metadata.parameters
+                ],
+                requires=metadata.requires,
+                source=metadata.source,
+            )
+            for metadata in strategy_registry.list_metadata()
+        ]
+    )
+
+
+def _create_strategy(strategy_registry: StrategyRegistry, strategy_type: str) -> Strategy:
+    try:
+        strategy = strategy_registry.create(strategy_type)
+        # 가격 이력 등 전략이 사용하는 데이터가 없으면 주문을 만들기 전에 알리도록 비중을 미리
+        # 계산합니다. 데이터를 사용하는 전략은 비중을 캐시합니다.
+        if strategy_registry.metadata(strategy_type).requires:
+            strategy.create_target_weights()
+        return strategy
+    except StrategyNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+    except InitializationError as e:  # 전략이 사용하는 데이터나 필수 인자가 없음
+        raise HTTPException(status_code=409, detail=str(e)) from e
+
+
+@app.get("/strategies/{strategy_type}/drift/stream")
+async def stream_drift(
+    context: RebalanceContextDep,
+    streaming_price_fetcher: StreamingPriceFetcherDep,
+    strategy_registry: StrategyRegistryDep,
+    strategy_type: str,
+    threshold: float = Query(default=0.05, gt=0, lt=1),
+) -> StreamingResponse:
+    """
+    Streams the drift of the portfolio from the target weights of the strategy as
+    server-sent events: a `snapshot` event first, then a `drift` event whenever the drift
+    of a symbol crosses the threshold.
+    """
+    drift_monitor = DriftMonitor.from_context(
+        RebalanceContext(context.portfolio, streaming_price_fetcher, context.order_manager),
+        _create_strategy(strategy_registry, strategy_type),
+        threshold,
+    )
+
+    return StreamingResponse(
+        _stream_drift_events(drift_monitor, streaming_price_fetcher.price_board),
+        media_type="text/event-stream",
+    )
+
+
+async def _stream_drift_events(
+    drift_monitor: DriftMonitor, price_board: PriceBoard
+) -> AsyncIterator[str]:
+    loop = asyncio.get_running_loop()
+    events: asyncio.Queue[DriftEvent] = asyncio.Queue()
+
+    def on_drift(event: DriftEvent) -> None:
+        # 시세 수신 스레드에서 호출되므로 이벤트 루프로 넘겨줍니다.
+        loop.call_soon_threadsafe(events.put_nowait, event)
+
+    drift_monitor.add_listener(on_drift)
+    price_board.add_listener(drift_monitor.update)
+    try:
+        yield _server_sent_event("snapshot", drift_monitor.snapshot())
+        while True:
+            try:
+                event = await asyncio.wait_for(events.get(), timeout=SSE_KEEP_ALIVE_INTERVAL)
+            except TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+
+            yield _server_sent_event("drift", event)
+    finally:
+        price_board.remove_listener(drift_monitor.update)
+
+
+def _server_sent_event(event: str, data: BaseModel) -> str:
+    return f"event: {event}\ndata: {data.model_dump_json()}\n\n"
+
+
 @app.get("/portfolio/returns", response_model=PortfolioReturnsResponse)
 async def fetch_portfolio_returns(
     context: RebalanceContextDep,
@@ -122,36 +438,189 @@ async def fetch_portfolio_returns(
     )
 
 
+@app.post("/strategies/orders/preview", response_model=OrdersPreviewResponse)
+async def preview_orders(
+    context: RebalanceContextDep, strategy_registry: StrategyRegistryDep, body: OrdersPreviewRequest
+) -> OrdersPreviewResponse:
+    strategies: dict[str, Strategy] = {
+        strategy_type: _create_strategy(strategy_registry, strategy_type)
+        for strategy_type in body.strategies
+    }
+    investment_amounts = body.investment_amounts or [context.portfolio.total_value * 0.99]
+    rebalancer = Rebalancer(context)
+
+    try:
+        previews = rebalancer.prepare_orders_batch(strategies, investment_amounts)
+    except InsufficientFundsException as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    return OrdersPreviewResponse(previews=previews)
+
+
 @app.get("/strategies/{strategy_type}/orders", response_model=OrdersPrepareResponse)
 async def prepare_orders(
+    account: AccountDep,
     context: RebalanceContextDep,
-    strategy_type: AssetAllocationStrategyEnum,
+    plan_cache: PlanCacheDep,
+    strategy_registry: StrategyRegistryDep,
+    strategy_type: str,
 ) -> OrdersPrepareResponse:
-    strategy = AssetAllocationStrategyFactory.create(strategy_type)
-    rebalancer = Rebalancer(context)
+    snapshot = _snapshot(context)
+    plan = plan_cache.get_latest(account.id, strategy_type, snapshot)
+    if plan is None:
+        strategy = _create_strategy(strategy_registry, strategy_type)
+        rebalancer = Rebalancer(context)
+
+        priced_at = datetime.datetime.now(ZoneInfo("Asia/Seoul"))
+        investment_amount = snapshot.total_value * 0.99
+        orders = rebalancer.prepare_orders(strategy=strategy, investment_amount=investment_amount)
+        plan = RebalancePlan(
+            account_id=account.id,
+            strategy=strategy_type,
+            investment_amount=investment_amount,
+            orders=orders,
+            snapshot=snapshot,
+            priced_at=priced_at,
+        )
+        plan_cache.put(plan)
 
-    orders = rebalancer.prepare_orders(
-        strategy=strategy, investment_amount=context.portfolio.total_value * 0.99
+    return OrdersPrepareResponse(
+        plan_id=plan.id,
+        orders=plan.orders,
     )
 
-    return OrdersPrepareResponse(
-        orders=orders,
+
+def _snapshot(context: RebalanceContext) -> PortfolioSnapshot:
+    return PortfolioSnapshot(
+        total_value=context.portfolio.total_value,
+        cash_balance=context.portfolio.cash_balance,
+        positions=context.portfolio.positions,
     )
 
 
 @app.post("/strategies/{strategy_type}/orders", response_model=OrdersPlaceResponse)
 async def place_orders(
+    account: AccountDep,
     context: RebalanceContextDep,
+    plan_cache: PlanCacheDep,
+    strategy_type: str,
     body: OrdersPlaceRequest,
 ) -> OrdersPlaceResponse:
+    if body.plan_id is not None:
+        try:
+            plan = plan_cache.pop(body.plan_id, account.id, strategy_type, _snapshot(context))
+        except PlanNotFoundError as e:
+            raise HTTPException(status_code=404, detail=str(e)) from e
+        except (PlanMismatchError, StalePlanError) as e:
+            raise HTTPException(status_code=409, detail=str(e)) from e
+
+        orders = plan.orders
+    else:
+        orders = body.orders or []
+
     rebalancer = Rebalancer(context)
-    placed_orders = rebalancer.place_orders(body.orders)
+    if body.pre_trade_check:
+        check_result = rebalancer.check_orders(orders)
+        if not check_result.passed:
+            raise HTTPException(
+                status_code=422, detail=check_result.model_dump(mode="json")["violations"]
+            )
+
+    # 매도 체결을 기다리는 동안 이벤트 루프가 멈추지 않도록 별도 스레드에서 주문합니다.
+    placed_orders = await asyncio.to_thread(
+        rebalancer.place_orders,
+        orders,
+        release_buys_on_sell_fills=body.release_buys_on_sell_fills,
+    )
+    # 주문 이후에는 포트폴리오가 변경되므로 계좌의 모든 주문 계획을 폐기합니다.
+    plan_cache.invalidate(account.id)
+
     return OrdersPlaceResponse(
         placed_at=datetime.datetime.now(ZoneInfo("Asia/Seoul")),
         placed_orders=placed_orders,
     )
 
 
+@app.post("/strategies/{strategy_type}/batch-rebalance", response_model=BatchRebalanceReport)
+async def batch_rebalance(
+    account_service: AccountServiceDep,
+    context_factory: ContextFactoryDep,
+    strategy_registry: StrategyRegistryDep,
+    strategy_type: str,
+    body: BatchRebalanceRequest,
+) -> BatchRebalanceReport:
+    try:
+        accounts = (
+            [account_service.get(account_id) for account_id in body.account_ids]
+            if body.account_ids
+            else account_service.get_all()
+        )
+    except AccountNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+
+    batch_rebalancer = BatchRebalancer({
+        account.id: context_factory(account) for account in accounts
+    })
+    strategy = _create_strategy(strategy_registry, strategy_type)
+    # 계좌 조회와 주문 제출은 블로킹 I/O 이므로 별도 스레드에서 실행합니다.
+    report = await asyncio.to_thread(batch_rebalancer.prepare, strategy, body.investment_ratio)
+    if body.place:
+        report = await asyncio.to_thread(batch_rebalancer.place, report)
+
+    return report
+
+
+@app.post("/orders/check", response_model=PreTradeCheckResult)
+async def check_orders(
+    context: RebalanceContextDep, body: OrdersCheckRequest
+) -> PreTradeCheckResult:
+    rebalancer = Rebalancer(context)
+    return rebalancer.check_orders(body.orders, clip_to_sellable=body.clip_to_sellable)
+
+
+@app.post("/twap-schedules", response_model=TWAPSchedule, status_code=HTTP_201_CREATED)
+async def start_twap_schedule(
+    scheduler: TWAPSchedulerDep, body: TWAPScheduleCreateRequest
+) -> TWAPSchedule:
+    schedule = scheduler.create(body.order, body.window_minutes * 60, body.slices, body.spacing)
+    scheduler.start(schedule.id)
+    return schedule
+
+
+@app.get("/twap-schedules", response_model=TWAPSchedulesResponse)
+async def get_twap_schedules(schedule_repo: ScheduleRepoDep) -> TWAPSchedulesResponse:
+    return TWAPSchedulesResponse(schedules=schedule_repo.get_all())
+
+
+@app.get("/twap-schedules/{schedule_id}", response_model=TWAPSchedule)
+async def get_twap_schedule(schedule_repo: ScheduleRepoDep, schedule_id: UUID) -> TWAPSchedule:
+    try:
+        return schedule_repo.get(schedule_id)
+    except ScheduleNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+
+
+@app.post("/twap-schedules/{schedule_id}/cancel", response_model=TWAPSchedule)
+async def cancel_twap_schedule(scheduler: TWAPSchedulerDep, schedule_id: UUID) -> TWAPSchedule:
+    try:
+        return scheduler.cancel(schedule_id)
+    except ScheduleNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+
+
+@app.post("/twap-schedules/{schedule_id}/resume", response_model=TWAPSchedule)
+async def resume_twap_schedule(scheduler: TWAPSchedulerDep, schedule_id: UUID) -> TWAPSchedule:
+    try:
+        schedule = scheduler.resume(schedule_id)
+        scheduler.start(schedule.id)
+    except ScheduleNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+    except ScheduleConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e)) from e
+
+    return schedule
+
+
 if __name__ == "__main__":
     import uvicorn
 
@@ -1,14 +1,24 @@
-from typing import Annotated
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Annotated
+from uuid import UUID
 
 import typer
+from rich.console import Console
+from rich.table import Table
 
-from pyrb.controllers.constants import ACCOUNTS_CONFIG_PATH
+from pyrb.controllers.constants import ACCOUNTS_CONFIG_PATH, ACCOUNTS_DB_PATH
 from pyrb.enums import BrokerageType
-from pyrb.models.account import AccountFactory
-from pyrb.repositories.account import LocalConfigAccountRepository
-from pyrb.services.account import AccountService
+
+if TYPE_CHECKING:
+    from pyrb.models.account import Account
+    from pyrb.services.account import AccountService
 
 app = typer.Typer()
+console = Console()
+
+# `pyrb --account <id>` 으로 선택된 계좌. 선택하지 않으면 기본 계좌를 사용합니다.
+_selected_account_id: UUID | None = None
 
 
 @app.command("set")
@@ -18,15 +28,76 @@ def set(
     brokerage: Annotated[
         BrokerageType, typer.Option(help="brokerage type", case_sensitive=False)
     ] = BrokerageType.EBEST,
+    default: Annotated[bool, typer.Option(help="use the account as the default account")] = False,
 ) -> None:
+    from pyrb.models.account import AccountFactory
+
     account_service = create_account_service()
     account = AccountFactory.create(brokerage, app_key=app_key, app_secret=app_secret)
     account_service.set(account=account)
+    if default:
+        account_service.set_default(account.id)
+
+    typer.echo(f"Registered account {account.id}")
+
+
+@app.command("list")
+def list_accounts() -> None:
+    """
+    Displays the registered accounts.
+    """
+    account_service = create_account_service()
+    accounts = account_service.get_all()
+    default_account_id = account_service.get().id if accounts else None
+
+    table = Table("Id", "Brokerage", "Default")
+    for account in accounts:
+        table.add_row(
+            str(account.id), account.brokerage, "*" if account.id == default_account_id else ""
+        )
+
+    console.print(table)
+
+
+@app.command()
+def use(account_id: Annotated[UUID, typer.Argument(help="The id of the account")]) -> None:
+    """
+    Sets the default account.
+    """
+    from pyrb.exceptions import AccountNotFoundError
+
+    try:
+        create_account_service().set_default(account_id)
+    except AccountNotFoundError as e:
+        console.print(f"[red]{e}[/red]")
+        raise typer.Exit(code=1) from None
+
+    typer.echo(f"Using account {account_id} as the default account")
 
 
 def create_account_service() -> AccountService:
+    from pyrb.repositories.account import SQLiteAccountRepository
+    from pyrb.services.account import AccountService
+
     account_service = AccountService(
-        account_repo=LocalConfigAccountRepository(ACCOUNTS_CONFIG_PATH)
+        account_repo=SQLiteAccountRepository(
+            ACCOUNTS_DB_PATH, legacy_config_path=ACCOUNTS_CONFIG_PATH
+        )
     )
 
     return account_service
+
+
+def select_account(account_id: UUID | None) -> None:
+    global _selected_account_id
+    _selected_account_id = account_id
+
+
+def get_selected_account_id() -> UUID | None:
+    """Returns the id of the account selected with `--account`, if any."""
+    return _selected_account_id
+
+
+def get_selected_account() -> Account:
+    """Returns the account selected with `--account`, or the default account."""
+    return create_account_service().get(_selected_account_id)
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+from pyrb.exceptions import DaemonRequestError
+
+if TYPE_CHECKING:
+    import http.client
+
+    from pyrb.models.plan import PlanPreview, PortfolioSnapshot
+    from pyrb.models.portfolio import AggregatedPortfolio
+
+PING_TIMEOUT = 0.5  # 데몬이 실행 중인지 확인할 때의 응답 대기 시간(초)
+
+
+class DaemonClient:
+    """
+    A client of the `pyrb daemon` API over its Unix socket.
+
+    It only uses the standard library, so the CLI can talk to the daemon without the HTTP
+    client packages of the development environment.
+
+    Args:
+        socket_path (Path): The path of the Unix socket of the daemon.
+        timeout (float): The number of seconds to wait for a response.
+    """
+
+    def __init__(self, socket_path: Path, timeout: float = 30.0) -> None:
+        self._socket_path = socket_path
+        self._timeout = timeout
+
+    def ping(self) -> bool:
+        """Whether the daemon is running and responding."""
+        import http.client
+
+        try:
+            self._request("GET", "/ping", timeout=PING_TIMEOUT)
+        except (OSError, http.client.HTTPException, DaemonRequestError):
+            # 소켓 파일만 남은 경우에도 연결이 거부되므로 실행 중이 아닌 것으로 봅니다.
+            return False
+
+        return True
+
+    def get_portfolio(self, account_id: UUID | None = None) -> PortfolioSnapshot:
+        from pyrb.models.plan import PortfolioSnapshot
+
+        content = self._request("GET", "/portfolio", account_id)
+        return PortfolioSnapshot.model_validate_json(content)
+
+    def get_aggregated_portfolio(self) -> AggregatedPortfolio:
+        from pyrb.models.portfolio import AggregatedPortfolio
+
+        content = self._request("GET", "/portfolio/aggregate")
+        return AggregatedPortfolio.model_validate_json(content)
+
+    def preview_orders(
+        self,
+        strategies: list[str],
+        investment_amounts: list[float],
+        account_id: UUID | None = None,
+    ) -> list[PlanPreview]:
+        from pyrb.models.plan import PlanPreview
+
+        content = self._request(
+            "POST",
+            "/strategies/orders/preview",
+            account_id,
+            body={"strategies": strategies, "investment_amounts": investment_amounts},
+        )
+        return [PlanPreview.model_validate(preview) for preview in json.loads(content)["previews"]]
+
+    def close(self) -> None:
+        # 요청마다 연결을 열고 닫으므로 정리할 연결이 없습니다.
+        pass
+
+    def __enter__(self) -> DaemonClient:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        account_id: UUID | None = None,
+        body: Any = None,
+        timeout: float | None = None,
+    ) -> bytes:
+        from urllib.parse import urlencode
+
+        if account_id is not None:
+            path = f"{path}?{urlencode({'account_id': str(account_id)})}"
+        payload = json.dumps(body).encode() if body is not None else None
+        headers = {"Content-Type": "application/json"} if payload is not None else {}
+
+        connection = _connect(self._socket_path, timeout or self._timeout)
+        try:
+            connection.request(method, path, body=payload, headers=headers)
+            response = connection.getresponse()
+            content = response.read()
+        finally:
+            connection.close()
+
+        if response.status >= 400:
+            detail = json.loads(content).get("detail") if content else None
+            raise DaemonRequestError(f"Daemon request failed ({response.status}): {detail}")
+
+        return content
+
+
+def _connect(socket_path: Path, timeout: float) -> http.client.HTTPConnection:
+    """Returns an HTTP connection over the Unix socket instead of TCP."""
+    # CLI 시작 시간을 줄이기 위해 데몬에 요청할 때 불러옵니다.
+    import http.client
+    import socket
+
+    class UnixHTTPConnection(http.client.HTTPConnection):
+        def connect(self) -> None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            try:
+                sock.connect(str(socket_path))
+            except OSError:
+                sock.close()
+                raise
+            self.sock = sock
+
+    return UnixHTTPConnection("pyrb", timeout=timeout)
+
+
+def connect_daemon(socket_path: Path) -> DaemonClient | None:
+    """
+    Connects to the daemon if it is running.
+
+    Returns:
+        DaemonClient | None: The client, or None if the daemon is not running.
+    """
+    # 데몬이 없으면 연결을 시도하지 않도록 소켓 파일부터 확인합니다.
+    if not socket_path.exists():
+        return None
+
+    client = DaemonClient(socket_path)
+    if not client.ping():
+        client.close()
+        return None
+
+    return client
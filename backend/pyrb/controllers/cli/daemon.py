@@ -0,0 +1,70 @@
+import os
+import signal
+
+import typer
+
+from pyrb.controllers.cli.client import connect_daemon
+from pyrb.controllers.constants import DAEMON_PID_PATH, DAEMON_SOCKET_PATH
+
+app = typer.Typer()
+
+
+@app.command()
+def start() -> None:
+    """
+    Runs the daemon in the foreground until it is stopped.
+    While it is running, `pyrb portfolio` and `pyrb preview` are served from its warm contexts.
+    """
+    client = connect_daemon(DAEMON_SOCKET_PATH)
+    if client is not None:
+        client.close()
+        typer.echo(f"The daemon is already running on {DAEMON_SOCKET_PATH}")
+        raise typer.Exit(code=1)
+
+    from pyrb.controllers.api.daemon import serve
+
+    DAEMON_PID_PATH.parent.mkdir(parents=True, exist_ok=True)
+    DAEMON_PID_PATH.write_text(str(os.getpid()))
+    typer.echo(f"Serving on {DAEMON_SOCKET_PATH}. Press Ctrl-C to stop")
+    try:
+        serve(DAEMON_SOCKET_PATH)
+    finally:
+        DAEMON_PID_PATH.unlink(missing_ok=True)
+
+
+@app.command()
+def stop() -> None:
+    """
+    Stops the running daemon.
+    """
+    # pid 파일이 남아 있더라도 데몬이 응답할 때만 종료 신호를 보냅니다. 재사용된 pid 를 가진
+    # 다른 프로세스를 종료하지 않기 위해서입니다.
+    client = connect_daemon(DAEMON_SOCKET_PATH)
+    if client is None:
+        DAEMON_PID_PATH.unlink(missing_ok=True)
+        typer.echo("The daemon is not running")
+        raise typer.Exit(code=1)
+
+    client.close()
+    try:
+        pid = int(DAEMON_PID_PATH.read_text())
+        os.kill(pid, signal.SIGTERM)
+    except (FileNotFoundError, ValueError, ProcessLookupError):
+        typer.echo(f"The daemon on {DAEMON_SOCKET_PATH} has no valid pid file")
+        raise typer.Exit(code=1) from None
+
+    typer.echo(f"Stopped the daemon (pid {pid})")
+
+
+@app.command()
+def status() -> None:
+    """
+    Displays whether the daemon is running.
+    """
+    client = connect_daemon(DAEMON_SOCKET_PATH)
+    if client is None:
+        typer.echo("The daemon is not running")
+        raise typer.Exit(code=1)
+
+    client.close()
+    typer.echo(f"The daemon is running on {DAEMON_SOCKET_PATH}")
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import datetime
+from typing import TYPE_CHECKING, Annotated
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from pyrb.controllers.cli.account import get_selected_account
+from pyrb.controllers.constants import PRICE_HISTORY_DIR
+
+if TYPE_CHECKING:
+    from pyrb.repositories.history import LocalPriceHistoryRepository
+
+app = typer.Typer()
+console = Console()
+
+
+@app.command()
+def sync(
+    symbols: Annotated[
+        list[str],
+        typer.Option(
+            "--symbol", help="A symbol to sync. Can be repeated. Defaults to every stored symbol"
+        ),
+    ] = [],  # noqa: B006
+    years: Annotated[
+        int, typer.Option(help="The number of years to download for a new symbol", min=1)
+    ] = 10,
+) -> None:
+    """
+    Downloads the daily bars missing from the local price history.
+    """
+    from pyrb.repositories.brokerages.context import create_daily_bar_fetcher
+    from pyrb.services.history import PriceHistoryService
+
+    _validate_symbols(symbols, param_hint="--symbol")
+    repository = _create_repository()
+    symbols = symbols or repository.symbols()
+    if not symbols:
+        typer.echo("No symbols to sync. Pass the symbols to download with --symbol")
+        raise typer.Exit(code=1)
+
+    price_history_service = PriceHistoryService(
+        repository, create_daily_bar_fetcher(get_selected_account())
+    )
+    since = datetime.date.today() - datetime.timedelta(days=365 * years)
+    for symbol, count in price_history_service.sync(symbols, since).items():
+        typer.echo(f"{symbol}: stored {count} bars")
+
+
+@app.command()
+def show(
+    symbol: Annotated[str, typer.Argument(help="The symbol to display")],
+    days: Annotated[int, typer.Option(help="The number of latest bars to display", min=1)] = 20,
+) -> None:
+    """
+    Displays the latest daily bars of a symbol from the local price history.
+    """
+    _validate_symbols([symbol], param_hint="SYMBOL")
+    bars = _create_repository().read_bars(symbol)
+    if not len(bars):
+        typer.echo(
+            f"No price history for {symbol}. Run `pyrb history sync --symbol {symbol}` first"
+        )
+        raise typer.Exit(code=1)
+
+    table = Table("Date", "Open", "High", "Low", "Close", "Volume")
+    for bar in bars[-days:]:
+        table.add_row(
+            str(bar["date"]),
+            f"{bar['open']:,.0f}",
+            f"{bar['high']:,.0f}",
+            f"{bar['low']:,.0f}",
+            f"{bar['close']:,.0f}",
+            f"{bar['volume']:,}",
+        )
+    console.print(table)
+
+
+@app.command()
+def rebuild() -> None:
+    """
+    Rewrites the local price history from the stored bars, without downloading them again.
+    """
+    typer.echo(f"Rebuilt the price history of {_create_repository().rebuild()} symbols")
+
+
+def _create_repository() -> LocalPriceHistoryRepository:
+    from pyrb.repositories.history import LocalPriceHistoryRepository
+
+    return LocalPriceHistoryRepository(PRICE_HISTORY_DIR)
+
+
+def _validate_symbols(symbols: list[str], param_hint: str) -> None:
+    from pyrb.exceptions import PriceHistoryError
+    from pyrb.repositories.history import validate_symbol
+
+    try:
+        for symbol in symbols:
+            validate_symbol(symbol)
+    except PriceHistoryError as e:
+        raise typer.BadParameter(str(e), param_hint=param_hint) from e
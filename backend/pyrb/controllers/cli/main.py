@@ -1,5 +1,8 @@
+from __future__ import annotations
+
 from pathlib import Path
-from typing import Annotated, Literal
+from typing import TYPE_CHECKING, Annotated, Literal
+from uuid import UUID
 
 import typer
 from rich import box
@@ -8,45 +11,116 @@ from rich.table import Table
 from rich.text import Text
 
 from pyrb.controllers.cli.account import app as account_app
-from pyrb.controllers.cli.account import create_account_service
-from pyrb.enums import AssetAllocationStrategyEnum, OrderSide
-from pyrb.models.order import Order, OrderPlacementResult
-from pyrb.repositories.brokerages.context import RebalanceContext, create_rebalance_context
-from pyrb.services.rebalance import Rebalancer
-from pyrb.services.strategy.asset_allocate import (
-    AssetAllocationStrategyFactory,
+from pyrb.controllers.cli.account import (
+    create_account_service,
+    get_selected_account,
+    get_selected_account_id,
+    select_account,
 )
-from pyrb.services.strategy.explicit_target import (
-    ExplicitTargetRebalanceStrategy,
-    read_targets_from_source,
+from pyrb.controllers.cli.client import connect_daemon
+from pyrb.controllers.cli.daemon import app as daemon_app
+from pyrb.controllers.cli.history import app as history_app
+from pyrb.controllers.cli.symbols import app as symbols_app
+from pyrb.controllers.cli.twap import app as twap_app
+from pyrb.controllers.constants import (
+    DAEMON_SOCKET_PATH,
+    PRICE_HISTORY_DIR,
+    STRATEGY_PLUGIN_DIR,
+    SYMBOL_MASTER_PATH,
+    TARGET_CACHE_DIR,
 )
-from pyrb.services.strategy.holding_portfolio import HoldingPortfolioRebalanceStrategy
+from pyrb.enums import OrderSide
+from pyrb.repositories.symbol_master import configure_symbol_master
+from pyrb.repositories.target_cache import configure_target_cache
+from pyrb.services.strategy.registry import configure_strategy_registry
+
+# CLI 시작 시간을 줄이기 위해 무거운 모듈은 타입 검사 시에만 import 하고,
+# 실행에 필요한 모듈은 각 명령 안에서 import 합니다. (benchmarks/bench_startup.py 참고)
+if TYPE_CHECKING:
+    from collections.abc import Collection
+
+    from pyrb.models.batch import BatchRebalanceReport
+    from pyrb.models.drift import DriftEvent, DriftSnapshot
+    from pyrb.models.montecarlo import PolicySummary
+    from pyrb.models.order import Order, OrderPlacementResult, OrderViolation
+    from pyrb.models.plan import PlanPreview
+    from pyrb.models.portfolio import AggregatedPortfolio
+    from pyrb.models.position import Position
+    from pyrb.models.sweep import SweepResult
+    from pyrb.models.watch import WatchRow, WatchUpdate
+    from pyrb.repositories.brokerages.context import RebalanceContext
+    from pyrb.services.rebalance import Rebalancer
+    from pyrb.services.strategy.base import Strategy
+    from pyrb.services.strategy.registry import StrategyMetadata
 
 app = typer.Typer()
 app.add_typer(account_app, name="account")
+app.add_typer(twap_app, name="twap", help="Time-sliced (TWAP) order execution")
+app.add_typer(symbols_app, name="symbols", help="The local symbol master")
+app.add_typer(history_app, name="history", help="The local daily price history")
+app.add_typer(daemon_app, name="daemon", help="A background daemon keeping the contexts warm")
 console = Console()
 
+TARGETS_POLL_INTERVAL = 0.2  # 목표 비중 파일의 변경을 확인하는 주기(초)
+
+ReleaseBuysOnSellFillsOption = Annotated[
+    bool,
+    typer.Option(
+        help=(
+            "Hold back buy orders until confirmed sell fills free up cash, and size them"
+            " against the cash available at release time"
+        )
+    ),
+]
+StrategyOption = Annotated[
+    str,
+    typer.Option(..., help="The asset allocation strategy to use. See `pyrb strategies`"),
+]
+ClipToSellableOption = Annotated[
+    bool, typer.Option(help="Clip sell orders to the sellable quantity of the positions")
+]
+
 
 @app.callback()
-def callback() -> None:
+def callback(
+    account: Annotated[
+        str,
+        typer.Option(
+            "--account",
+            envvar="PYRB_ACCOUNT",
+            help="The id of the account to use. Defaults to the default account",
+        ),
+    ] = "",
+) -> None:
     """Rebalance your portfolio"""
-    ...
+    configure_symbol_master(SYMBOL_MASTER_PATH)
+    configure_target_cache(TARGET_CACHE_DIR)
+    configure_strategy_registry(STRATEGY_PLUGIN_DIR)
+    try:
+        select_account(UUID(account) if account else None)
+    except ValueError as e:
+        raise typer.BadParameter(f"Invalid account id: {account}") from e
 
 
 @app.command()
 def holding_portfolio(
     investment_amount: Annotated[float, typer.Option(..., help="The total investment amount")],
+    release_buys_on_sell_fills: ReleaseBuysOnSellFillsOption = False,
+    clip_to_sellable: ClipToSellableOption = False,
 ) -> None:
     """
     Rebalances a holding portfolio with equal weights based on the specified options.
     """
+    from pyrb.services.rebalance import Rebalancer
+    from pyrb.services.strategy.holding_portfolio import HoldingPortfolioRebalanceStrategy
+
     context = _create_context()
 
     strategy = HoldingPortfolioRebalanceStrategy(context)
     rebalancer = Rebalancer(context)
 
     orders = rebalancer.prepare_orders(strategy=strategy, investment_amount=investment_amount)
-    _place_orders(context, rebalancer, orders)
+    _place_orders(context, rebalancer, orders, release_buys_on_sell_fills, clip_to_sellable)
 
 
 @app.command()
@@ -57,7 +131,7 @@ def explicit_target(
             ...,
             help=(
                 "The source to read the target weights from. Supported file types: .csv, .json,"
-                " .yaml"
+                " .yaml, .parquet, .arrow"
             ),  # TODO: add docstring for each file structure.
             exists=True,
             file_okay=True,
@@ -68,83 +142,594 @@ def explicit_target(
         ),
     ],
     investment_amount: Annotated[float, typer.Option(..., help="The total investment amount")],
+    release_buys_on_sell_fills: ReleaseBuysOnSellFillsOption = False,
+    clip_to_sellable: ClipToSellableOption = False,
+    watch: Annotated[
+        bool,
+        typer.Option(
+            help=(
+                "Keep re-planning the orders whenever the targets source is saved, without"
+                " placing them. Press Ctrl-C to stop"
+            )
+        ),
+    ] = False,
 ) -> None:
     """
     Rebalances a portfolio with explicit target weights from the specified source.
     Sum of target weights must be 1.0. If not, the weights will be normalized.
 
     """
+    from pyrb.services.rebalance import Rebalancer
+    from pyrb.services.strategy.explicit_target import (
+        ExplicitTargetRebalanceStrategy,
+        read_targets_from_source,
+    )
+
     context = _create_context()
+    if watch:
+        _watch_targets_source(context, targets_source, investment_amount)
+        return
 
     targets = read_targets_from_source(targets_source)
     strategy = ExplicitTargetRebalanceStrategy(targets)
     rebalancer = Rebalancer(context)
 
     orders = rebalancer.prepare_orders(strategy=strategy, investment_amount=investment_amount)
-    _place_orders(context, rebalancer, orders)
+    _place_orders(context, rebalancer, orders, release_buys_on_sell_fills, clip_to_sellable)
 
 
 @app.command()
 def asset_allocate(
-    strategy: Annotated[AssetAllocationStrategyEnum, typer.Option(..., help="The strategy to use")],
+    strategy: StrategyOption,
     investment_amount: Annotated[float, typer.Option(..., help="The total investment amount")],
+    release_buys_on_sell_fills: ReleaseBuysOnSellFillsOption = False,
+    clip_to_sellable: ClipToSellableOption = False,
 ) -> None:
     """
     Rebalances a portfolio with the specified asset allocation strategy.
 
     """
+    from pyrb.services.rebalance import Rebalancer
+
     context = _create_context()
 
-    strategy = AssetAllocationStrategyFactory.create(strategy)
+    strategy = _create_asset_allocation_strategy(strategy)
     rebalancer = Rebalancer(context)
 
     orders = rebalancer.prepare_orders(strategy=strategy, investment_amount=investment_amount)
-    _place_orders(context, rebalancer, orders)
+    _place_orders(context, rebalancer, orders, release_buys_on_sell_fills, clip_to_sellable)
+
+
+@app.command()
+def preview(
+    investment_amounts: Annotated[
+        list[float],
+        typer.Option(
+            ..., "--investment-amount", help="The total investment amount. Can be repeated"
+        ),
+    ],
+    strategies: Annotated[
+        list[str],
+        typer.Option(
+            "--strategy",
+            help="An asset allocation strategy to compare. Can be repeated. See `pyrb strategies`",
+        ),
+    ] = [],  # noqa: B006
+    targets_sources: Annotated[
+        list[Path],
+        typer.Option(
+            "--targets-source",
+            help="A target weights file to compare. Can be repeated",
+            exists=True,
+            file_okay=True,
+            dir_okay=False,
+            readable=True,
+            resolve_path=True,
+        ),
+    ] = [],  # noqa: B006
+) -> None:
+    """
+    Previews the orders of several strategies and target files for several investment amounts.
+    The portfolio and the current prices are loaded only once. No orders are placed.
+    """
+    from pyrb.services.rebalance import Rebalancer
+    from pyrb.services.strategy.explicit_target import (
+        ExplicitTargetRebalanceStrategy,
+        read_targets_from_source,
+    )
+
+    if not strategies and not targets_sources:
+        raise typer.BadParameter("Give at least one --strategy or --targets-source")
+
+    # 목표 비중 파일은 데몬에 전달할 수 없으므로 전략만 비교할 때 데몬을 사용합니다.
+    client = connect_daemon(DAEMON_SOCKET_PATH) if not targets_sources else None
+    if client is not None:
+        with client:
+            account_id = get_selected_account_id()
+            positions = client.get_portfolio(account_id).positions
+            previews = client.preview_orders(list(strategies), investment_amounts, account_id)
+    else:
+        context = _create_context()
+
+        strategies_by_name: dict[str, Strategy] = {
+            strategy: _create_asset_allocation_strategy(strategy) for strategy in strategies
+        }
+        for targets_source in targets_sources:
+            targets = read_targets_from_source(targets_source)
+            strategies_by_name[targets_source.name] = ExplicitTargetRebalanceStrategy(targets)
+
+        rebalancer = Rebalancer(context)
+        previews = rebalancer.prepare_orders_batch(strategies_by_name, investment_amounts)
+        positions = context.portfolio.positions
+
+    _print_plan_previews(previews, positions)
+
+
+@app.command()
+def batch_rebalance(
+    strategy: StrategyOption,
+    investment_ratio: Annotated[
+        float,
+        typer.Option(help="The share of each account's total value to invest", min=0, max=1),
+    ] = 0.99,
+    account_ids: Annotated[
+        list[UUID],
+        typer.Option(
+            "--account-id", help="An account to rebalance. Can be repeated. Defaults to all"
+        ),
+    ] = [],  # noqa: B006
+) -> None:
+    """
+    Rebalances several accounts to the same asset allocation strategy concurrently.
+    """
+    from pyrb.exceptions import AccountNotFoundError
+    from pyrb.repositories.brokerages.context import create_rebalance_context
+    from pyrb.services.batch import BatchRebalancer
+
+    # API 와 같이 0 은 허용하지 않습니다. (typer 는 열린 구간을 지원하지 않습니다.)
+    if investment_ratio <= 0:
+        raise typer.BadParameter("Must be greater than 0", param_hint="--investment-ratio")
+
+    account_service = create_account_service()
+    try:
+        accounts = [account_service.get(account_id) for account_id in account_ids]
+    except AccountNotFoundError as e:
+        raise typer.BadParameter(str(e), param_hint="--account-id") from e
+
+    contexts = {
+        account.id: create_rebalance_context(account)
+        for account in accounts or account_service.get_all()
+    }
+
+    batch_rebalancer = BatchRebalancer(contexts)
+    report = batch_rebalancer.prepare(_create_asset_allocation_strategy(strategy), investment_ratio)
+    _print_batch_report(report)
+
+    if not typer.confirm("Do you want to place these orders?"):
+        typer.echo("No orders were placed")
+        return
+
+    report = batch_rebalancer.place(report)
+    _print_batch_report(report)
+
+
+@app.command()
+def drift(
+    strategy: StrategyOption,
+    threshold: Annotated[
+        float, typer.Option(help="The drift of a weight that triggers an alert", min=0, max=1)
+    ] = 0.05,
+) -> None:
+    """
+    Monitors the drift of the portfolio from the strategy on real-time prices.
+    Prints an alert whenever the drift of a symbol crosses the threshold. Press Ctrl-C to stop.
+    """
+    import time
+
+    from pyrb.repositories.brokerages.context import (
+        RebalanceContext,
+        create_rebalance_context,
+        create_streaming_price_fetcher,
+    )
+    from pyrb.services.drift import DriftMonitor
+
+    account = get_selected_account()
+    context = create_rebalance_context(account)
+    streaming_price_fetcher = create_streaming_price_fetcher(account)
+    streaming_price_fetcher.start()
+
+    try:
+        drift_monitor = DriftMonitor.from_context(
+            RebalanceContext(context.portfolio, streaming_price_fetcher, context.order_manager),
+            _create_asset_allocation_strategy(strategy),
+            threshold,
+        )
+        _print_drift_snapshot(drift_monitor.snapshot())
+
+        drift_monitor.add_listener(_print_drift_event)
+        streaming_price_fetcher.price_board.add_listener(drift_monitor.update)
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        streaming_price_fetcher.stop()
+
+
+@app.command()
+def watch(
+    strategies: Annotated[
+        list[str],
+        typer.Option(
+            "--strategy",
+            help="An asset allocation strategy to show the drift against. See `pyrb strategies`",
+        ),
+    ] = [],  # noqa: B006
+    targets_sources: Annotated[
+        list[Path],
+        typer.Option(
+            "--targets-source",
+            help="A target weights file to show the drift against",
+            exists=True,
+            file_okay=True,
+            dir_okay=False,
+            readable=True,
+            resolve_path=True,
+        ),
+    ] = [],  # noqa: B006
+    interval: Annotated[
+        float, typer.Option(help="The number of seconds between two price fetches", min=0.5)
+    ] = 2.0,
+    threshold: Annotated[
+        float, typer.Option(help="The drift of a weight that is highlighted", min=0, max=1)
+    ] = 0.05,
+) -> None:
+    """
+    Displays a live-updating portfolio table, optionally with the drift from a strategy or
+    a target weights file. Prices are fetched in one request per interval. Press Ctrl-C to stop.
+    """
+    import time
+
+    from rich.live import Live
+
+    from pyrb.services.strategy.explicit_target import read_targets_from_source
+    from pyrb.services.watch import PortfolioWatcher
+
+    if len(strategies) + len(targets_sources) > 1:
+        raise typer.BadParameter("Give at most one --strategy or --targets-source")
+
+    target_weights = None
+    if strategies:
+        target_weights = _create_asset_allocation_strategy(strategies[0]).create_target_weights()
+    elif targets_sources:
+        target_weights = read_targets_from_source(targets_sources[0])
+
+    watcher = PortfolioWatcher(_create_context(), target_weights, interval, threshold=threshold)
+    # 바뀐 행의 셀만 다시 만들고, 바뀐 것이 없으면 화면을 다시 그리지 않습니다.
+    cells_by_symbol: dict[str, list[str | Text]] = {}
+    with Live(console=console, auto_refresh=False) as live:
+        try:
+            while True:
+                update = watcher.refresh()
+                if update is not None and (update.rows or update.removed_symbols):
+                    for symbol in update.removed_symbols:
+                        del cells_by_symbol[symbol]
+                    for row in update.rows:
+                        cells_by_symbol[row.symbol] = _watch_row_cells(row)
+
+                    live.update(
+                        _create_watch_table(cells_by_symbol, update, target_weights is not None),
+                        refresh=True,
+                    )
+                time.sleep(min(interval, 0.5))
+        except KeyboardInterrupt:
+            pass
+
+
+@app.command()
+def sweep(
+    spec_path: Annotated[
+        Path,
+        typer.Argument(
+            help="A YAML file of the weights, frequencies, bands and investment amounts to sweep",
+            exists=True,
+            file_okay=True,
+            dir_okay=False,
+            readable=True,
+        ),
+    ],
+    output: Annotated[
+        Path, typer.Option(help="The JSON Lines file to append the results to")
+    ] = Path("sweep.jsonl"),
+    workers: Annotated[
+        int, typer.Option(help="The number of worker processes. 0 for the CPU count", min=0)
+    ] = 0,
+    top: Annotated[int, typer.Option(help="The number of best cases to display", min=1)] = 10,
+) -> None:
+    """
+    Backtests every combination of the parameters on the local price history.
+    Running it again with the same output resumes an interrupted sweep.
+    """
+    import yaml
+
+    from pyrb.exceptions import PriceHistoryError
+    from pyrb.models.sweep import SweepResult, SweepSpec
+    from pyrb.repositories.history import LocalPriceHistoryRepository
+    from pyrb.services.sweep import SweepRunner
+
+    spec = SweepSpec.model_validate(yaml.safe_load(spec_path.read_text()))
+    try:
+        prices = LocalPriceHistoryRepository(PRICE_HISTORY_DIR).load_closes(spec.symbols)
+    except PriceHistoryError as e:
+        typer.echo(f"{e}. Run `pyrb history sync` first")
+        raise typer.Exit(code=1) from e
+
+    cases = spec.cases()
+    sweep_runner = SweepRunner(prices, max_workers=workers or None)
+    run_count = sum(1 for _ in sweep_runner.run(cases, output))
+    typer.echo(f"Ran {run_count} of {len(cases)} cases. The results are in {output}")
+
+    with open(output) as f:
+        results = [SweepResult.model_validate_json(line) for line in f]
+    _print_sweep_results(results, top)
+
+
+@app.command()
+def simulate(
+    spec_path: Annotated[
+        Path,
+        typer.Argument(
+            help="A YAML file of the weights, the rebalance policies and the paths to simulate",
+            exists=True,
+            file_okay=True,
+            dir_okay=False,
+            readable=True,
+        ),
+    ],
+    output: Annotated[
+        Path, typer.Option(help="The JSON file to write the distribution summaries to")
+    ] = Path("simulation.json"),
+    workers: Annotated[
+        int, typer.Option(help="The number of worker processes. 0 for the CPU count", min=0)
+    ] = 0,
+) -> None:
+    """
+    Compares rebalance policies on synthetic price paths bootstrapped from the local price
+    history.
+    """
+    import json
+
+    import yaml
+
+    from pyrb.exceptions import PriceHistoryError
+    from pyrb.models.montecarlo import MonteCarloSpec
+    from pyrb.repositories.history import LocalPriceHistoryRepository
+    from pyrb.services.montecarlo import MonteCarloSimulator
+
+    spec = MonteCarloSpec.model_validate(yaml.safe_load(spec_path.read_text()))
+    try:
+        prices = LocalPriceHistoryRepository(PRICE_HISTORY_DIR).load_closes(spec.symbols)
+        summaries = MonteCarloSimulator(prices, max_workers=workers or None).run(spec)
+    except PriceHistoryError as e:
+        typer.echo(f"{e}. Run `pyrb history sync` first")
+        raise typer.Exit(code=1) from e
+
+    output.write_text(
+        json.dumps([summary.model_dump(mode="json") for summary in summaries], indent=2)
+    )
+    _print_policy_summaries(summaries, spec.years)
+    typer.echo(f"The distribution summaries are in {output}")
 
 
 @app.command()
-def portfolio() -> None:
+def portfolio(
+    all_accounts: Annotated[
+        bool, typer.Option(help="Aggregate the positions of all accounts")
+    ] = False,
+) -> None:
     """
     Display the portfolio table and summary.
     """
-    context = _create_context()
+    from pyrb.models.plan import PortfolioSnapshot
+
+    client = connect_daemon(DAEMON_SOCKET_PATH)
+    if all_accounts:
+        from pyrb.repositories.brokerages.context import create_rebalance_context
+        from pyrb.services.aggregate import PortfolioAggregator
+
+        if client is not None:
+            with client:
+                aggregated_portfolio = client.get_aggregated_portfolio()
+        else:
+            portfolio_aggregator = PortfolioAggregator(create_rebalance_context)
+            aggregated_portfolio = portfolio_aggregator.aggregate(
+                create_account_service().get_all()
+            )
+            portfolio_aggregator.close()
+
+        _print_aggregated_portfolio(aggregated_portfolio)
+        return
+
+    if client is not None:
+        with client:
+            snapshot = client.get_portfolio(get_selected_account_id())
+    else:
+        portfolio = _create_context().portfolio
+        snapshot = PortfolioSnapshot(
+            total_value=portfolio.total_value,
+            cash_balance=portfolio.cash_balance,
+            positions=portfolio.positions,
+        )
+
+    _print_portfolio_table(snapshot.positions)
+    _print_portfolio_summary(snapshot.cash_balance, snapshot.positions)
+
+
+@app.command()
+def strategies() -> None:
+    """
+    List the asset allocation strategies: the built-in ones, those of the installed plugin
+    packages and those of the local plugin directory.
+    """
+    from pyrb.services.strategy.registry import get_strategy_registry
 
-    _print_portfolio_table(context)
-    _print_portfolio_summary(context)
+    registry = get_strategy_registry() or configure_strategy_registry(STRATEGY_PLUGIN_DIR)
+    _print_strategies(registry.list_metadata())
 
 
 def _create_context() -> RebalanceContext:
-    account_service = create_account_service()
-    account = account_service.get()
+    from pyrb.repositories.brokerages.context import create_rebalance_context
+
+    account = get_selected_account()
     context = create_rebalance_context(account)
     return context
 
 
-def _place_orders(context: RebalanceContext, rebalancer: Rebalancer, orders: list[Order]) -> None:
+def _create_asset_allocation_strategy(name: str) -> Strategy:
+    from pyrb.exceptions import InitializationError, StrategyNotFoundError
+    from pyrb.repositories.history import configure_price_history, get_price_history
+    from pyrb.services.strategy.registry import get_strategy_registry
+
+    # 과거 가격으로 비중을 계산하는 전략이 로컬 가격 이력을 사용합니다.
+    if get_price_history() is None:
+        configure_price_history(PRICE_HISTORY_DIR)
+    registry = get_strategy_registry() or configure_strategy_registry(STRATEGY_PLUGIN_DIR)
+    try:
+        strategy = registry.create(name)
+        # 전략이 사용하는 데이터가 없으면 주문을 만들기 전에 알립니다.
+        if registry.metadata(name).requires:
+            strategy.create_target_weights()
+    except StrategyNotFoundError as e:
+        raise typer.BadParameter(str(e), param_hint="--strategy") from e
+    except InitializationError as e:
+        typer.echo(str(e))
+        raise typer.Exit(code=1) from e
+
+    return strategy
+
+
+def _place_orders(
+    context: RebalanceContext,
+    rebalancer: Rebalancer,
+    orders: list[Order],
+    release_buys_on_sell_fills: bool = False,
+    clip_to_sellable: bool = False,
+) -> None:
     """
     Places the given orders using the provided rebalancer.
-    Before placing the orders, the user is asked to confirm the orders.
-    If the user does not confirm, the orders are not placed.
+    Before placing the orders, the orders are validated against the portfolio and
+    the user is asked to confirm the orders.
+    If any order violates the pre-trade checks or the user does not confirm,
+    the orders are not placed.
 
     Args:
         context (RebalanceContext): The context for rebalancing.
         rebalancer (Rebalancer): The rebalancer object used for placing orders.
         orders (list[Order]): The list of orders to be placed.
+        release_buys_on_sell_fills (bool): Whether to release buy orders on sell fills.
+        clip_to_sellable (bool): Whether to clip sell orders to the sellable quantity.
 
     Returns:
         None
     """
+    check_result = rebalancer.check_orders(orders, clip_to_sellable=clip_to_sellable)
+    if not check_result.passed:
+        _report_violations(check_result.violations)
+        typer.echo("No orders were placed")
+        return
+
+    orders = check_result.orders
     user_confirmation = _get_confirm_for_order_submit(context, orders)
     if not user_confirmation:
         typer.echo("No orders were placed")
         return
 
-    results = rebalancer.place_orders(orders)
+    results = rebalancer.place_orders(orders, release_buys_on_sell_fills=release_buys_on_sell_fills)
     _report_orders(results)
 
 
+def _watch_targets_source(
+    context: RebalanceContext, targets_source: Path, investment_amount: float
+) -> None:
+    """Re-plans the orders on every change of the targets source until interrupted."""
+    import time
+
+    from rich.live import Live
+
+    from pyrb.exceptions import InvalidTargetError
+    from pyrb.services.incremental import IncrementalPlanner
+    from pyrb.services.strategy.explicit_target import read_targets_from_source
+
+    planner = IncrementalPlanner(context, investment_amount)
+    positions = context.portfolio.positions
+    signature: tuple[int, int] | None = None
+    table: Table | None = None
+    with Live(console=console, auto_refresh=False) as live:
+        try:
+            while True:
+                # 편집기가 파일을 교체하는 중에는 파일이 잠시 없을 수 있습니다.
+                try:
+                    stat = targets_source.stat()
+                except FileNotFoundError:
+                    stat = None
+
+                if stat is not None and (stat.st_mtime_ns, stat.st_size) != signature:
+                    signature = (stat.st_mtime_ns, stat.st_size)
+                    started_at = time.perf_counter()
+                    error: str | None = None
+                    try:
+                        targets = read_targets_from_source(targets_source)
+                    except InvalidTargetError as e:
+                        error = f"Invalid targets: {e}"
+                    except OSError as e:  # 권한이 없는 등 파일을 읽을 수 없는 경우
+                        error = f"Cannot read the targets: {e}"
+                    else:
+                        try:
+                            update = planner.update(targets)
+                        except Exception as e:  # 증권사에서 현재가를 가져오지 못한 경우
+                            error = f"Failed to fetch the prices: {e}"
+
+                    if error is not None:
+                        if table is None:
+                            table = _create_orders_table(positions, [])
+                        table.caption = Text(error, style="red")
+                    else:
+                        elapsed_ms = (time.perf_counter() - started_at) * 1000
+                        table = _create_orders_table(
+                            positions, update.orders, highlighted_symbols=update.changed_symbols
+                        )
+                        table.caption = (
+                            f"Re-planned {len(update.changed_symbols)} symbols"
+                            f" in {elapsed_ms:.0f} ms · {time.strftime('%H:%M:%S')}"
+                        )
+                    live.update(table, refresh=True)
+
+                time.sleep(TARGETS_POLL_INTERVAL)
+        except KeyboardInterrupt:
+            pass
+
+
 def _get_confirm_for_order_submit(context: RebalanceContext, orders: list[Order]) -> bool:
     """Confirm orders to the user and return the user's confirmation."""
+    console.print(_create_orders_table(context.portfolio.positions, orders))
+
+    return typer.confirm("Do you want to place these orders?")
+
+
+def _print_plan_previews(previews: list[PlanPreview], positions: list[Position]) -> None:
+    for plan_preview in previews:
+        investment_amount = _format(plan_preview.investment_amount, "currency")
+        console.print(
+            Text(f"\n{plan_preview.strategy} / {investment_amount}", style="bold underline")
+        )
+        console.print(_create_orders_table(positions, plan_preview.orders))
+
+
+def _create_orders_table(
+    positions: list[Position], orders: list[Order], highlighted_symbols: Collection[str] = ()
+) -> Table:
+    position_amounts = {position.asset.symbol: position.total_amount for position in positions}
+    highlighted_symbols = set(highlighted_symbols)
     table = Table(
         "Symbol",
         "Side",
@@ -157,7 +742,7 @@ def _get_confirm_for_order_submit(context: RebalanceContext, orders: list[Order]
 
     for order in orders:
         total_amount = order.quantity * order.price
-        current_position_value = context.portfolio.get_position_amount(order.symbol)
+        current_position_value = position_amounts.get(order.symbol, 0)
         expected_position_value = (
             current_position_value + total_amount
             if order.side == OrderSide.BUY
@@ -172,11 +757,10 @@ def _get_confirm_for_order_submit(context: RebalanceContext, orders: list[Order]
             _format(total_amount, "currency"),
             _format(current_position_value, "currency"),
             _format(expected_position_value, "currency"),
+            style="bold yellow" if order.symbol in highlighted_symbols else None,
         )
 
-    console.print(table)
-
-    return typer.confirm("Do you want to place these orders?")
+    return table
 
 
 def _report_orders(order_placement_results: list[OrderPlacementResult]) -> None:
@@ -188,6 +772,126 @@ def _report_orders(order_placement_results: list[OrderPlacementResult]) -> None:
             typer.echo(f"Failed to place order: {res.order} ({res.message})")
 
 
+def _report_violations(violations: list[OrderViolation]) -> None:
+    """Displays the orders that failed the pre-trade checks."""
+    table = Table("Symbol", "Side", "Quantity", "Price", "Violation", "Message")
+    for violation in violations:
+        table.add_row(
+            violation.order.symbol,
+            violation.order.side,
+            _format(violation.order.quantity, "number"),
+            _format(violation.order.price, "currency"),
+            violation.violation_type,
+            violation.message,
+        )
+
+    console.print(table)
+
+
+def _print_batch_report(report: BatchRebalanceReport) -> None:
+    table = Table(
+        "Account",
+        "Investment Amount",
+        "Orders",
+        "Placed",
+        "Load (s)",
+        "Plan (s)",
+        "Place (s)",
+        "Error",
+    )
+    for account_report in report.reports:
+        placed = sum(result.success for result in account_report.placed_orders)
+        table.add_row(
+            str(account_report.account_id),
+            _format(account_report.investment_amount or 0, "currency"),
+            str(len(account_report.orders)),
+            f"{placed}/{len(account_report.placed_orders)}",
+            _format(account_report.load_seconds, "number"),
+            _format(account_report.plan_seconds, "number"),
+            _format(account_report.place_seconds, "number"),
+            account_report.error or "",
+        )
+
+    console.print(table)
+    if report.prefetch_error:
+        console.print(f"[yellow]{report.prefetch_error}[/yellow]")
+    console.print(f"Elapsed: {_format(report.elapsed_seconds, 'number')}s")
+
+
+def _print_sweep_results(results: list[SweepResult], top: int) -> None:
+    table = Table(
+        "Case", "Symbols", "Frequency", "Band", "Amount", "CAGR", "Volatility", "MDD", "Turnover"
+    )
+    reports = [(result, result.report) for result in results if result.report is not None]
+    reports.sort(key=lambda each: each[1].cagr, reverse=True)
+    for result, report in reports[:top]:
+        table.add_row(
+            result.case_id,
+            str(len(result.case.weights)),
+            report.frequency or "-",
+            _format(report.band, "percentage") if report.band is not None else "-",
+            _format(report.initial_value, "currency"),
+            _format(report.cagr, "percentage"),
+            _format(report.volatility, "percentage"),
+            _format(report.max_drawdown, "percentage"),
+            _format(report.turnover, "number"),
+        )
+
+    console.print(table)
+    failed_count = len(results) - len(reports)
+    if failed_count:
+        console.print(f"[red]{failed_count} cases failed[/red]")
+
+
+def _print_policy_summaries(summaries: list[PolicySummary], years: float) -> None:
+    table = Table(
+        "Policy",
+        "CAGR (p50)",
+        "CAGR (p5 ~ p95)",
+        "Volatility",
+        "MDD (p50)",
+        "MDD (p5)",
+        "Turnover",
+        "Trading Cost",
+        "Rebalances",
+        "Shortfall",
+        title=f"{summaries[0].path_count:,} paths of {years:g} years" if summaries else None,
+    )
+    for summary in summaries:
+        table.add_row(
+            summary.policy.label,
+            _format(summary.cagr.median, "percentage"),
+            f"{_format(summary.cagr.p5, 'percentage')} ~ {_format(summary.cagr.p95, 'percentage')}",
+            _format(summary.volatility.median, "percentage"),
+            _format(summary.max_drawdown.median, "percentage"),
+            _format(summary.max_drawdown.p5, "percentage"),
+            _format(summary.turnover.median, "number"),
+            _format(summary.trading_cost.mean, "currency"),
+            f"{summary.rebalance_count.median:.0f}",
+            _format(summary.shortfall_probability, "percentage"),
+        )
+
+    console.print(table)
+
+
+def _print_strategies(strategies: list[StrategyMetadata]) -> None:
+    table = Table("Name", "Description", "Parameters", "Requires", "Source")
+    for strategy in strategies:
+        parameters = ", ".join(
+            parameter.name if parameter.required else f"{parameter.name}={parameter.default!r}"
+            for parameter in strategy.parameters
+        )
+        table.add_row(
+            strategy.name,
+            strategy.description,
+            parameters or "-",
+            ", ".join(strategy.requires) or "-",
+            strategy.source,
+        )
+
+    console.print(table)
+
+
 def _format(value: float, format_type: Literal["number", "currency", "percentage"]) -> str:
     """Format a number."""
     match format_type:
@@ -201,7 +905,7 @@ def _format(value: float, format_type: Literal["number", "currency", "percentage
             raise NotImplementedError(f"Unsupported format type: {format_type}")
 
 
-def _print_portfolio_table(context: RebalanceContext) -> None:
+def _print_portfolio_table(positions: list[Position]) -> None:
     columns = [
         "Symbol",
         "Quantity",
@@ -220,7 +924,7 @@ def _print_portfolio_table(context: RebalanceContext) -> None:
     for column in columns:
         table.add_column(column, justify="right")
 
-    for position in context.portfolio.positions:
+    for position in positions:
         if position.rtn > 0:
             rtn_style = "red"
         elif position.rtn == 0:
@@ -240,9 +944,8 @@ def _print_portfolio_table(context: RebalanceContext) -> None:
     console.print(table)
 
 
-def _print_portfolio_summary(context: RebalanceContext) -> None:
-    cash_balance = context.portfolio.cash_balance
-    total_asset_value = sum(p.total_amount for p in context.portfolio.positions)
+def _print_portfolio_summary(cash_balance: float, positions: list[Position]) -> None:
+    total_asset_value = sum(p.total_amount for p in positions)
     total_portfolio_value = total_asset_value + cash_balance
 
     console.print(Text("\nPortfolio Summary:", style="bold underline"))
@@ -251,5 +954,111 @@ def _print_portfolio_summary(context: RebalanceContext) -> None:
     console.print(f"Total Portfolio Value: {_format(total_portfolio_value, 'currency')}")
 
 
+def _print_drift_snapshot(snapshot: DriftSnapshot) -> None:
+    table = Table(box=box.MINIMAL_DOUBLE_HEAD, show_header=True, header_style="bold magenta")
+    for column in ["Symbol", "Target Weight (%)", "Current Weight (%)", "Drift (%)"]:
+        table.add_column(column, justify="right")
+
+    for symbol_drift in snapshot.drifts:
+        style = "red" if symbol_drift.symbol in snapshot.breached_symbols else None
+        table.add_row(
+            symbol_drift.symbol,
+            _format(symbol_drift.target_weight, "percentage"),
+            _format(symbol_drift.current_weight, "percentage"),
+            Text(_format(symbol_drift.drift, "percentage"), style=style or ""),
+        )
+
+    console.print(table)
+    console.print(f"Total Portfolio Value: {_format(snapshot.total_value, 'currency')}")
+
+
+def _print_drift_event(event: DriftEvent) -> None:
+    symbol_drift = event.symbol_drift
+    message = (
+        f"[{event.dt:%H:%M:%S}] {symbol_drift.symbol}"
+        f" {_format(symbol_drift.current_weight, 'percentage')}"
+        f" (target {_format(symbol_drift.target_weight, 'percentage')},"
+        f" drift {_format(symbol_drift.drift, 'percentage')})"
+    )
+    if event.breached:
+        console.print(f"[red]Drift threshold breached: {message}[/red]")
+    else:
+        console.print(f"[green]Back within threshold: {message}[/green]")
+
+
+def _watch_row_cells(row: WatchRow) -> list[str | Text]:
+    cells: list[str | Text] = [
+        row.symbol,
+        _format(row.quantity, "number"),
+        _format(row.price, "currency"),
+        _format(row.total_amount, "currency"),
+        _format(row.weight, "percentage"),
+    ]
+    if row.target_weight is not None and row.drift is not None:
+        cells.append(_format(row.target_weight, "percentage"))
+        cells.append(Text(_format(row.drift, "percentage"), style="red" if row.breached else ""))
+
+    return cells
+
+
+def _create_watch_table(
+    cells_by_symbol: dict[str, list[str | Text]], update: WatchUpdate, show_drift: bool
+) -> Table:
+    columns = ["Symbol", "Quantity", "Price", "Total Amount", "Weight (%)"]
+    if show_drift:
+        columns += ["Target Weight (%)", "Drift (%)"]
+
+    table = Table(
+        box=box.MINIMAL_DOUBLE_HEAD,
+        show_header=True,
+        header_style="bold magenta",
+        caption=(
+            f"Total {_format(update.total_value, 'currency')}"
+            f" · Cash {_format(update.cash_balance, 'currency')}"
+            f" · Updated {update.dt:%H:%M:%S}"
+        ),
+    )
+    for column in columns:
+        table.add_column(column, justify="right")
+
+    for symbol in sorted(cells_by_symbol):
+        table.add_row(*cells_by_symbol[symbol])
+
+    return table
+
+
+def _print_aggregated_portfolio(aggregated_portfolio: AggregatedPortfolio) -> None:
+    table = Table(box=box.MINIMAL_DOUBLE_HEAD, show_header=True, header_style="bold magenta")
+    for column in ["Symbol", "Label", "Asset Class", "Quantity", "Total Amount", "Weight (%)"]:
+        table.add_column(column, justify="right")
+
+    for position in aggregated_portfolio.positions:
+        table.add_row(
+            position.asset.symbol,
+            position.asset.label,
+            str(position.asset.asset_class),
+            _format(position.quantity, "number"),
+            _format(position.total_amount, "currency"),
+            _format(position.weight, "percentage"),
+        )
+
+    console.print(table)
+
+    console.print(Text("\nAsset Classes:", style="bold underline"))
+    for exposure in aggregated_portfolio.asset_classes:
+        console.print(
+            f"{exposure.asset_class}: {_format(exposure.total_amount, 'currency')}"
+            f" ({_format(exposure.weight, 'percentage')})"
+        )
+
+    console.print(Text("\nPortfolio Summary:", style="bold underline"))
+    console.print(f"Cash Balance: {_format(aggregated_portfolio.cash_balance, 'currency')}")
+    console.print(f"Total Portfolio Value: {_format(aggregated_portfolio.total_value, 'currency')}")
+
+    for account in aggregated_portfolio.accounts:
+        if account.error is not None:
+            console.print(f"[red]Excluded account {account.account_id}: {account.error}[/red]")
+
+
 if __name__ == "__main__":
     app()
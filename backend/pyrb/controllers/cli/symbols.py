@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Annotated
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from pyrb.controllers.cli.account import get_selected_account
+from pyrb.controllers.constants import SYMBOL_MASTER_PATH
+from pyrb.exceptions import SymbolMasterError
+from pyrb.repositories.symbol_master import get_symbol_master
+
+if TYPE_CHECKING:
+    from pyrb.repositories.symbol_master import SymbolMaster
+
+app = typer.Typer()
+console = Console()
+
+
+@app.command()
+def update(
+    force: Annotated[bool, typer.Option(help="Download even if up to date")] = False,
+) -> None:
+    """
+    Downloads the listing of every security and rebuilds the local symbol master.
+    """
+    from pyrb.repositories.brokerages.context import create_symbol_list_fetcher
+    from pyrb.services.symbol_master import SymbolMasterService
+
+    symbol_master = _get_symbol_master()
+    symbol_master_service = SymbolMasterService(
+        symbol_master, create_symbol_list_fetcher(get_selected_account())
+    )
+    if symbol_master_service.update(force=force):
+        typer.echo(f"Updated the symbol master with {len(symbol_master)} symbols")
+    else:
+        typer.echo("The symbol master is up to date")
+
+
+@app.command()
+def show(symbol: Annotated[str, typer.Argument(help="The symbol to look up")]) -> None:
+    """
+    Displays a security from the local symbol master.
+    """
+    try:
+        symbol_info = _get_symbol_master().get(symbol)
+    except SymbolMasterError as e:
+        typer.echo(e)
+        raise typer.Exit(code=1) from None
+
+    if symbol_info is None:
+        typer.echo(f"Unknown symbol: {symbol}. Run `pyrb symbols update` to refresh the master")
+        raise typer.Exit(code=1)
+
+    table = Table("Symbol", "Name", "Market", "Asset Class", "ETF", "Tick Size")
+    table.add_row(
+        symbol_info.symbol,
+        symbol_info.name,
+        symbol_info.market,
+        symbol_info.asset_class,
+        "Y" if symbol_info.is_etf else "N",
+        str(symbol_info.tick_size),
+    )
+    console.print(table)
+
+
+def _get_symbol_master() -> SymbolMaster:
+    from pyrb.repositories.symbol_master import SymbolMaster
+
+    return get_symbol_master() or SymbolMaster(SYMBOL_MASTER_PATH)
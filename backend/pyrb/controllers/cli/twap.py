@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Annotated
+from uuid import UUID
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from pyrb.controllers.cli.account import get_selected_account
+from pyrb.controllers.constants import SCHEDULES_PATH
+from pyrb.enums import OrderSide, OrderType, SliceSpacing
+
+if TYPE_CHECKING:
+    from pyrb.models.schedule import TWAPSchedule
+    from pyrb.repositories.brokerages.context import RebalanceContext
+    from pyrb.repositories.schedule import ScheduleRepository
+    from pyrb.services.twap import TWAPScheduler
+
+app = typer.Typer()
+console = Console()
+
+
+@app.command()
+def start(
+    symbol: Annotated[str, typer.Option(..., help="The symbol to trade")],
+    side: Annotated[OrderSide, typer.Option(..., help="The order side", case_sensitive=False)],
+    quantity: Annotated[int, typer.Option(..., help="The total quantity to trade", min=1)],
+    window_minutes: Annotated[
+        float, typer.Option(..., help="The number of minutes to spread the orders over")
+    ],
+    slices: Annotated[int, typer.Option(help="The number of child orders", min=1)] = 10,
+    spacing: Annotated[
+        SliceSpacing, typer.Option(help="How to distribute the quantity over the child orders")
+    ] = SliceSpacing.EVEN,
+) -> None:
+    """
+    Splits an order into child orders placed over the given window and runs the schedule.
+    """
+    from pyrb.models.order import Order
+
+    context = _create_context()
+    price = context.price_fetcher.get_current_price(symbol).price
+    scheduler = _create_scheduler(context)
+    parent_order = Order(
+        symbol=symbol, price=price, quantity=quantity, side=side, order_type=OrderType.MARKET
+    )
+
+    schedule = scheduler.create(parent_order, window_minutes * 60, slices, spacing)
+    typer.echo(f"Created schedule {schedule.id}")
+    _run(scheduler, schedule.id)
+
+
+@app.command()
+def resume(schedule_id: Annotated[UUID, typer.Argument(help="The id of the schedule")]) -> None:
+    """
+    Resumes a cancelled or interrupted schedule.
+    """
+    from pyrb.exceptions import ScheduleConflictError
+
+    scheduler = _create_scheduler(_create_context())
+    try:
+        scheduler.resume(schedule_id)
+    except ScheduleConflictError as e:
+        typer.echo(str(e))
+        raise typer.Exit(code=1) from e
+
+    _run(scheduler, schedule_id)
+
+
+@app.command()
+def cancel(schedule_id: Annotated[UUID, typer.Argument(help="The id of the schedule")]) -> None:
+    """
+    Cancels a schedule. A schedule running in another process stops before its next child order.
+    """
+    schedule = _create_scheduler(_create_context()).cancel(schedule_id)
+    typer.echo(f"Schedule {schedule.id} is {schedule.status}")
+
+
+@app.command()
+def status(schedule_id: Annotated[UUID, typer.Argument(help="The id of the schedule")]) -> None:
+    """
+    Displays the progress of a schedule.
+    """
+    _print_schedules([_create_schedule_repo().get(schedule_id)])
+
+
+@app.command("list")
+def list_schedules() -> None:
+    """
+    Displays the progress of all schedules.
+    """
+    _print_schedules(_create_schedule_repo().get_all())
+
+
+def _create_context() -> RebalanceContext:
+    from pyrb.repositories.brokerages.context import create_rebalance_context
+
+    account = get_selected_account()
+    return create_rebalance_context(account)
+
+
+def _create_schedule_repo() -> ScheduleRepository:
+    from pyrb.repositories.schedule import LocalScheduleRepository
+
+    return LocalScheduleRepository(SCHEDULES_PATH)
+
+
+def _create_scheduler(context: RebalanceContext) -> TWAPScheduler:
+    from pyrb.services.twap import TWAPScheduler
+
+    return TWAPScheduler(context, _create_schedule_repo())
+
+
+def _run(scheduler: TWAPScheduler, schedule_id: UUID) -> None:
+    from pyrb.exceptions import ScheduleConflictError
+
+    def _on_progress(schedule: TWAPSchedule) -> None:
+        typer.echo(
+            f"[{schedule.status}] placed {schedule.placed_quantity}"
+            f"/{schedule.parent_order.quantity} shares"
+        )
+
+    try:
+        schedule = asyncio.run(scheduler.run(schedule_id, on_progress=_on_progress))
+    except KeyboardInterrupt:
+        schedule = scheduler.cancel(schedule_id)
+        typer.echo(f"Interrupted. Resume with: pyrb twap resume {schedule.id}")
+        return
+    except ScheduleConflictError as e:
+        typer.echo(str(e))
+        raise typer.Exit(code=1) from e
+
+    typer.echo(f"Schedule {schedule.id} is {schedule.status}")
+
+
+def _print_schedules(schedules: list[TWAPSchedule]) -> None:
+    table = Table("Id", "Order", "Status", "Placed", "Child orders", "Created at")
+    for schedule in schedules:
+        placed_children = len(schedule.children) - len(schedule.pending_children)
+        table.add_row(
+            str(schedule.id),
+            str(schedule.parent_order),
+            schedule.status,
+            f"{schedule.placed_quantity}/{schedule.parent_order.quantity}",
+            f"{placed_children}/{len(schedule.children)}",
+            schedule.created_at.strftime("%Y-%m-%d %H:%M:%S"),
+        )
+
+    console.print(table)
@@ -4,4 +4,12 @@ import typer
 
 APP_NAME = "pyrb"  # TODO: parse from pyproject.toml and move to constants.py
 APP_DIR = Path(typer.get_app_dir(APP_NAME))
-ACCOUNTS_CONFIG_PATH = APP_DIR / "accounts"
+ACCOUNTS_CONFIG_PATH = APP_DIR / "accounts"  # 단일 계좌 설정 파일 (accounts.db 로 이전됨)
+ACCOUNTS_DB_PATH = APP_DIR / "accounts.db"
+SCHEDULES_PATH = APP_DIR / "schedules"
+SYMBOL_MASTER_PATH = APP_DIR / "symbols.bin"
+TARGET_CACHE_DIR = APP_DIR / "targets"  # 검증된 목표 비중 캐시
+DAEMON_SOCKET_PATH = APP_DIR / "daemon.sock"
+DAEMON_PID_PATH = APP_DIR / "daemon.pid"
+PRICE_HISTORY_DIR = APP_DIR / "history"  # 종목별 일봉 저장소
+STRATEGY_PLUGIN_DIR = APP_DIR / "strategies"  # 로컬 전략 플러그인
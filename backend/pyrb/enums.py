@@ -23,6 +23,7 @@ class OrderSide(StrEnum):
 
 class AssetAllocationStrategyEnum(StrEnum):
     ALL_WEATHER_KR = "all-weather-kr"
+    RISK_PARITY_KR = "risk-parity-kr"  # 올웨더 종목을 위험 기여도가 같도록 배분
 
 
 class AssetClassEnum(StrEnum):
@@ -31,3 +32,35 @@ class AssetClassEnum(StrEnum):
     CASH = "CASH"
     COMMODITY = "COMMODITY"
     OTHER = "OTHER"
+
+
+class Market(StrEnum):
+    KOSPI = "KOSPI"
+    KOSDAQ = "KOSDAQ"
+
+
+class SliceSpacing(StrEnum):
+    EVEN = "even"  # 균등 분할
+    VOLUME = "volume"  # 장중 거래량 분포에 비례하여 분할
+
+
+class ScheduleStatus(StrEnum):
+    PENDING = "PENDING"
+    RUNNING = "RUNNING"
+    CANCELLED = "CANCELLED"
+    COMPLETED = "COMPLETED"
+
+
+class OrderViolationType(StrEnum):
+    NON_POSITIVE_QUANTITY = "NON_POSITIVE_QUANTITY"  # 주문수량이 0 이하
+    NOT_HELD = "NOT_HELD"  # 보유하지 않은 종목의 매도
+    EXCEEDS_SELLABLE_QUANTITY = "EXCEEDS_SELLABLE_QUANTITY"  # 매도가능수량 초과
+    INSUFFICIENT_CASH = "INSUFFICIENT_CASH"  # 매도대금을 포함한 주문가능금액 초과
+
+
+class RebalanceFrequency(StrEnum):
+    DAILY = "daily"
+    WEEKLY = "weekly"
+    MONTHLY = "monthly"
+    QUARTERLY = "quarterly"
+    YEARLY = "yearly"
@@ -16,8 +16,41 @@ class InvalidTargetError(PyRbException): ...
 class InitializationError(PyRbException): ...
 
 
+class ScheduleNotFoundError(PyRbException): ...
+
+
+class ScheduleConflictError(PyRbException): ...
+
+
 class APIClientError(PyRbException):
     def __init__(self, client_error_code: str, client_error_message: str, status_code: int) -> None:
         self.client_error_code = client_error_code
         self.client_error_message = client_error_message
         self.status_code = status_code
+
+
+class PlanNotFoundError(PyRbException): ...
+
+
+class StalePlanError(PyRbException): ...
+
+
+class PlanMismatchError(PyRbException): ...
+
+
+class AccountNotFoundError(PyRbException): ...
+
+
+class StreamDisconnectedError(PyRbException): ...
+
+
+class DaemonRequestError(PyRbException): ...
+
+
+class PriceHistoryError(PyRbException): ...
+
+
+class StrategyNotFoundError(PyRbException): ...
+
+
+class SymbolMasterError(PyRbException): ...
@@ -0,0 +1,21 @@
+import datetime
+
+from pydantic import BaseModel
+
+from pyrb.enums import RebalanceFrequency
+
+
+class BacktestReport(BaseModel):
+    start: datetime.date
+    end: datetime.date
+    frequency: RebalanceFrequency | None  # 정기 리밸런싱 주기. None 이면 비중 이탈 시에만
+    band: float | None  # 리밸런싱을 일으키는 비중 이탈 폭. None 이면 정기적으로만
+    initial_value: float
+    final_value: float
+    total_return: float
+    cagr: float  # 연환산 수익률
+    volatility: float  # 연환산 변동성
+    max_drawdown: float  # 최대 낙폭 (음수)
+    turnover: float  # 연평균 회전율: 매매금액의 절반 / 평균 평가금액
+    trading_cost: float  # 누적 거래비용
+    rebalance_count: int  # 최초 매수를 제외한 리밸런싱 횟수
@@ -0,0 +1,22 @@
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from pyrb.models.order import Order, OrderPlacementResult
+
+
+class AccountRebalanceReport(BaseModel):
+    account_id: UUID
+    investment_amount: float | None = None
+    orders: list[Order] = []
+    placed_orders: list[OrderPlacementResult] = []
+    load_seconds: float = 0  # 포트폴리오 조회 소요시간
+    plan_seconds: float = 0  # 주문 산출 소요시간
+    place_seconds: float = 0  # 주문 제출 소요시간
+    error: str | None = None  # 실패한 경우 오류 메시지
+
+
+class BatchRebalanceReport(BaseModel):
+    reports: list[AccountRebalanceReport]
+    elapsed_seconds: float
+    prefetch_error: str | None = None  # 현재가 일괄 조회에 실패한 경우 오류 메시지
@@ -0,0 +1,25 @@
+from pydantic import AwareDatetime, BaseModel
+
+
+class SymbolDrift(BaseModel):
+    symbol: str
+    target_weight: float  # 목표 비중
+    current_weight: float  # 현재 비중
+    drift: float  # 현재 비중 - 목표 비중
+
+
+class DriftEvent(BaseModel):
+    """Emitted when the drift of a symbol crosses the threshold in either direction."""
+
+    symbol_drift: SymbolDrift
+    breached: bool  # True 이면 임계값을 넘어섰고, False 이면 임계값 안으로 돌아왔습니다.
+    total_value: float
+    dt: AwareDatetime
+
+
+class DriftSnapshot(BaseModel):
+    total_value: float
+    drifts: list[SymbolDrift]
+    threshold: float
+    breached_symbols: list[str]
+    dt: AwareDatetime
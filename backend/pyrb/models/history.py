@@ -0,0 +1,12 @@
+import datetime
+
+from pydantic import BaseModel
+
+
+class DailyBar(BaseModel):
+    date: datetime.date
+    open: int
+    high: int
+    low: int
+    close: int
+    volume: int
@@ -0,0 +1,67 @@
+from pydantic import BaseModel, Field, field_validator
+
+from pyrb.enums import RebalanceFrequency
+
+
+class RebalancePolicy(BaseModel):
+    """When to rebalance, with the same semantics as `Backtester.run`."""
+
+    frequency: RebalanceFrequency | None = None  # 정기 리밸런싱 주기
+    band: float | None = Field(default=None, gt=0)  # 리밸런싱을 일으키는 비중 이탈 폭
+
+    @property
+    def label(self) -> str:
+        parts = [str(self.frequency)] if self.frequency is not None else []
+        if self.band is not None:
+            parts.append(f"band {self.band:.1%}")
+        return " ".join(parts) or "buy and hold"
+
+
+class MonteCarloSpec(BaseModel):
+    """The synthetic paths to generate and the rebalance policies to evaluate on each path."""
+
+    weights: dict[str, float]
+    policies: list[RebalancePolicy] = Field(min_length=1)
+    investment_amount: float = Field(gt=0)
+    cost_rate: float = Field(default=0.0, ge=0)
+    path_count: int = Field(default=1000, gt=0)
+    years: float = Field(default=10.0, gt=0)
+    block_size: int = Field(default=20, gt=0)  # 부트스트랩으로 함께 뽑는 연속된 거래일 수
+    seed: int = 0
+
+    @field_validator("weights")
+    @classmethod
+    def _normalize(cls, weights: dict[str, float]) -> dict[str, float]:
+        total = sum(weights.values())
+        if not weights or total <= 0:
+            raise ValueError("The weights must have a positive total")
+        return {symbol: weight / total for symbol, weight in weights.items()}
+
+    @property
+    def symbols(self) -> list[str]:
+        return list(self.weights)
+
+
+class DistributionSummary(BaseModel):
+    mean: float
+    std: float
+    p5: float
+    p25: float
+    median: float
+    p75: float
+    p95: float
+
+
+class PolicySummary(BaseModel):
+    """The distribution of the outcomes of a policy over every simulated path."""
+
+    policy: RebalancePolicy
+    path_count: int
+    final_value: DistributionSummary
+    cagr: DistributionSummary  # 연환산 수익률
+    volatility: DistributionSummary  # 연환산 변동성
+    max_drawdown: DistributionSummary  # 최대 낙폭 (음수)
+    turnover: DistributionSummary  # 연평균 회전율: 매매금액의 절반 / 평균 평가금액
+    trading_cost: DistributionSummary  # 최초 매수를 포함한 누적 거래비용
+    rebalance_count: DistributionSummary  # 최초 매수를 제외한 리밸런싱 횟수
+    shortfall_probability: float  # 최종 평가금액이 투자금액보다 작은 경로의 비율
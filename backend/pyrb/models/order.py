@@ -1,6 +1,6 @@
 from pydantic import BaseModel
 
-from pyrb.enums import OrderSide, OrderType
+from pyrb.enums import OrderSide, OrderType, OrderViolationType
 
 
 class Order(BaseModel):
@@ -18,3 +18,34 @@ class OrderPlacementResult(BaseModel):
     order: Order
     success: bool
     message: str | None = None
+
+
+class OrderFill(BaseModel):
+    order: Order  # 원주문
+    quantity: int  # 체결수량
+    price: int  # 체결가격
+
+    @property
+    def amount(self) -> int:
+        return self.quantity * self.price
+
+
+class OrderExecution(BaseModel):
+    order_number: str  # 증권사 주문번호
+    quantity: int  # 이번 체결수량
+    price: int  # 체결가격
+
+
+class OrderViolation(BaseModel):
+    order: Order
+    violation_type: OrderViolationType
+    message: str
+
+
+class PreTradeCheckResult(BaseModel):
+    orders: list[Order]  # 검증을 통과한 주문 (매도가능수량으로 조정된 주문 포함)
+    violations: list[OrderViolation]
+
+    @property
+    def passed(self) -> bool:
+        return not self.violations
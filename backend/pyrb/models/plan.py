@@ -0,0 +1,42 @@
+import uuid
+
+from pydantic import AwareDatetime, BaseModel, Field
+
+from pyrb.models.order import Order
+from pyrb.models.position import Position
+
+
+class PortfolioSnapshot(BaseModel):
+    total_value: float
+    cash_balance: float
+    positions: list[Position]
+
+    def has_same_holdings(self, other: "PortfolioSnapshot") -> bool:
+        """Whether both snapshots hold the same cash and quantities, whatever the prices."""
+        return self.cash_balance == other.cash_balance and {
+            position.asset.symbol: position.quantity for position in self.positions
+        } == {position.asset.symbol: position.quantity for position in other.positions}
+
+
+class RebalancePlan(BaseModel):
+    id: uuid.UUID = Field(default_factory=uuid.uuid4)
+    account_id: uuid.UUID
+    strategy: str  # 전략 이름
+    investment_amount: float
+    orders: list[Order]
+    snapshot: PortfolioSnapshot  # 주문 산출에 사용된 포트폴리오
+    priced_at: AwareDatetime  # 주문 산출에 사용된 현재가의 조회 시점
+
+
+class PlanPreview(BaseModel):
+    strategy: str  # 전략 이름 또는 목표 비중 파일 경로
+    investment_amount: float
+    orders: list[Order]
+
+
+class PlanUpdate(BaseModel):
+    """The plan of an `IncrementalPlanner` after the target weights were edited."""
+
+    orders: list[Order]  # 전체 주문 (매도 주문 우선)
+    changed_symbols: list[str]  # 목표 비중이 바뀌어 주문을 다시 계산한 종목
+    removed_symbols: list[str]  # 목표에서 빠진 종목
@@ -1,7 +1,74 @@
-from pydantic import AwareDatetime, BaseModel
+from uuid import UUID
+
+from pydantic import AwareDatetime, BaseModel, computed_field
+
+from pyrb.models.position import Asset, Position
 
 
 class PortfolioReturn(BaseModel):
     dt: AwareDatetime
     rtn: float
     pnl: float
+
+
+class AggregatedPosition(BaseModel):
+    asset: Asset
+    quantity: int  # 전 계좌 합산 보유수량
+    total_amount: float  # 전 계좌 합산 평가금액
+    profit: float  # 전 계좌 합산 수익금
+    weight: float  # 합산 평가금액 대비 비중
+    account_ids: list[UUID]  # 보유 계좌
+
+
+class AssetClassExposure(BaseModel):
+    asset_class: str
+    total_amount: float
+    weight: float
+
+
+class AccountLoadStatus(BaseModel):
+    account_id: UUID
+    total_value: float | None = None
+    load_seconds: float | None = None
+    error: str | None = None  # 조회에 실패하거나 시간이 초과된 경우 오류 메시지
+
+
+class AggregatedPortfolio(BaseModel):
+    """
+    The positions of several accounts merged by symbol and by asset class.
+    Accounts that failed to load are reported in `accounts` and excluded from the totals.
+    """
+
+    total_value: float
+    cash_balance: float
+    positions: list[AggregatedPosition]
+    asset_classes: list[AssetClassExposure]
+    accounts: list[AccountLoadStatus]
+    loaded_at: AwareDatetime
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def partial(self) -> bool:
+        return any(account.error is not None for account in self.accounts)
+
+
+class PortfolioValuationDelta(BaseModel):
+    """
+    The changes of a portfolio since the previous valuation.
+    A delta sent as a snapshot contains the whole portfolio and replaces the previous one.
+    """
+
+    total_value: float | None = None  # 변경된 경우에만 포함됩니다.
+    cash_balance: float | None = None  # 변경된 경우에만 포함됩니다.
+    positions: list[Position] = []  # 새로 생기거나 변경된 포지션
+    removed_symbols: list[str] = []  # 전량 매도된 종목
+    dt: AwareDatetime
+
+
+class PortfolioValuationError(BaseModel):
+    """
+    A failed refresh of a portfolio. The latest valuation is stale until the next snapshot.
+    """
+
+    message: str
+    dt: AwareDatetime
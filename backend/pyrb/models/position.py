@@ -1,4 +1,6 @@
-from pydantic import BaseModel, PositiveFloat, PositiveInt, computed_field
+from typing import Any
+
+from pydantic import BaseModel, PositiveFloat, PositiveInt, model_validator
 
 from pyrb.enums import AssetClassEnum
 
@@ -15,12 +17,26 @@ asset_class_by_symbols: dict[str, AssetClassEnum] = {
 
 
 class Asset(BaseModel):
+    """
+    An asset. The asset class is looked up from the symbol once, when the asset is created,
+    instead of on every serialization. Repositories parsing brokerage payloads pass it
+    explicitly.
+    """
+
     symbol: str  # 종목코드
     label: str  # 종목명
+    asset_class: str = AssetClassEnum.OTHER  # 자산군
+
+    @model_validator(mode="before")
+    @classmethod
+    def _classify(cls, data: Any) -> Any:
+        if isinstance(data, dict) and "asset_class" not in data and "symbol" in data:
+            return {**data, "asset_class": classify(data["symbol"])}
+        return data
+
 
-    @computed_field
-    def asset_class(self) -> str:
-        return asset_class_by_symbols.get(self.symbol, AssetClassEnum.OTHER)
+def classify(symbol: str) -> AssetClassEnum:
+    return asset_class_by_symbols.get(symbol, AssetClassEnum.OTHER)
 
 
 class Position(BaseModel):
@@ -0,0 +1,36 @@
+import uuid
+
+from pydantic import AwareDatetime, BaseModel, Field, NonNegativeFloat, computed_field
+
+from pyrb.enums import ScheduleStatus, SliceSpacing
+from pyrb.models.order import Order, OrderPlacementResult
+
+
+class ChildOrder(BaseModel):
+    order: Order  # 분할주문
+    offset: NonNegativeFloat  # 스케줄 시작 시점으로부터 주문 시점까지의 시간(초)
+    result: OrderPlacementResult | None = None  # 주문 결과, 아직 주문되지 않았다면 None
+
+
+class TWAPSchedule(BaseModel):
+    id: uuid.UUID = Field(default_factory=uuid.uuid4)
+    parent_order: Order  # 원주문
+    window: NonNegativeFloat  # 분할주문 기간(초)
+    spacing: SliceSpacing
+    children: list[ChildOrder]
+    status: ScheduleStatus = ScheduleStatus.PENDING
+    created_at: AwareDatetime
+    started_at: AwareDatetime | None = None  # 첫 번째 분할주문의 기준 시점
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def placed_quantity(self) -> int:
+        return sum(
+            child.order.quantity
+            for child in self.children
+            if child.result is not None and child.result.success
+        )
+
+    @property
+    def pending_children(self) -> list[ChildOrder]:
+        return [child for child in self.children if child.result is None]
@@ -0,0 +1,66 @@
+import hashlib
+import itertools
+
+from pydantic import BaseModel, field_validator
+
+from pyrb.enums import RebalanceFrequency
+from pyrb.models.backtest import BacktestReport
+
+
+class SweepCase(BaseModel):
+    weights: dict[str, float]  # 정규화된 목표 비중
+    frequency: RebalanceFrequency | None
+    band: float | None
+    investment_amount: float
+    cost_rate: float = 0.0
+
+    @property
+    def case_id(self) -> str:
+        """Identifies the parameters of the case, independent of its position in the sweep."""
+        return hashlib.blake2b(self.model_dump_json().encode(), digest_size=8).hexdigest()
+
+
+class SweepSpec(BaseModel):
+    """The grid of parameters to sweep. Every combination is a case."""
+
+    weights: list[dict[str, float]]
+    frequencies: list[RebalanceFrequency | None] = [RebalanceFrequency.MONTHLY]
+    bands: list[float | None] = [None]
+    investment_amounts: list[float]
+    cost_rate: float = 0.0
+
+    @field_validator("weights")
+    @classmethod
+    def _normalize(cls, weights: list[dict[str, float]]) -> list[dict[str, float]]:
+        normalized = []
+        for each in weights:
+            total = sum(each.values())
+            if not each or total <= 0:
+                raise ValueError("Each set of weights must have a positive total")
+            normalized.append({symbol: weight / total for symbol, weight in each.items()})
+        return normalized
+
+    @property
+    def symbols(self) -> list[str]:
+        return sorted({symbol for each in self.weights for symbol in each})
+
+    def cases(self) -> list[SweepCase]:
+        return [
+            SweepCase(
+                weights=weights,
+                frequency=frequency,
+                band=band,
+                investment_amount=investment_amount,
+                cost_rate=self.cost_rate,
+            )
+            for weights, frequency, band, investment_amount in itertools.product(
+                self.weights, self.frequencies, self.bands, self.investment_amounts
+            )
+        ]
+
+
+class SweepResult(BaseModel):
+    case_id: str
+    case: SweepCase
+    report: BacktestReport | None = None
+    error: str | None = None  # 실패한 경우 오류 메시지
@@ -0,0 +1,63 @@
+from pydantic import BaseModel
+
+from pyrb.enums import AssetClassEnum, Market
+
+# ETF 종목명에 포함된 키워드로 자산군을 분류합니다. 먼저 일치하는 키워드가 우선합니다.
+asset_class_by_name_keywords: list[tuple[str, AssetClassEnum]] = [
+    ("단기채", AssetClassEnum.CASH),
+    ("단기자금", AssetClassEnum.CASH),
+    ("머니마켓", AssetClassEnum.CASH),
+    ("CD금리", AssetClassEnum.CASH),
+    ("KOFR", AssetClassEnum.CASH),
+    ("국고채", AssetClassEnum.BOND),
+    ("국채", AssetClassEnum.BOND),
+    ("미국채", AssetClassEnum.BOND),
+    ("회사채", AssetClassEnum.BOND),
+    ("채권", AssetClassEnum.BOND),
+    ("금현물", AssetClassEnum.COMMODITY),
+    ("골드", AssetClassEnum.COMMODITY),
+    ("금선물", AssetClassEnum.COMMODITY),
+    ("은선물", AssetClassEnum.COMMODITY),
+    ("원유", AssetClassEnum.COMMODITY),
+    ("WTI", AssetClassEnum.COMMODITY),
+    ("구리", AssetClassEnum.COMMODITY),
+    ("농산물", AssetClassEnum.COMMODITY),
+]
+
+# KRX 주식 호가가격단위 (가격 상한, 호가단위)
+stock_tick_sizes: list[tuple[int, int]] = [
+    (2_000, 1),
+    (5_000, 5),
+    (20_000, 10),
+    (50_000, 50),
+    (200_000, 100),
+    (500_000, 500),
+]
+
+
+class SymbolInfo(BaseModel):
+    symbol: str  # 종목코드
+    name: str  # 종목명
+    market: Market  # 시장구분
+    asset_class: str  # 자산군
+    is_etf: bool  # ETF/ETN 여부
+    tick_size: int  # 호가단위 (전일 종가 기준)
+
+
+def classify_by_name(name: str, is_etf: bool) -> AssetClassEnum:
+    """Classifies a listed security. Stocks are `STOCK`, ETFs are classified by their name."""
+    if not is_etf:
+        return AssetClassEnum.STOCK
+
+    return next(
+        (asset_class for keyword, asset_class in asset_class_by_name_keywords if keyword in name),
+        AssetClassEnum.STOCK,
+    )
+
+
+def krx_tick_size(price: int, is_etf: bool) -> int:
+    """Returns the KRX tick size of a security trading at the given price."""
+    if is_etf:
+        return 1 if price < 2_000 else 5
+
+    return next((tick for upper, tick in stock_tick_sizes if price < upper), 1_000)
@@ -0,0 +1,22 @@
+from pydantic import AwareDatetime, BaseModel
+
+
+class WatchRow(BaseModel):
+    symbol: str
+    quantity: int
+    price: int  # 현재가
+    total_amount: float  # 평가금액
+    weight: float  # 현재 비중
+    target_weight: float | None = None  # 목표 비중. 비교할 목표가 없으면 None
+    drift: float | None = None  # 현재 비중 - 목표 비중
+    breached: bool = False  # 비중 차이가 임계값을 넘었는지 여부
+
+
+class WatchUpdate(BaseModel):
+    """The rows that changed since the previous refresh of a `PortfolioWatcher`."""
+
+    rows: list[WatchRow]  # 새로 생기거나 값이 바뀐 행
+    removed_symbols: list[str]  # 더 이상 보유하지 않는 종목
+    total_value: float
+    cash_balance: float
+    dt: AwareDatetime
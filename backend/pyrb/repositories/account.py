@@ -1,21 +1,44 @@
+import json
+import sqlite3
+import threading
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
+from uuid import UUID
 
 import toml
 
-from pyrb.exceptions import InitializationError
+from pyrb.exceptions import AccountNotFoundError, InitializationError
 from pyrb.models.account import Account, AccountFactory
 
 
 class AccountRepository(ABC):
     @abstractmethod
-    def set(self, account: Account) -> None: ...
+    def set(self, account: Account) -> None:
+        """Stores the account. The first stored account becomes the default account."""
+        ...
 
     @abstractmethod
-    def get(self) -> Account: ...
+    def get(self, account_id: UUID | None = None) -> Account:
+        """Returns the account with the given id, or the default account if no id is given.
+
+        Raises:
+            InitializationError: If no account is set.
+            AccountNotFoundError: If there is no account with the given id.
+        """
+        ...
+
+    @abstractmethod
+    def get_all(self) -> list[Account]: ...
+
+    @abstractmethod
+    def set_default(self, account_id: UUID) -> None: ...
 
 
 class LocalConfigAccountRepository(AccountRepository):
+    """Stores a single account as a TOML file."""
+
     def __init__(self, config_path: Path) -> None:
         self._config_path = config_path
         # create config file within a directory if not exists
@@ -26,7 +49,7 @@ class LocalConfigAccountRepository(AccountRepository):
         with open(self._config_path, "w") as f:
             f.write(account.to_toml())
 
-    def get(self) -> Account:
+    def get(self, account_id: UUID | None = None) -> Account:
         with open(self._config_path) as f:
             account_config = toml.loads(f.read())
             if not account_config:
@@ -35,4 +58,164 @@ class LocalConfigAccountRepository(AccountRepository):
             brokerage = account_config.pop("brokerage")
             account = AccountFactory.create(brokerage=brokerage, **account_config)
 
+            if account_id is not None and account.id != account_id:
+                raise AccountNotFoundError(f"account {account_id} does not exist")
+
             return account
+
+    def get_all(self) -> list[Account]:
+        try:
+            return [self.get()]
+        except InitializationError:
+            return []
+
+    def set_default(self, account_id: UUID) -> None:
+        self.get(account_id)  # the only account is always the default account
+
+
+class SQLiteAccountRepository(AccountRepository):
+    """
+    Stores multiple accounts in a SQLite database indexed by account id.
+
+    The database runs in WAL mode, so readers never block the writer and several processes
+    (e.g. the API server and the CLI) can share it. Parsed accounts are cached in-process.
+    Every write bumps a version counter, and a cheap version check before each read
+    invalidates the cache when any connection has changed the accounts.
+
+    Args:
+        db_path (Path): The path of the database file.
+        legacy_config_path (Path | None): The TOML file of `LocalConfigAccountRepository`.
+            If given and the database is empty, its account is imported as the default account.
+    """
+
+    def __init__(self, db_path: Path, legacy_config_path: Path | None = None) -> None:
+        self._db_path = db_path
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._local = threading.local()  # sqlite3 connections must not be shared across threads
+        self._cache_lock = threading.Lock()
+        self._cached_version: int | None = None
+        self._cached_accounts: dict[UUID, Account] = {}
+        self._cached_default_id: UUID | None = None
+
+        self._create_schema()
+        if legacy_config_path is not None and legacy_config_path.exists():
+            self._import_legacy_config(legacy_config_path)
+
+    def set(self, account: Account) -> None:
+        with self._transaction() as conn:
+            has_default = conn.execute("SELECT 1 FROM accounts WHERE is_default = 1").fetchone()
+            conn.execute(
+                """
+                INSERT INTO accounts (id, brokerage, config, is_default) VALUES (?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET brokerage = excluded.brokerage,
+                                              config = excluded.config
+                """,
+                (
+                    str(account.id),
+                    account.brokerage,
+                    account.model_dump_json(),
+                    0 if has_default else 1,
+                ),
+            )
+
+    def get(self, account_id: UUID | None = None) -> Account:
+        accounts, default_id = self._load()
+        if account_id is None:
+            if default_id is None:
+                raise InitializationError("account is not set. Please set account first")
+            account_id = default_id
+
+        account = accounts.get(account_id)
+        if account is None:
+            raise AccountNotFoundError(f"account {account_id} does not exist")
+
+        return account
+
+    def get_all(self) -> list[Account]:
+        accounts, _ = self._load()
+        return list(accounts.values())
+
+    def set_default(self, account_id: UUID) -> None:
+        with self._transaction() as conn:
+            exists = conn.execute(
+                "SELECT 1 FROM accounts WHERE id = ?", (str(account_id),)
+            ).fetchone()
+            if not exists:
+                raise AccountNotFoundError(f"account {account_id} does not exist")
+
+            conn.execute("UPDATE accounts SET is_default = 0 WHERE is_default = 1")
+            conn.execute("UPDATE accounts SET is_default = 1 WHERE id = ?", (str(account_id),))
+
+    def _load(self) -> tuple[dict[UUID, Account], UUID | None]:
+        conn = self._connection()
+        (version,) = conn.execute("SELECT version FROM meta").fetchone()
+
+        with self._cache_lock:
+            if version != self._cached_version:
+                rows = conn.execute(
+                    "SELECT id, brokerage, config, is_default FROM accounts ORDER BY rowid"
+                ).fetchall()
+                self._cached_accounts = {}
+                self._cached_default_id = None
+                for account_id, brokerage, config, is_default in rows:
+                    account_config = json.loads(config)
+                    account_config.pop("brokerage", None)
+                    account = AccountFactory.create(brokerage=brokerage, **account_config)
+                    self._cached_accounts[UUID(account_id)] = account
+                    if is_default:
+                        self._cached_default_id = account.id
+                self._cached_version = version
+
+            return self._cached_accounts, self._cached_default_id
+
+    def _connection(self) -> sqlite3.Connection:
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self._db_path, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")  # take the write lock up front to serialize writers
+        try:
+            yield conn
+            conn.execute("UPDATE meta SET version = version + 1")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def _create_schema(self) -> None:
+        conn = self._connection()
+        conn.executescript(
+            """
+            BEGIN IMMEDIATE;
+            CREATE TABLE IF NOT EXISTS accounts (
+                id TEXT PRIMARY KEY,
+                brokerage TEXT NOT NULL,
+                config TEXT NOT NULL,
+                is_default INTEGER NOT NULL DEFAULT 0,
+                created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+            );
+            CREATE UNIQUE INDEX IF NOT EXISTS accounts_default
+                ON accounts (is_default) WHERE is_default = 1;
+            CREATE TABLE IF NOT EXISTS meta (version INTEGER NOT NULL);
+            INSERT INTO meta (version) SELECT 0 WHERE NOT EXISTS (SELECT 1 FROM meta);
+            COMMIT;
+            """
+        )
+
+    def _import_legacy_config(self, legacy_config_path: Path) -> None:
+        if self.get_all():
+            return
+
+        try:
+            account = LocalConfigAccountRepository(legacy_config_path).get()
+        except InitializationError:
+            return
+
+        self.set(account)
@@ -0,0 +1,23 @@
+import abc
+import datetime
+
+from pyrb.models.history import DailyBar
+
+
+class DailyBarFetcher(abc.ABC):
+    @abc.abstractmethod
+    def fetch_daily_bars(
+        self, symbol: str, start: datetime.date, end: datetime.date
+    ) -> list[DailyBar]:
+        """
+        Fetches the daily bars of a symbol between the dates, both inclusive.
+
+        Args:
+            symbol (str): The symbol to fetch.
+            start (datetime.date): The first date.
+            end (datetime.date): The last date.
+
+        Returns:
+            list[DailyBar]: The bars in ascending order of date.
+        """
+        ...
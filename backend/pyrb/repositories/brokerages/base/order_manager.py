@@ -1,6 +1,7 @@
 import abc
+from collections.abc import Iterator
 
-from pyrb.models.order import Order
+from pyrb.models.order import Order, OrderFill
 
 
 class OrderManager(abc.ABC):
@@ -21,3 +22,22 @@ class OrderManager(abc.ABC):
             OrderPlacementError: If the order fails to place.
         """
         ...
+
+    def wait_for_fills(self, orders: list[Order], timeout: float) -> Iterator[OrderFill]:
+        """
+        Yields fills of the given (already placed) orders as soon as they are confirmed.
+        The iterator ends when every order is completely filled or the timeout expires.
+
+        The default implementation assumes that accepted orders are filled immediately at
+        the order price, which holds for brokerages without an execution inquiry.
+        Concrete classes should override this method when fills can be observed.
+
+        Args:
+            orders (list[Order]): The placed orders to wait for.
+            timeout (float): The maximum number of seconds to wait for fills.
+
+        Yields:
+            OrderFill: A (partial) fill of one of the given orders.
+        """
+        for order in orders:
+            yield OrderFill(order=order, quantity=order.quantity, price=order.price)
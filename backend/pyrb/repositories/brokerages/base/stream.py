@@ -0,0 +1,92 @@
+import abc
+
+from pyrb.models.order import OrderExecution
+from pyrb.models.price import CurrentPrice
+
+
+class QuoteStream(abc.ABC):
+    """
+    A connection to the real-time quote feed of a brokerage.
+    A quote stream is not thread-safe: all methods are called from the thread consuming it.
+    """
+
+    @abc.abstractmethod
+    def connect(self) -> None:
+        """
+        Opens the connection. Symbols subscribed over a previous connection are not
+        subscribed again.
+
+        Raises:
+            StreamDisconnectedError: If the connection cannot be opened.
+        """
+        ...
+
+    @abc.abstractmethod
+    def subscribe(self, symbols: list[str]) -> None:
+        """Starts receiving the trades of the given symbols."""
+        ...
+
+    @abc.abstractmethod
+    def unsubscribe(self, symbols: list[str]) -> None:
+        """Stops receiving the trades of the given symbols."""
+        ...
+
+    @abc.abstractmethod
+    def receive(self, timeout: float) -> CurrentPrice | None:
+        """
+        Waits for the next trade.
+
+        Args:
+            timeout (float): The maximum number of seconds to wait.
+
+        Returns:
+            CurrentPrice | None: The price of the trade, or None if no trade arrived in time.
+
+        Raises:
+            StreamDisconnectedError: If the connection is lost.
+        """
+        ...
+
+    @abc.abstractmethod
+    def close(self) -> None: ...
+
+
+class ExecutionStream(abc.ABC):
+    """
+    A connection to the real-time execution feed of the orders of an account.
+    An execution stream is not thread-safe: all methods are called from the thread consuming it.
+    """
+
+    @abc.abstractmethod
+    def connect(self) -> None:
+        """
+        Opens the connection and starts receiving the executions of the account. Executions
+        arriving before they are received are buffered by the connection.
+
+        Raises:
+            StreamDisconnectedError: If the connection cannot be opened.
+        """
+        ...
+
+    @property
+    @abc.abstractmethod
+    def connected(self) -> bool: ...
+
+    @abc.abstractmethod
+    def receive(self, timeout: float) -> OrderExecution | None:
+        """
+        Waits for the next execution of an order of the account.
+
+        Args:
+            timeout (float): The maximum number of seconds to wait.
+
+        Returns:
+            OrderExecution | None: The execution, or None if none arrived in time.
+
+        Raises:
+            StreamDisconnectedError: If the connection is lost.
+        """
+        ...
+
+    @abc.abstractmethod
+    def close(self) -> None: ...
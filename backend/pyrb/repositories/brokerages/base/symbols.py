@@ -0,0 +1,15 @@
+import abc
+
+from pyrb.models.symbol import SymbolInfo
+
+
+class SymbolListFetcher(abc.ABC):
+    @abc.abstractmethod
+    def fetch_symbols(self) -> list[SymbolInfo]:
+        """
+        Fetches the full listing of the securities traded through the brokerage.
+
+        Returns:
+            list[SymbolInfo]: Every listed security.
+        """
+        ...
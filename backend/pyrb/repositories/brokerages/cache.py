@@ -0,0 +1,64 @@
+import threading
+import time
+
+from pyrb.models.price import CurrentPrice
+from pyrb.repositories.brokerages.base.fetcher import PriceFetcher
+
+
+class PriceCache:
+    """
+    A thread-safe cache of current prices that can be shared by several price fetchers,
+    e.g. by the contexts of several accounts.
+
+    Args:
+        ttl (float): The number of seconds a cached price stays valid.
+    """
+
+    def __init__(self, ttl: float = 5.0) -> None:
+        self._ttl = ttl
+        self._prices: dict[str, tuple[CurrentPrice, float]] = {}
+        self._lock = threading.Lock()
+
+    def get_many(self, symbols: list[str]) -> dict[str, CurrentPrice]:
+        """Returns the valid cached prices of the given symbols. Missing symbols are omitted."""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                symbol: cached[0]
+                for symbol in symbols
+                if (cached := self._prices.get(symbol)) is not None and now - cached[1] <= self._ttl
+            }
+
+    def put_many(self, prices: dict[str, CurrentPrice]) -> None:
+        now = time.monotonic()
+        with self._lock:
+            for symbol, price in prices.items():
+                self._prices[symbol] = (price, now)
+
+
+class CachedPriceFetcher(PriceFetcher):
+    """
+    A price fetcher serving prices from a `PriceCache`.
+    Only the symbols missing from the cache are fetched, in a single request.
+
+    Args:
+        price_fetcher (PriceFetcher): The fetcher used for cache misses.
+        price_cache (PriceCache): The (possibly shared) cache.
+    """
+
+    def __init__(self, price_fetcher: PriceFetcher, price_cache: PriceCache) -> None:
+        self._price_fetcher = price_fetcher
+        self._price_cache = price_cache
+
+    def get_current_price(self, symbol: str) -> CurrentPrice:
+        return self.get_current_prices([symbol])[symbol]
+
+    def get_current_prices(self, symbols: list[str]) -> dict[str, CurrentPrice]:
+        prices = self._price_cache.get_many(symbols)
+        missing_symbols = [symbol for symbol in symbols if symbol not in prices]
+        if missing_symbols:
+            fetched_prices = self._price_fetcher.get_current_prices(missing_symbols)
+            self._price_cache.put_many(fetched_prices)
+            prices |= fetched_prices
+
+        return prices
@@ -1,13 +1,20 @@
 from pyrb.models.account import Account
 from pyrb.repositories.brokerages.base.fetcher import PriceFetcher
+from pyrb.repositories.brokerages.base.history import DailyBarFetcher
 from pyrb.repositories.brokerages.base.order_manager import OrderManager
 from pyrb.repositories.brokerages.base.portfolio import Portfolio
+from pyrb.repositories.brokerages.base.symbols import SymbolListFetcher
 from pyrb.repositories.brokerages.factory import (
     BrokerageAPIClientFactory,
+    DailyBarFetcherFactory,
     OrderManagerFactory,
     PortfolioFactory,
     PriceFetcherFactory,
+    QuoteStreamFactory,
+    SymbolListFetcherFactory,
 )
+from pyrb.repositories.brokerages.stream import StreamingPriceFetcher
+from pyrb.repositories.symbol_master import get_symbol_master
 
 
 class RebalanceContext:
@@ -34,9 +41,31 @@ class RebalanceContext:
 def create_rebalance_context(account: Account) -> RebalanceContext:
     brokerage_api_client = BrokerageAPIClientFactory().create(account)
 
-    portfolio = PortfolioFactory().create(brokerage_api_client)
+    # 종목 마스터는 하드코딩되지 않은 종목의 자산군을 분류합니다.
+    portfolio = PortfolioFactory().create(brokerage_api_client, get_symbol_master())
     price_fetcher = PriceFetcherFactory().create(brokerage_api_client)
     order_manager = OrderManagerFactory().create(brokerage_api_client)
 
     rebalance_context = RebalanceContext(portfolio, price_fetcher, order_manager)
     return rebalance_context
+
+
+def create_streaming_price_fetcher(account: Account) -> StreamingPriceFetcher:
+    """Creates a price fetcher backed by the real-time quote stream. It is not started yet."""
+    brokerage_api_client = BrokerageAPIClientFactory().create(account)
+
+    # 종목 마스터의 시장구분으로 코스피/코스닥 실시간 체결 TR 을 고릅니다.
+    quote_stream = QuoteStreamFactory().create(brokerage_api_client, get_symbol_master())
+    price_fetcher = PriceFetcherFactory().create(brokerage_api_client)
+
+    return StreamingPriceFetcher(quote_stream, price_fetcher)
+
+
+def create_symbol_list_fetcher(account: Account) -> SymbolListFetcher:
+    brokerage_api_client = BrokerageAPIClientFactory().create(account)
+    return SymbolListFetcherFactory().create(brokerage_api_client)
+
+
+def create_daily_bar_fetcher(account: Account) -> DailyBarFetcher:
+    brokerage_api_client = BrokerageAPIClientFactory().create(account)
+    return DailyBarFetcherFactory().create(brokerage_api_client)
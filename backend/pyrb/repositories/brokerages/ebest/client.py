@@ -13,12 +13,20 @@ class EbestAPIClient(BrokerageAPIClient):
     def __init__(self, account: EbestAccount) -> None:
         self._account = account
 
-        self._access_token = self._issue_access_token()
+        # 토큰은 첫 요청 시점에 발급합니다.
+        # 캐시된 결과만 사용하는 경우 네트워크 요청이 발생하지 않습니다.
+        self._access_token: str | None = None
+
+    @property
+    def access_token(self) -> str:
+        if self._access_token is None:
+            self._access_token = self._issue_access_token()
+        return self._access_token
 
     def send_request(self, method: str, path: str, **kwargs: Any) -> Response:
         URL = f"{self.BASE_URL}/{path}"
         headers = kwargs.get("headers", {})
-        headers["authorization"] = f"Bearer {self._access_token}"
+        headers["authorization"] = f"Bearer {self.access_token}"
         kwargs["headers"] = headers
 
         response = requests.request(method, URL, **kwargs)
@@ -0,0 +1,67 @@
+import datetime
+
+from pyrb.models.history import DailyBar
+from pyrb.repositories.brokerages.base.history import DailyBarFetcher
+from pyrb.repositories.brokerages.ebest.client import EbestAPIClient
+from pyrb.repositories.brokerages.rate_limit import RateLimiter
+
+CHART_TR_RATE = 1.0  # t8410 의 초당 전송 한도
+CHART_PAGE_SIZE = 500  # 한 번에 조회할 봉 수 (최대 500)
+
+
+class EbestDailyBarFetcher(DailyBarFetcher):
+    def __init__(self, api_client: EbestAPIClient) -> None:
+        self._api_client = api_client
+        self._rate_limiter = RateLimiter(CHART_TR_RATE)
+
+    def fetch_daily_bars(
+        self, symbol: str, start: datetime.date, end: datetime.date
+    ) -> list[DailyBar]:
+        path = "stock/chart"
+        content_type = "application/json; charset=UTF-8"
+
+        bars_by_date: dict[datetime.date, DailyBar] = {}
+        tr_cont, tr_cont_key, cts_date = "N", "", ""
+        while True:
+            headers = {
+                "content-type": content_type,
+                "tr_cd": "t8410",
+                "tr_cont": tr_cont,
+                "tr_cont_key": tr_cont_key,
+            }
+            body = {
+                "t8410InBlock": {
+                    "shcode": symbol,  # 종목코드
+                    "gubun": "2",  # 2: 일, 3: 주, 4: 월, 5: 년
+                    "qrycnt": CHART_PAGE_SIZE,
+                    "sdate": start.strftime("%Y%m%d"),
+                    "edate": end.strftime("%Y%m%d"),
+                    "cts_date": cts_date,  # 연속조회 일자
+                    "comp_yn": "N",  # 압축 여부
+                    "sujung": "Y",  # 수정주가 여부
+                }
+            }
+
+            self._rate_limiter.acquire()
+            response = self._api_client.send_request("POST", path, headers=headers, json=body)
+
+            res = response.json()
+            for item in res.get("t8410OutBlock1", []):
+                bar = DailyBar(
+                    date=datetime.datetime.strptime(item["date"], "%Y%m%d").date(),
+                    open=item["open"],
+                    high=item["high"],
+                    low=item["low"],
+                    close=item["close"],
+                    volume=item["jdiff_vol"],
+                )
+                bars_by_date[bar.date] = bar
+
+            # 연속 데이터가 있으면 응답 헤더의 연속키와 연속일자로 다음 페이지를 조회합니다.
+            cts_date = res.get("t8410OutBlock", {}).get("cts_date", "").strip()
+            if response.headers.get("tr_cont") != "Y" or not cts_date:
+                break
+
+            tr_cont, tr_cont_key = "Y", response.headers.get("tr_cont_key", "")
+
+        return [bars_by_date[date] for date in sorted(bars_by_date)]
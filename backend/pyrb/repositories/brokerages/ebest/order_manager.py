@@ -1,13 +1,34 @@
+import datetime
+import logging
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+
 from requests import HTTPError
 
 from pyrb.enums import OrderType
-from pyrb.exceptions import OrderPlacementError
-from pyrb.models.order import Order
+from pyrb.exceptions import OrderPlacementError, StreamDisconnectedError
+from pyrb.models.order import Order, OrderExecution, OrderFill
 from pyrb.repositories.brokerages.base.order_manager import OrderManager
+from pyrb.repositories.brokerages.base.stream import ExecutionStream
 from pyrb.repositories.brokerages.ebest.client import EbestAPIClient
 
+logger = logging.getLogger(__name__)
+
 
 class EbestOrderManager(OrderManager):
+    """
+    Places orders through the eBest REST API and waits for their fills on the real-time
+    execution feed (SC1). The feed is connected before the first order is placed, so no
+    execution of a placed order is missed. Without the feed, or after it is lost, the
+    fills are polled with the execution inquiry (t0425) instead.
+
+    Args:
+        api_client (EbestAPIClient): The client of the eBest API.
+        execution_stream (ExecutionStream | None): The real-time execution feed, or None
+            to always poll the fills.
+    """
+
     _order_type_mapping: dict[OrderType, str] = {
         OrderType.LIMIT: "00",
         OrderType.MARKET: "03",
@@ -19,10 +40,20 @@ class EbestOrderManager(OrderManager):
         OrderType.AFTER_HOURS_SINGLE: "82",
     }
 
-    def __init__(self, api_client: EbestAPIClient) -> None:
+    FILL_POLL_INTERVAL = 0.5  # 실시간 체결을 수신하지 못할 때의 체결 조회 주기(초)
+
+    def __init__(
+        self, api_client: EbestAPIClient, execution_stream: ExecutionStream | None = None
+    ) -> None:
         self._api_client = api_client
+        self._execution_stream = execution_stream
+        # 주문번호별 (주문, 주문일). 주문번호는 매일 새로 매겨지므로 주문일을 함께 기록합니다.
+        self._placed_orders: dict[str, tuple[Order, datetime.date]] = {}
+        # 체결을 기다리지 않는 동안 수신한 주문번호별 체결
+        self._unclaimed_executions: defaultdict[str, list[OrderExecution]] = defaultdict(list)
 
     def place_order(self, order: Order) -> None:
+        self._connect_execution_stream()
         path = "stock/order"
         content_type = "application/json; charset=UTF-8"
 
@@ -46,3 +77,142 @@ class EbestOrderManager(OrderManager):
                 raise OrderPlacementError(resp)
         except HTTPError as e:
             raise OrderPlacementError(e) from e
+
+        today = datetime.date.today()
+        # 지난 주문일의 주문은 더 이상 체결 조회 대상이 아니므로 정리합니다.
+        self._placed_orders = {
+            order_number: placed
+            for order_number, placed in self._placed_orders.items()
+            if placed[1] == today
+        }
+        for order_number in self._unclaimed_executions.keys() - self._placed_orders.keys():
+            del self._unclaimed_executions[order_number]
+        self._placed_orders[str(resp["CSPAT00601OutBlock2"]["OrdNo"])] = (order, today)
+
+    def wait_for_fills(self, orders: list[Order], timeout: float) -> Iterator[OrderFill]:
+        """
+        Yields the fills of the orders as their executions arrive on the real-time feed,
+        falling back to polling the execution inquiry if the feed is not connected.
+        """
+        pending = {
+            order_number: order
+            for order_number, (placed, _) in self._placed_orders.items()
+            for order in orders
+            if placed is order
+        }
+        filled_quantity = dict.fromkeys(pending, 0)
+        deadline = time.monotonic() + timeout
+
+        for execution in self._receive_executions(filled_quantity, deadline):
+            order = pending.get(execution.order_number)
+            if order is None:
+                # 다른 호출에서 기다리는 주문의 체결은 그때 전달합니다.
+                if execution.order_number in self._placed_orders:
+                    self._unclaimed_executions[execution.order_number].append(execution)
+                continue
+
+            filled_quantity[execution.order_number] += execution.quantity
+            yield OrderFill(order=order, quantity=execution.quantity, price=execution.price)
+            if filled_quantity[execution.order_number] >= order.quantity:
+                # 전량 체결된 주문은 더 기다릴 필요가 없으므로 기록에서 제거합니다.
+                del pending[execution.order_number]
+                self._placed_orders.pop(execution.order_number, None)
+            if not pending:
+                return
+
+    def _receive_executions(
+        self, filled_quantity: dict[str, int], deadline: float
+    ) -> Iterator[OrderExecution]:
+        for order_number in filled_quantity:
+            yield from self._unclaimed_executions.pop(order_number, [])
+
+        stream = self._execution_stream
+        if stream is not None and stream.connected:
+            try:
+                while (remaining := deadline - time.monotonic()) > 0:
+                    execution = stream.receive(timeout=remaining)
+                    if execution is not None:
+                        yield execution
+                return
+            except StreamDisconnectedError:
+                # 연결이 끊긴 동안의 체결은 체결 조회로 확인합니다.
+                logger.warning("The execution stream was lost, polling the fills", exc_info=True)
+                stream.close()
+
+        yield from self._poll_executions(filled_quantity, deadline)
+
+    def _poll_executions(
+        self, filled_quantity: dict[str, int], deadline: float
+    ) -> Iterator[OrderExecution]:
+        """Polls the execution inquiry and yields what was executed beyond `filled_quantity`."""
+        while True:
+            executions = self._fetch_executions()
+            self._prune_filled_orders(executions)
+            for order_number, reported_quantity in list(filled_quantity.items()):
+                executed_quantity, executed_price = executions.get(order_number, (0, 0))
+                if executed_quantity > reported_quantity:
+                    yield OrderExecution(
+                        order_number=order_number,
+                        quantity=executed_quantity - reported_quantity,
+                        price=executed_price,
+                    )
+
+            if time.monotonic() >= deadline:
+                return
+            time.sleep(self.FILL_POLL_INTERVAL)
+
+    def _connect_execution_stream(self) -> None:
+        stream = self._execution_stream
+        if stream is None or stream.connected:
+            return
+
+        try:
+            stream.connect()
+        except StreamDisconnectedError:
+            # 실시간 체결을 수신하지 못하면 체결 조회로 대신합니다.
+            logger.warning("Failed to connect the execution stream", exc_info=True)
+
+    def _prune_filled_orders(self, executions: dict[str, tuple[int, int]]) -> None:
+        """전량 체결된 주문은 더 기다릴 필요가 없으므로 기록에서 제거합니다."""
+        for order_number, (order, _) in list(self._placed_orders.items()):
+            if executions.get(order_number, (0, 0))[0] >= order.quantity:
+                del self._placed_orders[order_number]
+
+    def _fetch_executions(self) -> dict[str, tuple[int, int]]:
+        """주식 체결/미체결 TR(t0425)을 조회하여 주문번호별 (체결수량, 체결가격)을 반환합니다."""
+        path = "stock/accno"
+        content_type = "application/json; charset=UTF-8"
+
+        executions: dict[str, tuple[int, int]] = {}
+        tr_cont, tr_cont_key, cts_ordno = "N", "", ""
+        while True:
+            headers = {
+                "content-type": content_type,
+                "tr_cd": "t0425",
+                "tr_cont": tr_cont,
+                "tr_cont_key": tr_cont_key,
+            }
+            body = {
+                "t0425InBlock": {
+                    "expcode": "",
+                    "chegb": "1",  # 체결
+                    "medosu": "0",  # 전체
+                    "sortgb": "1",
+                    "cts_ordno": cts_ordno,  # 연속조회 주문번호
+                }
+            }
+
+            response = self._api_client.send_request("POST", path, headers=headers, json=body)
+
+            res = response.json()
+            for item in res.get("t0425OutBlock1", []):
+                executions[str(item["ordno"])] = (int(item["cheqty"]), int(item["cheprice"]))
+
+            # 연속 데이터가 있으면 응답 헤더의 연속키와 연속 주문번호로 다음 페이지를 조회합니다.
+            cts_ordno = str(res.get("t0425OutBlock", {}).get("cts_ordno", "")).strip()
+            if response.headers.get("tr_cont") != "Y" or not cts_ordno:
+                break
+
+            tr_cont, tr_cont_key = "Y", response.headers.get("tr_cont_key", "")
+
+        return executions
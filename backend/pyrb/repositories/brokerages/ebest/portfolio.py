@@ -2,18 +2,36 @@ import datetime
 from typing import Any
 from zoneinfo import ZoneInfo
 
-from pydantic import AwareDatetime, NonNegativeFloat
+from pydantic import AwareDatetime, NonNegativeFloat, TypeAdapter
 
+from pyrb.enums import AssetClassEnum
 from pyrb.models.portfolio import PortfolioReturn
-from pyrb.models.position import Asset, Position
+from pyrb.models.position import Position, asset_class_by_symbols
 from pyrb.repositories.brokerages.base.portfolio import Portfolio
 from pyrb.repositories.brokerages.ebest.client import EbestAPIClient
+from pyrb.repositories.symbol_master import SymbolMaster
+
+# 포지션 목록을 한 번의 호출로 검증합니다. 모델마다 생성자를 호출하는 것보다 빠릅니다.
+positions_adapter: TypeAdapter[list[Position]] = TypeAdapter(list[Position])
 
 
 class EbestPortfolio(Portfolio):
-    def __init__(self, api_client: EbestAPIClient) -> None:
+    """
+    The portfolio of an eBest account.
+
+    Args:
+        api_client (EbestAPIClient): The client of the account.
+        symbol_master (SymbolMaster | None): Classifies the symbols that are not in the
+            hard-coded asset classes. Without it, such symbols are classified as OTHER.
+    """
+
+    def __init__(
+        self, api_client: EbestAPIClient, symbol_master: SymbolMaster | None = None
+    ) -> None:
         self._api_client = api_client
+        self._symbol_master = symbol_master
         self._serialized_portfolio: dict[str, Any] | None = None
+        self._parsed_positions: dict[str, Position] | None = None
 
     @property
     def total_value(self) -> NonNegativeFloat:
@@ -25,24 +43,11 @@ class EbestPortfolio(Portfolio):
 
     @property
     def positions(self) -> list[Position]:
-        positions = [
-            Position(
-                asset=Asset(symbol=item["expcode"], label=item["hname"]),
-                quantity=item["janqty"],
-                sellable_quantity=item["mdposqt"],
-                average_buy_price=item["pamt"],
-                total_amount=item["appamt"],
-                rtn=float(item["sunikrt"]) / 100,
-                profit=item["dtsunik"],
-            )
-            for item in self.serialized_portfolio["t0424OutBlock1"]
-        ]
-
-        return positions
+        return list(self._positions_by_symbol.values())
 
     @property
     def holding_symbols(self) -> list[str]:
-        return [position.asset.symbol for position in self.positions]
+        return list(self._positions_by_symbol)
 
     @property
     def serialized_portfolio(self) -> dict[str, Any]:
@@ -51,9 +56,7 @@ class EbestPortfolio(Portfolio):
         return self._serialized_portfolio
 
     def get_position(self, symbol: str) -> Position | None:
-        return next(
-            (position for position in self.positions if position.asset.symbol == symbol), None
-        )
+        return self._positions_by_symbol.get(symbol)
 
     def get_position_amount(self, symbol: str) -> NonNegativeFloat:
         position = self.get_position(symbol)
@@ -90,6 +93,41 @@ class EbestPortfolio(Portfolio):
 
     def refresh(self) -> None:
         self._serialized_portfolio = self._fetch_portfolio()
+        self._parsed_positions = None
+
+    @property
+    def _positions_by_symbol(self) -> dict[str, Position]:
+        # 응답은 조회할 때마다 한 번만 파싱하여 종목코드로 색인해 둡니다.
+        if self._parsed_positions is None:
+            positions = positions_adapter.validate_python([
+                self._to_position_data(item) for item in self.serialized_portfolio["t0424OutBlock1"]
+            ])
+            self._parsed_positions = {position.asset.symbol: position for position in positions}
+        return self._parsed_positions
+
+    def _to_position_data(self, item: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "asset": {
+                "symbol": item["expcode"],
+                "label": item["hname"],
+                "asset_class": self._classify(item["expcode"]),
+            },
+            "quantity": item["janqty"],
+            "sellable_quantity": item["mdposqt"],
+            "average_buy_price": item["pamt"],
+            "total_amount": item["appamt"],
+            "rtn": float(item["sunikrt"]) / 100,
+            "profit": item["dtsunik"],
+        }
+
+    def _classify(self, symbol: str) -> AssetClassEnum:
+        # 하드코딩된 자산군이 종목명으로 분류한 종목 마스터의 자산군보다 우선합니다.
+        if symbol in asset_class_by_symbols:
+            return asset_class_by_symbols[symbol]
+
+        symbol_master = self._symbol_master
+        asset_class = symbol_master.get_asset_class(symbol) if symbol_master is not None else None
+        return asset_class or AssetClassEnum.OTHER
 
     def _fetch_portfolio(self) -> dict[str, Any]:
         asset_balance = self._fetch_assets_balance()
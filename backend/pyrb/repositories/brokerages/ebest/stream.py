@@ -0,0 +1,130 @@
+import json
+from typing import Any
+
+from websockets.exceptions import ConnectionClosed, WebSocketException
+from websockets.sync.client import ClientConnection, connect
+
+from pyrb.enums import Market
+from pyrb.exceptions import StreamDisconnectedError
+from pyrb.models.order import OrderExecution
+from pyrb.models.price import CurrentPrice
+from pyrb.repositories.brokerages.base.stream import ExecutionStream, QuoteStream
+from pyrb.repositories.brokerages.ebest.client import EbestAPIClient
+from pyrb.repositories.symbol_master import SymbolMaster
+
+
+class _EbestWebSocket:
+    """The websocket connection shared by the real-time feeds of eBest."""
+
+    WEBSOCKET_URL = "wss://openapi.ebestsec.co.kr:9443/websocket"
+
+    def __init__(self, api_client: EbestAPIClient) -> None:
+        self._api_client = api_client
+        self._connection: ClientConnection | None = None
+
+    def connect(self) -> None:
+        self.close()
+        try:
+            self._connection = connect(self.WEBSOCKET_URL)
+        except (OSError, WebSocketException) as e:
+            raise StreamDisconnectedError(f"Failed to connect to the stream: {e}") from e
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _receive(self, timeout: float) -> dict[str, Any] | None:
+        """Returns the next message with a body, or None on a timeout or a reply to a request."""
+        connection = self._get_connection()
+        try:
+            message = connection.recv(timeout=timeout)
+        except TimeoutError:
+            return None
+        except ConnectionClosed as e:
+            raise StreamDisconnectedError(f"The stream was closed: {e}") from e
+
+        data: dict[str, Any] = json.loads(message)
+        if not data.get("body"):  # 등록/해제 요청에 대한 응답
+            return None
+        return data
+
+    def _send(self, tr_type: str, tr_cd: str, tr_key: str) -> None:
+        message = {
+            "header": {"token": self._api_client.access_token, "tr_type": tr_type},
+            "body": {"tr_cd": tr_cd, "tr_key": tr_key},
+        }
+        try:
+            self._get_connection().send(json.dumps(message))
+        except ConnectionClosed as e:
+            raise StreamDisconnectedError(f"The stream was closed: {e}") from e
+
+    def _get_connection(self) -> ClientConnection:
+        if self._connection is None:
+            raise StreamDisconnectedError("The stream is not connected")
+        return self._connection
+
+
+class EbestQuoteStream(_EbestWebSocket, QuoteStream):
+    """
+    The real-time trades of eBest. The trades of a symbol are sent by the TR of its market,
+    which is looked up in the symbol master. Symbols missing from the master are assumed
+    to be listed on KOSPI, like every ETF.
+
+    Args:
+        api_client (EbestAPIClient): The client of the eBest API.
+        symbol_master (SymbolMaster | None): The master to look up the market of a symbol.
+    """
+
+    # 시장별 실시간 체결 TR. 코스피 상장 종목과 ETF 는 S3_, 코스닥 상장 종목은 K3_ 로 수신합니다.
+    TR_CODES: dict[Market, str] = {Market.KOSPI: "S3_", Market.KOSDAQ: "K3_"}
+
+    def __init__(
+        self, api_client: EbestAPIClient, symbol_master: SymbolMaster | None = None
+    ) -> None:
+        super().__init__(api_client)
+        self._symbol_master = symbol_master
+
+    def subscribe(self, symbols: list[str]) -> None:
+        for symbol in symbols:
+            self._send(tr_type="3", tr_cd=self._tr_code(symbol), tr_key=symbol)  # 실시간 시세 등록
+
+    def unsubscribe(self, symbols: list[str]) -> None:
+        for symbol in symbols:
+            self._send(tr_type="4", tr_cd=self._tr_code(symbol), tr_key=symbol)  # 실시간 시세 해제
+
+    def receive(self, timeout: float) -> CurrentPrice | None:
+        data = self._receive(timeout)
+        if data is None:
+            return None
+
+        return CurrentPrice(symbol=data["header"]["tr_key"], price=int(data["body"]["price"]))
+
+    def _tr_code(self, symbol: str) -> str:
+        info = self._symbol_master.get(symbol) if self._symbol_master is not None else None
+        return self.TR_CODES[info.market if info is not None else Market.KOSPI]
+
+
+class EbestExecutionStream(_EbestWebSocket, ExecutionStream):
+    # 주식 주문체결 TR. 계좌 단위로 등록하며, 접속한 계좌의 모든 체결을 수신합니다.
+    TR_CODE = "SC1"
+
+    @property
+    def connected(self) -> bool:
+        return self._connection is not None
+
+    def connect(self) -> None:
+        super().connect()
+        self._send(tr_type="1", tr_cd=self.TR_CODE, tr_key="")  # 계좌 실시간 등록
+
+    def receive(self, timeout: float) -> OrderExecution | None:
+        data = self._receive(timeout)
+        if data is None or data["header"].get("tr_cd") != self.TR_CODE:
+            return None
+
+        body = data["body"]
+        return OrderExecution(
+            order_number=str(int(body["ordno"])),
+            quantity=int(body["execqty"]),
+            price=int(body["execprc"]),
+        )
@@ -0,0 +1,34 @@
+from pyrb.enums import Market
+from pyrb.models.symbol import SymbolInfo, classify_by_name, krx_tick_size
+from pyrb.repositories.brokerages.base.symbols import SymbolListFetcher
+from pyrb.repositories.brokerages.ebest.client import EbestAPIClient
+
+
+class EbestSymbolListFetcher(SymbolListFetcher):
+    def __init__(self, api_client: EbestAPIClient) -> None:
+        self._api_client = api_client
+
+    def fetch_symbols(self) -> list[SymbolInfo]:
+        path = "stock/etc"
+        content_type = "application/json; charset=UTF-8"
+
+        headers = {"content-type": content_type, "tr_cd": "t8436", "tr_cont": "N"}
+        body = {"t8436InBlock": {"gubun": "0"}}  # 0: 전체, 1: 코스피, 2: 코스닥
+
+        response = self._api_client.send_request("POST", path, headers=headers, json=body)
+
+        symbols = []
+        for item in response.json()["t8436OutBlock"]:
+            is_etf = item["etfgubun"] in ("1", "2")  # 1: ETF, 2: ETN
+            symbols.append(
+                SymbolInfo(
+                    symbol=item["shcode"],
+                    name=item["hname"],
+                    market=Market.KOSPI if item["gubun"] == "1" else Market.KOSDAQ,
+                    asset_class=classify_by_name(item["hname"], is_etf),
+                    is_etf=is_etf,
+                    tick_size=krx_tick_size(int(item["jnilclose"]), is_etf),
+                )
+            )
+
+        return symbols
@@ -1,12 +1,19 @@
 from pyrb.models.account import Account, EbestAccount
 from pyrb.repositories.brokerages.base.client import BrokerageAPIClient
 from pyrb.repositories.brokerages.base.fetcher import PriceFetcher
+from pyrb.repositories.brokerages.base.history import DailyBarFetcher
 from pyrb.repositories.brokerages.base.order_manager import OrderManager
 from pyrb.repositories.brokerages.base.portfolio import Portfolio
+from pyrb.repositories.brokerages.base.stream import QuoteStream
+from pyrb.repositories.brokerages.base.symbols import SymbolListFetcher
 from pyrb.repositories.brokerages.ebest.client import EbestAPIClient
 from pyrb.repositories.brokerages.ebest.fetcher import EbestPriceFetcher
+from pyrb.repositories.brokerages.ebest.history import EbestDailyBarFetcher
 from pyrb.repositories.brokerages.ebest.order_manager import EbestOrderManager
 from pyrb.repositories.brokerages.ebest.portfolio import EbestPortfolio
+from pyrb.repositories.brokerages.ebest.stream import EbestExecutionStream, EbestQuoteStream
+from pyrb.repositories.brokerages.ebest.symbols import EbestSymbolListFetcher
+from pyrb.repositories.symbol_master import SymbolMaster
 
 
 class BrokerageAPIClientFactory:
@@ -23,10 +30,12 @@ class BrokerageAPIClientFactory:
 class PortfolioFactory:
     def __init__(self) -> None: ...
 
-    def create(self, brokerage_api_client: BrokerageAPIClient) -> Portfolio:
+    def create(
+        self, brokerage_api_client: BrokerageAPIClient, symbol_master: SymbolMaster | None = None
+    ) -> Portfolio:
         match brokerage_api_client:
             case EbestAPIClient():
-                return EbestPortfolio(brokerage_api_client)
+                return EbestPortfolio(brokerage_api_client, symbol_master)
             case _:
                 raise NotImplementedError(f"Unsupported BrokerageAPIClient: {brokerage_api_client}")
 
@@ -48,6 +57,43 @@ class OrderManagerFactory:
     def create(self, brokerage_api_client: BrokerageAPIClient) -> OrderManager:
         match brokerage_api_client:
             case EbestAPIClient():
-                return EbestOrderManager(brokerage_api_client)
+                return EbestOrderManager(
+                    brokerage_api_client, EbestExecutionStream(brokerage_api_client)
+                )
+            case _:
+                raise NotImplementedError(f"Unsupported BrokerageAPIClient: {brokerage_api_client}")
+
+
+class QuoteStreamFactory:
+    def __init__(self) -> None: ...
+
+    def create(
+        self, brokerage_api_client: BrokerageAPIClient, symbol_master: SymbolMaster | None = None
+    ) -> QuoteStream:
+        match brokerage_api_client:
+            case EbestAPIClient():
+                return EbestQuoteStream(brokerage_api_client, symbol_master)
+            case _:
+                raise NotImplementedError(f"Unsupported BrokerageAPIClient: {brokerage_api_client}")
+
+
+class SymbolListFetcherFactory:
+    def __init__(self) -> None: ...
+
+    def create(self, brokerage_api_client: BrokerageAPIClient) -> SymbolListFetcher:
+        match brokerage_api_client:
+            case EbestAPIClient():
+                return EbestSymbolListFetcher(brokerage_api_client)
+            case _:
+                raise NotImplementedError(f"Unsupported BrokerageAPIClient: {brokerage_api_client}")
+
+
+class DailyBarFetcherFactory:
+    def __init__(self) -> None: ...
+
+    def create(self, brokerage_api_client: BrokerageAPIClient) -> DailyBarFetcher:
+        match brokerage_api_client:
+            case EbestAPIClient():
+                return EbestDailyBarFetcher(brokerage_api_client)
             case _:
                 raise NotImplementedError(f"Unsupported BrokerageAPIClient: {brokerage_api_client}")
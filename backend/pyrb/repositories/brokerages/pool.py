@@ -0,0 +1,109 @@
+import threading
+import time
+from collections.abc import Callable, Iterator
+from uuid import UUID
+
+from pyrb.models.account import Account
+from pyrb.models.order import Order, OrderFill
+from pyrb.repositories.brokerages.base.order_manager import OrderManager
+from pyrb.repositories.brokerages.cache import CachedPriceFetcher, PriceCache
+from pyrb.repositories.brokerages.context import RebalanceContext
+
+
+class ContextPool:
+    """
+    Keeps a warm `RebalanceContext` per account for a long-running process, so that
+    requests reuse the issued access token, the cached prices and the portfolio snapshot
+    instead of building them from scratch.
+
+    The portfolio snapshot of an account is refreshed when it is older than `snapshot_ttl`
+    seconds, and after any order is placed through the context. Prices are cached for
+    `price_ttl` seconds in a cache shared by every account.
+
+    Args:
+        context_factory (Callable[[Account], RebalanceContext]): Creates the context of
+            an account.
+        snapshot_ttl (float): The number of seconds a portfolio snapshot stays valid.
+        price_ttl (float): The number of seconds a cached price stays valid.
+    """
+
+    def __init__(
+        self,
+        context_factory: Callable[[Account], RebalanceContext],
+        snapshot_ttl: float = 5.0,
+        price_ttl: float = 2.0,
+    ) -> None:
+        self._context_factory = context_factory
+        self._snapshot_ttl = snapshot_ttl
+        self._price_cache = PriceCache(ttl=price_ttl)
+        self._contexts: dict[UUID, RebalanceContext] = {}
+        self._loaded_at: dict[UUID, float] = {}
+        self._invalidations: dict[UUID, int] = {}  # 계좌별 invalidate 호출 횟수
+        self._account_locks: dict[UUID, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get(self, account: Account) -> RebalanceContext:
+        """Returns the context of the account, refreshing its portfolio if it is stale."""
+        with self._lock:
+            account_lock = self._account_locks.setdefault(account.id, threading.Lock())
+
+        # 토큰 발급과 포트폴리오 조회는 계좌별 잠금 안에서 하므로, 느린 계좌가 다른 계좌의
+        # 요청을 막지 않습니다.
+        with account_lock:
+            with self._lock:
+                now = time.monotonic()
+                context = self._contexts.get(account.id)
+                stale = context is None or now - self._loaded_at[account.id] > self._snapshot_ttl
+                invalidations = self._invalidations.get(account.id, 0)
+
+            if not stale and context is not None:
+                return context
+
+            if context is None:
+                # 새로 만든 컨텍스트의 포트폴리오는 처음 조회할 때 불러옵니다.
+                context = self._create(account)
+            else:
+                context.portfolio.refresh()
+
+            with self._lock:
+                self._contexts[account.id] = context
+                # 불러오는 도중 주문이 나갔다면 다음 조회에서 다시 불러옵니다.
+                if self._invalidations.get(account.id, 0) == invalidations:
+                    self._loaded_at[account.id] = now
+                else:
+                    self._loaded_at[account.id] = float("-inf")
+
+            return context
+
+    def invalidate(self, account_id: UUID) -> None:
+        """Makes the next `get` refresh the portfolio, e.g. after orders were placed."""
+        with self._lock:
+            self._invalidations[account_id] = self._invalidations.get(account_id, 0) + 1
+            if account_id in self._loaded_at:
+                self._loaded_at[account_id] = float("-inf")
+
+    def _create(self, account: Account) -> RebalanceContext:
+        context = self._context_factory(account)
+        return RebalanceContext(
+            context.portfolio,
+            CachedPriceFetcher(context.price_fetcher, self._price_cache),
+            _InvalidatingOrderManager(context.order_manager, lambda: self.invalidate(account.id)),
+        )
+
+
+class _InvalidatingOrderManager(OrderManager):
+    """Invalidates the portfolio snapshot of the account after every order it places."""
+
+    def __init__(self, order_manager: OrderManager, invalidate: Callable[[], None]) -> None:
+        self._order_manager = order_manager
+        self._invalidate = invalidate
+
+    def place_order(self, order: Order) -> None:
+        try:
+            self._order_manager.place_order(order)
+        finally:
+            # 실패한 주문도 일부 반영되었을 수 있으므로 항상 다시 불러오게 합니다.
+            self._invalidate()
+
+    def wait_for_fills(self, orders: list[Order], timeout: float) -> Iterator[OrderFill]:
+        return self._order_manager.wait_for_fills(orders, timeout)
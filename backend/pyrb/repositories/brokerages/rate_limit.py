@@ -0,0 +1,62 @@
+import threading
+import time
+from collections.abc import Iterator
+
+from pyrb.models.order import Order, OrderFill
+from pyrb.repositories.brokerages.base.order_manager import OrderManager
+
+
+class RateLimiter:
+    """
+    A thread-safe token bucket. `acquire` blocks until a token is available.
+
+    Args:
+        rate (float): The number of tokens added per second.
+        burst (int): The maximum number of tokens in the bucket.
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._burst, self._tokens + (now - self._updated_at) * self._rate
+                )
+                self._updated_at = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                wait = (1 - self._tokens) / self._rate
+
+            time.sleep(wait)
+
+
+class RateLimitedOrderManager(OrderManager):
+    """
+    An order manager placing orders through a (possibly shared) `RateLimiter`, so that
+    the orders of several accounts stay within a global rate-limit budget.
+
+    Args:
+        order_manager (OrderManager): The order manager to place the orders with.
+        rate_limiter (RateLimiter): The rate limiter to acquire a token from per order.
+    """
+
+    def __init__(self, order_manager: OrderManager, rate_limiter: RateLimiter) -> None:
+        self._order_manager = order_manager
+        self._rate_limiter = rate_limiter
+
+    def place_order(self, order: Order) -> None:
+        self._rate_limiter.acquire()
+        self._order_manager.place_order(order)
+
+    def wait_for_fills(self, orders: list[Order], timeout: float) -> Iterator[OrderFill]:
+        return self._order_manager.wait_for_fills(orders, timeout)
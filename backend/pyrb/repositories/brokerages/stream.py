@@ -0,0 +1,193 @@
+import threading
+from collections.abc import Callable, Iterable
+
+from pyrb.models.price import CurrentPrice
+from pyrb.repositories.brokerages.base.fetcher import PriceFetcher
+from pyrb.repositories.brokerages.base.stream import QuoteStream
+
+PriceListener = Callable[[CurrentPrice], object]  # 반환값은 무시합니다.
+
+RECEIVE_TIMEOUT = 0.2  # 구독 변경 요청을 확인하는 주기(초)
+
+
+class PriceBoard:
+    """
+    A thread-safe in-memory board of the latest price of each symbol.
+    Listeners are called on every update, from the thread that updates the board.
+    """
+
+    def __init__(self) -> None:
+        self._prices: dict[str, CurrentPrice] = {}
+        self._listeners: list[PriceListener] = []
+        self._lock = threading.Lock()
+
+    def update(self, price: CurrentPrice) -> None:
+        with self._lock:
+            self._prices[price.symbol] = price
+            listeners = list(self._listeners)
+
+        for listener in listeners:
+            listener(price)
+
+    def update_many(self, prices: Iterable[CurrentPrice]) -> None:
+        for price in prices:
+            self.update(price)
+
+    def get_many(self, symbols: Iterable[str]) -> dict[str, CurrentPrice]:
+        """Returns the latest prices of the given symbols. Symbols without a price are omitted."""
+        with self._lock:
+            return {symbol: self._prices[symbol] for symbol in symbols if symbol in self._prices}
+
+    def add_listener(self, listener: PriceListener) -> None:
+        with self._lock:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: PriceListener) -> None:
+        with self._lock:
+            self._listeners.remove(listener)
+
+
+class StreamingPriceFetcher(PriceFetcher):
+    """
+    A price fetcher serving the prices of subscribed symbols from a `PriceBoard` kept up to
+    date by a real-time quote stream, without any network call.
+
+    The stream is consumed by a background thread. When the connection is lost, the thread
+    reconnects with an exponential backoff, subscribes every symbol again and back-fills
+    the board through the request/response price fetcher, so that trades missed during
+    the gap do not leave stale prices behind. While the stream is down, every price is
+    fetched through the request/response price fetcher.
+
+    Args:
+        quote_stream (QuoteStream): The real-time quote stream.
+        price_fetcher (PriceFetcher): The fetcher used for back-fills and unsubscribed symbols.
+        price_board (PriceBoard | None): The board to keep up to date.
+        auto_subscribe (bool): Whether to subscribe the symbols requested by
+            `get_current_prices`.
+        reconnect_delay (float): The number of seconds to wait before the first reconnect.
+        max_reconnect_delay (float): The maximum number of seconds to wait between reconnects.
+    """
+
+    def __init__(
+        self,
+        quote_stream: QuoteStream,
+        price_fetcher: PriceFetcher,
+        price_board: PriceBoard | None = None,
+        auto_subscribe: bool = True,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0,
+    ) -> None:
+        self._quote_stream = quote_stream
+        self._price_fetcher = price_fetcher
+        self._price_board = price_board or PriceBoard()
+        self._auto_subscribe = auto_subscribe
+        self._reconnect_delay = reconnect_delay
+        self._max_reconnect_delay = max_reconnect_delay
+
+        self._subscribed: set[str] = set()
+        self._pending: set[str] = set()  # 스트림 스레드가 아직 구독하지 않은 종목
+        self._lock = threading.Lock()
+        self._live = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.reconnect_count = 0
+
+    @property
+    def price_board(self) -> PriceBoard:
+        return self._price_board
+
+    @property
+    def live(self) -> bool:
+        """Whether the stream is connected and the board is up to date."""
+        return self._live.is_set()
+
+    def start(self) -> None:
+        """Starts consuming the stream in a background thread."""
+        if self._thread is not None:
+            return
+
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="quote-stream", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def subscribe(self, symbols: Iterable[str]) -> None:
+        with self._lock:
+            new_symbols = set(symbols) - self._subscribed
+            self._subscribed |= new_symbols
+            self._pending |= new_symbols
+
+    def get_current_price(self, symbol: str) -> CurrentPrice:
+        return self.get_current_prices([symbol])[symbol]
+
+    def get_current_prices(self, symbols: list[str]) -> dict[str, CurrentPrice]:
+        if self._auto_subscribe:
+            self.subscribe(symbols)
+
+        with self._lock:
+            subscribed_symbols = [symbol for symbol in symbols if symbol in self._subscribed]
+
+        prices = self._price_board.get_many(subscribed_symbols) if self.live else {}
+        missing_symbols = [symbol for symbol in symbols if symbol not in prices]
+        if missing_symbols:
+            fetched_prices = self._price_fetcher.get_current_prices(missing_symbols)
+            if self.live:
+                # 이후 체결은 스트림으로 갱신되므로 구독 중인 종목의 조회 결과를 보드에 채워둡니다.
+                self._price_board.update_many(
+                    price
+                    for symbol, price in fetched_prices.items()
+                    if symbol in subscribed_symbols
+                )
+            prices |= fetched_prices
+
+        return prices
+
+    def _run(self) -> None:
+        delay = self._reconnect_delay
+        while not self._stopped.is_set():
+            try:
+                self._quote_stream.connect()
+                with self._lock:
+                    self._pending = set(self._subscribed)
+                self._sync_subscriptions()
+                self._live.set()
+                delay = self._reconnect_delay
+
+                while not self._stopped.is_set():
+                    self._sync_subscriptions()
+                    price = self._quote_stream.receive(timeout=RECEIVE_TIMEOUT)
+                    if price is not None:
+                        self._price_board.update(price)
+
+            except Exception:
+                # 연결이 끊기거나 백필에 실패하면 잠시 후 재연결합니다.
+                self._live.clear()
+                self.reconnect_count += 1
+                self._stopped.wait(delay)
+                delay = min(delay * 2, self._max_reconnect_delay)
+
+        self._live.clear()
+        self._quote_stream.close()
+
+    def _sync_subscriptions(self) -> None:
+        """Subscribes the pending symbols and back-fills their prices."""
+        with self._lock:
+            symbols = sorted(self._pending)
+            self._pending.clear()
+
+        if not symbols:
+            return
+
+        try:
+            # 구독 후 백필하여, 백필 이후의 체결은 모두 스트림으로 수신되도록 합니다.
+            self._quote_stream.subscribe(symbols)
+            self._price_board.update_many(self._price_fetcher.get_current_prices(symbols).values())
+        except Exception:
+            with self._lock:
+                self._pending |= set(symbols)
+            raise
@@ -0,0 +1,30 @@
+import os
+import tempfile
+from pathlib import Path
+
+
+def write_atomically(path: Path, *chunks: bytes) -> None:
+    """
+    Writes the chunks to the file through a temporary file that replaces it at once.
+
+    Readers in other processes only ever see a complete file, either the previous or the
+    new one. The temporary file has a unique name in the directory of the file, so
+    concurrent writers of the same file never write to the same temporary file, and the
+    last writer wins. The content is flushed to the disk before the file is replaced.
+
+    Args:
+        path (Path): The file to write.
+        chunks (bytes): The content of the file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
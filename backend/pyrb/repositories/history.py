@@ -0,0 +1,346 @@
+import datetime
+import fcntl
+import mmap
+import os
+import re
+import struct
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+import numpy.typing as npt
+
+from pyrb.exceptions import PriceHistoryError
+from pyrb.models.history import DailyBar
+from pyrb.repositories.files import write_atomically
+
+# 종목별 파일 구조: 헤더 | 일봉 레코드 배열 (날짜 오름차순)
+# 헤더: 매직, 버전, 확정된 레코드 수. 레코드 수를 마지막에 갱신하므로
+#       그 뒤의 레코드는 아직 쓰는 중입니다.
+HEADER = struct.Struct("<8sH6xq")
+COUNT = struct.Struct("<q")
+COUNT_OFFSET = HEADER.size - COUNT.size
+BAR_DTYPE = np.dtype([
+    ("date", "<M8[D]"),
+    ("open", "<f8"),
+    ("high", "<f8"),
+    ("low", "<f8"),
+    ("close", "<f8"),
+    ("volume", "<i8"),
+])
+
+MAGIC = b"PYRBBAR\x00"
+VERSION = 1
+SUFFIX = ".bars"
+LOCK_NAME = ".lock"
+# 종목 코드는 파일 이름으로 쓰이므로 6자리 영문 대문자와 숫자만 허용합니다.
+SYMBOL_PATTERN = re.compile(r"[0-9A-Z]{6}")
+
+
+class PriceMatrix(NamedTuple):
+    """Daily closes of several symbols, aligned on the same trading dates."""
+
+    dates: npt.NDArray[np.datetime64]  # (거래일,) datetime64[D], 오름차순
+    symbols: list[str]
+    closes: npt.NDArray[np.float64]  # (거래일, 종목) 종가. 상장 전이나 거래가 없는 날은 NaN
+
+    def select(self, symbols: list[str]) -> "PriceMatrix":
+        """The closes of the given symbols only, in the given order."""
+        columns = [self.symbols.index(symbol) for symbol in symbols]
+        return PriceMatrix(self.dates, list(symbols), self.closes[:, columns])
+
+
+class PriceHistoryRepository(ABC):
+    """A local store of the daily price history of symbols."""
+
+    @abstractmethod
+    def symbols(self) -> list[str]:
+        """The symbols with a stored history."""
+        ...
+
+    @abstractmethod
+    def read_bars(
+        self,
+        symbol: str,
+        start: datetime.date | None = None,
+        end: datetime.date | None = None,
+    ) -> npt.NDArray[np.void]:
+        """
+        Reads the daily bars of a symbol between the dates, both inclusive.
+
+        Args:
+            symbol (str): The symbol to read.
+            start (datetime.date | None): The first date, or None from the oldest bar.
+            end (datetime.date | None): The last date, or None until the latest bar.
+
+        Returns:
+            npt.NDArray[np.void]: A read-only array of `BAR_DTYPE`, empty if nothing is stored.
+        """
+        ...
+
+    @abstractmethod
+    def last_bar(self, symbol: str) -> DailyBar | None:
+        """The latest stored bar of a symbol, or None if nothing is stored."""
+        ...
+
+    @abstractmethod
+    def append(self, symbol: str, bars: list[DailyBar]) -> int:
+        """
+        Appends the bars dated after the latest stored bar of a symbol.
+
+        Args:
+            symbol (str): The symbol of the bars.
+            bars (list[DailyBar]): The bars in ascending order of date.
+
+        Returns:
+            int: The number of bars appended.
+        """
+        ...
+
+    @abstractmethod
+    def replace(self, symbol: str, bars: list[DailyBar]) -> None:
+        """Replaces the whole history of a symbol, e.g. after its prices were adjusted."""
+        ...
+
+    @abstractmethod
+    def load_closes(
+        self,
+        symbols: list[str],
+        start: datetime.date | None = None,
+        end: datetime.date | None = None,
+    ) -> PriceMatrix:
+        """
+        Loads the daily closes of the symbols between the dates, both inclusive.
+
+        Args:
+            symbols (list[str]): The symbols to load.
+            start (datetime.date | None): The first date, or None from the oldest bar.
+            end (datetime.date | None): The last date, or None until the latest bar.
+
+        Returns:
+            PriceMatrix: The closes aligned on the union of the trading dates of the symbols.
+        """
+        ...
+
+
+class LocalPriceHistoryRepository(PriceHistoryRepository):
+    """
+    Stores the daily bars of every symbol in its own file of fixed-size records, sorted by
+    date, which are memory-mapped for reading.
+
+    A range read binary-searches the dates and returns a read-only view of the mapping, so
+    it copies nothing and only touches the pages it reads. Appends are serialized across
+    processes by a lock file. A writer appends the records after the committed ones and only
+    then updates the committed record count in the header, so readers, which map only the
+    committed records, never see a partially written bar and need no lock. Records left
+    after the committed count by an interrupted append are overwritten by the next append,
+    or dropped by `rebuild`.
+
+    Args:
+        directory (Path): The directory to store the files in.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self._directory = directory
+        # 종목별 (inode, 확정 레코드 수, 매핑된 레코드) 캐시
+        self._mapped: dict[str, tuple[int, int, npt.NDArray[np.void]]] = {}
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    def symbols(self) -> list[str]:
+        return sorted(path.stem for path in self._directory.glob(f"*{SUFFIX}"))
+
+    def read_bars(
+        self,
+        symbol: str,
+        start: datetime.date | None = None,
+        end: datetime.date | None = None,
+    ) -> npt.NDArray[np.void]:
+        bars = self._map(symbol)
+        dates = bars["date"]
+        lo = 0 if start is None else int(np.searchsorted(dates, np.datetime64(start, "D")))
+        hi = (
+            len(bars)
+            if end is None
+            else int(np.searchsorted(dates, np.datetime64(end, "D"), side="right"))
+        )
+        return bars[lo:hi]
+
+    def last_bar(self, symbol: str) -> DailyBar | None:
+        bars = self._map(symbol)
+        return _to_daily_bar(bars[-1]) if len(bars) else None
+
+    def append(self, symbol: str, bars: list[DailyBar]) -> int:
+        records = _to_records(bars)
+        with self._write_lock():
+            path = self._path(symbol)
+            if not path.exists():
+                self._write(path, records)
+                return len(records)
+
+            with open(path, "r+b") as f:
+                count = _read_count(f.read(HEADER.size))
+                if count is None:
+                    raise PriceHistoryError(f"Unsupported price history file: {path}")
+
+                if count:
+                    f.seek(HEADER.size + (count - 1) * BAR_DTYPE.itemsize)
+                    last = np.frombuffer(f.read(BAR_DTYPE.itemsize), dtype=BAR_DTYPE)[0]
+                    records = records[records["date"] > last["date"]]
+
+                if not len(records):
+                    return 0
+
+                f.seek(HEADER.size + count * BAR_DTYPE.itemsize)
+                f.write(records.tobytes())
+                f.truncate()
+                # 레코드가 디스크에 기록된 뒤에 확정 레코드 수를 갱신합니다.
+                f.flush()
+                os.fsync(f.fileno())
+                f.seek(COUNT_OFFSET)
+                f.write(COUNT.pack(count + len(records)))
+                f.flush()
+                os.fsync(f.fileno())
+
+        return len(records)
+
+    def replace(self, symbol: str, bars: list[DailyBar]) -> None:
+        with self._write_lock():
+            self._write(self._path(symbol), _to_records(bars))
+
+    def rebuild(self) -> int:
+        """
+        Rewrites every file from its committed bars, dropping the records of interrupted
+        appends and any bar out of date order. Nothing is downloaded again.
+
+        Returns:
+            int: The number of rebuilt files.
+        """
+        symbols = self.symbols()
+        with self._write_lock():
+            for symbol in symbols:
+                records = np.array(self._map(symbol))
+                # 날짜가 중복되면 나중에 기록된 봉을 남깁니다.
+                _, last_indices = np.unique(records["date"][::-1], return_index=True)
+                self._write(self._path(symbol), records[len(records) - 1 - last_indices])
+
+        return len(symbols)
+
+    def load_closes(
+        self,
+        symbols: list[str],
+        start: datetime.date | None = None,
+        end: datetime.date | None = None,
+    ) -> PriceMatrix:
+        bars_by_symbol = {symbol: self.read_bars(symbol, start, end) for symbol in symbols}
+        missing_symbols = [symbol for symbol, bars in bars_by_symbol.items() if not len(bars)]
+        if missing_symbols:
+            raise PriceHistoryError(f"No price history for: {', '.join(missing_symbols)}")
+
+        dates = np.unique(np.concatenate([bars["date"] for bars in bars_by_symbol.values()]))
+        closes = np.full((len(dates), len(symbols)), np.nan, dtype=np.float64)
+        for column, bars in enumerate(bars_by_symbol.values()):
+            closes[np.searchsorted(dates, bars["date"]), column] = bars["close"]
+
+        return PriceMatrix(dates, list(symbols), closes)
+
+    def _path(self, symbol: str) -> Path:
+        validate_symbol(symbol)
+        return self._directory / f"{symbol}{SUFFIX}"
+
+    def _map(self, symbol: str) -> npt.NDArray[np.void]:
+        try:
+            f = open(self._path(symbol), "rb")
+        except FileNotFoundError:
+            return np.empty(0, dtype=BAR_DTYPE)
+
+        with f:
+            count = _read_count(f.read(HEADER.size))
+            if count is None:
+                raise PriceHistoryError(f"Unsupported price history file: {self._path(symbol)}")
+
+            inode = os.fstat(f.fileno()).st_ino
+            mapped = self._mapped.get(symbol)
+            if mapped is not None and mapped[:2] == (inode, count):
+                return mapped[2]
+
+            if count == 0:
+                bars = np.empty(0, dtype=BAR_DTYPE)
+            else:
+                # 확정된 레코드까지만 매핑하므로 이후에 추가되는 레코드는 보이지 않습니다.
+                buffer = mmap.mmap(
+                    f.fileno(), HEADER.size + count * BAR_DTYPE.itemsize, access=mmap.ACCESS_READ
+                )
+                bars = np.frombuffer(buffer, dtype=BAR_DTYPE, count=count, offset=HEADER.size)
+
+        self._mapped[symbol] = (inode, count, bars)
+        return bars
+
+    def _write(self, path: Path, records: npt.NDArray[np.void]) -> None:
+        write_atomically(path, HEADER.pack(MAGIC, VERSION, len(records)), records.tobytes())
+
+    @contextmanager
+    def _write_lock(self) -> Iterator[None]:
+        self._directory.mkdir(parents=True, exist_ok=True)
+        with open(self._directory / LOCK_NAME, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def validate_symbol(symbol: str) -> None:
+    """Raises `PriceHistoryError` unless the symbol is a 6-character code, e.g. 005930."""
+    if not SYMBOL_PATTERN.fullmatch(symbol):
+        raise PriceHistoryError(f"Invalid symbol: {symbol!r}")
+
+
+def _read_count(header: bytes) -> int | None:
+    """The committed record count of a file header, or None if it is not supported."""
+    if len(header) < HEADER.size:
+        return None
+
+    magic, version, count = HEADER.unpack(header)
+    return count if magic == MAGIC and version == VERSION else None
+
+
+def _to_records(bars: list[DailyBar]) -> npt.NDArray[np.void]:
+    records = np.array(
+        [(bar.date, bar.open, bar.high, bar.low, bar.close, bar.volume) for bar in bars],
+        dtype=BAR_DTYPE,
+    )
+    if np.any(records["date"][1:] <= records["date"][:-1]):
+        raise PriceHistoryError("The bars must be in strictly ascending order of date")
+
+    return records
+
+
+def _to_daily_bar(record: np.void) -> DailyBar:
+    return DailyBar(
+        date=record["date"].item(),
+        open=int(record["open"]),
+        high=int(record["high"]),
+        low=int(record["low"]),
+        close=int(record["close"]),
+        volume=int(record["volume"]),
+    )
+
+
+_default_price_history: PriceHistoryRepository | None = None
+
+
+def configure_price_history(directory: Path) -> PriceHistoryRepository:
+    """Sets the price history used by the strategies computing weights from past prices."""
+    global _default_price_history
+    _default_price_history = LocalPriceHistoryRepository(directory)
+    return _default_price_history
+
+
+def get_price_history() -> PriceHistoryRepository | None:
+    return _default_price_history
@@ -0,0 +1,76 @@
+import fcntl
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager
+from pathlib import Path
+from uuid import UUID
+
+from pyrb.exceptions import ScheduleConflictError, ScheduleNotFoundError
+from pyrb.models.schedule import TWAPSchedule
+from pyrb.repositories.files import write_atomically
+
+
+class ScheduleRepository(ABC):
+    @abstractmethod
+    def save(self, schedule: TWAPSchedule) -> None: ...
+
+    @abstractmethod
+    def get(self, schedule_id: UUID) -> TWAPSchedule: ...
+
+    @abstractmethod
+    def get_all(self) -> list[TWAPSchedule]: ...
+
+    @abstractmethod
+    def lease(self, schedule_id: UUID) -> AbstractContextManager[None]:
+        """
+        Holds the exclusive right to place the child orders of the schedule, across processes.
+        The lease is released when the context exits or the process holding it dies.
+
+        Raises:
+            ScheduleConflictError: If the lease is held by someone else.
+        """
+        ...
+
+
+class LocalScheduleRepository(ScheduleRepository):
+    """
+    Stores each schedule as a JSON file named after its id.
+    A lease is a lock on a file next to it, which the OS releases when its process dies.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self._directory = directory
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+    def save(self, schedule: TWAPSchedule) -> None:
+        write_atomically(self._path(schedule.id), schedule.model_dump_json().encode())
+
+    def get(self, schedule_id: UUID) -> TWAPSchedule:
+        path = self._path(schedule_id)
+        if not path.exists():
+            raise ScheduleNotFoundError(f"schedule {schedule_id} does not exist")
+
+        return TWAPSchedule.model_validate_json(path.read_text())
+
+    def get_all(self) -> list[TWAPSchedule]:
+        schedules = [
+            TWAPSchedule.model_validate_json(path.read_text())
+            for path in self._directory.glob("*.json")
+        ]
+        return sorted(schedules, key=lambda schedule: schedule.created_at)
+
+    @contextmanager
+    def lease(self, schedule_id: UUID) -> Iterator[None]:
+        with open(self._directory / f"{schedule_id}.lock", "a") as lock_file:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError as e:
+                raise ScheduleConflictError(f"Schedule {schedule_id} is already running") from e
+
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _path(self, schedule_id: UUID) -> Path:
+        return self._directory / f"{schedule_id}.json"
@@ -0,0 +1,253 @@
+import contextlib
+import datetime
+import mmap
+import struct
+import threading
+import time
+import zlib
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+from pyrb.enums import AssetClassEnum, Market
+from pyrb.exceptions import SymbolMasterError
+from pyrb.repositories.files import write_atomically
+
+if TYPE_CHECKING:
+    # 종목 마스터는 CLI 시작 시 등록되므로 pydantic 모델은 조회할 때 import 합니다.
+    from pyrb.models.symbol import SymbolInfo
+
+# 파일 구조: 헤더 | 레코드 배열 | 해시 색인
+# 헤더: 매직, 버전, 레코드 수, 색인 슬롯 수, 갱신 시각(epoch 초)
+HEADER = struct.Struct("<8sHIIq")
+# 레코드: 종목코드, 종목명(UTF-8), 시장구분, 자산군, 플래그(bit 0: ETF), 호가단위
+RECORD = struct.Struct("<12s60sBBBxI")
+SLOT = struct.Struct("<I")  # 레코드 번호 + 1 (0 은 빈 슬롯)
+SYMBOL_SIZE = 12
+ASSET_CLASS_OFFSET = struct.calcsize("<12s60sB")
+
+MAGIC = b"PYRBSYM\x00"
+VERSION = 1
+ETF_FLAG = 0b1
+
+MARKETS: list[Market] = list(Market)
+ASSET_CLASSES: list[AssetClassEnum] = list(AssetClassEnum)
+
+RELOAD_CHECK_INTERVAL = 60.0  # 파일이 교체되었는지 확인하는 주기(초)
+
+
+def _slot(symbol: bytes, slot_count: int) -> int:
+    return zlib.crc32(symbol) & (slot_count - 1)
+
+
+class _MappedIndex(NamedTuple):
+    buffer: mmap.mmap
+    record_count: int
+    slot_count: int
+    updated_at: datetime.datetime
+
+
+class SymbolMaster:
+    """
+    A read-only index of every listed symbol, stored in a compact binary file.
+
+    The file is memory-mapped and looked up through an open-addressing hash table stored
+    after the fixed-size records, so a lookup is O(1) and only touches the pages it reads.
+    No symbol is loaded into Python objects until it is looked up. A missing file is
+    treated as an empty master, and a truncated file raises `SymbolMasterError`. The file
+    is replaced atomically by `write`, and readers pick up the new file within
+    `RELOAD_CHECK_INTERVAL` seconds.
+
+    Args:
+        path (Path): The path of the master file.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._lock = threading.Lock()
+        # 다른 스레드가 파일을 다시 읽는 중에도 일관된 상태를 보도록 한 번에 교체합니다.
+        self._index: _MappedIndex | None = None
+        self._mtime_ns: int | None = None
+        self._checked_at: float | None = None
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def updated_at(self) -> datetime.datetime | None:
+        """When the master was built, or None if there is no master file."""
+        index = self._load()
+        return index.updated_at if index is not None else None
+
+    def __len__(self) -> int:
+        index = self._load()
+        return index.record_count if index is not None else 0
+
+    def __contains__(self, symbol: str) -> bool:
+        return self._find(symbol) is not None
+
+    def get(self, symbol: str) -> "SymbolInfo | None":
+        from pyrb.models.symbol import SymbolInfo
+
+        record = self._find(symbol)
+        if record is None:
+            return None
+
+        raw_symbol, name, market, asset_class, flags, tick_size = RECORD.unpack(record)
+        return SymbolInfo(
+            symbol=raw_symbol.rstrip(b"\x00").decode(),
+            name=name.rstrip(b"\x00").decode(errors="ignore"),
+            market=MARKETS[market],
+            asset_class=ASSET_CLASSES[asset_class],
+            is_etf=bool(flags & ETF_FLAG),
+            tick_size=tick_size,
+        )
+
+    def get_asset_class(self, symbol: str) -> AssetClassEnum | None:
+        """Looks up only the asset class, without creating a `SymbolInfo`."""
+        record = self._find(symbol)
+        if record is None:
+            return None
+
+        return ASSET_CLASSES[record[ASSET_CLASS_OFFSET]]
+
+    def reload(self) -> None:
+        """Checks for a replaced master file on the next lookup, instead of waiting."""
+        self._checked_at = None
+
+    def _find(self, symbol: str) -> bytes | None:
+        """Returns a copy of the record of the symbol, if it is listed."""
+        key = symbol.encode()
+        if len(key) > SYMBOL_SIZE:
+            return None
+
+        while True:
+            index = self._load()
+            if index is None or index.record_count == 0:
+                return None
+
+            try:
+                return self._find_record(index, key)
+            except ValueError:
+                if index is self._index:
+                    raise
+                # 다른 스레드가 파일을 다시 읽으면서 닫은 매핑입니다. 새 매핑에서 다시 찾습니다.
+
+    @staticmethod
+    def _find_record(index: _MappedIndex, key: bytes) -> bytes | None:
+        buffer = index.buffer
+        slots_offset = HEADER.size + index.record_count * RECORD.size
+        slot = _slot(key, index.slot_count)
+        while True:
+            (record_number,) = SLOT.unpack_from(buffer, slots_offset + slot * SLOT.size)
+            if record_number == 0:
+                return None
+
+            offset = HEADER.size + (record_number - 1) * RECORD.size
+            if buffer[offset : offset + SYMBOL_SIZE].rstrip(b"\x00") == key:
+                return buffer[offset : offset + RECORD.size]
+
+            slot = (slot + 1) & (index.slot_count - 1)
+
+    def _load(self) -> _MappedIndex | None:
+        now = time.monotonic()
+        if self._checked_at is not None and now - self._checked_at < RELOAD_CHECK_INTERVAL:
+            return self._index
+
+        with self._lock:
+            self._checked_at = now
+            try:
+                mtime_ns: int | None = self._path.stat().st_mtime_ns
+            except FileNotFoundError:
+                mtime_ns = None
+
+            if mtime_ns != self._mtime_ns:
+                index = self._map() if mtime_ns is not None else None
+                replaced, self._index, self._mtime_ns = self._index, index, mtime_ns
+                if replaced is not None:
+                    # 조회 중인 스레드는 닫힌 매핑을 만나면 새 매핑에서 다시 찾습니다.
+                    with contextlib.suppress(BufferError):
+                        replaced.buffer.close()
+
+            return self._index
+
+    def _map(self) -> _MappedIndex | None:
+        with open(self._path, "rb") as f:
+            try:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as e:  # 빈 파일
+                raise SymbolMasterError(self._corrupted_message()) from e
+
+        if len(buffer) < HEADER.size:
+            buffer.close()
+            raise SymbolMasterError(self._corrupted_message())
+
+        magic, version, count, slot_count, updated_at = HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC or version != VERSION:
+            buffer.close()
+            return None
+
+        if len(buffer) < HEADER.size + count * RECORD.size + slot_count * SLOT.size:
+            buffer.close()
+            raise SymbolMasterError(self._corrupted_message())
+
+        return _MappedIndex(
+            buffer=buffer,
+            record_count=count,
+            slot_count=slot_count,
+            updated_at=datetime.datetime.fromtimestamp(updated_at, tz=datetime.UTC),
+        )
+
+    def _corrupted_message(self) -> str:
+        return f"The symbol master {self._path} is truncated. Run `pyrb symbols update`"
+
+    @staticmethod
+    def write(path: Path, symbols: "Iterable[SymbolInfo]") -> None:
+        """Builds the master file from the given symbols, replacing any existing file."""
+        records = list({info.symbol: info for info in symbols}.values())
+        slot_count = 1 << max(len(records) * 2 - 1, 1).bit_length()  # 적재율 50% 이하
+        slots = [0] * slot_count
+        for index, info in enumerate(records):
+            slot = _slot(info.symbol.encode(), slot_count)
+            while slots[slot]:
+                slot = (slot + 1) & (slot_count - 1)
+            slots[slot] = index + 1
+
+        buffer = bytearray(HEADER.size + len(records) * RECORD.size + slot_count * SLOT.size)
+        HEADER.pack_into(buffer, 0, MAGIC, VERSION, len(records), slot_count, int(time.time()))
+        for index, info in enumerate(records):
+            RECORD.pack_into(
+                buffer,
+                HEADER.size + index * RECORD.size,
+                info.symbol.encode(),
+                _truncate_utf8(info.name, 60),
+                MARKETS.index(info.market),
+                ASSET_CLASSES.index(AssetClassEnum(info.asset_class)),
+                ETF_FLAG if info.is_etf else 0,
+                info.tick_size,
+            )
+        slots_offset = HEADER.size + len(records) * RECORD.size
+        for slot, index in enumerate(slots):
+            SLOT.pack_into(buffer, slots_offset + slot * SLOT.size, index)
+
+        write_atomically(path, buffer)
+
+
+def _truncate_utf8(text: str, size: int) -> bytes:
+    encoded = text.encode()[:size]
+    return encoded.decode(errors="ignore").encode()  # 잘린 멀티바이트 문자를 제거합니다.
+
+
+_default_symbol_master: SymbolMaster | None = None
+
+
+def configure_symbol_master(path: Path) -> SymbolMaster:
+    """Sets the symbol master used by `Asset` classification and target validation."""
+    global _default_symbol_master
+    _default_symbol_master = SymbolMaster(path)
+    return _default_symbol_master
+
+
+def get_symbol_master() -> SymbolMaster | None:
+    return _default_symbol_master
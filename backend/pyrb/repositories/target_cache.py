@@ -0,0 +1,221 @@
+import hashlib
+import os
+import struct
+import tempfile
+from array import array
+from collections.abc import Callable
+from contextlib import suppress
+from pathlib import Path
+
+from pyrb.repositories.files import write_atomically
+from pyrb.repositories.symbol_master import get_symbol_master
+
+# 파일 구조: 헤더 | 비중 배열(float64) | 종목코드(UTF-8, NUL 구분)
+# 헤더: 매직, 버전, 원본의 mtime(ns), 원본 크기, 내용 해시, 검증에 쓴 종목 마스터의 갱신 시각,
+#       종목 수
+HEADER = struct.Struct("<8sHqq16sqI")
+WEIGHT_SIZE = array("d").itemsize  # 로컬 캐시이므로 비중은 네이티브 바이트 순서로 저장합니다.
+
+MAGIC = b"PYRBTGT\x00"
+VERSION = 1
+SEPARATOR = "\x00"
+
+CHUNK_SIZE = 1 << 20
+MAX_CONTENT_ENTRIES = 256  # 업로드된 목표 비중 파일의 항목을 최근 사용 순으로 보관하는 수
+
+
+def hash_content(content: bytes) -> bytes:
+    return hashlib.blake2b(content, digest_size=16).digest()
+
+
+def _hash_file(path: Path) -> bytes:
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def _symbol_master_stamp() -> int:
+    """Identifies the symbol master the targets were validated against, 0 if there is none."""
+    symbol_master = get_symbol_master()
+    updated_at = symbol_master.updated_at if symbol_master is not None else None
+    return int(updated_at.timestamp()) if updated_at is not None else 0
+
+
+class TargetCache:
+    """
+    Caches validated and normalized targets in compact binary files, so that reading an
+    unchanged target file costs a `stat` and a small read instead of parsing it again.
+
+    An entry of a target file is keyed by its path and is valid as long as the mtime and
+    the size of the file are unchanged. When only the mtime changed, e.g. after the file was
+    touched or checked out again, the content hash is compared before parsing the file.
+    Uploaded target files are keyed by their content hash alone, and only the most recently
+    used `max_content_entries` of them are kept. Every entry is also invalidated when the
+    symbol master the targets were validated against is replaced.
+
+    Args:
+        directory (Path): The directory to store the entries in.
+        max_content_entries (int): The number of entries of uploaded target files to keep.
+    """
+
+    def __init__(self, directory: Path, max_content_entries: int = MAX_CONTENT_ENTRIES) -> None:
+        self._directory = directory
+        self._max_content_entries = max_content_entries
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    def read(
+        self, source: Path, read_targets: Callable[[Path], dict[str, float]]
+    ) -> dict[str, float]:
+        """
+        Returns the cached targets of the source file, reading and caching them on a miss.
+
+        Args:
+            source (Path): The target file.
+            read_targets (Callable[[Path], dict[str, float]]): Reads, validates and
+                normalizes the targets of a file.
+
+        Returns:
+            dict[str, float]: A dictionary mapping asset symbols to target weights.
+        """
+        stat = source.stat()
+        entry_path = self._entry_path("path", os.fsencode(source.absolute()))
+        master_stamp = _symbol_master_stamp()
+        entry = self._load(entry_path, master_stamp)
+        digest: bytes | None = None
+        if entry is not None:
+            mtime_ns, size, cached_digest, targets = entry
+            if mtime_ns == stat.st_mtime_ns and size == stat.st_size:
+                return targets
+
+            # 수정 시각만 바뀐 경우에는 내용을 비교해서 다시 파싱하지 않습니다.
+            if size == stat.st_size:
+                digest = _hash_file(source)
+                if digest == cached_digest:
+                    self._store(entry_path, stat.st_mtime_ns, size, digest, master_stamp, targets)
+                    return targets
+
+        # 읽는 도중 파일이 바뀌어도 캐시가 오래된 내용을 가리키지 않도록 읽기 전에 해시합니다.
+        if digest is None:
+            digest = _hash_file(source)
+        targets = read_targets(source)
+        self._store(entry_path, stat.st_mtime_ns, stat.st_size, digest, master_stamp, targets)
+        return targets
+
+    def read_content(
+        self,
+        content: bytes,
+        suffix: str,
+        read_targets: Callable[[Path], dict[str, float]],
+    ) -> dict[str, float]:
+        """
+        Returns the cached targets of an uploaded target file, reading and caching them on a miss.
+
+        Args:
+            content (bytes): The content of the target file.
+            suffix (str): The suffix of the file type, e.g. ".csv".
+            read_targets (Callable[[Path], dict[str, float]]): Reads, validates and
+                normalizes the targets of a file.
+
+        Returns:
+            dict[str, float]: A dictionary mapping asset symbols to target weights.
+        """
+        digest = hash_content(content)
+        entry_path = self._entry_path("content", digest + suffix.encode())
+        master_stamp = _symbol_master_stamp()
+        entry = self._load(entry_path, master_stamp)
+        if entry is not None and entry[2] == digest:
+            # 수정 시각을 최근 사용 시각으로 사용하여 오래 쓰지 않은 항목부터 제거합니다.
+            with suppress(FileNotFoundError):
+                os.utime(entry_path)
+            return entry[3]
+
+        self._directory.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=self._directory, suffix=suffix) as f:
+            f.write(content)
+            f.flush()
+            targets = read_targets(Path(f.name))
+
+        self._store(entry_path, 0, len(content), digest, master_stamp, targets)
+        self._evict_content_entries()
+        return targets
+
+    def clear(self) -> None:
+        """Removes every entry."""
+        for entry_path in self._directory.glob("*.bin"):
+            entry_path.unlink(missing_ok=True)
+
+    def _evict_content_entries(self) -> None:
+        entries = []
+        for entry_path in self._directory.glob("content-*.bin"):
+            try:
+                entries.append((entry_path.stat().st_mtime_ns, entry_path))
+            except FileNotFoundError:  # 다른 프로세스가 먼저 제거함
+                continue
+
+        entries.sort()
+        for _, entry_path in entries[: max(len(entries) - self._max_content_entries, 0)]:
+            entry_path.unlink(missing_ok=True)
+
+    def _entry_path(self, kind: str, key: bytes) -> Path:
+        return self._directory / f"{kind}-{hashlib.blake2b(key, digest_size=16).hexdigest()}.bin"
+
+    def _load(
+        self, entry_path: Path, master_stamp: int
+    ) -> tuple[int, int, bytes, dict[str, float]] | None:
+        try:
+            data = entry_path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+        if len(data) < HEADER.size:
+            return None
+
+        magic, version, mtime_ns, size, digest, stamp, count = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION or stamp != master_stamp:
+            return None
+
+        symbols_offset = HEADER.size + count * WEIGHT_SIZE
+        weights = array("d")
+        weights.frombytes(data[HEADER.size : symbols_offset])
+        symbols = data[symbols_offset:].decode().split(SEPARATOR) if count else []
+        if len(symbols) != count:
+            return None
+
+        return mtime_ns, size, digest, dict(zip(symbols, weights, strict=True))
+
+    def _store(
+        self,
+        entry_path: Path,
+        mtime_ns: int,
+        size: int,
+        digest: bytes,
+        master_stamp: int,
+        targets: dict[str, float],
+    ) -> None:
+        if any(SEPARATOR in symbol for symbol in targets):
+            return
+
+        header = HEADER.pack(MAGIC, VERSION, mtime_ns, size, digest, master_stamp, len(targets))
+        weights = array("d", targets.values()).tobytes()
+        symbols = SEPARATOR.join(targets).encode()
+
+        write_atomically(entry_path, header, weights, symbols)
+
+
+_default_target_cache: TargetCache | None = None
+
+
+def configure_target_cache(directory: Path) -> TargetCache:
+    """Sets the cache used by `read_targets_from_source`."""
+    global _default_target_cache
+    _default_target_cache = TargetCache(directory)
+    return _default_target_cache
+
+
+def get_target_cache() -> TargetCache | None:
+    return _default_target_cache
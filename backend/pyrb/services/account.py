@@ -1,3 +1,5 @@
+from uuid import UUID
+
 from pyrb.models.account import Account
 from pyrb.repositories.account import AccountRepository
 
@@ -9,5 +11,11 @@ class AccountService:
     def set(self, account: Account) -> None:
         self._account_repo.set(account)
 
-    def get(self) -> Account:
-        return self._account_repo.get()
+    def get(self, account_id: UUID | None = None) -> Account:
+        return self._account_repo.get(account_id)
+
+    def get_all(self) -> list[Account]:
+        return self._account_repo.get_all()
+
+    def set_default(self, account_id: UUID) -> None:
+        self._account_repo.set_default(account_id)
@@ -0,0 +1,175 @@
+import datetime
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from uuid import UUID
+from zoneinfo import ZoneInfo
+
+from pyrb.models.account import Account
+from pyrb.models.plan import PortfolioSnapshot
+from pyrb.models.portfolio import (
+    AccountLoadStatus,
+    AggregatedPortfolio,
+    AggregatedPosition,
+    AssetClassExposure,
+)
+from pyrb.models.position import Asset
+from pyrb.repositories.brokerages.context import RebalanceContext
+
+
+class PortfolioAggregator:
+    """
+    Loads the portfolios of several accounts concurrently and merges them into a single view.
+
+    The contexts of the accounts and the worker threads are kept between calls, so that the
+    view can be refreshed every few seconds without re-creating the brokerage clients.
+    An account that does not respond within the timeout is reported as failed and excluded
+    from the totals. Its load keeps running in the background and is not requested again
+    until it has finished.
+
+    Args:
+        context_factory (Callable[[Account], RebalanceContext]): Creates the context of
+            an account.
+        timeout (float): The number of seconds to wait for the accounts to load.
+        max_workers (int): The maximum number of accounts loaded at the same time.
+    """
+
+    def __init__(
+        self,
+        context_factory: Callable[[Account], RebalanceContext],
+        timeout: float = 5.0,
+        max_workers: int = 8,
+    ) -> None:
+        self._context_factory = context_factory
+        self._timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._contexts: dict[UUID, RebalanceContext] = {}
+        self._loads: dict[UUID, Future[tuple[PortfolioSnapshot, float]]] = {}
+        self._lock = threading.Lock()
+
+    def aggregate(self, accounts: list[Account]) -> AggregatedPortfolio:
+        """
+        Loads the portfolios of the given accounts and merges the positions by symbol
+        and by asset class.
+
+        Args:
+            accounts (list[Account]): The accounts to aggregate.
+
+        Returns:
+            AggregatedPortfolio: The merged portfolio, possibly with failed accounts.
+        """
+        with self._lock:
+            loads = {account.id: self._submit(account) for account in accounts}
+
+        wait(loads.values(), timeout=self._timeout)
+
+        snapshots: list[tuple[UUID, PortfolioSnapshot]] = []
+        statuses: list[AccountLoadStatus] = []
+        for account_id, load in loads.items():
+            if not load.done():
+                statuses.append(
+                    AccountLoadStatus(
+                        account_id=account_id, error=f"Timed out after {self._timeout}s"
+                    )
+                )
+            elif (e := load.exception()) is not None:
+                statuses.append(
+                    AccountLoadStatus(account_id=account_id, error=f"Failed to load: {e}")
+                )
+            else:
+                snapshot, load_seconds = load.result()
+                snapshots.append((account_id, snapshot))
+                statuses.append(
+                    AccountLoadStatus(
+                        account_id=account_id,
+                        total_value=snapshot.total_value,
+                        load_seconds=load_seconds,
+                    )
+                )
+
+        return self._merge(snapshots, statuses)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _submit(self, account: Account) -> Future[tuple[PortfolioSnapshot, float]]:
+        # 이전 조회가 아직 끝나지 않은 계좌는 중복으로 요청하지 않고 그 결과를 기다립니다.
+        load = self._loads.get(account.id)
+        if load is None or load.done():
+            context = self._contexts.get(account.id)
+            if context is None:
+                context = self._contexts[account.id] = self._context_factory(account)
+            load = self._loads[account.id] = self._executor.submit(self._load, context)
+
+        return load
+
+    @staticmethod
+    def _load(context: RebalanceContext) -> tuple[PortfolioSnapshot, float]:
+        started_at = time.perf_counter()
+        portfolio = context.portfolio
+        portfolio.refresh()
+        snapshot = PortfolioSnapshot(
+            total_value=portfolio.total_value,
+            cash_balance=portfolio.cash_balance,
+            positions=portfolio.positions,
+        )
+        return snapshot, time.perf_counter() - started_at
+
+    @staticmethod
+    def _merge(
+        snapshots: list[tuple[UUID, PortfolioSnapshot]], statuses: list[AccountLoadStatus]
+    ) -> AggregatedPortfolio:
+        total_value = sum(snapshot.total_value for _, snapshot in snapshots)
+        assets: dict[str, Asset] = {}
+        quantities: dict[str, int] = defaultdict(int)
+        amounts: dict[str, float] = defaultdict(float)
+        profits: dict[str, float] = defaultdict(float)
+        account_ids: dict[str, list[UUID]] = defaultdict(list)
+        for account_id, snapshot in snapshots:
+            for position in snapshot.positions:
+                symbol = position.asset.symbol
+                assets.setdefault(symbol, position.asset)
+                quantities[symbol] += position.quantity
+                amounts[symbol] += position.total_amount
+                profits[symbol] += position.profit
+                account_ids[symbol].append(account_id)
+
+        positions = sorted(
+            (
+                AggregatedPosition(
+                    asset=asset,
+                    quantity=quantities[symbol],
+                    total_amount=amounts[symbol],
+                    profit=profits[symbol],
+                    weight=amounts[symbol] / total_value if total_value else 0,
+                    account_ids=account_ids[symbol],
+                )
+                for symbol, asset in assets.items()
+            ),
+            key=lambda position: position.total_amount,
+            reverse=True,
+        )
+
+        class_amounts: dict[str, float] = defaultdict(float)
+        for symbol, asset in assets.items():
+            class_amounts[str(asset.asset_class)] += amounts[symbol]
+
+        return AggregatedPortfolio(
+            total_value=total_value,
+            cash_balance=sum(snapshot.cash_balance for _, snapshot in snapshots),
+            positions=positions,
+            asset_classes=[
+                AssetClassExposure(
+                    asset_class=asset_class,
+                    total_amount=amount,
+                    weight=amount / total_value if total_value else 0,
+                )
+                for asset_class, amount in sorted(
+                    class_amounts.items(), key=lambda item: item[1], reverse=True
+                )
+            ],
+            accounts=statuses,
+            loaded_at=datetime.datetime.now(ZoneInfo("Asia/Seoul")),
+        )
@@ -0,0 +1,270 @@
+from typing import NamedTuple
+
+import numpy as np
+import numpy.typing as npt
+
+from pyrb.enums import RebalanceFrequency
+from pyrb.exceptions import PriceHistoryError
+from pyrb.models.backtest import BacktestReport
+from pyrb.repositories.history import PriceMatrix
+from pyrb.services.sizing import calculate_shares_to_trade
+from pyrb.services.strategy.base import Strategy
+
+TRADING_DAYS_PER_YEAR = 252
+BAND_CHECK_CHUNK = 256  # 비중 이탈을 한 번에 검사하는 후보일 수
+
+
+class BacktestResult(NamedTuple):
+    report: BacktestReport
+    dates: npt.NDArray[np.datetime64]  # (거래일,)
+    values: npt.NDArray[np.float64]  # (거래일,) 종가 기준 평가금액 (현금 포함)
+    rebalance_dates: npt.NDArray[np.datetime64]  # 최초 매수일을 포함한 리밸런싱일
+
+
+class Backtester:
+    """
+    Simulates a rebalancing strategy over the daily closes of a `PriceMatrix`.
+
+    The holdings only change on rebalance days, so the portfolio values between two
+    rebalances are computed at once as a product of the closes and the held shares, and
+    the drift bands are checked over blocks of days at once. The Python-level loop runs
+    once per rebalance, not once per day. A rebalance trades the whole portfolio value back
+    to the target weights at the close of the day with `rebalance_to_target`.
+
+    Missing closes are carried forward from the previous trading day, and the simulation
+    starts on the first day every symbol of the strategy has a close.
+
+    Args:
+        prices (PriceMatrix): The daily closes to simulate over.
+    """
+
+    def __init__(self, prices: PriceMatrix) -> None:
+        self._prices = prices
+
+    def run(
+        self,
+        strategy: Strategy,
+        initial_cash: float,
+        frequency: RebalanceFrequency | None = RebalanceFrequency.MONTHLY,
+        band: float | None = None,
+        cost_rate: float = 0.0,
+    ) -> BacktestResult:
+        """
+        Runs the strategy, buying the target weights on the first day.
+
+        With only a `frequency`, the portfolio is rebalanced on the first trading day of
+        every period. With only a `band`, it is rebalanced on any day the weight of a symbol
+        in the invested amount drifts more than `band` from its target. With both, the drift
+        is checked on the first trading day of every period only. With neither, the initial
+        portfolio is held.
+
+        Args:
+            strategy (Strategy): The strategy providing the target weights.
+            initial_cash (float): The cash to start with.
+            frequency (RebalanceFrequency | None): The calendar period of the rebalances.
+            band (float | None): The absolute drift of a weight that triggers a rebalance.
+            cost_rate (float): The trading cost as a fraction of the traded amount.
+
+        Returns:
+            BacktestResult: The daily values and the report of the simulation.
+
+        Raises:
+            PriceHistoryError: If a symbol of the strategy has no price history.
+        """
+        target_weights = strategy.create_target_weights()
+        symbols = list(target_weights)
+        missing_symbols = [symbol for symbol in symbols if symbol not in self._prices.symbols]
+        if missing_symbols:
+            raise PriceHistoryError(f"No price history for: {', '.join(missing_symbols)}")
+
+        dates, closes = fill_closes(self._prices.select(symbols))
+        target = np.array([target_weights[symbol] for symbol in symbols], dtype=np.float64)
+        if frequency is None and band is None:
+            candidates = np.empty(0, dtype=np.intp)
+        elif frequency is None:
+            candidates = np.arange(1, len(dates))
+        else:
+            candidates = period_starts(dates, frequency)
+
+        simulation = _Simulation(closes, target, initial_cash, cost_rate)
+        day = 0
+        rebalance_days = [day]
+        simulation.rebalance(day, count_turnover=False)
+        while True:
+            next_day = simulation.next_rebalance(day, candidates, band)
+            simulation.hold(day, next_day)
+            if next_day >= len(dates):
+                break
+
+            simulation.rebalance(next_day)
+            rebalance_days.append(next_day)
+            day = next_day
+
+        report = _report(dates, simulation, initial_cash, frequency, band, len(rebalance_days) - 1)
+        return BacktestResult(report, dates, simulation.values, dates[rebalance_days])
+
+
+class _Simulation:
+    def __init__(
+        self,
+        closes: npt.NDArray[np.float64],
+        target: npt.NDArray[np.float64],
+        initial_cash: float,
+        cost_rate: float,
+    ) -> None:
+        self.closes = closes
+        self.target = target
+        self.cost_rate = cost_rate
+        self.shares = np.zeros(closes.shape[1], dtype=np.float64)
+        self.cash = initial_cash
+        self.values = np.empty(closes.shape[0], dtype=np.float64)
+        self.traded_amount = 0.0  # 최초 매수를 제외한 매매금액
+        self.trading_cost = 0.0
+
+    def rebalance(self, day: int, count_turnover: bool = True) -> None:
+        rebalanced = rebalance_to_target(
+            self.shares, self.closes[day], self.cash, self.target, self.cost_rate
+        )
+        self.shares += rebalanced.trades
+        self.cash = float(rebalanced.cash)
+        self.trading_cost += float(rebalanced.cost)
+        if count_turnover:
+            self.traded_amount += float(rebalanced.traded_amount)
+
+    def hold(self, start: int, end: int) -> None:
+        self.values[start:end] = self.closes[start:end] @ self.shares + self.cash
+
+    def next_rebalance(self, day: int, candidates: npt.NDArray[np.intp], band: float | None) -> int:
+        """The first candidate day after `day` to rebalance on, or the number of days."""
+        position = int(np.searchsorted(candidates, day, side="right"))
+        if band is None:
+            return int(candidates[position]) if position < len(candidates) else len(self.closes)
+
+        while position < len(candidates):
+            window = candidates[position : position + BAND_CHECK_CHUNK]
+            amounts = self.closes[window] * self.shares
+            # 수량 내림으로 남은 현금은 리밸런싱으로 없앨 수 없으므로 투자금액 기준으로 비교합니다.
+            weights = amounts / amounts.sum(axis=1)[:, np.newaxis]
+            breached = np.flatnonzero(np.abs(weights - self.target).max(axis=1) > band)
+            if breached.size:
+                return int(window[breached[0]])
+
+            position += BAND_CHECK_CHUNK
+
+        return len(self.closes)
+
+
+class RebalanceTrades(NamedTuple):
+    trades: npt.NDArray[np.float64]  # (종목, ...) 매매 수량 (매도는 음수)
+    traded_amount: npt.NDArray[np.float64]  # (...) 매매금액
+    cost: npt.NDArray[np.float64]  # (...) 거래비용
+    cash: npt.NDArray[np.float64]  # (...) 매매 후 현금
+
+
+def rebalance_to_target(
+    shares: npt.NDArray[np.float64],
+    prices: npt.NDArray[np.float64],
+    cash: float | npt.NDArray[np.float64],
+    target: npt.NDArray[np.float64],
+    cost_rate: float,
+    mask: npt.NDArray[np.bool_] | None = None,
+) -> RebalanceTrades:
+    """
+    Trades the holdings back to the target weights with the same share rounding as
+    `Rebalancer`, after reserving the estimated trading cost.
+
+    The symbols are on the first axis of `shares`, `prices` and `target`, and any other axes
+    are independent portfolios, so a single call rebalances every path and policy of a
+    simulation at once.
+
+    Args:
+        shares (npt.NDArray[np.float64]): The held shares.
+        prices (npt.NDArray[np.float64]): The prices to trade at.
+        cash (float | npt.NDArray[np.float64]): The cash of each portfolio.
+        target (npt.NDArray[np.float64]): The target weights.
+        cost_rate (float): The trading cost as a fraction of the traded amount.
+        mask (npt.NDArray[np.bool_] | None): The portfolios to rebalance. Defaults to all.
+
+    Returns:
+        RebalanceTrades: The trades, their amount and cost, and the cash after the trades.
+    """
+    current_amounts = shares * prices
+    value = current_amounts.sum(axis=0) + cash
+    # 거래비용으로 현금이 부족해지지 않도록 예상 비용을 빼고 투자합니다.
+    estimated_cost = cost_rate * np.abs(value * target - current_amounts).sum(axis=0)
+    investment_amount = value - estimated_cost
+
+    trades = calculate_shares_to_trade(investment_amount * target - current_amounts, prices)
+    if mask is not None:
+        trades = np.where(mask, trades, 0)
+    traded_amount = (np.abs(trades) * prices).sum(axis=0)
+    cost = traded_amount * cost_rate
+    return RebalanceTrades(trades, traded_amount, cost, cash - (trades * prices).sum(axis=0) - cost)
+
+
+def fill_closes(
+    prices: PriceMatrix,
+) -> tuple[npt.NDArray[np.datetime64], npt.NDArray[np.float64]]:
+    """Carries missing closes forward and drops the days before every symbol has a close."""
+    closes = prices.closes
+    rows = np.where(np.isnan(closes), 0, np.arange(len(closes))[:, np.newaxis])
+    np.maximum.accumulate(rows, axis=0, out=rows)
+    filled = closes[rows, np.arange(closes.shape[1])]
+
+    complete = np.flatnonzero(~np.isnan(filled).any(axis=1))
+    if not complete.size:
+        raise PriceHistoryError("The symbols have no trading day in common")
+
+    return prices.dates[complete[0] :], filled[complete[0] :]
+
+
+def period_starts(
+    dates: npt.NDArray[np.datetime64], frequency: RebalanceFrequency
+) -> npt.NDArray[np.intp]:
+    """The indices of the first trading day of every period, except the first period."""
+    days = dates.astype("datetime64[D]").astype(np.int64)
+    match frequency:
+        case RebalanceFrequency.DAILY:
+            periods = days
+        case RebalanceFrequency.WEEKLY:
+            periods = (days + 3) // 7  # 1970-01-01 은 목요일이므로 월요일부터 한 주로 셉니다.
+        case RebalanceFrequency.MONTHLY:
+            periods = dates.astype("datetime64[M]").astype(np.int64)
+        case RebalanceFrequency.QUARTERLY:
+            periods = dates.astype("datetime64[M]").astype(np.int64) // 3
+        case RebalanceFrequency.YEARLY:
+            periods = dates.astype("datetime64[Y]").astype(np.int64)
+
+    return np.flatnonzero(periods[1:] != periods[:-1]) + 1
+
+
+def _report(
+    dates: npt.NDArray[np.datetime64],
+    simulation: _Simulation,
+    initial_cash: float,
+    frequency: RebalanceFrequency | None,
+    band: float | None,
+    rebalance_count: int,
+) -> BacktestReport:
+    values = simulation.values
+    years = (dates[-1] - dates[0]).astype("timedelta64[D]").astype(np.int64) / 365.25
+    final_value = float(values[-1])
+    daily_returns = values[1:] / values[:-1] - 1
+    drawdowns = values / np.maximum.accumulate(values) - 1
+    return BacktestReport(
+        start=dates[0].item(),
+        end=dates[-1].item(),
+        frequency=frequency,
+        band=band,
+        initial_value=initial_cash,
+        final_value=final_value,
+        total_return=final_value / initial_cash - 1,
+        cagr=(final_value / initial_cash) ** (1 / years) - 1 if years > 0 else 0.0,
+        volatility=float(daily_returns.std() * np.sqrt(TRADING_DAYS_PER_YEAR))
+        if daily_returns.size
+        else 0.0,
+        max_drawdown=float(drawdowns.min()),
+        turnover=simulation.traded_amount / 2 / float(values.mean()) / years if years > 0 else 0.0,
+        trading_cost=simulation.trading_cost,
+        rebalance_count=rebalance_count,
+    )
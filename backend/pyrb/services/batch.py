@@ -0,0 +1,150 @@
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from uuid import UUID
+
+from pyrb.models.batch import AccountRebalanceReport, BatchRebalanceReport
+from pyrb.repositories.brokerages.cache import CachedPriceFetcher, PriceCache
+from pyrb.repositories.brokerages.context import RebalanceContext
+from pyrb.repositories.brokerages.rate_limit import RateLimitedOrderManager, RateLimiter
+from pyrb.services.rebalance import Rebalancer
+from pyrb.services.strategy.base import Strategy
+
+ORDER_RATE_LIMIT = 10  # 모든 계좌를 합산한 초당 주문 제출 수
+
+logger = logging.getLogger(__name__)
+
+
+class BatchRebalancer:
+    """
+    Rebalances several accounts to the same strategy concurrently.
+
+    The portfolios are loaded concurrently, and the current prices of the union of all
+    symbols are fetched once into a price cache shared by every account. Orders are placed
+    concurrently with per-account isolation: a failure of one account is reported and does
+    not affect the others. All orders share a global rate-limit budget.
+
+    Args:
+        contexts (dict[UUID, RebalanceContext]): The contexts keyed by account id.
+        price_cache (PriceCache | None): The price cache shared by the accounts.
+        rate_limiter (RateLimiter | None): The rate limiter shared by the accounts.
+        max_workers (int): The maximum number of accounts processed at the same time.
+    """
+
+    def __init__(
+        self,
+        contexts: dict[UUID, RebalanceContext],
+        price_cache: PriceCache | None = None,
+        rate_limiter: RateLimiter | None = None,
+        max_workers: int = 8,
+    ) -> None:
+        price_cache = price_cache or PriceCache()
+        rate_limiter = rate_limiter or RateLimiter(rate=ORDER_RATE_LIMIT)
+        self._contexts = {
+            account_id: RebalanceContext(
+                portfolio=context.portfolio,
+                price_fetcher=CachedPriceFetcher(context.price_fetcher, price_cache),
+                order_manager=RateLimitedOrderManager(context.order_manager, rate_limiter),
+            )
+            for account_id, context in contexts.items()
+        }
+        self._max_workers = max_workers
+
+    def prepare(self, strategy: Strategy, investment_ratio: float) -> BatchRebalanceReport:
+        """
+        Prepares the orders of every account.
+
+        Args:
+            strategy (Strategy): The strategy to rebalance every account to.
+            investment_ratio (float): The share of each account's total value to invest.
+
+        Returns:
+            BatchRebalanceReport: The orders and timings per account, without placed orders.
+        """
+        started_at = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            reports = list(executor.map(self._load, self._contexts))
+            loaded = [report for report in reports if report.error is None]
+
+            prefetch_error = None
+            try:
+                self._prefetch_prices(loaded, strategy)
+            except Exception as e:
+                # 일괄 조회에 실패하면 각 계좌가 주문 산출 시 개별적으로 현재가를 조회합니다.
+                logger.warning("Failed to prefetch the current prices", exc_info=True)
+                prefetch_error = f"Failed to prefetch the current prices: {e}"
+
+            list(
+                executor.map(lambda report: self._plan(report, strategy, investment_ratio), loaded)
+            )
+
+        return BatchRebalanceReport(
+            reports=reports,
+            elapsed_seconds=time.perf_counter() - started_at,
+            prefetch_error=prefetch_error,
+        )
+
+    def place(self, batch_report: BatchRebalanceReport) -> BatchRebalanceReport:
+        """
+        Places the prepared orders of every account that has no error.
+
+        Args:
+            batch_report (BatchRebalanceReport): The report returned by `prepare`.
+
+        Returns:
+            BatchRebalanceReport: The report with the placed orders and timings.
+        """
+        started_at = time.perf_counter()
+        reports = [report.model_copy(deep=True) for report in batch_report.reports]
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            list(executor.map(self._place, [report for report in reports if report.error is None]))
+
+        return BatchRebalanceReport(
+            reports=reports,
+            elapsed_seconds=batch_report.elapsed_seconds + time.perf_counter() - started_at,
+            prefetch_error=batch_report.prefetch_error,
+        )
+
+    def _load(self, account_id: UUID) -> AccountRebalanceReport:
+        report = AccountRebalanceReport(account_id=account_id)
+        started_at = time.perf_counter()
+        try:
+            portfolio = self._contexts[account_id].portfolio
+            portfolio.refresh()
+            portfolio.total_value  # noqa: B018 - make sure the balances are loaded
+        except Exception as e:
+            report.error = f"Failed to load the portfolio: {e}"
+        report.load_seconds = time.perf_counter() - started_at
+        return report
+
+    def _prefetch_prices(self, reports: list[AccountRebalanceReport], strategy: Strategy) -> None:
+        """Fetches the prices of every account's symbols into the shared cache at once."""
+        if not reports:
+            return
+
+        symbols = set(strategy.create_target_weights())
+        for report in reports:
+            symbols.update(self._contexts[report.account_id].portfolio.holding_symbols)
+
+        self._contexts[reports[0].account_id].price_fetcher.get_current_prices(list(symbols))
+
+    def _plan(
+        self, report: AccountRebalanceReport, strategy: Strategy, investment_ratio: float
+    ) -> None:
+        started_at = time.perf_counter()
+        try:
+            context = self._contexts[report.account_id]
+            report.investment_amount = context.portfolio.total_value * investment_ratio
+            report.orders = Rebalancer(context).prepare_orders(strategy, report.investment_amount)
+        except Exception as e:
+            report.error = f"Failed to prepare orders: {e}"
+        report.plan_seconds = time.perf_counter() - started_at
+
+    def _place(self, report: AccountRebalanceReport) -> None:
+        started_at = time.perf_counter()
+        try:
+            context = self._contexts[report.account_id]
+            report.placed_orders = Rebalancer(context).place_orders(report.orders)
+        except Exception as e:
+            report.error = f"Failed to place orders: {e}"
+        report.place_seconds = time.perf_counter() - started_at
@@ -0,0 +1,152 @@
+import datetime
+import threading
+from collections.abc import Callable
+from zoneinfo import ZoneInfo
+
+from pyrb.models.drift import DriftEvent, DriftSnapshot, SymbolDrift
+from pyrb.models.price import CurrentPrice
+from pyrb.repositories.brokerages.context import RebalanceContext
+from pyrb.services.strategy.base import Strategy
+
+DriftListener = Callable[[DriftEvent], None]
+
+
+class DriftMonitor:
+    """
+    Keeps the current weights of a portfolio against the target weights of a strategy,
+    updated incrementally on every price tick.
+
+    A tick only changes the value of its symbol, so the value of that symbol and the total
+    value are adjusted by the difference in O(1), without reloading the portfolio or
+    fetching any price. The weights of the other symbols are derived from the cached values
+    when their threshold crossings are checked. Held symbols that are not part of the
+    strategy are monitored with a target weight of 0.
+
+    Args:
+        target_weights (dict[str, float]): The target weights of the strategy.
+        quantities (dict[str, int]): The held quantity per symbol.
+        cash_balance (float): The cash balance, which is part of the total value.
+        prices (dict[str, CurrentPrice]): The current prices of the monitored symbols.
+        threshold (float): The absolute drift of a weight that triggers an event.
+    """
+
+    def __init__(
+        self,
+        target_weights: dict[str, float],
+        quantities: dict[str, int],
+        cash_balance: float,
+        prices: dict[str, CurrentPrice],
+        threshold: float = 0.05,
+    ) -> None:
+        symbols = sorted(set(target_weights) | set(quantities))
+        self._threshold = threshold
+        self._target_weights = {symbol: target_weights.get(symbol, 0.0) for symbol in symbols}
+        self._quantities = {symbol: quantities.get(symbol, 0) for symbol in symbols}
+        self._values = {
+            symbol: float(self._quantities[symbol] * prices[symbol].price) for symbol in symbols
+        }
+        self._cash_balance = cash_balance
+        self._total_value = cash_balance + sum(self._values.values())
+        self._breached = {
+            symbol for symbol in symbols if abs(self._drift(symbol)) > self._threshold
+        }
+        self._listeners: list[DriftListener] = []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_context(
+        cls, context: RebalanceContext, strategy: Strategy, threshold: float = 0.05
+    ) -> "DriftMonitor":
+        """Creates a monitor from the current portfolio and prices of the context."""
+        target_weights = strategy.create_target_weights()
+        portfolio = context.portfolio
+        quantities = {position.asset.symbol: position.quantity for position in portfolio.positions}
+        prices = context.price_fetcher.get_current_prices(
+            sorted(set(target_weights) | set(quantities))
+        )
+        return cls(target_weights, quantities, portfolio.cash_balance, prices, threshold)
+
+    @property
+    def symbols(self) -> list[str]:
+        return list(self._values)
+
+    def add_listener(self, listener: DriftListener) -> None:
+        with self._lock:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: DriftListener) -> None:
+        with self._lock:
+            self._listeners.remove(listener)
+
+    def update(self, price: CurrentPrice) -> list[DriftEvent]:
+        """
+        Applies a price tick and returns the threshold crossings it caused.
+        The events are also passed to the listeners.
+
+        Args:
+            price (CurrentPrice): The new price of a symbol. Unmonitored symbols are ignored.
+
+        Returns:
+            list[DriftEvent]: The symbols whose drift crossed the threshold.
+        """
+        with self._lock:
+            value = self._values.get(price.symbol)
+            if value is None:
+                return []
+
+            new_value = float(self._quantities[price.symbol] * price.price)
+            if new_value == value:
+                return []
+
+            self._values[price.symbol] = new_value
+            self._total_value += new_value - value
+
+            dt = datetime.datetime.now(ZoneInfo("Asia/Seoul"))
+            events = []
+            for symbol in self._values:
+                breached = abs(self._drift(symbol)) > self._threshold
+                if breached != (symbol in self._breached):
+                    if breached:
+                        self._breached.add(symbol)
+                    else:
+                        self._breached.discard(symbol)
+                    events.append(
+                        DriftEvent(
+                            symbol_drift=self._symbol_drift(symbol),
+                            breached=breached,
+                            total_value=self._total_value,
+                            dt=dt,
+                        )
+                    )
+
+            listeners = list(self._listeners)
+
+        for event in events:
+            for listener in listeners:
+                listener(event)
+
+        return events
+
+    def snapshot(self) -> DriftSnapshot:
+        with self._lock:
+            return DriftSnapshot(
+                total_value=self._total_value,
+                drifts=[self._symbol_drift(symbol) for symbol in self._values],
+                threshold=self._threshold,
+                breached_symbols=sorted(self._breached),
+                dt=datetime.datetime.now(ZoneInfo("Asia/Seoul")),
+            )
+
+    def _weight(self, symbol: str) -> float:
+        return self._values[symbol] / self._total_value if self._total_value else 0.0
+
+    def _drift(self, symbol: str) -> float:
+        return self._weight(symbol) - self._target_weights[symbol]
+
+    def _symbol_drift(self, symbol: str) -> SymbolDrift:
+        return SymbolDrift(
+            symbol=symbol,
+            target_weight=self._target_weights[symbol],
+            current_weight=self._weight(symbol),
+            drift=self._drift(symbol),
+        )
@@ -0,0 +1,125 @@
+from collections import deque
+from math import floor
+
+from pyrb.enums import OrderSide
+from pyrb.exceptions import OrderPlacementError
+from pyrb.models.order import Order, OrderPlacementResult
+from pyrb.repositories.brokerages.context import RebalanceContext
+
+# 매도 체결대금에서 빠지는 비용의 보수적인 상한: 증권거래세(농어촌특별세 포함)와 위탁수수료
+SELL_TAX_RATE = 0.0018
+COMMISSION_RATE = 0.00015
+
+
+class BuyReleasePipeline:
+    """
+    An execution pipeline that places all sell orders first and releases buy orders
+    as confirmed sell fills free up cash.
+
+    Buy orders are released in the given order. A buy order is released as soon as the
+    available cash covers it. A sell fill only adds its net proceeds, after the sell tax
+    and the commission, to the available cash. Once every sell order is filled (or the fill
+    timeout expires), the remaining buy orders are re-sized against the cash left at that time.
+
+    Args:
+        context (RebalanceContext): The context for rebalancing.
+        fill_timeout (float): The maximum number of seconds to wait for sell fills.
+        sell_cost_rate (float): The share of the sell proceeds paid as tax and commission.
+    """
+
+    def __init__(
+        self,
+        context: RebalanceContext,
+        fill_timeout: float = 60.0,
+        sell_cost_rate: float = SELL_TAX_RATE + COMMISSION_RATE,
+    ) -> None:
+        self._context = context
+        self._fill_timeout = fill_timeout
+        self._sell_cost_rate = sell_cost_rate
+
+    def run(self, orders: list[Order]) -> list[OrderPlacementResult]:
+        """
+        Places the given orders and returns the placement results.
+        Results of the buy orders hold the orders as they were re-sized at release time.
+
+        Args:
+            orders (list[Order]): A list of orders to be placed in the market.
+
+        Returns:
+            list[OrderPlacementResult]: A list of order placement results.
+        """
+        sell_orders = [order for order in orders if order.side == OrderSide.SELL]
+        pending_buy_orders = deque(order for order in orders if order.side == OrderSide.BUY)
+
+        res = []
+        placed_sell_orders = []
+        for order in sell_orders:
+            result = self._place_order(order)
+            res.append(result)
+            if result.success:
+                placed_sell_orders.append(order)
+
+        available_cash = self._context.portfolio.cash_balance
+        released = self._release_affordable(pending_buy_orders, available_cash)
+        available_cash -= self._placed_amount(released)
+        res.extend(released)
+
+        if pending_buy_orders and placed_sell_orders:
+            for fill in self._context.order_manager.wait_for_fills(
+                placed_sell_orders, self._fill_timeout
+            ):
+                available_cash += floor(fill.amount * (1 - self._sell_cost_rate))
+                released = self._release_affordable(pending_buy_orders, available_cash)
+                available_cash -= self._placed_amount(released)
+                res.extend(released)
+                if not pending_buy_orders:
+                    break
+
+        while pending_buy_orders:
+            order = pending_buy_orders.popleft()
+            quantity = min(order.quantity, floor(available_cash / order.price))
+            if quantity <= 0:
+                res.append(
+                    OrderPlacementResult(
+                        order=order, success=False, message="Insufficient cash after sell fills"
+                    )
+                )
+                continue
+
+            result = self._place_order(order.model_copy(update={"quantity": quantity}))
+            available_cash -= self._placed_amount([result])
+            res.append(result)
+
+        return res
+
+    def _release_affordable(
+        self, pending_buy_orders: deque[Order], available_cash: float
+    ) -> list[OrderPlacementResult]:
+        """Place the pending buy orders from the head of the queue while the cash covers them."""
+        res = []
+        while pending_buy_orders:
+            order = pending_buy_orders[0]
+            if order.quantity * order.price > available_cash:
+                break
+
+            pending_buy_orders.popleft()
+            result = self._place_order(order)
+            available_cash -= self._placed_amount([result])
+            res.append(result)
+
+        return res
+
+    def _place_order(self, order: Order) -> OrderPlacementResult:
+        try:
+            self._context.order_manager.place_order(order)
+            return OrderPlacementResult(order=order, success=True)
+        except OrderPlacementError as e:
+            return OrderPlacementResult(order=order, success=False, message=str(e))
+
+    @staticmethod
+    def _placed_amount(results: list[OrderPlacementResult]) -> int:
+        return sum(
+            result.order.quantity * result.order.price
+            for result in results
+            if result.success and result.order.side == OrderSide.BUY
+        )
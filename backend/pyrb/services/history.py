@@ -0,0 +1,82 @@
+import datetime
+from zoneinfo import ZoneInfo
+
+from pyrb.repositories.brokerages.base.history import DailyBarFetcher
+from pyrb.repositories.history import PriceHistoryRepository
+
+KST = ZoneInfo("Asia/Seoul")
+MARKET_CLOSE = datetime.time(15, 30)  # 정규장 마감 시각 (KST)
+
+
+class PriceHistoryService:
+    """
+    Keeps the local daily price history up to date with the brokerage.
+
+    A sync downloads only the bars from the latest stored bar on. The latest stored bar is
+    downloaded again to detect a price adjustment, e.g. after a stock split, which changes
+    the adjusted prices of the whole history; only then is the history of that symbol
+    downloaded again. The bar of the current day is stored only after the market closed, so
+    that no stored bar is ever incomplete.
+
+    Args:
+        repository (PriceHistoryRepository): The local store of the price history.
+        daily_bar_fetcher (DailyBarFetcher): Fetches the daily bars from the brokerage.
+    """
+
+    def __init__(
+        self, repository: PriceHistoryRepository, daily_bar_fetcher: DailyBarFetcher
+    ) -> None:
+        self._repository = repository
+        self._daily_bar_fetcher = daily_bar_fetcher
+
+    def sync(
+        self,
+        symbols: list[str],
+        since: datetime.date,
+        now: datetime.datetime | None = None,
+    ) -> dict[str, int]:
+        """
+        Downloads the bars missing from the local history of the symbols.
+
+        Args:
+            symbols (list[str]): The symbols to sync.
+            since (datetime.date): The first date to download for a symbol with no history.
+            now (datetime.datetime | None): The current time, or None for the system time.
+
+        Returns:
+            dict[str, int]: The number of bars stored for each symbol.
+        """
+        end = last_closed_date(now or datetime.datetime.now(KST))
+        stored_counts = {}
+        for symbol in symbols:
+            last_bar = self._repository.last_bar(symbol)
+            if last_bar is None:
+                bars = self._daily_bar_fetcher.fetch_daily_bars(symbol, since, end)
+                stored_counts[symbol] = self._repository.append(symbol, bars)
+                continue
+
+            if last_bar.date >= end:
+                stored_counts[symbol] = 0
+                continue
+
+            bars = self._daily_bar_fetcher.fetch_daily_bars(symbol, last_bar.date, end)
+            if bars and bars[0].date == last_bar.date and bars[0] != last_bar:
+                # 수정주가가 바뀌었으므로 저장된 기간 전체를 다시 받습니다.
+                first_date = self._repository.read_bars(symbol)["date"][0].item()
+                bars = self._daily_bar_fetcher.fetch_daily_bars(symbol, first_date, end)
+                self._repository.replace(symbol, bars)
+                stored_counts[symbol] = len(bars)
+                continue
+
+            stored_counts[symbol] = self._repository.append(symbol, bars)
+
+        return stored_counts
+
+
+def last_closed_date(now: datetime.datetime) -> datetime.date:
+    """The latest date whose regular session has closed, trading day or not."""
+    now = now.astimezone(KST)
+    if now.time() < MARKET_CLOSE:
+        return now.date() - datetime.timedelta(days=1)
+
+    return now.date()
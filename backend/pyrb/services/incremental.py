@@ -0,0 +1,100 @@
+import time
+
+from pyrb.exceptions import InsufficientFundsException
+from pyrb.models.order import Order
+from pyrb.models.plan import PlanUpdate
+from pyrb.models.price import CurrentPrice
+from pyrb.repositories.brokerages.context import RebalanceContext
+from pyrb.services.rebalance import create_order, sort_sells_first
+
+
+class IncrementalPlanner:
+    """
+    Keeps the orders of an explicit-target plan up to date while the target weights are
+    being edited, without reloading the portfolio or re-pricing every symbol.
+
+    The portfolio snapshot is loaded once. Each `update` diffs the new target weights against
+    the previous ones and recomputes only the orders of the symbols whose weight changed,
+    which is plain arithmetic. An edit that changes the total of the raw weights changes
+    every normalized weight, so every order is recomputed in that case. Prices are fetched
+    only for symbols that were never priced, and are refetched in one batched request once
+    they are older than `price_ttl` seconds. The orders are the same as
+    `Rebalancer.prepare_orders` would create with the same prices.
+
+    Args:
+        context (RebalanceContext): The context of the account to rebalance.
+        investment_amount (float): The amount of money to invest in the portfolio.
+        price_ttl (float): The number of seconds the fetched prices stay valid.
+    """
+
+    def __init__(
+        self, context: RebalanceContext, investment_amount: float, price_ttl: float = 60.0
+    ) -> None:
+        if investment_amount > context.portfolio.total_value:
+            raise InsufficientFundsException(
+                "Insufficient funds. The amount of your total asset is"
+                f" {context.portfolio.total_value}"
+            )
+
+        self._context = context
+        self._investment_amount = investment_amount
+        self._price_ttl = price_ttl
+        self._position_amounts = {
+            position.asset.symbol: position.total_amount for position in context.portfolio.positions
+        }
+
+        self._weights: dict[str, float] = {}
+        self._orders: dict[str, Order] = {}
+        self._prices: dict[str, CurrentPrice] = {}
+        self._priced_at: float | None = None
+
+    def update(self, target_weights: dict[str, float]) -> PlanUpdate:
+        """
+        Re-plans the orders for the edited target weights.
+
+        Args:
+            target_weights (dict[str, float]): The normalized target weights.
+
+        Returns:
+            PlanUpdate: Every order, and the symbols whose orders were recomputed.
+        """
+        now = time.monotonic()
+        if self._priced_at is None or now - self._priced_at > self._price_ttl:
+            # 가격을 모두 다시 조회하면 모든 주문을 다시 계산합니다.
+            self._prices = self._context.price_fetcher.get_current_prices(list(target_weights))
+            self._priced_at = now
+            self._weights = {}
+        else:
+            missing_symbols = [symbol for symbol in target_weights if symbol not in self._prices]
+            if missing_symbols:
+                self._prices |= self._context.price_fetcher.get_current_prices(missing_symbols)
+
+        changed_symbols = [
+            symbol
+            for symbol, weight in target_weights.items()
+            if self._weights.get(symbol) != weight
+        ]
+        removed_symbols = [symbol for symbol in self._weights if symbol not in target_weights]
+        for symbol in removed_symbols:
+            self._orders.pop(symbol, None)
+
+        for symbol in changed_symbols:
+            order = create_order(
+                symbol,
+                target_weights[symbol],
+                self._prices[symbol].price,
+                self._position_amounts.get(symbol, 0),
+                self._investment_amount,
+            )
+            if order is not None:
+                self._orders[symbol] = order
+            else:
+                self._orders.pop(symbol, None)
+
+        self._weights = dict(target_weights)
+        orders = [self._orders[symbol] for symbol in target_weights if symbol in self._orders]
+        return PlanUpdate(
+            orders=sort_sells_first(orders),
+            changed_symbols=changed_symbols,
+            removed_symbols=removed_symbols,
+        )
@@ -0,0 +1,362 @@
+from collections.abc import Iterable, Iterator
+from functools import partial
+from typing import NamedTuple
+
+import numpy as np
+import numpy.typing as npt
+
+from pyrb.exceptions import PriceHistoryError
+from pyrb.models.montecarlo import (
+    DistributionSummary,
+    MonteCarloSpec,
+    PolicySummary,
+    RebalancePolicy,
+)
+from pyrb.repositories.history import PriceMatrix
+from pyrb.services.backtest import (
+    TRADING_DAYS_PER_YEAR,
+    fill_closes,
+    period_starts,
+    rebalance_to_target,
+)
+from pyrb.services.parallel import SharedArrays, run_on_shared_arrays
+
+PATHS_PER_BATCH = 256  # 작업 하나에서 함께 시뮬레이션하는 경로 수
+METRICS = (
+    "final_value",
+    "cagr",
+    "volatility",
+    "max_drawdown",
+    "turnover",
+    "trading_cost",
+    "rebalance_count",
+)
+
+
+class _WorkerContext(NamedTuple):
+    spec: MonteCarloSpec
+    returns: npt.NDArray[np.float64]  # (과거 거래일, 종목) 일간 로그 수익률
+    initial_prices: npt.NDArray[np.float64]  # (종목,) 마지막 종가
+    dates: npt.NDArray[np.datetime64]  # (시뮬레이션 거래일 + 1,) 가상의 거래일
+
+
+class _Batch(NamedTuple):
+    start: int  # 첫 경로의 번호
+    path_count: int
+    seed: np.random.SeedSequence
+
+
+class MonteCarloSimulator:
+    """
+    Evaluates rebalance policies on synthetic price paths bootstrapped from the daily closes
+    of a `PriceMatrix`, and summarizes the distribution of their outcomes.
+
+    Every path starts from the last closes and draws blocks of consecutive daily returns of
+    every symbol at once from the history, which keeps the correlations between the symbols
+    and the short-term autocorrelation of the returns. Every policy is evaluated on the same
+    paths, so their differences are not blurred by sampling noise.
+
+    A policy trades like `Backtester`, with `rebalance_to_target`. The simulation steps
+    through the days once for a whole batch of paths and every policy, as arrays of paths
+    by symbols, so the Python-level loop runs once per day, not once per path. Only the
+    prices of the current day are kept, and each batch returns a few metrics per path, so
+    the memory is bounded by the batch size rather than by the number of paths.
+
+    Batches run on a process pool sharing the returns with `run_on_shared_arrays`. Each batch
+    draws from its own seed derived from the seed of the spec, so the results do not depend
+    on the number of workers.
+
+    Args:
+        prices (PriceMatrix): The daily closes to bootstrap the returns from.
+        max_workers (int | None): The number of worker processes. Defaults to the CPU count.
+        paths_per_batch (int): The number of paths a worker simulates per task.
+    """
+
+    def __init__(
+        self,
+        prices: PriceMatrix,
+        max_workers: int | None = None,
+        paths_per_batch: int = PATHS_PER_BATCH,
+    ) -> None:
+        self._prices = prices
+        self._max_workers = max_workers
+        self._paths_per_batch = paths_per_batch
+
+    def run(self, spec: MonteCarloSpec) -> list[PolicySummary]:
+        """
+        Simulates the paths of the spec and evaluates each policy on every path.
+
+        Args:
+            spec (MonteCarloSpec): The weights, the policies and the paths to simulate.
+
+        Returns:
+            list[PolicySummary]: The summary of each policy, in the order of the spec.
+
+        Raises:
+            PriceHistoryError: If a symbol has no price history, or the history is shorter
+                than a bootstrap block.
+        """
+        missing_symbols = [symbol for symbol in spec.symbols if symbol not in self._prices.symbols]
+        if missing_symbols:
+            raise PriceHistoryError(f"No price history for: {', '.join(missing_symbols)}")
+
+        dates, closes = fill_closes(self._prices.select(spec.symbols))
+        returns = np.diff(np.log(closes), axis=0)
+        if len(returns) < spec.block_size:
+            raise PriceHistoryError(
+                f"At least {spec.block_size + 1} days of price history are required"
+            )
+
+        # 마지막 종가일부터 이어지는 영업일을 가상의 거래일로 사용합니다.
+        day_count = max(round(spec.years * TRADING_DAYS_PER_YEAR), 1)
+        simulated_dates = np.busday_offset(
+            dates[-1].astype("datetime64[D]"), np.arange(day_count + 1), roll="backward"
+        )
+
+        starts = range(0, spec.path_count, self._paths_per_batch)
+        seeds = np.random.SeedSequence(spec.seed).spawn(len(starts))
+        batches = [
+            _Batch(start, min(self._paths_per_batch, spec.path_count - start), seed)
+            for start, seed in zip(starts, seeds, strict=True)
+        ]
+        results = np.empty((len(spec.policies), len(METRICS), spec.path_count), dtype=np.float64)
+        for batch, batch_results in run_on_shared_arrays(
+            {"returns": returns},
+            partial(_create_worker_context, spec, closes[-1], simulated_dates),
+            _simulate_batch,
+            batches,
+            self._max_workers,
+        ):
+            results[:, :, batch.start : batch.start + batch.path_count] = batch_results
+
+        return [
+            _summarize(policy, results[k], spec.investment_amount)
+            for k, policy in enumerate(spec.policies)
+        ]
+
+
+def bootstrap_prices(
+    returns: npt.NDArray[np.float64],
+    initial_prices: npt.NDArray[np.float64],
+    path_count: int,
+    day_count: int,
+    block_size: int,
+    rng: np.random.Generator,
+) -> Iterator[npt.NDArray[np.float64]]:
+    """
+    Yields the prices of every path day by day, starting with the initial prices.
+
+    Args:
+        returns (npt.NDArray[np.float64]): The historical daily log returns, days by symbols.
+        initial_prices (npt.NDArray[np.float64]): The prices of the first day.
+        path_count (int): The number of paths.
+        day_count (int): The number of days to simulate after the first day.
+        block_size (int): The number of consecutive historical days drawn at once.
+        rng (np.random.Generator): The random generator.
+
+    Yields:
+        npt.NDArray[np.float64]: The prices of a day, symbols by paths.
+    """
+    block_count = -(-day_count // block_size)
+    starts = rng.integers(0, len(returns) - block_size + 1, size=(path_count, block_count))
+    # 경로마다 뽑은 블록들을 이어 붙여 날짜별로 사용할 과거 거래일의 인덱스를 만듭니다.
+    rows = (starts[:, :, np.newaxis] + np.arange(block_size)).reshape(path_count, -1)
+    # 종목을 첫 번째 축에 두어 종목별 합계가 경로 방향의 연속된 덧셈이 되게 합니다.
+    symbol_returns = np.ascontiguousarray(returns.T)
+    log_prices = np.repeat(np.log(initial_prices)[:, np.newaxis], path_count, axis=1)
+    yield np.exp(log_prices)
+    for day in range(day_count):
+        log_prices += symbol_returns[:, rows[:, day]]
+        yield np.exp(log_prices)
+
+
+def evaluate_policies(
+    daily_prices: Iterable[npt.NDArray[np.float64]],
+    dates: npt.NDArray[np.datetime64],
+    target: npt.NDArray[np.float64],
+    policies: list[RebalancePolicy],
+    investment_amount: float,
+    cost_rate: float = 0.0,
+) -> npt.NDArray[np.float64]:
+    """
+    Runs every policy on every path at once, buying the target weights on the first day.
+
+    Args:
+        daily_prices (Iterable[npt.NDArray[np.float64]]): The prices of each day, symbols
+            by paths, one array per date.
+        dates (npt.NDArray[np.datetime64]): The dates of the prices.
+        target (npt.NDArray[np.float64]): The target weights, in the order of the symbols.
+        policies (list[RebalancePolicy]): The policies to evaluate.
+        investment_amount (float): The cash to start with.
+        cost_rate (float): The trading cost as a fraction of the traded amount.
+
+    Returns:
+        npt.NDArray[np.float64]: The `METRICS` of every path, policies by metrics by paths.
+    """
+    # 정기 리밸런싱일(또는 매일)에 비중 이탈을 확인하고, 이탈 폭이 없으면 항상 리밸런싱합니다.
+    candidates = np.zeros((len(policies), len(dates)), dtype=bool)
+    bands = np.array([policy.band or 0.0 for policy in policies])
+    has_band = np.array([policy.band is not None for policy in policies])
+    for k, policy in enumerate(policies):
+        if policy.frequency is not None:
+            candidates[k, period_starts(dates, policy.frequency)] = True
+        elif policy.band is not None:
+            candidates[k, 1:] = True
+
+    days = iter(daily_prices)
+    prices = next(days)
+    simulation = _PathSimulation(
+        len(policies), prices.shape[1], target, investment_amount, cost_rate
+    )
+    simulation.rebalance(prices, np.ones(simulation.cash.shape, dtype=bool), count_turnover=False)
+    simulation.record(prices)
+    for day, prices in enumerate(days, start=1):
+        due = candidates[:, day]
+        if due.any():
+            rebalancing = np.repeat(due[:, np.newaxis], prices.shape[1], axis=1)
+            if (due & has_band).any():
+                rebalancing &= ~has_band[:, np.newaxis] | (
+                    simulation.drift(prices) > bands[:, np.newaxis]
+                )
+            if rebalancing.any():
+                simulation.rebalance(prices, rebalancing)
+        simulation.record(prices)
+
+    years = (dates[-1] - dates[0]).astype("timedelta64[D]").astype(np.int64) / 365.25
+    return simulation.metrics(investment_amount, float(years))
+
+
+class _PathSimulation:
+    """The state of every policy on every path, as arrays of (symbols by) policies by paths."""
+
+    def __init__(
+        self,
+        policy_count: int,
+        path_count: int,
+        target: npt.NDArray[np.float64],
+        investment_amount: float,
+        cost_rate: float,
+    ) -> None:
+        shape = (policy_count, path_count)
+        self.cost_rate = cost_rate
+        self.target = target[:, np.newaxis, np.newaxis]
+        self.shares = np.zeros((len(target), *shape), dtype=np.float64)
+        self.cash = np.full(shape, investment_amount, dtype=np.float64)
+        self.traded_amount = np.zeros(shape)  # 최초 매수를 제외한 매매금액
+        self.trading_cost = np.zeros(shape)
+        self.rebalance_count = np.zeros(shape)
+
+        # 평가금액을 모두 저장하지 않고 지표에 필요한 값만 누적합니다.
+        self.value = np.zeros(shape)
+        self.peak = np.zeros(shape)
+        self.max_drawdown = np.zeros(shape)
+        self.value_sum = np.zeros(shape)
+        self.return_sum = np.zeros(shape)
+        self.return_square_sum = np.zeros(shape)
+        self.day_count = 0
+
+    def rebalance(
+        self,
+        prices: npt.NDArray[np.float64],
+        mask: npt.NDArray[np.bool_],
+        count_turnover: bool = True,
+    ) -> None:
+        rebalanced = rebalance_to_target(
+            self.shares, prices[:, np.newaxis, :], self.cash, self.target, self.cost_rate, mask
+        )
+        self.shares += rebalanced.trades
+        self.cash = rebalanced.cash
+        self.trading_cost += rebalanced.cost
+        if count_turnover:
+            self.traded_amount += rebalanced.traded_amount
+            self.rebalance_count += mask
+
+    def drift(self, prices: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        """The largest drift of a weight in the invested amount from its target."""
+        amounts = self.shares * prices[:, np.newaxis, :]
+        weights = amounts / amounts.sum(axis=0)
+        drift: npt.NDArray[np.float64] = np.abs(weights - self.target).max(axis=0)
+        return drift
+
+    def record(self, prices: npt.NDArray[np.float64]) -> None:
+        value = (self.shares * prices[:, np.newaxis, :]).sum(axis=0) + self.cash
+        if self.day_count:
+            daily_return = value / self.value - 1
+            self.return_sum += daily_return
+            self.return_square_sum += daily_return**2
+        np.maximum(self.peak, value, out=self.peak)
+        np.minimum(self.max_drawdown, value / self.peak - 1, out=self.max_drawdown)
+        self.value_sum += value
+        self.value = value
+        self.day_count += 1
+
+    def metrics(self, investment_amount: float, years: float) -> npt.NDArray[np.float64]:
+        return_count = max(self.day_count - 1, 1)
+        mean_return = self.return_sum / return_count
+        variance = np.maximum(self.return_square_sum / return_count - mean_return**2, 0)
+        mean_value = self.value_sum / self.day_count
+        if years > 0:
+            cagr = (self.value / investment_amount) ** (1 / years) - 1
+            turnover = self.traded_amount / 2 / mean_value / years
+        else:
+            cagr = turnover = np.zeros_like(self.value)
+
+        metrics = {
+            "final_value": self.value,
+            "cagr": cagr,
+            "volatility": np.sqrt(variance * TRADING_DAYS_PER_YEAR),
+            "max_drawdown": self.max_drawdown,
+            "turnover": turnover,
+            "trading_cost": self.trading_cost,
+            "rebalance_count": self.rebalance_count,
+        }
+        return np.stack([metrics[metric] for metric in METRICS], axis=1)
+
+
+def _create_worker_context(
+    spec: MonteCarloSpec,
+    initial_prices: npt.NDArray[np.float64],
+    dates: npt.NDArray[np.datetime64],
+    arrays: SharedArrays,
+) -> _WorkerContext:
+    return _WorkerContext(spec, arrays["returns"], initial_prices, dates)
+
+
+def _simulate_batch(context: _WorkerContext, batch: _Batch) -> npt.NDArray[np.float64]:
+    spec, returns, initial_prices, dates = context
+    daily_prices = bootstrap_prices(
+        returns,
+        initial_prices,
+        batch.path_count,
+        len(dates) - 1,
+        spec.block_size,
+        np.random.default_rng(batch.seed),
+    )
+    target = np.array([spec.weights[symbol] for symbol in spec.symbols], dtype=np.float64)
+    return evaluate_policies(
+        daily_prices, dates, target, spec.policies, spec.investment_amount, spec.cost_rate
+    )
+
+
+def _summarize(
+    policy: RebalancePolicy, results: npt.NDArray[np.float64], investment_amount: float
+) -> PolicySummary:
+    summaries = {}
+    for metric, values in zip(METRICS, results, strict=True):
+        p5, p25, median, p75, p95 = np.percentile(values, [5, 25, 50, 75, 95]).tolist()
+        summaries[metric] = DistributionSummary(
+            mean=float(values.mean()),
+            std=float(values.std()),
+            p5=p5,
+            p25=p25,
+            median=median,
+            p75=p75,
+            p95=p95,
+        )
+
+    return PolicySummary(
+        policy=policy,
+        path_count=results.shape[1],
+        shortfall_probability=float((results[0] < investment_amount).mean()),
+        **summaries,
+    )
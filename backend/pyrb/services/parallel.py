@@ -0,0 +1,75 @@
+import tempfile
+from collections.abc import Callable, Generator, Iterable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, TypeVar
+
+import numpy as np
+import numpy.typing as npt
+
+SharedArrays = dict[str, npt.NDArray[Any]]
+StateT = TypeVar("StateT")
+ItemT = TypeVar("ItemT")
+ResultT = TypeVar("ResultT")
+
+# 작업 프로세스마다 공유 배열을 매핑하여 만든 상태를 한 번만 만듭니다.
+_UNINITIALIZED = object()
+_worker_state: Any = _UNINITIALIZED
+
+
+def run_on_shared_arrays(
+    arrays: SharedArrays,
+    setup: Callable[[SharedArrays], StateT],
+    task: Callable[[StateT, ItemT], ResultT],
+    items: Iterable[ItemT],
+    max_workers: int | None = None,
+) -> Generator[tuple[ItemT, ResultT], None, None]:
+    """
+    Runs a task per item on a process pool whose workers share read-only arrays.
+
+    The arrays are written once to memory-mapped files that every worker maps read-only,
+    so the workers share the pages of a single copy instead of receiving the arrays with
+    every task. Each worker builds its state once from the mapped arrays with `setup`, and
+    every task of the worker receives that state. `setup` and `task` must be picklable,
+    e.g. module-level functions or partials of them.
+
+    Args:
+        arrays (SharedArrays): The arrays shared by every worker, by name.
+        setup (Callable[[SharedArrays], StateT]): Builds the state of a worker.
+        task (Callable[[StateT, ItemT], ResultT]): Runs an item on the state of a worker.
+        items (Iterable[ItemT]): The items to run.
+        max_workers (int | None): The number of worker processes. Defaults to the CPU count.
+
+    Yields:
+        tuple[ItemT, ResultT]: Each item with its result, in the order they complete. If the
+            iteration is stopped early, the items that have not started are cancelled.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        for name, array in arrays.items():
+            np.save(Path(directory) / f"{name}.npy", array)
+
+        executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(directory, list(arrays), setup),
+        )
+        try:
+            futures = {executor.submit(_run_task, task, item): item for item in items}
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            # 중단된 경우 아직 시작하지 않은 작업은 취소합니다.
+            executor.shutdown(cancel_futures=True)
+
+
+def _init_worker(directory: str, names: list[str], setup: Callable[[SharedArrays], object]) -> None:
+    global _worker_state
+    arrays = {name: np.load(Path(directory) / f"{name}.npy", mmap_mode="r") for name in names}
+    _worker_state = setup(arrays)
+
+
+def _run_task(task: Callable[[Any, ItemT], ResultT], item: ItemT) -> ResultT:
+    if _worker_state is _UNINITIALIZED:
+        raise RuntimeError("The worker is not initialized")
+
+    return task(_worker_state, item)
@@ -0,0 +1,94 @@
+import datetime
+import threading
+from collections import OrderedDict
+from uuid import UUID
+from zoneinfo import ZoneInfo
+
+from pyrb.exceptions import PlanMismatchError, PlanNotFoundError, StalePlanError
+from pyrb.models.plan import PortfolioSnapshot, RebalancePlan
+
+
+class RebalancePlanCache:
+    """
+    An in-process cache of prepared rebalance plans.
+
+    A plan is fresh while the prices it was computed from are younger than `max_age` seconds,
+    no orders have been placed for its account since, and the account still holds the cash
+    and quantities the plan was computed from. Fresh plans are served again to
+    repeated requests for the same account and strategy, and can be placed by their id
+    exactly once.
+
+    Args:
+        max_age (float): The number of seconds a plan stays fresh.
+        max_size (int): The maximum number of plans to keep. The oldest plans are evicted first.
+    """
+
+    def __init__(self, max_age: float = 60.0, max_size: int = 128) -> None:
+        self._max_age = max_age
+        self._max_size = max_size
+        self._plans: OrderedDict[UUID, RebalancePlan] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, plan: RebalancePlan) -> None:
+        with self._lock:
+            self._plans[plan.id] = plan
+            while len(self._plans) > self._max_size:
+                self._plans.popitem(last=False)
+
+    def get_latest(
+        self, account_id: UUID, strategy: str, snapshot: PortfolioSnapshot
+    ) -> RebalancePlan | None:
+        """
+        Returns the latest fresh plan for the account and strategy, if any.
+
+        Args:
+            account_id (UUID): The account of the plan.
+            strategy (str): The strategy of the plan.
+            snapshot (PortfolioSnapshot): The current portfolio of the account.
+        """
+        with self._lock:
+            for plan in reversed(self._plans.values()):
+                if plan.account_id == account_id and plan.strategy == strategy:
+                    return plan if self._is_fresh(plan, snapshot) else None
+            return None
+
+    def pop(
+        self, plan_id: UUID, account_id: UUID, strategy: str, snapshot: PortfolioSnapshot
+    ) -> RebalancePlan:
+        """
+        Removes the plan from the cache and returns it, so that it is placed only once.
+
+        Args:
+            plan_id (UUID): The id of the plan.
+            account_id (UUID): The account placing the plan.
+            strategy (str): The strategy the plan is placed for.
+            snapshot (PortfolioSnapshot): The current portfolio of the account.
+
+        Raises:
+            PlanNotFoundError: If the plan does not exist for the account.
+            PlanMismatchError: If the plan was prepared for another strategy. The plan is kept.
+            StalePlanError: If the plan is no longer fresh.
+        """
+        with self._lock:
+            plan = self._plans.get(plan_id)
+            if plan is None or plan.account_id != account_id:
+                raise PlanNotFoundError(f"plan {plan_id} does not exist or was already placed")
+            if plan.strategy != strategy:
+                raise PlanMismatchError(f"plan {plan_id} was prepared for {plan.strategy}")
+
+            del self._plans[plan_id]
+            if not self._is_fresh(plan, snapshot):
+                raise StalePlanError(f"plan {plan_id} is stale. Please prepare the orders again")
+
+            return plan
+
+    def invalidate(self, account_id: UUID) -> None:
+        """Drops every plan of the account, e.g. after its portfolio has changed."""
+        with self._lock:
+            for plan_id in [p.id for p in self._plans.values() if p.account_id == account_id]:
+                del self._plans[plan_id]
+
+    def _is_fresh(self, plan: RebalancePlan, snapshot: PortfolioSnapshot) -> bool:
+        age = datetime.datetime.now(ZoneInfo("Asia/Seoul")) - plan.priced_at
+        # 다른 경로(HTS, 다른 프로세스 등)로 주문이 나갔다면 보유 현황이 달라집니다.
+        return age.total_seconds() <= self._max_age and plan.snapshot.has_same_holdings(snapshot)
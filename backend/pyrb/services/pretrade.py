@@ -0,0 +1,114 @@
+from pyrb.enums import OrderSide, OrderViolationType
+from pyrb.models.order import Order, OrderViolation, PreTradeCheckResult
+from pyrb.repositories.brokerages.context import RebalanceContext
+
+
+class PreTradeChecker:
+    """
+    Validates a batch of orders against the portfolio snapshot of the context before
+    they are sent to the brokerage, so that orders which would be rejected do not cost
+    a round trip.
+
+    The following rules are checked:
+    - the quantity of an order must be positive
+    - a sell order must not exceed the sellable quantity of the position
+    - buy orders must not exceed the cash balance plus the proceeds of the sell orders
+
+    Args:
+        context (RebalanceContext): The context for rebalancing.
+    """
+
+    def __init__(self, context: RebalanceContext) -> None:
+        self._context = context
+
+    def check(self, orders: list[Order], clip_to_sellable: bool = False) -> PreTradeCheckResult:
+        """
+        Checks the orders and returns every violation at once.
+
+        Args:
+            orders (list[Order]): The orders to check.
+            clip_to_sellable (bool): If True, sell orders exceeding the sellable quantity are
+                reduced to the sellable quantity instead of being reported as violations.
+
+        Returns:
+            PreTradeCheckResult: The orders that passed the check and the violations.
+        """
+        sellable_quantities = {
+            position.asset.symbol: position.sellable_quantity
+            for position in self._context.portfolio.positions
+            if position.sellable_quantity > 0
+        }
+
+        passed: list[Order] = []
+        violations: list[OrderViolation] = []
+        sell_proceeds = 0
+
+        for order in orders:
+            if order.quantity <= 0:
+                violations.append(
+                    OrderViolation(
+                        order=order,
+                        violation_type=OrderViolationType.NON_POSITIVE_QUANTITY,
+                        message=f"Order quantity must be positive: {order.quantity}",
+                    )
+                )
+                continue
+
+            if order.side == OrderSide.SELL:
+                if order.symbol not in sellable_quantities:
+                    violations.append(
+                        OrderViolation(
+                            order=order,
+                            violation_type=OrderViolationType.NOT_HELD,
+                            message=f"No sellable position of {order.symbol}",
+                        )
+                    )
+                    continue
+
+                # 같은 종목의 매도주문들은 남은 매도가능수량을 나누어 사용합니다.
+                sellable_quantity = sellable_quantities[order.symbol]
+                if order.quantity > sellable_quantity:
+                    if not clip_to_sellable or sellable_quantity == 0:
+                        violations.append(
+                            OrderViolation(
+                                order=order,
+                                violation_type=OrderViolationType.EXCEEDS_SELLABLE_QUANTITY,
+                                message=(
+                                    f"Sell quantity {order.quantity} exceeds the remaining"
+                                    f" sellable quantity {sellable_quantity}"
+                                ),
+                            )
+                        )
+                        continue
+
+                    order = order.model_copy(update={"quantity": sellable_quantity})
+
+                sellable_quantities[order.symbol] -= order.quantity
+                sell_proceeds += order.quantity * order.price
+
+            passed.append(order)
+
+        # 매수주문은 주문 순서대로 매도대금을 포함한 주문가능금액에서 차감합니다.
+        available_cash = self._context.portfolio.cash_balance + sell_proceeds
+        res: list[Order] = []
+        for order in passed:
+            if order.side == OrderSide.BUY:
+                amount = order.quantity * order.price
+                if amount > available_cash:
+                    violations.append(
+                        OrderViolation(
+                            order=order,
+                            violation_type=OrderViolationType.INSUFFICIENT_CASH,
+                            message=(
+                                f"Buy amount {amount} exceeds the available cash"
+                                f" {available_cash:.0f} after sells"
+                            ),
+                        )
+                    )
+                    continue
+
+                available_cash -= amount
+
+            res.append(order)
+
+        return PreTradeCheckResult(orders=res, violations=violations)
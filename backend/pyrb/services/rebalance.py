@@ -1,17 +1,54 @@
-from math import floor
+from collections.abc import Iterable
 
 from pyrb.enums import (
     OrderSide,
     OrderType,
 )
 from pyrb.exceptions import InsufficientFundsException, OrderPlacementError
-from pyrb.models.order import Order, OrderPlacementResult
+from pyrb.models.order import Order, OrderPlacementResult, PreTradeCheckResult
+from pyrb.models.plan import PlanPreview
 from pyrb.models.price import CurrentPrice
-from pyrb.repositories.brokerages.base.portfolio import Portfolio
 from pyrb.repositories.brokerages.context import RebalanceContext
+from pyrb.services.execution import BuyReleasePipeline
+from pyrb.services.pretrade import PreTradeChecker
+from pyrb.services.sizing import calculate_shares_to_trade
 from pyrb.services.strategy.base import Strategy
 
 
+def create_order(
+    symbol: str,
+    weight: float,
+    current_price: int,
+    current_amount: float,
+    investment_amount: float,
+) -> Order | None:
+    """
+    Create the market order that brings the position of a symbol to its target weight.
+
+    Returns:
+        Order | None: The order, or None if no share needs to be traded.
+    """
+    target_amount = investment_amount * weight
+    difference_in_amount = target_amount - current_amount
+    shares_to_trade = calculate_shares_to_trade(difference_in_amount, current_price)
+    if shares_to_trade == 0:
+        return None
+
+    return Order(
+        symbol=symbol,
+        price=current_price,
+        quantity=abs(shares_to_trade),
+        side=OrderSide.BUY if shares_to_trade > 0 else OrderSide.SELL,
+        order_type=OrderType.MARKET,
+    )
+
+
+def sort_sells_first(orders: list[Order]) -> list[Order]:
+    # 매도주문을 우선 제출
+    orders.sort(key=lambda order: order.side == OrderSide.SELL, reverse=True)
+    return orders
+
+
 class Rebalancer:
     def __init__(self, context: RebalanceContext) -> None:
         self._context = context
@@ -28,68 +65,88 @@ class Rebalancer:
         Returns:
             list[Order]: A list of orders to rebalance the portfolio.
         """
-
-        def _calculate_shares_to_trade(difference_in_amount: float, current_price: float) -> int:
-            """Determine the number of shares to trade based on the difference in amount."""
-            return floor(difference_in_amount / current_price)
-
-        def _get_current_stock_amount(portfolio: Portfolio, stock: str) -> float:
-            """Retrieve the current amount of a stock."""
-            current_position = portfolio.get_position(stock)
-            return current_position.total_amount if current_position else 0
-
-        def _fetch_current_prices(
-            context: RebalanceContext, weight_by_stock: dict[str, float]
-        ) -> dict[str, CurrentPrice]:
-            """Fetch the current prices of stocks in the portfolio and target stocks."""
-            holding_symbols = context.portfolio.holding_symbols
-            target_symbols = weight_by_stock.keys()
-            whole_symbols = list(set(holding_symbols).union(target_symbols))
-            current_prices = context.price_fetcher.get_current_prices(whole_symbols)
-            return current_prices
-
         self._validate_investment_amount(investment_amount)
 
         weight_by_stock = strategy.create_target_weights()
 
-        current_prices = _fetch_current_prices(self._context, weight_by_stock)
-        orders: list[Order] = []
+        current_prices = self._fetch_current_prices(weight_by_stock.keys())
+        return self._create_orders(
+            weight_by_stock, current_prices, self._get_position_amounts(), investment_amount
+        )
 
-        for stock, weight in weight_by_stock.items():
-            current_price = current_prices[stock].price
-            current_amount = _get_current_stock_amount(self._context.portfolio, stock)
-
-            target_amount = investment_amount * weight
-            difference_in_amount = target_amount - current_amount
-            shares_to_trade = _calculate_shares_to_trade(difference_in_amount, current_price)
-
-            if shares_to_trade != 0:
-                order_action = OrderSide.BUY if shares_to_trade > 0 else OrderSide.SELL
-                orders.append(
-                    Order(
-                        symbol=stock,
-                        price=current_price,
-                        quantity=abs(shares_to_trade),
-                        side=order_action,
-                        order_type=OrderType.MARKET,
-                    )
-                )
-
-        # 매도주문을 우선 제출
-        orders.sort(key=lambda order: order.side == OrderSide.SELL, reverse=True)
-        return orders
-
-    def place_orders(self, orders: list[Order]) -> list[OrderPlacementResult]:
+    def prepare_orders_batch(
+        self, strategies: dict[str, Strategy], investment_amounts: list[float]
+    ) -> list[PlanPreview]:
+        """
+        Prepare orders for every combination of the given strategies and investment amounts.
+        The portfolio snapshot is loaded once and the current prices of the union of all
+        symbols are fetched in a single request.
+
+        Args:
+            strategies (dict[str, Strategy]): Strategies keyed by the name to report them with.
+            investment_amounts (list[float]): The amounts of money to invest in the portfolio.
+
+        Returns:
+            list[PlanPreview]: A preview per (strategy, investment amount) combination.
+        """
+        for investment_amount in investment_amounts:
+            self._validate_investment_amount(investment_amount)
+
+        weights_by_strategy = {
+            name: strategy.create_target_weights() for name, strategy in strategies.items()
+        }
+        target_symbols = set().union(*weights_by_strategy.values())
+
+        current_prices = self._fetch_current_prices(target_symbols)
+        position_amounts = self._get_position_amounts()
+
+        return [
+            PlanPreview(
+                strategy=name,
+                investment_amount=investment_amount,
+                orders=self._create_orders(
+                    weight_by_stock, current_prices, position_amounts, investment_amount
+                ),
+            )
+            for name, weight_by_stock in weights_by_strategy.items()
+            for investment_amount in investment_amounts
+        ]
+
+    def check_orders(
+        self, orders: list[Order], clip_to_sellable: bool = False
+    ) -> PreTradeCheckResult:
+        """
+        Validate a list of orders against the current portfolio before placing them.
+        All violations are returned at once. See `PreTradeChecker`.
+
+        Args:
+            orders (list[Order]): A list of orders to be validated.
+            clip_to_sellable (bool): If True, sell orders are clipped to the sellable quantity.
+
+        Returns:
+            PreTradeCheckResult: The orders that passed the check and the violations.
+        """
+        return PreTradeChecker(self._context).check(orders, clip_to_sellable=clip_to_sellable)
+
+    def place_orders(
+        self, orders: list[Order], release_buys_on_sell_fills: bool = False
+    ) -> list[OrderPlacementResult]:
         """
         Place a list of orders in the market.
         The status of each order will be updated based on the result of the order placement.
 
         Args:
             orders (list[Order]): A list of orders to be placed in the market.
+            release_buys_on_sell_fills (bool): If True, buy orders are held back until
+                confirmed sell fills free up enough cash, and are re-sized against the cash
+                available at release time. See `BuyReleasePipeline`.
 
         Returns:
             list[OrderPlacementResult]: A list of order placement results.
         """
+        if release_buys_on_sell_fills:
+            return BuyReleasePipeline(self._context).run(orders)
+
         res = []
 
         for order in orders:
@@ -102,6 +159,41 @@ class Rebalancer:
 
         return res
 
+    def _fetch_current_prices(self, target_symbols: Iterable[str]) -> dict[str, CurrentPrice]:
+        """Fetch the current prices of stocks in the portfolio and target stocks."""
+        holding_symbols = self._context.portfolio.holding_symbols
+        whole_symbols = list(set(holding_symbols).union(target_symbols))
+        return self._context.price_fetcher.get_current_prices(whole_symbols)
+
+    def _get_position_amounts(self) -> dict[str, float]:
+        """Retrieve the current amount of each holding stock."""
+        return {
+            position.asset.symbol: position.total_amount
+            for position in self._context.portfolio.positions
+        }
+
+    @staticmethod
+    def _create_orders(
+        weight_by_stock: dict[str, float],
+        current_prices: dict[str, CurrentPrice],
+        position_amounts: dict[str, float],
+        investment_amount: float,
+    ) -> list[Order]:
+        orders: list[Order] = []
+
+        for stock, weight in weight_by_stock.items():
+            order = create_order(
+                stock,
+                weight,
+                current_prices[stock].price,
+                position_amounts.get(stock, 0),
+                investment_amount,
+            )
+            if order is not None:
+                orders.append(order)
+
+        return sort_sells_first(orders)
+
     def _validate_investment_amount(self, investment_amount: float) -> None:
         if investment_amount > self._context.portfolio.total_value:
             raise InsufficientFundsException(
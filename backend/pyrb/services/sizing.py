@@ -0,0 +1,33 @@
+from math import floor
+from typing import TYPE_CHECKING, Any, overload
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+
+@overload
+def calculate_shares_to_trade(difference_in_amount: float, current_price: float) -> int: ...
+
+
+@overload
+def calculate_shares_to_trade(
+    difference_in_amount: "npt.NDArray[np.float64]", current_price: "npt.NDArray[np.float64]"
+) -> "npt.NDArray[np.float64]": ...
+
+
+def calculate_shares_to_trade(difference_in_amount: Any, current_price: Any) -> Any:
+    """
+    Determine the number of shares to trade based on the difference in amount.
+
+    The simulations pass numpy arrays to round every trade element-wise exactly like the
+    orders of `Rebalancer`.
+    """
+    shares = difference_in_amount / current_price
+    if isinstance(shares, float):
+        return floor(shares)
+
+    # 배열을 넘기는 시뮬레이션은 이미 numpy 를 사용하므로, 주문 산출 시에는 import 하지 않습니다.
+    import numpy as np
+
+    return np.floor(shares)
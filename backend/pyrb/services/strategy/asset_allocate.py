@@ -1,6 +1,5 @@
 from abc import abstractmethod
 
-from pyrb.enums import AssetAllocationStrategyEnum
 from pyrb.services.strategy.base import Strategy
 
 
@@ -10,6 +9,8 @@ class AssetAllocationStrategy(Strategy):
 
 
 class AllWeatherKRStrategy(AssetAllocationStrategy):
+    """Fixed weights over Korean-listed ETFs of stocks, gold, government bonds and cash."""
+
     def __init__(self) -> None: ...
 
     def create_target_weights(self) -> dict[str, float]:
@@ -25,8 +26,12 @@ class AllWeatherKRStrategy(AssetAllocationStrategy):
 
 class AssetAllocationStrategyFactory:
     @staticmethod
-    def create(strategy_type: AssetAllocationStrategyEnum) -> AssetAllocationStrategy:
-        if strategy_type == AssetAllocationStrategyEnum.ALL_WEATHER_KR:
-            return AllWeatherKRStrategy()
-        else:
-            raise ValueError(f"Unsupported strategy type: {strategy_type}")
+    def create(strategy_type: str) -> Strategy:
+        """Creates a strategy of the configured registry, or of the built-in strategies."""
+        from pyrb.services.strategy.registry import (
+            configure_strategy_registry,
+            get_strategy_registry,
+        )
+
+        registry = get_strategy_registry() or configure_strategy_registry(None)
+        return registry.create(strategy_type)
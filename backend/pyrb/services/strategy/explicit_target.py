@@ -1,11 +1,18 @@
 import csv
 import json
+import re
+import tempfile
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from pathlib import Path
+from types import ModuleType
+from typing import Any, TextIO
 
 import yaml
 
 from pyrb.exceptions import InvalidTargetError
+from pyrb.repositories.symbol_master import get_symbol_master
+from pyrb.repositories.target_cache import get_target_cache
 from pyrb.services.strategy.base import Strategy
 
 
@@ -32,6 +39,10 @@ def read_targets_from_source(source: Path) -> dict[str, float]:
     - csv file
     - json file
     - yaml file
+    - parquet file (requires pyarrow)
+    - arrow IPC file, .arrow or .feather (requires pyarrow)
+
+    The targets are read through the configured target cache, if any.
 
     Args:
         source (Path): The source to read the target weights from.
@@ -40,6 +51,36 @@ def read_targets_from_source(source: Path) -> dict[str, float]:
         dict[str, float]: A dictionary mapping asset symbols to target weights.
 
     """
+    target_cache = get_target_cache()
+    if target_cache is not None:
+        return target_cache.read(source, _read_targets)
+
+    return _read_targets(source)
+
+
+def read_targets_from_content(content: bytes, suffix: str) -> dict[str, float]:
+    """
+    Reads the target weights from the content of an uploaded target file.
+
+    Args:
+        content (bytes): The content of the target file.
+        suffix (str): The suffix of the file type, e.g. ".csv".
+
+    Returns:
+        dict[str, float]: A dictionary mapping asset symbols to target weights.
+
+    """
+    target_cache = get_target_cache()
+    if target_cache is not None:
+        return target_cache.read_content(content, suffix, _read_targets)
+
+    with tempfile.NamedTemporaryFile(suffix=suffix) as f:
+        f.write(content)
+        f.flush()
+        return _read_targets(Path(f.name))
+
+
+def _read_targets(source: Path) -> dict[str, float]:
     match source.suffix:
         case ".csv":
             return CSVTargetReader().read(source)
@@ -47,6 +88,10 @@ def read_targets_from_source(source: Path) -> dict[str, float]:
             return JSONTargetReader().read(source)
         case ".yaml":
             return YAMLTargetReader().read(source)
+        case ".parquet":
+            return ParquetTargetReader().read(source)
+        case ".arrow" | ".feather":
+            return ArrowTargetReader().read(source)
         case _:
             raise InvalidTargetError(f"Unsupported source file type: {source.suffix}")
 
@@ -56,6 +101,8 @@ class TargetReader(ABC):
     Abstract class representing a reader for target allocations.
     Provides functionality to read, validate, and normalize target allocations.
 
+    The targets are streamed from the source and validated and summed up in a single pass,
+    so that only the resulting targets are held in memory, not the parsed source.
     """
 
     def read(self, source: Path) -> dict[str, float]:
@@ -71,66 +118,263 @@ class TargetReader(ABC):
         Raises:
             InvalidTargetError: If the target allocations are invalid.
         """
-        targets = self._read_targets(source)
-        self._validate_targets(targets)
-        normalized_targets = self._normalize_targets(targets)
-        return normalized_targets
+        # 종목 마스터가 있으면 상장되지 않은 종목을 미리 걸러냅니다.
+        symbol_master = get_symbol_master()
+        if symbol_master is not None and len(symbol_master) == 0:
+            symbol_master = None
+
+        targets: dict[str, float] = {}
+        total_weight = 0.0
+        unknown_symbols = []
+        for symbol, weight in self._iter_targets(source):
+            self._validate_target(symbol, weight)
+            if symbol_master is not None and symbol not in symbol_master:
+                unknown_symbols.append(symbol)
 
-    def _validate_targets(self, targets: dict[str, float]) -> None:
-        def _validate_symbol(symbol: str) -> None:
-            if not isinstance(symbol, str):
-                raise InvalidTargetError("Target symbol must be a string")
+            # 같은 종목이 다시 나오면 마지막 비중을 사용합니다.
+            total_weight += weight - targets.get(symbol, 0.0)
+            targets[symbol] = weight
 
-        def _validate_weight(weight: float) -> None:
-            if not isinstance(weight, float):
-                raise InvalidTargetError("Target weight must be a float")
+        if unknown_symbols:
+            raise InvalidTargetError(f"Unknown target symbols: {', '.join(unknown_symbols)}")
 
-            if weight <= 0:
-                raise InvalidTargetError("Target weight must be positive")
+        return self._normalize_targets(targets, total_weight)
 
-        if not isinstance(targets, dict):
-            raise InvalidTargetError("Targets must be a dictionary")
+    def _validate_target(self, symbol: Any, weight: Any) -> None:
+        if not isinstance(symbol, str):
+            raise InvalidTargetError("Target symbol must be a string")
 
-        for symbol, weight in targets.items():
-            _validate_symbol(symbol)
-            _validate_weight(weight)
+        if not isinstance(weight, float):
+            raise InvalidTargetError("Target weight must be a float")
 
-    def _normalize_targets(self, targets: dict[str, float]) -> dict[str, float]:
-        total_weight = sum(targets.values())
-        normalized_targets = {symbol: weight / total_weight for symbol, weight in targets.items()}
-        return normalized_targets
+        if weight <= 0:
+            raise InvalidTargetError("Target weight must be positive")
+
+    def _normalize_targets(
+        self, targets: dict[str, float], total_weight: float
+    ) -> dict[str, float]:
+        for symbol in targets:
+            targets[symbol] /= total_weight
+        return targets
 
     @abstractmethod
-    def _read_targets(self, source: Path) -> dict[str, float]:
+    def _iter_targets(self, source: Path) -> Iterator[tuple[Any, Any]]:
         """
-        Read the targets from the given source.
+        Streams the (symbol, weight) pairs of the given source, as they appear in the source.
+        The pairs are validated by `read`.
 
         Args:
             source (Path): The source to read the target weights from.
 
-        Returns:
-            dict[str, float]: A dictionary mapping asset symbols to target weights.
+        Yields:
+            tuple[Any, Any]: The symbol and the weight of a target.
         """
         ...
 
 
 class CSVTargetReader(TargetReader):
-    def _read_targets(self, source: Path) -> dict[str, float]:
+    def _iter_targets(self, source: Path) -> Iterator[tuple[Any, Any]]:
         with open(source, newline="") as csvfile:
-            reader = csv.DictReader(csvfile)
-            targets = {row["symbol"]: float(row["weight"]) for row in reader}
-            return targets
+            reader = csv.reader(csvfile)
+            header = next(reader, [])
+            try:
+                symbol_index, weight_index = header.index("symbol"), header.index("weight")
+            except ValueError as e:
+                raise InvalidTargetError("Targets must have a symbol and a weight column") from e
+
+            for row in reader:
+                # csv.DictReader 와 같이 빈 줄은 건너뜁니다.
+                if not row:
+                    continue
+                try:
+                    yield row[symbol_index], float(row[weight_index])
+                except (IndexError, ValueError) as e:
+                    raise InvalidTargetError(f"Invalid target row: {row}") from e
 
 
 class JSONTargetReader(TargetReader):
-    def _read_targets(self, source: Path) -> dict[str, float]:
+    def _iter_targets(self, source: Path) -> Iterator[tuple[Any, Any]]:
         with open(source) as jsonfile:
-            targets = json.load(jsonfile)
-            return targets
+            yield from iter_json_object(jsonfile)
 
 
 class YAMLTargetReader(TargetReader):
-    def _read_targets(self, source: Path) -> dict[str, float]:
-        with open(source) as yamlfile:
-            targets = yaml.safe_load(yamlfile)
-            return targets
+    def _iter_targets(self, source: Path) -> Iterator[tuple[Any, Any]]:
+        with open(source, "rb") as yamlfile:
+            # 문서 전체를 노드 트리로 만드는 safe_load 대신 파서 이벤트를 하나씩 읽습니다.
+            loader = _YAMLLoader(yamlfile)
+            try:
+                loader.get_event()  # StreamStartEvent
+                if loader.check_event(yaml.StreamEndEvent):
+                    raise InvalidTargetError("Targets must be a dictionary")
+
+                loader.get_event()  # DocumentStartEvent
+                if not loader.check_event(yaml.MappingStartEvent):
+                    raise InvalidTargetError("Targets must be a dictionary")
+
+                loader.get_event()
+                while not loader.check_event(yaml.MappingEndEvent):
+                    yield self._construct_scalar(loader), self._construct_scalar(loader)
+            finally:
+                loader.dispose()
+
+    @staticmethod
+    def _construct_scalar(loader: Any) -> Any:
+        event = loader.get_event()
+        if not isinstance(event, yaml.ScalarEvent):
+            raise InvalidTargetError("Target symbols and weights must be scalars")
+
+        tag: str = event.tag or "!"
+        if tag == "!":
+            tag = loader.resolve(yaml.ScalarNode, event.value, event.implicit)
+
+        # construct_object 는 만든 객체를 모두 캐시하므로 생성자를 직접 호출합니다.
+        node = yaml.ScalarNode(tag, event.value, style=event.style)
+        constructor = loader.yaml_constructors.get(tag, type(loader).construct_undefined)
+        return constructor(loader, node)
+
+
+class ParquetTargetReader(TargetReader):
+    def _iter_targets(self, source: Path) -> Iterator[tuple[Any, Any]]:
+        parquet = _import_pyarrow("pyarrow.parquet", source)
+        parquet_file = parquet.ParquetFile(source, memory_map=True)
+        try:
+            batches = parquet_file.iter_batches(columns=["symbol", "weight"])
+            for batch in batches:
+                yield from _iter_record_batch(batch)
+        except KeyError as e:
+            raise InvalidTargetError("Targets must have a symbol and a weight column") from e
+
+
+class ArrowTargetReader(TargetReader):
+    def _iter_targets(self, source: Path) -> Iterator[tuple[Any, Any]]:
+        pyarrow = _import_pyarrow("pyarrow", source)
+        # 메모리 맵으로 읽으므로 레코드 배치는 파일의 페이지를 그대로 참조합니다.
+        with pyarrow.memory_map(str(source)) as mapped_file:
+            reader = pyarrow.ipc.open_file(mapped_file)
+            for i in range(reader.num_record_batches):
+                yield from _iter_record_batch(reader.get_batch(i))
+
+
+def _iter_record_batch(batch: Any) -> Iterator[tuple[Any, Any]]:
+    names = batch.schema.names
+    if "symbol" not in names or "weight" not in names:
+        raise InvalidTargetError("Targets must have a symbol and a weight column")
+
+    symbols = batch.column(names.index("symbol")).to_pylist()
+    weights = batch.column(names.index("weight")).to_pylist()
+    return zip(symbols, weights, strict=True)
+
+
+def _import_pyarrow(name: str, source: Path) -> ModuleType:
+    try:
+        import importlib
+
+        return importlib.import_module(name)
+    except ImportError as e:
+        raise InvalidTargetError(
+            f"Reading {source.suffix} targets requires pyarrow: pip install 'pyrb[arrow]'"
+        ) from e
+
+
+# libyaml 이 있으면 C 파서를 사용합니다.
+_YAMLLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_JSON_DELIMITER = re.compile(r"[ \t\n\r,:}\]]")
+_JSON_NUMBER_MEMBER = re.compile(
+    r'[ \t\n\r]*("(?:[^"\\\x00-\x1f]|\\.)*")[ \t\n\r]*:[ \t\n\r]*'
+    r"(-?(?:0|[1-9][0-9]*))(\.[0-9]+)?([eE][-+]?[0-9]+)?[ \t\n\r]*([,}])"
+)
+
+
+def iter_json_object(file: TextIO, chunk_size: int = 1 << 16) -> Iterator[tuple[str, Any]]:
+    """
+    Streams the members of the top-level JSON object of the file, reading it in chunks.
+    Only the member being parsed is held in memory.
+
+    Args:
+        file (TextIO): The JSON file.
+        chunk_size (int): The number of characters read at a time.
+
+    Yields:
+        tuple[str, Any]: The name and the value of each member, in file order.
+
+    Raises:
+        InvalidTargetError: If the file is not a JSON object.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+
+    def fill() -> bool:
+        nonlocal buffer, pos
+        chunk = file.read(chunk_size)
+        if not chunk:
+            return False
+
+        buffer = buffer[pos:] + chunk
+        pos = 0
+        return True
+
+    def skip_whitespace() -> None:
+        nonlocal pos
+        while True:
+            pos = _JSON_WHITESPACE.match(buffer, pos).end()  # type: ignore[union-attr]
+            if pos < len(buffer) or not fill():
+                return
+
+    def expect(chars: str, message: str) -> str:
+        nonlocal pos
+        skip_whitespace()
+        if pos >= len(buffer) or buffer[pos] not in chars:
+            raise InvalidTargetError(message)
+
+        pos += 1
+        return buffer[pos - 1]
+
+    def decode() -> Any:
+        nonlocal pos
+        skip_whitespace()
+        # 숫자는 청크 경계에서 잘렸을 수 있으므로 구분 문자까지 읽은 뒤에 해석합니다.
+        if pos < len(buffer) and buffer[pos] not in '"{[':
+            while not _JSON_DELIMITER.search(buffer, pos) and fill():
+                pass
+
+        while True:
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+                pos = end
+                return value
+            except json.JSONDecodeError as e:
+                if not fill():
+                    raise InvalidTargetError(f"Invalid JSON: {e}") from e
+
+    expect("{", "Targets must be a dictionary")
+    skip_whitespace()
+    if pos < len(buffer) and buffer[pos] == "}":
+        return
+
+    while True:
+        # 대부분의 멤버는 "종목": 숫자 형태이므로 정규식 한 번으로 읽습니다.
+        member = _JSON_NUMBER_MEMBER.match(buffer, pos)
+        if member is not None:
+            name, integer, fraction, exponent, delimiter = member.groups()
+            pos = member.end()
+            number = integer + (fraction or "") + (exponent or "")
+            yield (
+                json.loads(name) if "\\" in name else name[1:-1],
+                float(number) if fraction or exponent else int(number),
+            )
+        else:
+            skip_whitespace()
+            if pos >= len(buffer) or buffer[pos] != '"':
+                raise InvalidTargetError("Invalid JSON: expected a member name")
+
+            name = decode()
+            expect(":", "Invalid JSON: expected ':'")
+            yield name, decode()
+            delimiter = expect(",}", "Invalid JSON: expected ',' or '}'")
+
+        if delimiter == "}":
+            return
@@ -0,0 +1,364 @@
+import ast
+import importlib
+import importlib.util
+import inspect
+import sys
+from collections.abc import Callable
+from functools import cached_property
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from pyrb.enums import AssetAllocationStrategyEnum
+from pyrb.exceptions import InitializationError, StrategyNotFoundError
+from pyrb.services.strategy.base import Strategy
+
+ENTRY_POINT_GROUP = "pyrb.strategies"
+PLUGIN_MODULE_PREFIX = "pyrb_strategy_plugins"
+PLUGIN_STRATEGIES_NAME = "STRATEGIES"  # 플러그인 파일에서 전략 이름과 클래스(함수)를 연결하는 dict
+
+# 내장 전략. 값은 전략을 만드는 클래스나 함수의 "모듈:이름" 입니다.
+BUILTIN_STRATEGIES: dict[str, str] = {
+    AssetAllocationStrategyEnum.ALL_WEATHER_KR: (
+        "pyrb.services.strategy.asset_allocate:AllWeatherKRStrategy"
+    ),
+    AssetAllocationStrategyEnum.RISK_PARITY_KR: (
+        "pyrb.services.strategy.risk_parity:create_risk_parity_kr_strategy"
+    ),
+}
+
+
+def _price_history() -> Any:
+    from pyrb.repositories.history import get_price_history
+
+    return get_price_history()
+
+
+# 전략을 만들 때 같은 이름의 인자로 전달하는 데이터
+DATA_SOURCES: dict[str, Callable[[], Any]] = {"price_history": _price_history}
+
+
+class StrategyParameter(NamedTuple):
+    name: str
+    default: Any  # 기본값. 리터럴이 아니면 소스 코드 문자열
+    required: bool
+
+
+class StrategyMetadata(NamedTuple):
+    name: str
+    target: str  # "모듈:이름"
+    source: str  # "builtin", 배포 패키지 이름 또는 플러그인 파일 경로
+    description: str
+    parameters: list[StrategyParameter]
+    requires: list[str]  # 전략이 필요로 하는 데이터 (DATA_SOURCES 의 키)
+
+
+class _Entry(NamedTuple):
+    target: str
+    source: str
+    locate: Callable[[], Path | None]  # 메타데이터를 읽을 소스 파일을 찾습니다.
+
+
+class StrategyRegistry:
+    """
+    The catalogue of the asset allocation strategies: the built-in ones, those registered
+    by installed packages under the `pyrb.strategies` entry point group, and those of the
+    Python files in a local plugin directory.
+
+    An entry point maps a strategy name to the class or function creating the strategy, as
+    `module:attribute`. A plugin file declares its strategies in a literal dict named
+    `STRATEGIES`, mapping strategy names to attributes of the file. When names collide, the
+    built-in strategies win over entry points, which win over plugin files.
+
+    Listing the strategies and their metadata never imports their code: the description
+    and the parameters are read from the source of the class or function with `ast`. A
+    strategy is imported only when it is created. Parameters named after a data source,
+    such as `price_history`, are the data the strategy requires and are passed by the
+    registry.
+
+    Args:
+        plugin_directory (Path | None): The directory of the plugin files, if any.
+    """
+
+    def __init__(self, plugin_directory: Path | None = None) -> None:
+        self._plugin_directory = plugin_directory
+        self._metadata: dict[str, StrategyMetadata] = {}
+        # 전략이 호출 사이에 상태(예: 공분산)를 유지하도록 인자마다 한 번만 만듭니다.
+        self._instances: dict[tuple[Any, ...], Strategy] = {}
+
+    def names(self) -> list[str]:
+        return list(self._entries)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries
+
+    def metadata(self, name: str) -> StrategyMetadata:
+        """
+        Reads the metadata of a strategy without importing it.
+
+        Raises:
+            StrategyNotFoundError: If there is no strategy with the name.
+        """
+        if name not in self._metadata:
+            entry = self._get_entry(name)
+            self._metadata[name] = _read_metadata(name, entry)
+        return self._metadata[name]
+
+    def list_metadata(self) -> list[StrategyMetadata]:
+        return [self.metadata(name) for name in self._entries]
+
+    def create(self, name: str, **parameters: Any) -> Strategy:
+        """
+        Imports and creates a strategy, passing it the data it requires.
+
+        Args:
+            name (str): The name of the strategy.
+            **parameters: The parameters of the strategy, overriding their defaults.
+
+        Returns:
+            Strategy: The strategy. The same instance is returned for the same parameters.
+
+        Raises:
+            StrategyNotFoundError: If there is no strategy with the name.
+            InitializationError: If the data the strategy requires is not configured, or a
+                required parameter of the strategy is not given.
+        """
+        metadata = self.metadata(name)
+        missing = [
+            each.name
+            for each in metadata.parameters
+            if each.required and each.name not in parameters
+        ]
+        if missing:
+            raise InitializationError(f"{name} requires the parameters: {', '.join(missing)}")
+
+        data = {}
+        for data_name in metadata.requires:
+            data[data_name] = DATA_SOURCES[data_name]()
+            if data[data_name] is None:
+                raise InitializationError(f"{name} requires the {data_name.replace('_', ' ')}")
+
+        key = (name, *sorted(parameters.items()), *(id(each) for each in data.values()))
+        if key not in self._instances:
+            create = self._load(name)
+            # 소스에서 인자를 읽지 못한 전략도 호출 전에 시그니처를 확인합니다.
+            try:
+                inspect.signature(create).bind(**data, **parameters)
+            except TypeError as e:
+                raise InitializationError(f"Cannot create {name} ({metadata.source}): {e}") from e
+            self._instances[key] = create(**data, **parameters)
+        return self._instances[key]
+
+    def _get_entry(self, name: str) -> _Entry:
+        entry = self._entries.get(name)
+        if entry is None:
+            raise StrategyNotFoundError(
+                f"Unknown strategy: {name}. Available strategies: {', '.join(self._entries)}"
+            )
+        return entry
+
+    def _load(self, name: str) -> Callable[..., Strategy]:
+        entry = self._get_entry(name)
+        module_name, attribute = entry.target.split(":")
+        if module_name.startswith(f"{PLUGIN_MODULE_PREFIX}."):
+            module = _import_plugin(module_name, Path(entry.source))
+        else:
+            module = importlib.import_module(module_name)
+        create: Callable[..., Strategy] = getattr(module, attribute)
+        return create
+
+    @cached_property
+    def _entries(self) -> dict[str, _Entry]:
+        entries: dict[str, _Entry] = {}
+        for name, target in BUILTIN_STRATEGIES.items():
+            entries[str(name)] = _Entry(target, "builtin", _spec_locator(target))
+
+        from importlib.metadata import entry_points
+
+        for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+            if entry_point.name not in entries:
+                dist = entry_point.dist
+                entries[entry_point.name] = _Entry(
+                    entry_point.value,
+                    dist.name if dist is not None else entry_point.value,
+                    _dist_locator(entry_point.value, dist),
+                )
+
+        if self._plugin_directory is not None:
+            for path in sorted(self._plugin_directory.glob("*.py")):
+                module_name = f"{PLUGIN_MODULE_PREFIX}.{path.stem}"
+                for name, attribute in _read_plugin_strategies(path).items():
+                    if name not in entries:
+                        entries[name] = _Entry(
+                            f"{module_name}:{attribute}", str(path), _path_locator(path)
+                        )
+
+        return entries
+
+
+def _path_locator(path: Path) -> Callable[[], Path | None]:
+    return lambda: path
+
+
+def _spec_locator(target: str) -> Callable[[], Path | None]:
+    def locate() -> Path | None:
+        # 상위 패키지만 import 하고 모듈 자체는 import 하지 않습니다.
+        spec = importlib.util.find_spec(target.split(":")[0])
+        return Path(spec.origin) if spec is not None and spec.origin else None
+
+    return locate
+
+
+def _dist_locator(target: str, dist: Any) -> Callable[[], Path | None]:
+    def locate() -> Path | None:
+        relative = target.split(":")[0].replace(".", "/")
+        for file in (dist.files or []) if dist is not None else []:
+            if str(file) in (f"{relative}.py", f"{relative}/__init__.py"):
+                return Path(dist.locate_file(file))
+        return _spec_locator(target)()
+
+    return locate
+
+
+def _read_plugin_strategies(path: Path) -> dict[str, str]:
+    """The literal `STRATEGIES` dict of a plugin file, read without running it."""
+    tree = _parse(path)
+    for node in tree.body if tree is not None else []:
+        target, value = _assignment(node)
+        if target == PLUGIN_STRATEGIES_NAME and value is not None:
+            try:
+                strategies = ast.literal_eval(value)
+            except ValueError:
+                return {}
+            if isinstance(strategies, dict):
+                return {str(name): str(attribute) for name, attribute in strategies.items()}
+    return {}
+
+
+def _parse(path: Path) -> ast.Module | None:
+    try:
+        return ast.parse(path.read_bytes(), filename=str(path))
+    except (OSError, SyntaxError):
+        return None
+
+
+def _assignment(node: ast.stmt) -> tuple[str | None, ast.expr | None]:
+    if isinstance(node, ast.Assign) and len(node.targets) == 1:
+        target = node.targets[0]
+        return (target.id if isinstance(target, ast.Name) else None), node.value
+    if isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+        return node.target.id, node.value
+    return None, None
+
+
+def _read_metadata(name: str, entry: _Entry) -> StrategyMetadata:
+    """Reads the docstring and the parameters of the target from its source."""
+    attribute = entry.target.split(":")[-1]
+    path = entry.locate()
+    tree = _parse(path) if path is not None else None
+    definition = next(
+        (
+            node
+            for node in (tree.body if tree is not None else [])
+            if isinstance(node, ast.ClassDef | ast.FunctionDef) and node.name == attribute
+        ),
+        None,
+    )
+
+    description = ""
+    parameters: list[StrategyParameter] = []
+    if tree is not None and definition is not None:
+        docstring = ast.get_docstring(definition) or ""
+        description = docstring.split("\n\n")[0].replace("\n", " ").strip()
+        # 클래스는 __init__ 의 인자를 읽습니다.
+        function: ast.AST | None = definition
+        if isinstance(definition, ast.ClassDef):
+            function = next(
+                (
+                    node
+                    for node in definition.body
+                    if isinstance(node, ast.FunctionDef) and node.name == "__init__"
+                ),
+                None,
+            )
+        if isinstance(function, ast.FunctionDef):
+            parameters = _read_parameters(
+                function.args, _read_constants(tree), skip_self=function is not definition
+            )
+
+    return StrategyMetadata(
+        name=name,
+        target=entry.target,
+        source=entry.source,
+        description=description,
+        parameters=[each for each in parameters if each.name not in DATA_SOURCES],
+        requires=[each.name for each in parameters if each.name in DATA_SOURCES],
+    )
+
+
+def _read_constants(tree: ast.Module) -> dict[str, Any]:
+    """The module-level constants with a literal value, e.g. the defaults of parameters."""
+    constants = {}
+    for node in tree.body:
+        target, value = _assignment(node)
+        if target is not None and value is not None:
+            try:
+                constants[target] = ast.literal_eval(value)
+            except ValueError:
+                continue
+    return constants
+
+
+def _read_parameters(
+    args: ast.arguments, constants: dict[str, Any], skip_self: bool
+) -> list[StrategyParameter]:
+    positional = [*args.posonlyargs, *args.args][1 if skip_self else 0 :]
+    # 기본값은 뒤쪽 인자부터 채워집니다.
+    defaults: list[ast.expr | None] = [None] * (len(positional) - len(args.defaults))
+    defaults += args.defaults
+    pairs = [
+        *zip(positional, defaults, strict=True),
+        *zip(args.kwonlyargs, args.kw_defaults, strict=True),
+    ]
+
+    parameters = []
+    for arg, default in pairs:
+        if default is None:
+            parameters.append(StrategyParameter(arg.arg, None, required=True))
+            continue
+        if isinstance(default, ast.Name) and default.id in constants:
+            value = constants[default.id]
+        else:
+            try:
+                value = ast.literal_eval(default)
+            except ValueError:
+                value = ast.unparse(default)
+        parameters.append(StrategyParameter(arg.arg, value, required=False))
+    return parameters
+
+
+def _import_plugin(module_name: str, path: Path) -> Any:
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    if spec is None or spec.loader is None:
+        raise StrategyNotFoundError(f"Cannot import the strategy plugin: {path}")
+
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+_default_strategy_registry: StrategyRegistry | None = None
+
+
+def configure_strategy_registry(plugin_directory: Path | None) -> StrategyRegistry:
+    """Sets the registry used by `AssetAllocationStrategyFactory`."""
+    global _default_strategy_registry
+    _default_strategy_registry = StrategyRegistry(plugin_directory)
+    return _default_strategy_registry
+
+
+def get_strategy_registry() -> StrategyRegistry | None:
+    return _default_strategy_registry
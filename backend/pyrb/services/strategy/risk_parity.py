@@ -0,0 +1,154 @@
+import datetime
+import math
+import threading
+
+import numpy as np
+import numpy.typing as npt
+
+from pyrb.exceptions import InitializationError, PriceHistoryError
+from pyrb.repositories.history import PriceHistoryRepository
+from pyrb.services.backtest import fill_closes
+from pyrb.services.history import KST, last_closed_date
+from pyrb.services.strategy.asset_allocate import AllWeatherKRStrategy, AssetAllocationStrategy
+
+DEFAULT_HALFLIFE = 60.0  # 수익률 가중치의 반감기(거래일)
+WARMUP_HALFLIVES = 5  # 처음 추정할 때 읽는 기간. 이보다 오래된 수익률의 가중치는 3% 미만입니다.
+FILL_LOOKBACK_DAYS = 14
+MIN_VARIANCE = 1e-12
+MAX_ITERATIONS = 100
+TOLERANCE = 1e-10
+
+
+class EWMACovariance:
+    """
+    An exponentially weighted moving covariance of daily returns, updated one day at a time
+    in O(n²) for n symbols, without keeping the past returns.
+
+    Args:
+        size (int): The number of symbols.
+        halflife (float): The number of days after which the weight of a return halves.
+    """
+
+    def __init__(self, size: int, halflife: float) -> None:
+        self._alpha = 1 - 0.5 ** (1 / halflife)
+        self.mean = np.zeros(size, dtype=np.float64)
+        self.covariance = np.zeros((size, size), dtype=np.float64)
+        self.count = 0
+
+    def update(self, returns: npt.NDArray[np.float64]) -> None:
+        delta = returns - self.mean
+        self.mean += self._alpha * delta
+        self.covariance += self._alpha * np.outer(delta, delta)
+        self.covariance *= 1 - self._alpha
+        self.count += 1
+
+
+class RiskParityStrategy(AssetAllocationStrategy):
+    """
+    Weighs the symbols so that each contributes the same share of the portfolio volatility,
+    estimated from an exponentially weighted covariance of the daily returns in the local
+    price history.
+
+    The covariance is kept between calls and only updated with the returns of the days
+    stored since the previous call. The weights are computed once per trading day, after the
+    market closed, and every other call on the same day returns them as is. An instance is
+    shared by the threads of the API and of batch rebalances, so the update is serialized.
+
+    Args:
+        price_history (PriceHistoryRepository): The local store of the daily closes.
+        symbols (list[str]): The symbols to allocate to.
+        halflife (float): The half-life of the return weights, in trading days.
+    """
+
+    def __init__(
+        self,
+        price_history: PriceHistoryRepository,
+        symbols: list[str],
+        halflife: float = DEFAULT_HALFLIFE,
+    ) -> None:
+        self._price_history = price_history
+        self._symbols = symbols
+        self._halflife = halflife
+        self._covariance = EWMACovariance(len(symbols), halflife)
+        self._last_date: datetime.date | None = None  # 공분산에 반영한 마지막 거래일
+        self._weights: dict[str, float] = {}
+        self._weights_date: datetime.date | None = None
+        # 같은 거래일의 수익률이 공분산에 두 번 반영되지 않도록 갱신을 직렬화합니다.
+        self._lock = threading.Lock()
+
+    @property
+    def covariance(self) -> EWMACovariance:
+        return self._covariance
+
+    def create_target_weights(self) -> dict[str, float]:
+        """
+        Raises:
+            InitializationError: If the price history of a symbol was not synced.
+        """
+        closed_date = last_closed_date(datetime.datetime.now(KST))
+        with self._lock:
+            if self._weights_date != closed_date:
+                try:
+                    self._update_covariance(closed_date)
+                except PriceHistoryError as e:
+                    raise InitializationError(f"{e}. Run `pyrb history sync` first") from e
+
+                weights = risk_parity_weights(self._covariance.covariance)
+                self._weights = dict(zip(self._symbols, weights.tolist(), strict=True))
+                self._weights_date = closed_date
+
+            # 호출한 쪽에서 수정해도 당일 캐시가 바뀌지 않도록 복사해서 반환합니다.
+            return dict(self._weights)
+
+    def _update_covariance(self, closed_date: datetime.date) -> None:
+        if self._last_date is None:
+            # 영업일 기준 기간을 달력 기준으로 넉넉하게 환산합니다.
+            warmup_days = math.ceil(WARMUP_HALFLIVES * self._halflife * 7 / 5) + 7
+            start = closed_date - datetime.timedelta(days=warmup_days)
+        else:
+            # 마지막 거래일에 종가가 없는 종목도 이전 종가로 채우도록 조금 앞에서부터 읽습니다.
+            start = self._last_date - datetime.timedelta(days=FILL_LOOKBACK_DAYS)
+
+        dates, closes = fill_closes(self._price_history.load_closes(self._symbols, start))
+        returns = closes[1:] / closes[:-1] - 1
+        if self._last_date is not None:
+            returns = returns[dates[1:] > np.datetime64(self._last_date, "D")]
+
+        for daily_returns in returns:
+            self._covariance.update(daily_returns)
+        self._last_date = dates[-1].item()
+
+
+def create_risk_parity_kr_strategy(
+    price_history: PriceHistoryRepository, halflife: float = DEFAULT_HALFLIFE
+) -> RiskParityStrategy:
+    """
+    Equal risk contributions over the ETFs of the all-weather portfolio, from the volatility
+    of their recent daily returns.
+    """
+    symbols = list(AllWeatherKRStrategy().create_target_weights())
+    return RiskParityStrategy(price_history, symbols, halflife)
+
+
+def risk_parity_weights(
+    covariance: npt.NDArray[np.float64],
+) -> npt.NDArray[np.float64]:
+    """
+    The weights with equal risk contributions, by cyclical coordinate descent. Each sweep
+    is O(n²), and a handful of sweeps converge for the usual number of symbols.
+    """
+    variances = np.maximum(np.diag(covariance), MIN_VARIANCE)
+    budget = 1 / len(variances)
+    # 변동성의 역수 비중에서 시작합니다. 상관관계가 모두 같으면 그대로 해가 됩니다.
+    weights = 1 / np.sqrt(variances)
+    for _ in range(MAX_ITERATIONS):
+        previous = weights / weights.sum()
+        for i in range(len(weights)):
+            others = covariance[i] @ weights - covariance[i, i] * weights[i]
+            weights[i] = (-others + math.sqrt(others**2 + 4 * variances[i] * budget)) / (
+                2 * variances[i]
+            )
+        if np.abs(weights / weights.sum() - previous).max() < TOLERANCE:
+            break
+
+    return weights / weights.sum()
@@ -0,0 +1,118 @@
+import json
+from collections.abc import Iterator
+from contextlib import closing
+from functools import partial
+from pathlib import Path
+
+from pyrb.exceptions import PriceHistoryError
+from pyrb.models.sweep import SweepCase, SweepResult
+from pyrb.repositories.history import PriceMatrix
+from pyrb.services.backtest import Backtester
+from pyrb.services.parallel import SharedArrays, run_on_shared_arrays
+from pyrb.services.strategy.explicit_target import ExplicitTargetRebalanceStrategy
+
+CASES_PER_TASK = 4  # 작업 하나로 보내는 케이스 수
+
+
+class SweepRunner:
+    """
+    Runs the backtest of every case of a parameter sweep on a process pool.
+
+    The price matrix is shared by every worker through `run_on_shared_arrays`, and each
+    worker copies only the columns of the symbols of the case it runs. Cases are sent in
+    small batches and only the reports are sent back.
+
+    The results are appended to a JSON Lines file as they complete. A sweep is resumed by
+    running it again with the same file: the cases already in the file are skipped, and a
+    line left incomplete by an interruption is dropped.
+
+    Args:
+        prices (PriceMatrix): The daily closes shared by every case.
+        max_workers (int | None): The number of worker processes. Defaults to the CPU count.
+        cases_per_task (int): The number of cases a worker runs per task.
+    """
+
+    def __init__(
+        self,
+        prices: PriceMatrix,
+        max_workers: int | None = None,
+        cases_per_task: int = CASES_PER_TASK,
+    ) -> None:
+        self._prices = prices
+        self._max_workers = max_workers
+        self._cases_per_task = cases_per_task
+
+    def run(self, cases: list[SweepCase], output: Path) -> Iterator[SweepResult]:
+        """
+        Runs the cases that are not in the output yet.
+
+        Args:
+            cases (list[SweepCase]): The cases of the sweep.
+            output (Path): The JSON Lines file to append the results to.
+
+        Yields:
+            SweepResult: The result of each case, as soon as it was written to the output.
+        """
+        completed_case_ids = _resume(output)
+        pending = list(
+            {
+                case.case_id: case for case in cases if case.case_id not in completed_case_ids
+            }.values()
+        )
+        if not pending:
+            return
+
+        batches = run_on_shared_arrays(
+            {"dates": self._prices.dates, "closes": self._prices.closes},
+            partial(_create_backtester, self._prices.symbols),
+            _run_cases,
+            [
+                pending[i : i + self._cases_per_task]
+                for i in range(0, len(pending), self._cases_per_task)
+            ],
+            self._max_workers,
+        )
+        # 중단된 경우 남은 작업은 취소되고, 다음 실행에서 이어서 합니다.
+        with closing(batches), open(output, "a") as f:
+            for _, results in batches:
+                f.writelines(result.model_dump_json() + "\n" for result in results)
+                f.flush()
+                yield from results
+
+
+def run_case(backtester: Backtester, case: SweepCase) -> SweepResult:
+    try:
+        result = backtester.run(
+            ExplicitTargetRebalanceStrategy(case.weights),
+            case.investment_amount,
+            case.frequency,
+            case.band,
+            case.cost_rate,
+        )
+    except PriceHistoryError as e:
+        return SweepResult(case_id=case.case_id, case=case, error=str(e))
+
+    return SweepResult(case_id=case.case_id, case=case, report=result.report)
+
+
+def _create_backtester(symbols: list[str], arrays: SharedArrays) -> Backtester:
+    return Backtester(PriceMatrix(arrays["dates"], symbols, arrays["closes"]))
+
+
+def _run_cases(backtester: Backtester, cases: list[SweepCase]) -> list[SweepResult]:
+    return [run_case(backtester, case) for case in cases]
+
+
+def _resume(output: Path) -> set[str]:
+    """The ids of the cases in the output, after dropping an incomplete last line."""
+    try:
+        content = output.read_bytes()
+    except FileNotFoundError:
+        return set()
+
+    complete_size = content.rfind(b"\n") + 1
+    if complete_size < len(content):
+        with open(output, "r+b") as f:
+            f.truncate(complete_size)
+
+    return {json.loads(line)["case_id"] for line in content[:complete_size].splitlines() if line}
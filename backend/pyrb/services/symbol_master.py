@@ -0,0 +1,53 @@
+import datetime
+from zoneinfo import ZoneInfo
+
+from pyrb.exceptions import SymbolMasterError
+from pyrb.repositories.brokerages.base.symbols import SymbolListFetcher
+from pyrb.repositories.symbol_master import SymbolMaster
+
+KST = ZoneInfo("Asia/Seoul")
+
+
+class SymbolMasterService:
+    """
+    Keeps the local symbol master up to date. The listing changes at most once a trading
+    day, so it is downloaded again only when the master was not built today.
+
+    Args:
+        symbol_master (SymbolMaster): The symbol master to keep up to date.
+        symbol_list_fetcher (SymbolListFetcher): Fetches the listing from the brokerage.
+    """
+
+    def __init__(self, symbol_master: SymbolMaster, symbol_list_fetcher: SymbolListFetcher) -> None:
+        self._symbol_master = symbol_master
+        self._symbol_list_fetcher = symbol_list_fetcher
+
+    def is_stale(self) -> bool:
+        """Whether the master is missing, truncated or was built before today (KST)."""
+        try:
+            updated_at = self._symbol_master.updated_at
+        except SymbolMasterError:
+            return True
+
+        if updated_at is None:
+            return True
+
+        return updated_at.astimezone(KST).date() < datetime.datetime.now(KST).date()
+
+    def update(self, force: bool = False) -> bool:
+        """
+        Downloads the listing and rebuilds the master, if it is stale.
+
+        Args:
+            force (bool): If True, the master is rebuilt even if it was built today.
+
+        Returns:
+            bool: Whether the master was rebuilt.
+        """
+        if not force and not self.is_stale():
+            return False
+
+        symbols = self._symbol_list_fetcher.fetch_symbols()
+        SymbolMaster.write(self._symbol_master.path, symbols)
+        self._symbol_master.reload()
+        return True
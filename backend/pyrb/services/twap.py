@@ -0,0 +1,261 @@
+import asyncio
+import datetime
+from collections.abc import Callable
+from math import floor
+from typing import ClassVar
+from uuid import UUID
+from zoneinfo import ZoneInfo
+
+from pyrb.enums import ScheduleStatus, SliceSpacing
+from pyrb.exceptions import ScheduleConflictError
+from pyrb.models.order import Order
+from pyrb.models.schedule import ChildOrder, TWAPSchedule
+from pyrb.repositories.brokerages.context import RebalanceContext
+from pyrb.repositories.schedule import ScheduleRepository
+from pyrb.services.rebalance import Rebalancer
+
+KST = ZoneInfo("Asia/Seoul")
+
+# KRX 정규장(09:00~15:30)의 30분 단위 거래량 비중.
+# 장 초반과 마감 직전에 거래가 몰리는 U자형 분포입니다.
+INTRADAY_VOLUME_PROFILE: list[float] = [
+    0.16, 0.09, 0.07, 0.06, 0.05, 0.05, 0.05, 0.05, 0.05, 0.06, 0.07, 0.09, 0.15,
+]  # fmt: skip
+
+ProgressCallback = Callable[[TWAPSchedule], None]
+
+
+def split_order(
+    parent_order: Order,
+    slices: int,
+    window: float,
+    spacing: SliceSpacing,
+    start: datetime.datetime,
+) -> list[ChildOrder]:
+    """
+    Splits the parent order into child orders placed at even intervals over the window.
+
+    With `SliceSpacing.EVEN` every child order has (almost) the same quantity.
+    With `SliceSpacing.VOLUME` the quantity of each child order is proportional to the
+    intraday volume share at its scheduled time. Child orders without quantity are dropped.
+
+    Args:
+        parent_order (Order): The order to split.
+        slices (int): The number of child orders.
+        window (float): The number of seconds to spread the child orders over.
+        spacing (SliceSpacing): How to distribute the quantity over the child orders.
+        start (datetime.datetime): The time the first child order is placed.
+
+    Returns:
+        list[ChildOrder]: The child orders, ordered by their scheduled time.
+    """
+    if slices <= 0:
+        raise ValueError("slices must be positive")
+
+    offsets = [window * i / slices for i in range(slices)]
+    match spacing:
+        case SliceSpacing.EVEN:
+            weights = [1.0] * slices
+        case SliceSpacing.VOLUME:
+            weights = [
+                _intraday_volume_weight(start + datetime.timedelta(seconds=offset))
+                for offset in offsets
+            ]
+        case _:
+            raise NotImplementedError(f"Unsupported slice spacing: {spacing}")
+
+    # 최대잔여법(largest remainder)으로 정수 수량을 배분하여 합계를 원주문 수량과 일치시킵니다.
+    total_weight = sum(weights)
+    exact_quantities = [parent_order.quantity * weight / total_weight for weight in weights]
+    quantities = [floor(quantity) for quantity in exact_quantities]
+    by_remainder = sorted(
+        range(slices), key=lambda i: exact_quantities[i] - quantities[i], reverse=True
+    )
+    for i in by_remainder[: parent_order.quantity - sum(quantities)]:
+        quantities[i] += 1
+
+    return [
+        ChildOrder(order=parent_order.model_copy(update={"quantity": quantity}), offset=offset)
+        for quantity, offset in zip(quantities, offsets, strict=True)
+        if quantity > 0
+    ]
+
+
+def _intraday_volume_weight(dt: datetime.datetime) -> float:
+    elapsed = dt.astimezone(KST) - dt.astimezone(KST).replace(hour=9, minute=0, second=0)
+    bucket = int(elapsed.total_seconds() // (30 * 60))
+    return INTRADAY_VOLUME_PROFILE[min(max(bucket, 0), len(INTRADAY_VOLUME_PROFILE) - 1)]
+
+
+class TWAPScheduler:
+    """
+    Executes TWAP schedules: child orders of a parent order are placed one by one
+    at their scheduled time. The state of a schedule is persisted after every child order,
+    so that a cancelled or interrupted schedule can be observed and resumed later,
+    also from another process. A schedule is only run while holding its lease from the
+    repository, so no two processes ever place the same child orders.
+
+    Args:
+        context (RebalanceContext): The context used to place the child orders.
+        schedule_repo (ScheduleRepository): The repository to persist the schedules.
+    """
+
+    # 이벤트 루프는 태스크를 약한 참조로만 보관하므로, 실행 중인 태스크를 여기서 참조합니다.
+    _tasks: ClassVar[dict[UUID, "asyncio.Task[TWAPSchedule]"]] = {}
+
+    def __init__(self, context: RebalanceContext, schedule_repo: ScheduleRepository) -> None:
+        self._context = context
+        self._schedule_repo = schedule_repo
+
+    def create(
+        self, parent_order: Order, window: float, slices: int, spacing: SliceSpacing
+    ) -> TWAPSchedule:
+        """Creates and persists a new schedule. The schedule is not started yet."""
+        now = datetime.datetime.now(KST)
+        schedule = TWAPSchedule(
+            parent_order=parent_order,
+            window=window,
+            spacing=spacing,
+            children=split_order(parent_order, slices, window, spacing, start=now),
+            created_at=now,
+        )
+        self._schedule_repo.save(schedule)
+        return schedule
+
+    def start(
+        self, schedule_id: UUID, on_progress: ProgressCallback | None = None
+    ) -> asyncio.Task[TWAPSchedule]:
+        """
+        Runs the schedule as a background task of the running event loop.
+
+        Raises:
+            ScheduleConflictError: If the schedule is already running in this process.
+        """
+        # 같은 자식 주문이 두 번 제출되지 않도록 실행 중인 스케줄은 다시 시작하지 않습니다.
+        if self._is_running(schedule_id):
+            raise ScheduleConflictError(f"Schedule {schedule_id} is already running")
+
+        task = asyncio.create_task(self.run(schedule_id, on_progress))
+        self._tasks[schedule_id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(schedule_id, None))
+        return task
+
+    async def run(
+        self, schedule_id: UUID, on_progress: ProgressCallback | None = None
+    ) -> TWAPSchedule:
+        """
+        Places the pending child orders of the schedule at their scheduled time.
+        When a schedule is resumed, the remaining child orders keep their intervals and
+        the first of them is placed immediately.
+
+        Args:
+            schedule_id (UUID): The id of the schedule to run.
+            on_progress (ProgressCallback | None): Called after every child order.
+
+        Returns:
+            TWAPSchedule: The schedule in its final state.
+
+        Raises:
+            ScheduleConflictError: If the schedule is running in another process.
+        """
+        with self._schedule_repo.lease(schedule_id):
+            return await self._run(schedule_id, on_progress)
+
+    async def _run(
+        self, schedule_id: UUID, on_progress: ProgressCallback | None = None
+    ) -> TWAPSchedule:
+        schedule = self._schedule_repo.get(schedule_id)
+        if schedule.status in (ScheduleStatus.CANCELLED, ScheduleStatus.COMPLETED):
+            return schedule
+
+        pending_children = schedule.pending_children
+        first_offset = pending_children[0].offset if pending_children else 0
+        started_at = datetime.datetime.now(KST) - datetime.timedelta(seconds=first_offset)
+        schedule.started_at = started_at
+        schedule.status = ScheduleStatus.RUNNING
+        self._save(schedule)
+
+        rebalancer = Rebalancer(self._context)
+        try:
+            for child in pending_children:
+                due = started_at + datetime.timedelta(seconds=child.offset)
+                delay = (due - datetime.datetime.now(KST)).total_seconds()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+                # 다른 프로세스에서 취소된 스케줄인지 확인합니다.
+                if self._schedule_repo.get(schedule_id).status == ScheduleStatus.CANCELLED:
+                    schedule.status = ScheduleStatus.CANCELLED
+                    return schedule
+
+                [child.result] = await asyncio.to_thread(rebalancer.place_orders, [child.order])
+                self._save(schedule)
+                if on_progress is not None:
+                    on_progress(schedule)
+
+                if schedule.status == ScheduleStatus.CANCELLED:
+                    return schedule
+
+        except asyncio.CancelledError:
+            schedule.status = ScheduleStatus.CANCELLED
+            self._save(schedule)
+            raise
+
+        schedule.status = ScheduleStatus.COMPLETED
+        self._save(schedule)
+        return schedule
+
+    def cancel(self, schedule_id: UUID) -> TWAPSchedule:
+        """Cancels the schedule. Child orders already placed are not cancelled."""
+        schedule = self._schedule_repo.get(schedule_id)
+        if schedule.status != ScheduleStatus.COMPLETED:
+            schedule.status = ScheduleStatus.CANCELLED
+            self._schedule_repo.save(schedule)
+
+        task = self._tasks.get(schedule_id)
+        if task is not None:
+            task.cancel()
+
+        return schedule
+
+    def resume(self, schedule_id: UUID) -> TWAPSchedule:
+        """
+        Marks a cancelled or interrupted schedule as pending again, so that it can be run.
+        A schedule is interrupted when it is pending or running, but no process holds its
+        lease, e.g. after the process running it exited.
+
+        Raises:
+            ScheduleConflictError: If the schedule is running in this or another process, or
+                has no pending child orders.
+        """
+        if self._is_running(schedule_id):
+            raise ScheduleConflictError(f"Schedule {schedule_id} is already running")
+
+        # 다른 프로세스가 실행 중인 스케줄은 실행 잠금(lease)을 얻지 못하므로 재개하지 않습니다.
+        with self._schedule_repo.lease(schedule_id):
+            schedule = self._schedule_repo.get(schedule_id)
+            if schedule.status == ScheduleStatus.COMPLETED or not schedule.pending_children:
+                raise ScheduleConflictError(f"Schedule {schedule_id} has no pending child orders")
+
+            if schedule.status == ScheduleStatus.CANCELLED:
+                schedule.status = ScheduleStatus.PENDING
+                self._schedule_repo.save(schedule)
+
+        return schedule
+
+    def get(self, schedule_id: UUID) -> TWAPSchedule:
+        return self._schedule_repo.get(schedule_id)
+
+    def get_all(self) -> list[TWAPSchedule]:
+        return self._schedule_repo.get_all()
+
+    def _is_running(self, schedule_id: UUID) -> bool:
+        task = self._tasks.get(schedule_id)
+        return task is not None and not task.done()
+
+    def _save(self, schedule: TWAPSchedule) -> None:
+        # 실행 중 저장된 취소 상태를 덮어쓰지 않도록 합니다.
+        if self._schedule_repo.get(schedule.id).status == ScheduleStatus.CANCELLED:
+            schedule.status = ScheduleStatus.CANCELLED
+
+        self._schedule_repo.save(schedule)
@@ -0,0 +1,155 @@
+import asyncio
+import datetime
+import logging
+from typing import Literal, NamedTuple
+from zoneinfo import ZoneInfo
+
+from pyrb.models.plan import PortfolioSnapshot
+from pyrb.models.portfolio import PortfolioValuationDelta, PortfolioValuationError
+from pyrb.repositories.brokerages.context import RebalanceContext
+
+logger = logging.getLogger(__name__)
+
+
+class ValuationEvent(NamedTuple):
+    """
+    An event pushed to the subscribers: a `snapshot` with the whole portfolio, a `valuation`
+    with the changes since the previous event, or an `error` when a refresh failed.
+    """
+
+    event: Literal["snapshot", "valuation", "error"]
+    data: PortfolioValuationDelta | PortfolioValuationError
+
+
+class ValuationBroadcaster:
+    """
+    Refreshes the portfolio of an account in a single loop shared by every subscriber, and
+    pushes only what changed since the previous refresh. The number of subscribers does not
+    change the number of requests sent to the brokerage.
+
+    The loop runs on the event loop while there is at least one subscriber. A new subscriber
+    receives the latest valuation at once as a snapshot, followed by the deltas. A failed
+    refresh is pushed as an error, and the next successful refresh as a new snapshot.
+
+    Args:
+        context (RebalanceContext): The context of the account.
+        interval (float): The number of seconds between two refreshes.
+    """
+
+    def __init__(self, context: RebalanceContext, interval: float = 5.0) -> None:
+        self._context = context
+        self._interval = interval
+        self._subscribers: set[asyncio.Queue[ValuationEvent]] = set()
+        self._snapshot: PortfolioSnapshot | None = None
+        self._error: PortfolioValuationError | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self) -> asyncio.Queue[ValuationEvent]:
+        """Returns a queue receiving the valuation events. Starts the refresh loop if needed."""
+        queue: asyncio.Queue[ValuationEvent] = asyncio.Queue()
+        if self._snapshot is not None and (delta := self._diff(None, self._snapshot)) is not None:
+            queue.put_nowait(ValuationEvent("snapshot", delta))
+        if self._error is not None:
+            queue.put_nowait(ValuationEvent("error", self._error))
+
+        self._subscribers.add(queue)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue[ValuationEvent]) -> None:
+        """Removes the subscriber. Stops the refresh loop when no subscriber is left."""
+        self._subscribers.discard(queue)
+        if not self._subscribers and self._task is not None:
+            self._task.cancel()
+            self._task = None
+            # 다시 구독할 때 오래된 평가금액을 보내지 않도록 버립니다.
+            self._snapshot = None
+            self._error = None
+
+    def close(self) -> None:
+        """Removes every subscriber and stops the refresh loop."""
+        self._subscribers.clear()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._snapshot = None
+        self._error = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                snapshot = await asyncio.to_thread(self._load)
+            except Exception as e:
+                # 이전 평가금액을 유지하되 오래되었음을 알리고, 다음 주기에 다시 조회합니다.
+                logger.warning("Failed to refresh the portfolio valuation", exc_info=True)
+                self._error = PortfolioValuationError(
+                    message=str(e), dt=datetime.datetime.now(ZoneInfo("Asia/Seoul"))
+                )
+                self._publish(ValuationEvent("error", self._error))
+            else:
+                # 처음 조회했거나 실패에서 회복하면 전체 포트폴리오를 다시 보냅니다.
+                if self._snapshot is None or self._error is not None:
+                    delta = self._diff(None, snapshot)
+                    event: Literal["snapshot", "valuation"] = "snapshot"
+                else:
+                    delta = self._diff(self._snapshot, snapshot)
+                    event = "valuation"
+                self._snapshot = snapshot
+                self._error = None
+                if delta is not None:
+                    self._publish(ValuationEvent(event, delta))
+
+            await asyncio.sleep(self._interval)
+
+    def _publish(self, event: ValuationEvent) -> None:
+        for queue in self._subscribers:
+            queue.put_nowait(event)
+
+    def _load(self) -> PortfolioSnapshot:
+        portfolio = self._context.portfolio
+        portfolio.refresh()
+        return PortfolioSnapshot(
+            total_value=portfolio.total_value,
+            cash_balance=portfolio.cash_balance,
+            positions=portfolio.positions,
+        )
+
+    @staticmethod
+    def _diff(
+        previous: PortfolioSnapshot | None, current: PortfolioSnapshot
+    ) -> PortfolioValuationDelta | None:
+        """Returns the changes from `previous` to `current`, or None if nothing changed."""
+        previous_positions = (
+            {position.asset.symbol: position for position in previous.positions}
+            if previous is not None
+            else {}
+        )
+        changed_positions = [
+            position
+            for position in current.positions
+            if previous_positions.get(position.asset.symbol) != position
+        ]
+        removed_symbols = sorted(
+            set(previous_positions) - {position.asset.symbol for position in current.positions}
+        )
+        total_value_changed = previous is None or previous.total_value != current.total_value
+        cash_balance_changed = previous is None or previous.cash_balance != current.cash_balance
+
+        if not (
+            total_value_changed or cash_balance_changed or changed_positions or removed_symbols
+        ):
+            return None
+
+        return PortfolioValuationDelta(
+            total_value=current.total_value if total_value_changed else None,
+            cash_balance=current.cash_balance if cash_balance_changed else None,
+            positions=changed_positions,
+            removed_symbols=removed_symbols,
+            dt=datetime.datetime.now(ZoneInfo("Asia/Seoul")),
+        )
@@ -0,0 +1,125 @@
+import datetime
+import time
+from zoneinfo import ZoneInfo
+
+from pyrb.models.price import CurrentPrice
+from pyrb.models.watch import WatchRow, WatchUpdate
+from pyrb.repositories.brokerages.context import RebalanceContext
+from pyrb.services.drift import DriftMonitor
+
+
+class PortfolioWatcher:
+    """
+    Produces the rows of a live portfolio dashboard on a rate-limited refresh loop.
+
+    The quantities and the cash balance come from a portfolio snapshot, reloaded every
+    `snapshot_interval` seconds. In between, a refresh fetches the prices of every row in a
+    single batched request and applies them to a `DriftMonitor`, so the cost of a refresh
+    does not grow with the number of positions. A refresh requested before `interval`
+    seconds have passed is skipped without any request. Only the rows whose values changed
+    since the previous refresh are returned.
+
+    Args:
+        context (RebalanceContext): The context of the watched account.
+        target_weights (dict[str, float] | None): The target weights to show the drift
+            against. If None, no drift is shown.
+        interval (float): The minimum number of seconds between two price fetches.
+        snapshot_interval (float): The number of seconds between two portfolio reloads.
+        threshold (float): The absolute drift of a weight that marks a row as breached.
+    """
+
+    def __init__(
+        self,
+        context: RebalanceContext,
+        target_weights: dict[str, float] | None = None,
+        interval: float = 2.0,
+        snapshot_interval: float = 60.0,
+        threshold: float = 0.05,
+    ) -> None:
+        self._context = context
+        self._target_weights = target_weights
+        self._interval = interval
+        self._snapshot_interval = snapshot_interval
+        self._threshold = threshold
+
+        self._drift_monitor: DriftMonitor | None = None
+        self._quantities: dict[str, int] = {}
+        self._prices: dict[str, CurrentPrice] = {}
+        self._cash_balance = 0.0
+        self._rows: dict[str, WatchRow] = {}
+        self._refreshed_at: float | None = None
+        self._loaded_at: float | None = None
+
+    @property
+    def rows(self) -> list[WatchRow]:
+        """Every row as of the last refresh."""
+        return list(self._rows.values())
+
+    def refresh(self) -> WatchUpdate | None:
+        """
+        Fetches the current prices and returns the rows that changed.
+
+        Returns:
+            WatchUpdate | None: The changes, or None if the refresh was skipped because
+                the previous one was less than `interval` seconds ago.
+        """
+        now = time.monotonic()
+        if self._refreshed_at is not None and now - self._refreshed_at < self._interval:
+            return None
+
+        self._refreshed_at = now
+        if (
+            self._drift_monitor is None
+            or self._loaded_at is None
+            or now - self._loaded_at >= self._snapshot_interval
+        ):
+            self._drift_monitor = self._load()
+            self._loaded_at = now
+        else:
+            prices = self._context.price_fetcher.get_current_prices(self._drift_monitor.symbols)
+            self._prices |= prices
+            for price in prices.values():
+                self._drift_monitor.update(price)
+
+        snapshot = self._drift_monitor.snapshot()
+        rows = {
+            symbol_drift.symbol: WatchRow(
+                symbol=symbol_drift.symbol,
+                quantity=self._quantities.get(symbol_drift.symbol, 0),
+                price=self._prices[symbol_drift.symbol].price,
+                total_amount=self._quantities.get(symbol_drift.symbol, 0)
+                * self._prices[symbol_drift.symbol].price,
+                weight=symbol_drift.current_weight,
+                target_weight=symbol_drift.target_weight if self._target_weights else None,
+                drift=symbol_drift.drift if self._target_weights else None,
+                breached=bool(self._target_weights)
+                and symbol_drift.symbol in snapshot.breached_symbols,
+            )
+            for symbol_drift in snapshot.drifts
+        }
+        update = WatchUpdate(
+            rows=[row for symbol, row in rows.items() if self._rows.get(symbol) != row],
+            removed_symbols=[symbol for symbol in self._rows if symbol not in rows],
+            total_value=snapshot.total_value,
+            cash_balance=self._cash_balance,
+            dt=datetime.datetime.now(ZoneInfo("Asia/Seoul")),
+        )
+        self._rows = rows
+        return update
+
+    def _load(self) -> DriftMonitor:
+        portfolio = self._context.portfolio
+        if self._drift_monitor is not None:
+            portfolio.refresh()
+
+        self._quantities = {
+            position.asset.symbol: position.quantity for position in portfolio.positions
+        }
+        self._cash_balance = portfolio.cash_balance
+        target_weights = self._target_weights or {}
+        self._prices = self._context.price_fetcher.get_current_prices(
+            sorted(set(target_weights) | set(self._quantities))
+        )
+        return DriftMonitor(
+            target_weights, self._quantities, self._cash_balance, self._prices, self._threshold
+        )
@@ -2,8 +2,10 @@ import tempfile
 from collections.abc import Generator
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import Mock
 
 import pytest
+from pytest_mock import MockerFixture
 
 from pyrb.models.order import Order
 from pyrb.models.portfolio import PortfolioReturn
@@ -14,6 +16,8 @@ from pyrb.repositories.brokerages.base.fetcher import PriceFetcher
 from pyrb.repositories.brokerages.base.order_manager import OrderManager
 from pyrb.repositories.brokerages.base.portfolio import Portfolio
 from pyrb.repositories.brokerages.context import RebalanceContext
+from pyrb.repositories.schedule import LocalScheduleRepository, ScheduleRepository
+from pyrb.repositories.target_cache import TargetCache, configure_target_cache
 from pyrb.services.account import AccountService
 
 
@@ -111,3 +115,21 @@ def tmp_account_repo() -> Generator[AccountRepository, None, None]:
 @pytest.fixture
 def account_service(tmp_account_repo: AccountRepository) -> AccountService:
     return AccountService(tmp_account_repo)
+
+
+@pytest.fixture
+def tmp_schedule_repo() -> Generator[ScheduleRepository, None, None]:
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        yield LocalScheduleRepository(Path(tmpdirname) / "schedules")
+
+
+@pytest.fixture(autouse=True)
+def target_cache(tmp_path: Path) -> TargetCache:
+    """목표 비중 캐시가 사용자의 설정 디렉터리에 쓰지 않도록 합니다."""
+    return configure_target_cache(tmp_path / "targets")
+
+
+@pytest.fixture(autouse=True)
+def update_symbol_master(mocker: MockerFixture) -> Mock:
+    """API 서버가 시작할 때 증권사에서 종목 마스터를 내려받지 않도록 합니다."""
+    return mocker.patch("pyrb.controllers.api.main.update_symbol_master", return_value=False)
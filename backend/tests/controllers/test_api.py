@@ -1,13 +1,29 @@
 from collections.abc import Generator
+from pathlib import Path
+from unittest.mock import Mock
+from uuid import uuid4
 
 import pytest
 from fastapi.testclient import TestClient
 from freezegun import freeze_time
-
-from pyrb.controllers.api.deps import account_repo_dep, context_dep
+from pytest_mock import MockerFixture
+
+from pyrb.controllers.api.deps import (
+    account_repo_dep,
+    context_dep,
+    portfolio_aggregator_dep,
+    schedule_repo_dep,
+    symbol_master_dep,
+    update_symbol_master,
+)
 from pyrb.controllers.api.main import AccountCreateResponse, app
-from pyrb.repositories.account import AccountRepository
+from pyrb.repositories.account import AccountRepository, SQLiteAccountRepository
 from pyrb.repositories.brokerages.context import RebalanceContext
+from pyrb.repositories.history import LocalPriceHistoryRepository
+from pyrb.repositories.schedule import ScheduleRepository
+from pyrb.repositories.symbol_master import SymbolMaster
+from pyrb.services.aggregate import PortfolioAggregator
+from tests.repositories.test_symbol_master import FAKE_SYMBOLS, FakeSymbolListFetcher
 
 client = TestClient(app)
 
@@ -79,7 +95,9 @@ def test_prepare_orders(fake_rebalance_context: RebalanceContext) -> None:
 
     # Then
     assert response.status_code == 200
+    assert "plan_id" in response.json()
     assert response.json() == {
+        "plan_id": response.json()["plan_id"],
         "orders": [
             {
                 "symbol": "379800",
@@ -123,7 +141,7 @@ def test_prepare_orders(fake_rebalance_context: RebalanceContext) -> None:
                 "side": "BUY",
                 "order_type": "MARKET",
             },
-        ]
+        ],
     }
     app.dependency_overrides.clear()
 
@@ -280,3 +298,331 @@ def test_get_portfolio_without_account() -> None:
     # Then
     assert response.status_code == 404
     assert response.json() == {"detail": "account is not set. Please set account first"}
+
+
+def test_start_twap_schedule(
+    fake_rebalance_context: RebalanceContext, tmp_schedule_repo: ScheduleRepository
+) -> None:
+    # Given
+    create_account()
+    app.dependency_overrides[context_dep] = lambda: fake_rebalance_context
+    app.dependency_overrides[schedule_repo_dep] = lambda: tmp_schedule_repo
+    order = {
+        "symbol": "411060",
+        "price": 100,
+        "quantity": 10,
+        "side": "BUY",
+        "order_type": "MARKET",
+    }
+
+    # When
+    response = client.post(
+        "/twap-schedules", json={"order": order, "window_minutes": 1, "slices": 5}
+    )
+
+    # Then
+    assert response.status_code == 201
+    schedule_id = response.json()["id"]
+    assert len(response.json()["children"]) == 5
+
+    response = client.get(f"/twap-schedules/{schedule_id}")
+    assert response.status_code == 200
+    assert response.json()["parent_order"] == order
+
+    response = client.post(f"/twap-schedules/{schedule_id}/cancel")
+    assert response.status_code == 200
+    assert response.json()["status"] == "CANCELLED"
+
+
+def test_prepare_orders_returns_cached_plan(
+    fake_rebalance_context: RebalanceContext, mocker: MockerFixture
+) -> None:
+    # Given
+    create_account()
+    app.dependency_overrides[context_dep] = lambda: fake_rebalance_context
+    spy = mocker.spy(fake_rebalance_context.price_fetcher, "get_current_prices")
+
+    # When
+    first = client.get("/strategies/all-weather-kr/orders").json()
+    second = client.get("/strategies/all-weather-kr/orders").json()
+
+    # Then
+    assert first == second
+    assert spy.call_count == 1
+    app.dependency_overrides.clear()
+
+
+def test_place_orders_with_plan_id(fake_rebalance_context: RebalanceContext) -> None:
+    # Given
+    create_account()
+    app.dependency_overrides[context_dep] = lambda: fake_rebalance_context
+    prepared = client.get("/strategies/all-weather-kr/orders").json()
+
+    # When
+    response = client.post(
+        "/strategies/all-weather-kr/orders", json={"plan_id": prepared["plan_id"]}
+    )
+
+    # Then
+    assert response.status_code == 200
+    placed_orders = [placed["order"] for placed in response.json()["placed_orders"]]
+    assert placed_orders == prepared["orders"]
+
+    # a plan is placed only once
+    response = client.post(
+        "/strategies/all-weather-kr/orders", json={"plan_id": prepared["plan_id"]}
+    )
+    assert response.status_code == 404
+    app.dependency_overrides.clear()
+
+
+def test_place_orders_rejects_stale_plan(fake_rebalance_context: RebalanceContext) -> None:
+    # Given
+    create_account()
+    app.dependency_overrides[context_dep] = lambda: fake_rebalance_context
+    with freeze_time("2024-01-03T00:00:00+09:00"):
+        prepared = client.get("/strategies/all-weather-kr/orders").json()
+
+    # When
+    with freeze_time("2024-01-03T00:10:00+09:00"):
+        response = client.post(
+            "/strategies/all-weather-kr/orders", json={"plan_id": prepared["plan_id"]}
+        )
+
+    # Then
+    assert response.status_code == 409
+    app.dependency_overrides.clear()
+
+
+def test_prepare_orders_replans_when_the_holdings_changed(
+    fake_rebalance_context: RebalanceContext, mocker: MockerFixture
+) -> None:
+    # Given
+    create_account()
+    app.dependency_overrides[context_dep] = lambda: fake_rebalance_context
+    first = client.get("/strategies/all-weather-kr/orders").json()
+
+    # When
+    mocker.patch.object(
+        type(fake_rebalance_context.portfolio),
+        "cash_balance",
+        new_callable=mocker.PropertyMock,
+        return_value=1000,
+    )
+    second = client.get("/strategies/all-weather-kr/orders").json()
+
+    # Then
+    assert second["plan_id"] != first["plan_id"]
+    response = client.post("/strategies/all-weather-kr/orders", json={"plan_id": first["plan_id"]})
+    assert response.status_code == 409
+    app.dependency_overrides.clear()
+
+
+def test_place_orders_keeps_a_plan_placed_for_another_strategy(
+    fake_rebalance_context: RebalanceContext,
+) -> None:
+    # Given
+    create_account()
+    app.dependency_overrides[context_dep] = lambda: fake_rebalance_context
+    prepared = client.get("/strategies/all-weather-kr/orders").json()
+
+    # When
+    response = client.post(
+        "/strategies/holding-portfolio/orders", json={"plan_id": prepared["plan_id"]}
+    )
+
+    # Then
+    assert response.status_code == 409
+    response = client.post(
+        "/strategies/all-weather-kr/orders", json={"plan_id": prepared["plan_id"]}
+    )
+    assert response.status_code == 200
+    app.dependency_overrides.clear()
+
+
+def test_preview_orders(fake_rebalance_context: RebalanceContext) -> None:
+    # Given
+    create_account()
+    app.dependency_overrides[context_dep] = lambda: fake_rebalance_context
+
+    # When
+    response = client.post(
+        "/strategies/orders/preview",
+        json={"strategies": ["all-weather-kr"], "investment_amounts": [10000, 20000]},
+    )
+
+    # Then
+    assert response.status_code == 200
+    previews = response.json()["previews"]
+    assert [(p["strategy"], p["investment_amount"]) for p in previews] == [
+        ("all-weather-kr", 10000),
+        ("all-weather-kr", 20000),
+    ]
+    app.dependency_overrides.clear()
+
+
+def test_get_aggregated_portfolio(fake_rebalance_context: RebalanceContext, tmp_path: Path) -> None:
+    # Given
+    app.dependency_overrides[account_repo_dep] = lambda: SQLiteAccountRepository(
+        tmp_path / "accounts.db"
+    )
+    first_account_id = create_account().account_id
+    second_account_id = create_account().account_id
+    app.dependency_overrides[portfolio_aggregator_dep] = lambda: PortfolioAggregator(
+        lambda _: fake_rebalance_context
+    )
+
+    # When
+    response = client.get("/portfolio/aggregate")
+
+    # Then
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total_value"] == 200000
+    assert data["partial"] is False
+    assert [account["account_id"] for account in data["accounts"]] == [
+        str(first_account_id),
+        str(second_account_id),
+    ]
+    assert data["positions"][0]["quantity"] == 200
+    app.dependency_overrides.clear()
+
+
+def test_get_symbol(tmp_path: Path) -> None:
+    # Given
+    SymbolMaster.write(tmp_path / "symbols.bin", FAKE_SYMBOLS)
+    app.dependency_overrides[symbol_master_dep] = lambda: SymbolMaster(tmp_path / "symbols.bin")
+
+    # When
+    response = client.get("/symbols/148070")
+    missing_response = client.get("/symbols/999999")
+
+    # Then
+    assert response.status_code == 200
+    assert response.json()["asset_class"] == "BOND"
+    assert response.json()["is_etf"] is True
+    assert missing_response.status_code == 404
+    app.dependency_overrides.clear()
+
+
+def test_list_strategies() -> None:
+    # When
+    response = client.get("/strategies")
+
+    # Then
+    assert response.status_code == 200
+    strategies = {strategy["name"]: strategy for strategy in response.json()["strategies"]}
+    assert strategies["risk-parity-kr"]["parameters"] == [
+        {"name": "halflife", "default": 60.0, "required": False}
+    ]
+    assert strategies["risk-parity-kr"]["requires"] == ["price_history"]
+
+
+def test_prepare_orders_of_unknown_strategy(fake_rebalance_context: RebalanceContext) -> None:
+    # Given
+    create_account()
+    app.dependency_overrides[context_dep] = lambda: fake_rebalance_context
+
+    # When
+    response = client.get("/strategies/unknown/orders")
+
+    # Then
+    assert response.status_code == 404
+
+
+def test_prepare_orders_of_strategy_without_price_history(
+    fake_rebalance_context: RebalanceContext, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Given
+    create_account()
+    app.dependency_overrides[context_dep] = lambda: fake_rebalance_context
+    monkeypatch.setattr(
+        "pyrb.repositories.history._default_price_history", LocalPriceHistoryRepository(tmp_path)
+    )
+
+    # When
+    response = client.get("/strategies/risk-parity-kr/orders")
+
+    # Then
+    assert response.status_code == 409
+    assert "pyrb history sync" in response.json()["detail"]
+
+
+def test_app_configures_the_shared_repositories_on_startup(mocker: MockerFixture) -> None:
+    # Given
+    symbol_master = mocker.patch("pyrb.controllers.api.main.symbol_master_dep")
+
+    # When
+    with TestClient(app):
+        pass
+
+    # Then
+    symbol_master.assert_called_once()
+
+
+def test_app_updates_the_symbol_master_on_startup(update_symbol_master: Mock) -> None:
+    # When
+    with TestClient(app):
+        pass
+
+    # Then
+    update_symbol_master.assert_called_once()
+
+
+def test_update_symbol_master_rebuilds_a_stale_master(
+    mocker: MockerFixture, tmp_account_repo: AccountRepository, tmp_path: Path
+) -> None:
+    # Given
+    create_account()
+    symbol_master = SymbolMaster(tmp_path / "symbols.bin")
+    mocker.patch("pyrb.controllers.api.deps.account_repo_dep", return_value=tmp_account_repo)
+    mocker.patch("pyrb.controllers.api.deps.symbol_master_dep", return_value=symbol_master)
+    mocker.patch(
+        "pyrb.controllers.api.deps.create_symbol_list_fetcher",
+        return_value=FakeSymbolListFetcher(),
+    )
+
+    # When
+    updated = [update_symbol_master(), update_symbol_master()]
+
+    # Then
+    assert updated == [True, False]
+    assert len(symbol_master) == len(FAKE_SYMBOLS)
+
+
+def test_update_symbol_master_keeps_the_master_when_the_download_fails(
+    mocker: MockerFixture, tmp_account_repo: AccountRepository, tmp_path: Path
+) -> None:
+    # Given
+    create_account()
+    symbol_list_fetcher = mocker.Mock()
+    symbol_list_fetcher.fetch_symbols.side_effect = ConnectionError
+    mocker.patch("pyrb.controllers.api.deps.account_repo_dep", return_value=tmp_account_repo)
+    mocker.patch(
+        "pyrb.controllers.api.deps.symbol_master_dep",
+        return_value=SymbolMaster(tmp_path / "symbols.bin"),
+    )
+    mocker.patch(
+        "pyrb.controllers.api.deps.create_symbol_list_fetcher", return_value=symbol_list_fetcher
+    )
+
+    # When
+    updated = update_symbol_master()
+
+    # Then
+    assert not updated
+
+
+def test_app_stops_the_shared_streams_on_shutdown(mocker: MockerFixture) -> None:
+    # Given
+    streaming_price_fetcher = mocker.Mock()
+    mocker.patch.dict(
+        "pyrb.controllers.api.deps._streaming_price_fetchers", {uuid4(): streaming_price_fetcher}
+    )
+
+    # When
+    with TestClient(app):
+        pass
+
+    # Then
+    streaming_price_fetcher.stop.assert_called_once()
@@ -1,15 +1,28 @@
+import json
+from datetime import date, timedelta
+from pathlib import Path
+
 import pytest
 from pytest_mock import MockerFixture
 from typer.testing import CliRunner
 
 from pyrb.controllers.cli.main import app
 from pyrb.enums import OrderSide, OrderType
-from pyrb.exceptions import InsufficientFundsException
+from pyrb.exceptions import AccountNotFoundError, InsufficientFundsException
+from pyrb.models.history import DailyBar
 from pyrb.models.order import Order
 from pyrb.repositories.brokerages.context import RebalanceContext
+from pyrb.repositories.history import LocalPriceHistoryRepository
 from pyrb.services.rebalance import Rebalancer
 
 
+@pytest.fixture(autouse=True)
+def run_in_process(mocker: MockerFixture, tmp_path: Path) -> None:
+    """실행 중인 데몬이 있더라도 명령을 프로세스 안에서 실행하도록 합니다."""
+    mocker.patch("pyrb.controllers.cli.main.DAEMON_SOCKET_PATH", tmp_path / "daemon.sock")
+    mocker.patch("pyrb.controllers.cli.main.TARGET_CACHE_DIR", tmp_path / "targets")
+
+
 def test_sut_rebalances(fake_rebalance_context: RebalanceContext, mocker: MockerFixture) -> None:
     """Test rebalance command with fake rebalance context"""
 
@@ -17,7 +30,8 @@ def test_sut_rebalances(fake_rebalance_context: RebalanceContext, mocker: Mocker
     runner = CliRunner()
 
     mocker.patch(
-        "pyrb.controllers.cli.main.create_rebalance_context", return_value=fake_rebalance_context
+        "pyrb.repositories.brokerages.context.create_rebalance_context",
+        return_value=fake_rebalance_context,
     )
 
     spy = mocker.spy(fake_rebalance_context.order_manager, "place_order")
@@ -57,7 +71,8 @@ def test_sut_rebalances_with_only_buy_orders(
     runner = CliRunner()
 
     mocker.patch(
-        "pyrb.controllers.cli.main.create_rebalance_context", return_value=fake_rebalance_context
+        "pyrb.repositories.brokerages.context.create_rebalance_context",
+        return_value=fake_rebalance_context,
     )
 
     # when
@@ -75,7 +90,8 @@ def test_sut_rebalances_with_only_sell_order(
     runner = CliRunner()
 
     mocker.patch(
-        "pyrb.controllers.cli.main.create_rebalance_context", return_value=fake_rebalance_context
+        "pyrb.repositories.brokerages.context.create_rebalance_context",
+        return_value=fake_rebalance_context,
     )
 
     # when
@@ -93,7 +109,8 @@ def test_sut_stops_rebalancing_with_disallowance_from_user(
     runner = CliRunner()
 
     mocker.patch(
-        "pyrb.controllers.cli.main.create_rebalance_context", return_value=fake_rebalance_context
+        "pyrb.repositories.brokerages.context.create_rebalance_context",
+        return_value=fake_rebalance_context,
     )
 
     # when
@@ -111,7 +128,8 @@ def test_sut_stops_rebalancing_with_insufficient_funds(
     runner = CliRunner()
 
     mocker.patch(
-        "pyrb.controllers.cli.main.create_rebalance_context", return_value=fake_rebalance_context
+        "pyrb.repositories.brokerages.context.create_rebalance_context",
+        return_value=fake_rebalance_context,
     )
 
     # when
@@ -159,7 +177,8 @@ def test_sut_rebalance_with_explicit_target_from_json_source(
     runner = CliRunner()
 
     mocker.patch(
-        "pyrb.controllers.cli.main.create_rebalance_context", return_value=fake_rebalance_context
+        "pyrb.repositories.brokerages.context.create_rebalance_context",
+        return_value=fake_rebalance_context,
     )
 
     spy = mocker.spy(Rebalancer, "place_orders")
@@ -205,3 +224,304 @@ def test_sut_rebalance_with_explicit_target_from_json_source(
             order_type=OrderType.MARKET,
         ),
     ]
+
+
+def test_sut_previews_orders_of_several_strategies_with_a_single_price_fetch(
+    fake_rebalance_context: RebalanceContext, mocker: MockerFixture
+) -> None:
+    # given
+    runner = CliRunner()
+
+    mocker.patch(
+        "pyrb.repositories.brokerages.context.create_rebalance_context",
+        return_value=fake_rebalance_context,
+    )
+    price_spy = mocker.spy(fake_rebalance_context.price_fetcher, "get_current_prices")
+    order_spy = mocker.spy(fake_rebalance_context.order_manager, "place_order")
+
+    # when
+    result = runner.invoke(
+        app,
+        [
+            "preview",
+            "--strategy",
+            "all-weather-kr",
+            "--targets-source",
+            "tests/resources/fake_targets.json",
+            "--investment-amount",
+            "10000",
+            "--investment-amount",
+            "20000",
+        ],
+    )
+
+    # then
+    assert result.exit_code == 0
+    assert price_spy.call_count == 1
+    assert order_spy.call_count == 0
+    assert result.output.count("all-weather-kr /") == 2
+    assert result.output.count("fake_targets.json /") == 2
+
+
+def test_sut_watches_the_drift_from_a_targets_file(
+    fake_rebalance_context: RebalanceContext, mocker: MockerFixture
+) -> None:
+    # given
+    runner = CliRunner()
+    mocker.patch(
+        "pyrb.repositories.brokerages.context.create_rebalance_context",
+        return_value=fake_rebalance_context,
+    )
+    mocker.patch("time.sleep", side_effect=KeyboardInterrupt)
+    price_spy = mocker.spy(fake_rebalance_context.price_fetcher, "get_current_prices")
+
+    # when
+    result = runner.invoke(app, ["watch", "--targets-source", "tests/resources/fake_targets.json"])
+
+    # then
+    assert result.exit_code == 0
+    assert price_spy.call_count == 1
+    assert "Drift (%)" in result.output
+    assert "000660" in result.output
+
+
+def test_sut_replans_when_the_targets_source_is_edited(
+    fake_rebalance_context: RebalanceContext, mocker: MockerFixture, tmp_path: Path
+) -> None:
+    # given
+    runner = CliRunner()
+    mocker.patch(
+        "pyrb.repositories.brokerages.context.create_rebalance_context",
+        return_value=fake_rebalance_context,
+    )
+    targets_source = tmp_path / "targets.json"
+    targets_source.write_text('{"000660": 0.5, "005930": 0.5}')
+
+    def edit_targets_source(seconds: float) -> None:
+        if "035420" in targets_source.read_text():
+            raise KeyboardInterrupt
+        targets_source.write_text('{"000660": 0.5, "035420": 0.5}')
+
+    mocker.patch("time.sleep", side_effect=edit_targets_source)
+    place_order_spy = mocker.spy(fake_rebalance_context.order_manager, "place_order")
+
+    # when
+    result = runner.invoke(
+        app,
+        [
+            "explicit-target",
+            "--targets-source",
+            str(targets_source),
+            "--investment-amount",
+            "10000",
+            "--watch",
+        ],
+    )
+
+    # then
+    assert result.exit_code == 0
+    assert "035420" in result.output
+    assert "Re-planned 1 symbols" in result.output
+    assert place_order_spy.call_count == 0
+
+
+@pytest.mark.parametrize(
+    ("read_error", "price_error", "caption"),
+    [
+        (PermissionError("Permission denied"), None, "Cannot read the targets: Permission denied"),
+        (None, Exception("API client error: 500"), "Failed to fetch the prices: API client error"),
+    ],
+)
+def test_sut_shows_why_the_targets_source_was_not_replanned(
+    fake_rebalance_context: RebalanceContext,
+    mocker: MockerFixture,
+    tmp_path: Path,
+    read_error: Exception | None,
+    price_error: Exception | None,
+    caption: str,
+) -> None:
+    # given
+    runner = CliRunner()
+    mocker.patch(
+        "pyrb.repositories.brokerages.context.create_rebalance_context",
+        return_value=fake_rebalance_context,
+    )
+    mocker.patch(
+        "pyrb.services.strategy.explicit_target.read_targets_from_source",
+        side_effect=read_error,
+        return_value={"000660": 0.5, "005930": 0.5},
+    )
+    mocker.patch.object(
+        fake_rebalance_context.price_fetcher, "get_current_prices", side_effect=price_error
+    )
+    mocker.patch("time.sleep", side_effect=KeyboardInterrupt)
+    targets_source = tmp_path / "targets.json"
+    targets_source.write_text('{"000660": 0.5, "005930": 0.5}')
+
+    # when
+    result = runner.invoke(
+        app,
+        [
+            "explicit-target",
+            "--targets-source",
+            str(targets_source),
+            "--investment-amount",
+            "10000",
+            "--watch",
+        ],
+    )
+
+    # then
+    assert result.exit_code == 0
+    assert caption in result.output
+
+
+def test_sut_sweeps_parameters_on_the_price_history(mocker: MockerFixture, tmp_path: Path) -> None:
+    # given
+    runner = CliRunner()
+    repository = LocalPriceHistoryRepository(tmp_path / "history")
+    dates = [date(2024, 1, 30), date(2024, 1, 31), date(2024, 2, 1), date(2024, 2, 2)]
+    for symbol, closes in {"005930": [100, 110, 120, 90], "000660": [200, 190, 210, 220]}.items():
+        repository.append(
+            symbol,
+            [
+                DailyBar(date=dt, open=close, high=close, low=close, close=close, volume=1)
+                for dt, close in zip(dates, closes, strict=True)
+            ],
+        )
+    mocker.patch("pyrb.controllers.cli.main.PRICE_HISTORY_DIR", tmp_path / "history")
+    spec_path = tmp_path / "spec.yaml"
+    spec_path.write_text(
+        "weights:\n  - {'005930': 1, '000660': 1}\n"
+        "frequencies: [monthly, null]\n"
+        "investment_amounts: [10000]\n"
+    )
+    output = tmp_path / "sweep.jsonl"
+
+    # when
+    result = runner.invoke(
+        app, ["sweep", str(spec_path), "--output", str(output), "--workers", "1"]
+    )
+
+    # then
+    assert result.exit_code == 0
+    assert "Ran 2 of 2 cases" in result.output
+    assert len(output.read_text().splitlines()) == 2
+
+
+def test_sut_simulates_rebalance_policies_on_the_price_history(
+    mocker: MockerFixture, tmp_path: Path
+) -> None:
+    # given
+    runner = CliRunner()
+    repository = LocalPriceHistoryRepository(tmp_path / "history")
+    dates = [date(2024, 1, 29) + timedelta(days=i) for i in range(30)]
+    for symbol, step in {"005930": 1, "000660": -1}.items():
+        repository.append(
+            symbol,
+            [
+                DailyBar(date=dt, open=close, high=close, low=close, close=close, volume=1)
+                for dt, close in zip(dates, range(1000, 1000 + 30 * step, step), strict=True)
+            ],
+        )
+    mocker.patch("pyrb.controllers.cli.main.PRICE_HISTORY_DIR", tmp_path / "history")
+    spec_path = tmp_path / "spec.yaml"
+    spec_path.write_text(
+        "weights: {'005930': 1, '000660': 1}\n"
+        "policies: [{frequency: monthly}, {band: 0.05}]\n"
+        "investment_amount: 100000\n"
+        "path_count: 20\n"
+        "years: 0.5\n"
+        "block_size: 5\n"
+    )
+    output = tmp_path / "simulation.json"
+
+    # when
+    result = runner.invoke(
+        app, ["simulate", str(spec_path), "--output", str(output), "--workers", "1"]
+    )
+
+    # then
+    assert result.exit_code == 0
+    assert "20 paths of 0.5 years" in result.output
+    assert [summary["policy"] for summary in json.loads(output.read_text())] == [
+        {"frequency": "monthly", "band": None},
+        {"frequency": None, "band": 0.05},
+    ]
+
+
+def test_sut_exits_when_the_strategy_has_no_price_history(
+    fake_rebalance_context: RebalanceContext, mocker: MockerFixture, tmp_path: Path
+) -> None:
+    # given
+    runner = CliRunner()
+    mocker.patch(
+        "pyrb.repositories.brokerages.context.create_rebalance_context",
+        return_value=fake_rebalance_context,
+    )
+    mocker.patch(
+        "pyrb.repositories.history._default_price_history",
+        LocalPriceHistoryRepository(tmp_path / "history"),
+    )
+
+    # when
+    result = runner.invoke(
+        app, ["asset-allocate", "--strategy", "risk-parity-kr", "--investment-amount", "1000"]
+    )
+
+    # then
+    assert result.exit_code == 1
+    assert "Run `pyrb history sync` first" in result.output
+
+
+def test_sut_rejects_an_unknown_account_in_batch_rebalance(mocker: MockerFixture) -> None:
+    # given
+    runner = CliRunner()
+    account_service = mocker.patch("pyrb.controllers.cli.main.create_account_service")
+    account_service.return_value.get.side_effect = AccountNotFoundError("Account not found")
+
+    # when
+    result = runner.invoke(
+        app,
+        [
+            "batch-rebalance",
+            "--strategy",
+            "all-weather-kr",
+            "--account-id",
+            "00000000-0000-0000-0000-000000000000",
+        ],
+    )
+
+    # then
+    assert result.exit_code == 2
+    assert "Account not found" in result.output
+
+
+def test_sut_rejects_an_unknown_account_as_the_default_account(mocker: MockerFixture) -> None:
+    # given
+    runner = CliRunner()
+    account_service = mocker.patch("pyrb.controllers.cli.account.create_account_service")
+    account_service.return_value.set_default.side_effect = AccountNotFoundError(
+        "account 00000000-0000-0000-0000-000000000000 does not exist"
+    )
+
+    # when
+    result = runner.invoke(app, ["account", "use", "00000000-0000-0000-0000-000000000000"])
+
+    # then
+    assert result.exit_code == 1
+    assert isinstance(result.exception, SystemExit)
+    assert "does not exist" in result.output
+
+
+def test_sut_rejects_a_symbol_that_is_not_a_code(mocker: MockerFixture, tmp_path: Path) -> None:
+    # given
+    runner = CliRunner()
+    mocker.patch("pyrb.controllers.cli.history.PRICE_HISTORY_DIR", tmp_path / "history")
+
+    # when
+    result = runner.invoke(app, ["history", "sync", "--symbol", "../005930"])
+
+    # then
+    assert result.exit_code == 2
+    assert not list(tmp_path.rglob("*.bars"))
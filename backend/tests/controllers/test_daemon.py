@@ -0,0 +1,139 @@
+import os
+import socket
+import stat
+import sys
+import threading
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+from typer.testing import CliRunner
+
+from pyrb.controllers.api.daemon import bind_unix_socket, create_daemon_server
+from pyrb.controllers.api.deps import account_repo_dep, context_pool_dep
+from pyrb.controllers.api.main import app as api_app
+from pyrb.controllers.cli.client import connect_daemon
+from pyrb.controllers.cli.main import app
+from pyrb.enums import BrokerageType
+from pyrb.models.account import AccountFactory
+from pyrb.repositories.account import AccountRepository
+from pyrb.repositories.brokerages.context import RebalanceContext
+from pyrb.repositories.brokerages.pool import ContextPool
+
+
+@pytest.fixture
+def socket_path(
+    tmp_path: Path, tmp_account_repo: AccountRepository, fake_rebalance_context: RebalanceContext
+) -> Generator[Path, None, None]:
+    """Runs the daemon with the fake context on a Unix socket in a background thread."""
+    tmp_account_repo.set(
+        AccountFactory.create(brokerage=BrokerageType.EBEST, app_key="key", app_secret="secret")
+    )
+    socket_path = tmp_path / "daemon.sock"
+    sock = bind_unix_socket(socket_path)
+    server = create_daemon_server()
+    api_app.dependency_overrides[account_repo_dep] = lambda: tmp_account_repo
+    api_app.dependency_overrides[context_pool_dep] = lambda: ContextPool(
+        lambda _: fake_rebalance_context
+    )
+    thread = threading.Thread(target=server.run, kwargs={"sockets": [sock]})
+    thread.start()
+    while not server.started:
+        thread.join(0.01)
+
+    yield socket_path
+
+    server.should_exit = True
+    thread.join()
+    sock.close()
+    api_app.dependency_overrides.clear()
+
+
+def test_sut_is_only_accessible_to_the_current_user(socket_path: Path) -> None:
+    # when
+    mode = stat.S_IMODE(socket_path.stat().st_mode)
+
+    # then
+    assert mode == 0o600
+
+
+def test_sut_connects_only_to_a_running_daemon(socket_path: Path, tmp_path: Path) -> None:
+    # when
+    client = connect_daemon(socket_path)
+    missing_client = connect_daemon(tmp_path / "missing.sock")
+
+    # then
+    assert client is not None
+    assert client.get_portfolio().total_value == 100000
+    assert missing_client is None
+    client.close()
+
+
+def test_sut_connects_without_the_development_http_client(
+    socket_path: Path, mocker: MockerFixture
+) -> None:
+    # given
+    mocker.patch.dict(sys.modules, {"httpx": None})  # httpx 는 개발 의존성에만 포함됩니다.
+
+    # when
+    client = connect_daemon(socket_path)
+
+    # then
+    assert client is not None
+    assert client.get_portfolio().total_value == 100000
+
+
+def test_sut_ignores_a_stale_socket(tmp_path: Path) -> None:
+    # given
+    socket_path = tmp_path / "stale.sock"
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.bind(str(socket_path))  # 데몬이 비정상 종료되어 소켓 파일만 남은 경우
+
+    # when
+    client = connect_daemon(socket_path)
+
+    # then
+    assert client is None
+
+
+def test_sut_routes_the_portfolio_command_through_the_daemon(
+    socket_path: Path, mocker: MockerFixture
+) -> None:
+    # given
+    mocker.patch("pyrb.controllers.cli.main.DAEMON_SOCKET_PATH", socket_path)
+    in_process = mocker.patch("pyrb.repositories.brokerages.context.create_rebalance_context")
+    runner = CliRunner()
+
+    # when
+    result = runner.invoke(app, ["portfolio"])
+    preview_result = runner.invoke(
+        app, ["preview", "--strategy", "all-weather-kr", "--investment-amount", "10000"]
+    )
+
+    # then
+    assert result.exit_code == 0
+    assert "000660" in result.output
+    assert "Total Portfolio Value: ₩17,500" in result.output
+    assert preview_result.exit_code == 0
+    assert "all-weather-kr /" in preview_result.output
+    assert in_process.call_count == 0
+
+
+def test_sut_does_not_signal_the_pid_of_a_stale_pid_file(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    # given
+    pid_path = tmp_path / "daemon.pid"
+    pid_path.write_text(str(os.getpid()))
+    mocker.patch("pyrb.controllers.cli.daemon.DAEMON_PID_PATH", pid_path)
+    mocker.patch("pyrb.controllers.cli.daemon.DAEMON_SOCKET_PATH", tmp_path / "missing.sock")
+    kill = mocker.patch("os.kill")
+
+    # when
+    result = CliRunner().invoke(app, ["daemon", "stop"])
+
+    # then
+    assert result.exit_code == 1
+    assert kill.call_count == 0
+    assert not pid_path.exists()
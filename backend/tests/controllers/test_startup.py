@@ -0,0 +1,37 @@
+from collections.abc import Iterator
+
+import pytest
+
+from benchmarks.bench_startup import (
+    LIGHTWEIGHT_COMMANDS,
+    STARTUP_BUDGETS_MS,
+    heavy_modules_of,
+    isolated_app_dir,
+    measure_startup,
+)
+
+
+@pytest.fixture(scope="module")
+def env() -> Iterator[dict[str, str]]:
+    with isolated_app_dir() as env:
+        yield env
+
+
+@pytest.mark.parametrize("args", LIGHTWEIGHT_COMMANDS)
+def test_sut_starts_without_heavy_modules(args: tuple[str, ...], env: dict[str, str]) -> None:
+    # when
+    measurement = measure_startup(args, env)
+
+    # then
+    assert "pyrb.controllers.cli.main" in measurement.cumulative_ms
+    assert heavy_modules_of(args, measurement) == []
+
+
+def test_sut_times_the_account_list_through_the_account_repository(env: dict[str, str]) -> None:
+    # when
+    measurement = measure_startup(("account", "list"), env)
+
+    # then
+    assert ("account", "list") in STARTUP_BUDGETS_MS
+    assert "pyrb.repositories.account" in measurement.cumulative_ms
+    assert "requests" not in measurement.cumulative_ms
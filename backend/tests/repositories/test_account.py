@@ -0,0 +1,98 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from pyrb.enums import BrokerageType
+from pyrb.exceptions import AccountNotFoundError, InitializationError
+from pyrb.models.account import EbestAccount
+from pyrb.repositories.account import LocalConfigAccountRepository, SQLiteAccountRepository
+
+
+def _account(app_key: str = "app_key") -> EbestAccount:
+    return EbestAccount(brokerage=BrokerageType.EBEST, app_key=app_key, app_secret="app_secret")
+
+
+def test_sut_uses_first_account_as_default_account(tmp_path: Path) -> None:
+    # given
+    repo = SQLiteAccountRepository(tmp_path / "accounts.db")
+    first, second = _account("first"), _account("second")
+
+    # when
+    repo.set(first)
+    repo.set(second)
+
+    # then
+    assert repo.get() == first
+    assert repo.get(second.id) == second
+    assert repo.get_all() == [first, second]
+
+
+def test_sut_changes_default_account(tmp_path: Path) -> None:
+    # given
+    repo = SQLiteAccountRepository(tmp_path / "accounts.db")
+    first, second = _account("first"), _account("second")
+    repo.set(first)
+    repo.set(second)
+
+    # when
+    repo.set_default(second.id)
+
+    # then
+    assert repo.get() == second
+
+
+def test_sut_raises_for_unknown_or_unset_account(tmp_path: Path) -> None:
+    # given
+    repo = SQLiteAccountRepository(tmp_path / "accounts.db")
+
+    # then
+    with pytest.raises(InitializationError):
+        repo.get()
+
+    repo.set(_account())
+    with pytest.raises(AccountNotFoundError):
+        repo.get(_account().id)
+
+
+def test_sut_invalidates_cache_on_changes_from_another_connection(tmp_path: Path) -> None:
+    # given
+    reader = SQLiteAccountRepository(tmp_path / "accounts.db")
+    writer = SQLiteAccountRepository(tmp_path / "accounts.db")
+    account = _account("before")
+    writer.set(account)
+    assert reader.get().app_key == "before"  # type: ignore[attr-defined]
+
+    # when
+    writer.set(account.model_copy(update={"app_key": "after"}))
+
+    # then
+    assert reader.get().app_key == "after"  # type: ignore[attr-defined]
+
+
+def test_sut_imports_legacy_config_account(tmp_path: Path) -> None:
+    # given
+    legacy_repo = LocalConfigAccountRepository(tmp_path / "accounts")
+    account = _account()
+    legacy_repo.set(account)
+
+    # when
+    repo = SQLiteAccountRepository(
+        tmp_path / "accounts.db", legacy_config_path=tmp_path / "accounts"
+    )
+
+    # then
+    assert repo.get() == account
+
+
+def test_sut_handles_concurrent_writers(tmp_path: Path) -> None:
+    # given
+    repo = SQLiteAccountRepository(tmp_path / "accounts.db")
+    accounts = [_account(str(i)) for i in range(20)]
+
+    # when
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(repo.set, accounts))
+
+    # then
+    assert {account.id for account in repo.get_all()} == {account.id for account in accounts}
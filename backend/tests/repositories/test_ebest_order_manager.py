@@ -0,0 +1,157 @@
+import queue
+from typing import Any
+
+from pyrb.enums import OrderSide, OrderType
+from pyrb.exceptions import StreamDisconnectedError
+from pyrb.models.order import Order, OrderExecution
+from pyrb.repositories.brokerages.base.stream import ExecutionStream
+from pyrb.repositories.brokerages.ebest.client import EbestAPIClient
+from pyrb.repositories.brokerages.ebest.order_manager import EbestOrderManager
+
+
+class FakeResponse:
+    def __init__(self, payload: dict[str, Any], headers: dict[str, str]) -> None:
+        self.payload = payload
+        self.headers = headers
+
+    def json(self) -> dict[str, Any]:
+        return self.payload
+
+
+class FakeEbestAPIClient(EbestAPIClient):
+    def __init__(self, execution_pages: list[list[tuple[str, int]]]) -> None:
+        self.execution_pages = execution_pages
+        self.requested_cts_ordnos: list[str] = []
+        self.next_order_number = 1
+
+    def send_request(self, method: str, path: str, **kwargs: Any) -> Any:
+        if kwargs["headers"]["tr_cd"] == "CSPAT00601":
+            order_number = self.next_order_number
+            self.next_order_number += 1
+            return FakeResponse(
+                {"rsp_cd": "00040", "CSPAT00601OutBlock2": {"OrdNo": order_number}}, {}
+            )
+
+        cts_ordno = kwargs["json"]["t0425InBlock"]["cts_ordno"]
+        self.requested_cts_ordnos.append(cts_ordno)
+        page = int(cts_ordno or 0)
+        has_next = page + 1 < len(self.execution_pages)
+        return FakeResponse(
+            {
+                "t0425OutBlock": {"cts_ordno": str(page + 1) if has_next else ""},
+                "t0425OutBlock1": [
+                    {"ordno": order_number, "cheqty": quantity, "cheprice": 1000}
+                    for order_number, quantity in self.execution_pages[page]
+                ],
+            },
+            {"tr_cont": "Y" if has_next else "N", "tr_cont_key": "key"},
+        )
+
+
+class FakeExecutionStream(ExecutionStream):
+    """An in-process stand-in for the real-time execution feed. None drops the connection."""
+
+    def __init__(self) -> None:
+        self.executions: queue.Queue[OrderExecution | None] = queue.Queue()
+        self._connected = False
+
+    def connect(self) -> None:
+        self._connected = True
+
+    @property
+    def connected(self) -> bool:
+        return self._connected
+
+    def receive(self, timeout: float) -> OrderExecution | None:
+        try:
+            execution = self.executions.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+        if execution is None:
+            raise StreamDisconnectedError("connection reset")
+        return execution
+
+    def close(self) -> None:
+        self._connected = False
+
+
+def _order(symbol: str, quantity: int) -> Order:
+    return Order(
+        symbol=symbol,
+        price=1000,
+        quantity=quantity,
+        side=OrderSide.SELL,
+        order_type=OrderType.LIMIT,
+    )
+
+
+def test_sut_reads_fills_on_every_execution_page() -> None:
+    # given
+    client = FakeEbestAPIClient([[("1", 10)], [("2", 5)]])
+    sut = EbestOrderManager(client)
+    first, second = _order("005930", 10), _order("000660", 5)
+    sut.place_order(first)
+    sut.place_order(second)
+
+    # when
+    fills = list(sut.wait_for_fills([first, second], timeout=0))
+
+    # then
+    assert [(fill.order, fill.quantity) for fill in fills] == [(first, 10), (second, 5)]
+    assert client.requested_cts_ordnos == ["", "1"]
+
+
+def test_sut_forgets_orders_once_they_are_fully_filled() -> None:
+    # given
+    client = FakeEbestAPIClient([[("1", 10), ("2", 3)]])
+    sut = EbestOrderManager(client)
+    filled, partially_filled = _order("005930", 10), _order("000660", 5)
+    sut.place_order(filled)
+    sut.place_order(partially_filled)
+
+    # when
+    list(sut.wait_for_fills([partially_filled], timeout=0))
+
+    # then
+    assert sut._placed_orders.keys() == {"2"}
+
+
+def test_sut_yields_fills_from_the_execution_stream_without_polling() -> None:
+    # given
+    client = FakeEbestAPIClient([[]])
+    execution_stream = FakeExecutionStream()
+    sut = EbestOrderManager(client, execution_stream)
+    first, second = _order("005930", 10), _order("000660", 5)
+    sut.place_order(first)
+    sut.place_order(second)
+    for order_number, quantity in [("1", 4), ("2", 5), ("1", 6)]:
+        execution_stream.executions.put(
+            OrderExecution(order_number=order_number, quantity=quantity, price=1000)
+        )
+
+    # when
+    fills = list(sut.wait_for_fills([first, second], timeout=5))
+
+    # then
+    assert [(fill.order, fill.quantity) for fill in fills] == [(first, 4), (second, 5), (first, 6)]
+    assert client.requested_cts_ordnos == []
+    assert sut._placed_orders == {}
+
+
+def test_sut_polls_the_fills_missed_while_the_execution_stream_was_lost() -> None:
+    # given
+    client = FakeEbestAPIClient([[("1", 10)]])
+    execution_stream = FakeExecutionStream()
+    sut = EbestOrderManager(client, execution_stream)
+    order = _order("005930", 10)
+    sut.place_order(order)
+    execution_stream.executions.put(OrderExecution(order_number="1", quantity=4, price=1000))
+    execution_stream.executions.put(None)
+
+    # when
+    fills = list(sut.wait_for_fills([order], timeout=5))
+
+    # then: 실시간으로 받은 4주 이후의 체결만 체결 조회로 보완합니다.
+    assert [fill.quantity for fill in fills] == [4, 6]
+    assert not execution_stream.connected
@@ -0,0 +1,80 @@
+from pathlib import Path
+from typing import Any
+
+from pyrb.enums import AssetClassEnum
+from pyrb.repositories.brokerages.ebest.client import EbestAPIClient
+from pyrb.repositories.brokerages.ebest.portfolio import EbestPortfolio
+from pyrb.repositories.symbol_master import SymbolMaster
+from tests.repositories.test_symbol_master import FAKE_SYMBOLS
+
+
+class PayloadPortfolio(EbestPortfolio):
+    def __init__(self, payload: dict[str, Any], symbol_master: SymbolMaster | None = None) -> None:
+        super().__init__(EbestAPIClient.__new__(EbestAPIClient), symbol_master)
+        self.payload = payload
+        self.fetch_count = 0
+
+    def _fetch_portfolio(self) -> dict[str, Any]:
+        self.fetch_count += 1
+        return self.payload
+
+
+def _item(symbol: str, label: str, quantity: int) -> dict[str, Any]:
+    return {
+        "expcode": symbol,
+        "hname": label,
+        "janqty": quantity,
+        "mdposqt": quantity,
+        "pamt": 100,
+        "appamt": quantity * 110,
+        "sunikrt": "10.00",
+        "dtsunik": quantity * 10,
+    }
+
+
+def test_sut_parses_positions_once_per_refresh() -> None:
+    # given
+    sut = PayloadPortfolio({
+        "t0424OutBlock": {"sunamt": 100000},
+        "t0424OutBlock1": [_item("005930", "삼성전자", 10), _item("123456", "기타", 5)],
+        "CSPAQ12200OutBlock2": {"D2Dps": 1000},
+    })
+
+    # when
+    positions = sut.positions
+    position = sut.get_position("005930")
+
+    # then
+    assert position is positions[0]
+    assert position.asset.asset_class == "STOCK"
+    assert position.rtn == 0.1
+    assert sut.get_position("123456").asset.asset_class == "OTHER"  # type: ignore[union-attr]
+    assert sut.holding_symbols == ["005930", "123456"]
+    assert sut.get_position_amount("000660") == 0
+
+    sut.payload["t0424OutBlock1"] = []
+    sut.refresh()
+    assert sut.positions == []
+    assert sut.fetch_count == 2
+
+
+def test_sut_classifies_unlisted_symbols_with_the_symbol_master(tmp_path: Path) -> None:
+    # given
+    SymbolMaster.write(tmp_path / "symbols.bin", FAKE_SYMBOLS)
+    payload = {
+        "t0424OutBlock": {"sunamt": 100000},
+        "t0424OutBlock1": [
+            _item("411060", "ACE KRX금현물", 10),
+            _item("148070", "KOSEF 국고채10년", 5),
+            _item("999999", "기타", 1),
+        ],
+        "CSPAQ12200OutBlock2": {"D2Dps": 1000},
+    }
+    sut = PayloadPortfolio(payload, SymbolMaster(tmp_path / "symbols.bin"))
+
+    # when
+    asset_classes = [position.asset.asset_class for position in sut.positions]
+
+    # then
+    assert asset_classes == [AssetClassEnum.COMMODITY, AssetClassEnum.BOND, AssetClassEnum.OTHER]
+    assert PayloadPortfolio(payload).positions[1].asset.asset_class == AssetClassEnum.OTHER
@@ -0,0 +1,43 @@
+import json
+from pathlib import Path
+from typing import Any
+
+from pytest_mock import MockerFixture
+
+from pyrb.enums import Market
+from pyrb.repositories.brokerages.ebest.client import EbestAPIClient
+from pyrb.repositories.brokerages.ebest.stream import EbestQuoteStream
+from pyrb.repositories.symbol_master import SymbolMaster
+from tests.repositories.test_symbol_master import FAKE_SYMBOLS
+
+
+class FakeConnection:
+    def __init__(self) -> None:
+        self.sent: list[dict[str, Any]] = []
+
+    def send(self, message: str) -> None:
+        self.sent.append(json.loads(message))
+
+
+def test_sut_subscribes_each_symbol_on_the_feed_of_its_market(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    # given
+    kosdaq_symbol = FAKE_SYMBOLS[0].model_copy(update={"symbol": "247540", "market": Market.KOSDAQ})
+    SymbolMaster.write(tmp_path / "symbols.bin", [*FAKE_SYMBOLS[:1], kosdaq_symbol])
+    api_client = mocker.Mock(spec=EbestAPIClient, access_token="token")
+    sut = EbestQuoteStream(api_client, SymbolMaster(tmp_path / "symbols.bin"))
+    connection = FakeConnection()
+    sut._connection = connection  # type: ignore[assignment]
+
+    # when
+    sut.subscribe(["005930", "247540", "069500"])
+
+    # then: 종목 마스터에 없는 종목은 코스피 TR 로 등록합니다.
+    assert [
+        (message["body"]["tr_cd"], message["body"]["tr_key"]) for message in connection.sent
+    ] == [
+        ("S3_", "005930"),
+        ("K3_", "247540"),
+        ("S3_", "069500"),
+    ]
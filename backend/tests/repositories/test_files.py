@@ -0,0 +1,30 @@
+from pathlib import Path
+
+import pytest
+
+from pyrb.repositories.files import write_atomically
+
+
+def test_sut_replaces_the_file_without_leaving_temporary_files(tmp_path: Path) -> None:
+    # given
+    path = tmp_path / "data" / "file.bin"
+    write_atomically(path, b"old")
+
+    # when
+    write_atomically(path, b"new ", b"content")
+
+    # then
+    assert path.read_bytes() == b"new content"
+    assert list(path.parent.iterdir()) == [path]
+
+
+def test_sut_keeps_the_previous_file_when_the_write_fails(tmp_path: Path) -> None:
+    # given
+    path = tmp_path / "file.bin"
+    write_atomically(path, b"old")
+
+    # when, then
+    with pytest.raises(TypeError):
+        write_atomically(path, b"new", "not bytes")  # type: ignore[arg-type]
+    assert path.read_bytes() == b"old"
+    assert list(tmp_path.iterdir()) == [path]
@@ -0,0 +1,128 @@
+import datetime
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from pyrb.exceptions import PriceHistoryError
+from pyrb.models.history import DailyBar
+from pyrb.repositories.history import (
+    BAR_DTYPE,
+    COUNT,
+    COUNT_OFFSET,
+    HEADER,
+    LocalPriceHistoryRepository,
+)
+
+
+def create_bars(start: datetime.date, closes: list[int]) -> list[DailyBar]:
+    return [
+        DailyBar(
+            date=start + datetime.timedelta(days=i),
+            open=close,
+            high=close,
+            low=close,
+            close=close,
+            volume=1000 + i,
+        )
+        for i, close in enumerate(closes)
+    ]
+
+
+def test_sut_appends_only_bars_after_the_latest_bar(tmp_path: Path) -> None:
+    # given
+    sut = LocalPriceHistoryRepository(tmp_path)
+    sut.append("005930", create_bars(datetime.date(2024, 1, 1), [100, 101, 102]))
+
+    # when
+    appended_count = sut.append("005930", create_bars(datetime.date(2024, 1, 3), [999, 103, 104]))
+
+    # then
+    assert appended_count == 2
+    assert sut.read_bars("005930")["close"].tolist() == [100, 101, 102, 103, 104]
+    assert sut.last_bar("005930") == create_bars(datetime.date(2024, 1, 5), [104])[0].model_copy(
+        update={"volume": 1002}
+    )
+    assert sut.symbols() == ["005930"]
+
+
+def test_sut_reads_a_range_without_copying(tmp_path: Path) -> None:
+    # given
+    sut = LocalPriceHistoryRepository(tmp_path)
+    sut.append("005930", create_bars(datetime.date(2024, 1, 1), list(range(100, 110))))
+    all_bars = sut.read_bars("005930")
+
+    # when
+    bars = sut.read_bars("005930", datetime.date(2024, 1, 3), datetime.date(2024, 1, 5))
+
+    # then
+    assert bars["close"].tolist() == [102, 103, 104]
+    assert np.shares_memory(bars, all_bars)
+    assert not bars.flags.writeable
+    assert len(sut.read_bars("000660")) == 0
+
+
+def test_readers_see_only_committed_bars(tmp_path: Path) -> None:
+    # given
+    sut = LocalPriceHistoryRepository(tmp_path)
+    sut.append("005930", create_bars(datetime.date(2024, 1, 1), [100, 101]))
+    reader = LocalPriceHistoryRepository(tmp_path)
+    bars_before = reader.read_bars("005930")
+
+    # 추가 중에 중단되어 확정되지 않은 레코드를 흉내냅니다.
+    with open(tmp_path / "005930.bars", "ab") as f:
+        f.write(b"\xff" * BAR_DTYPE.itemsize)
+
+    # when
+    bars_while_interrupted = reader.read_bars("005930")
+    sut.append("005930", create_bars(datetime.date(2024, 1, 3), [102, 103]))
+
+    # then
+    assert bars_while_interrupted["close"].tolist() == [100, 101]
+    assert bars_before["close"].tolist() == [100, 101]
+    assert reader.read_bars("005930")["close"].tolist() == [100, 101, 102, 103]
+
+
+def test_sut_rebuilds_from_committed_bars(tmp_path: Path) -> None:
+    # given
+    sut = LocalPriceHistoryRepository(tmp_path)
+    sut.append("005930", create_bars(datetime.date(2024, 1, 1), [100, 101, 102]))
+    path = tmp_path / "005930.bars"
+    with open(path, "r+b") as f:
+        f.seek(COUNT_OFFSET)
+        f.write(COUNT.pack(2))
+
+    # when
+    rebuilt_count = sut.rebuild()
+
+    # then
+    assert rebuilt_count == 1
+    assert sut.read_bars("005930")["close"].tolist() == [100, 101]
+    assert path.stat().st_size == HEADER.size + 2 * BAR_DTYPE.itemsize
+
+
+def test_sut_loads_closes_aligned_on_dates(tmp_path: Path) -> None:
+    # given
+    sut = LocalPriceHistoryRepository(tmp_path)
+    sut.append("005930", create_bars(datetime.date(2024, 1, 1), [100, 101, 102]))
+    sut.append("000660", create_bars(datetime.date(2024, 1, 2), [200, 201, 202]))
+
+    # when
+    prices = sut.load_closes(["000660", "005930"], start=datetime.date(2024, 1, 2))
+
+    # then
+    assert prices.dates.tolist() == [datetime.date(2024, 1, d) for d in (2, 3, 4)]
+    np.testing.assert_array_equal(prices.closes, [[200.0, 101.0], [201.0, 102.0], [202.0, np.nan]])
+    with pytest.raises(PriceHistoryError):
+        sut.load_closes(["035420"])
+
+
+@pytest.mark.parametrize("symbol", ["../005930", "005930/..", "abc123", ""])
+def test_sut_rejects_symbols_that_are_not_codes(tmp_path: Path, symbol: str) -> None:
+    # given
+    sut = LocalPriceHistoryRepository(tmp_path / "history")
+
+    # when, then
+    with pytest.raises(PriceHistoryError):
+        sut.append(symbol, create_bars(datetime.date(2024, 1, 1), [100]))
+    assert not list(tmp_path.rglob("*.bars"))
@@ -0,0 +1,101 @@
+from pyrb.enums import BrokerageType, OrderSide, OrderType
+from pyrb.models.account import Account, AccountFactory
+from pyrb.models.order import Order
+from pyrb.models.price import CurrentPrice
+from pyrb.repositories.brokerages.context import RebalanceContext
+from pyrb.repositories.brokerages.pool import ContextPool
+from tests.conftest import FakeOrderManager, FakePortfolio, FakePriceFetcher
+
+
+class CountingPortfolio(FakePortfolio):
+    def __init__(self) -> None:
+        self.refresh_count = 0
+
+    def refresh(self) -> None:
+        self.refresh_count += 1
+
+
+class CountingPriceFetcher(FakePriceFetcher):
+    def __init__(self) -> None:
+        self.requested_symbols: list[list[str]] = []
+
+    def get_current_prices(self, symbols: list[str]) -> dict[str, CurrentPrice]:
+        self.requested_symbols.append(symbols)
+        return super().get_current_prices(symbols)
+
+
+def _account() -> Account:
+    return AccountFactory.create(brokerage=BrokerageType.EBEST, app_key="key", app_secret="secret")
+
+
+def test_sut_reuses_the_context_of_an_account() -> None:
+    # given
+    account = _account()
+    portfolio, price_fetcher = CountingPortfolio(), CountingPriceFetcher()
+    created_count = 0
+
+    def context_factory(_: Account) -> RebalanceContext:
+        nonlocal created_count
+        created_count += 1
+        return RebalanceContext(portfolio, price_fetcher, FakeOrderManager())
+
+    sut = ContextPool(context_factory, snapshot_ttl=60)
+
+    # when
+    first = sut.get(account)
+    second = sut.get(account)
+    first.price_fetcher.get_current_prices(["005930"])
+    second.price_fetcher.get_current_prices(["005930", "000660"])
+
+    # then
+    assert first is second
+    assert created_count == 1
+    assert portfolio.refresh_count == 0
+    assert price_fetcher.requested_symbols == [["005930"], ["000660"]]
+
+
+def test_sut_refreshes_stale_snapshots() -> None:
+    # given
+    account = _account()
+    portfolio = CountingPortfolio()
+    sut = ContextPool(
+        lambda _: RebalanceContext(portfolio, FakePriceFetcher(), FakeOrderManager()),
+        snapshot_ttl=60,
+    )
+    sut.get(account)
+
+    # when
+    sut.get(account)
+    sut.invalidate(account.id)
+    sut.get(account)
+    sut.get(account)
+
+    # then
+    assert portfolio.refresh_count == 1
+
+
+def test_sut_refreshes_the_snapshot_after_orders_are_placed() -> None:
+    # given
+    account = _account()
+    portfolio = CountingPortfolio()
+    sut = ContextPool(
+        lambda _: RebalanceContext(portfolio, FakePriceFetcher(), FakeOrderManager()),
+        snapshot_ttl=60,
+    )
+    context = sut.get(account)
+
+    # when
+    context.order_manager.place_order(
+        Order(
+            symbol="005930",
+            price=100,
+            quantity=1,
+            side=OrderSide.BUY,
+            order_type=OrderType.MARKET,
+        )
+    )
+    sut.get(account)
+    sut.get(account)
+
+    # then
+    assert portfolio.refresh_count == 1
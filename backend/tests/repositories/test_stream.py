@@ -0,0 +1,116 @@
+import queue
+import time
+from collections.abc import Callable
+
+from pytest_mock import MockerFixture
+
+from pyrb.exceptions import StreamDisconnectedError
+from pyrb.models.price import CurrentPrice
+from pyrb.repositories.brokerages.base.stream import QuoteStream
+from pyrb.repositories.brokerages.stream import StreamingPriceFetcher
+from tests.conftest import FakePriceFetcher
+
+DISCONNECT = CurrentPrice(symbol="", price=0)
+
+
+class FakeQuoteStream(QuoteStream):
+    """An in-process stand-in for a real-time quote feed. `DISCONNECT` drops the connection."""
+
+    def __init__(self) -> None:
+        self.events: queue.Queue[CurrentPrice] = queue.Queue()
+        self.connect_count = 0
+        self.subscriptions: list[list[str]] = []
+
+    def connect(self) -> None:
+        self.connect_count += 1
+
+    def subscribe(self, symbols: list[str]) -> None:
+        self.subscriptions.append(symbols)
+
+    def unsubscribe(self, symbols: list[str]) -> None: ...
+
+    def receive(self, timeout: float) -> CurrentPrice | None:
+        try:
+            price = self.events.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+        if price is DISCONNECT:
+            raise StreamDisconnectedError("connection reset")
+        return price
+
+    def close(self) -> None: ...
+
+
+def _wait_until(condition: Callable[[], bool], timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition was not met in time"
+        time.sleep(0.01)
+
+
+def test_sut_serves_subscribed_symbols_from_the_price_board(mocker: MockerFixture) -> None:
+    # given
+    quote_stream = FakeQuoteStream()
+    price_fetcher = FakePriceFetcher()
+    sut = StreamingPriceFetcher(quote_stream, price_fetcher)
+    sut.subscribe(["005930"])
+    sut.start()
+    _wait_until(lambda: sut.live)
+
+    quote_stream.events.put(CurrentPrice(symbol="005930", price=160))
+    _wait_until(lambda: sut.price_board.get_many(["005930"])["005930"].price == 160)
+    spy = mocker.spy(price_fetcher, "get_current_prices")
+
+    # when
+    prices = sut.get_current_prices(["005930"])
+    sut.stop()
+
+    # then
+    assert prices == {"005930": CurrentPrice(symbol="005930", price=160)}
+    assert spy.call_count == 0
+
+
+def test_sut_resubscribes_and_backfills_after_a_gap(mocker: MockerFixture) -> None:
+    # given
+    quote_stream = FakeQuoteStream()
+    price_fetcher = FakePriceFetcher()
+    spy = mocker.spy(price_fetcher, "get_current_prices")
+    sut = StreamingPriceFetcher(quote_stream, price_fetcher, reconnect_delay=0.01)
+    sut.subscribe(["000660", "005930"])
+    sut.start()
+    _wait_until(lambda: sut.live)
+    quote_stream.events.put(CurrentPrice(symbol="005930", price=160))
+
+    # when
+    quote_stream.events.put(DISCONNECT)
+    _wait_until(lambda: quote_stream.connect_count == 2 and sut.live)
+    sut.stop()
+
+    # then
+    assert sut.reconnect_count == 1
+    assert quote_stream.subscriptions == [["000660", "005930"], ["000660", "005930"]]
+    assert [call.args[0] for call in spy.call_args_list] == [
+        ["000660", "005930"],
+        ["000660", "005930"],
+    ]
+    # the back-filled price replaces the tick received before the gap
+    assert sut.price_board.get_many(["005930"])["005930"].price == 150
+
+
+def test_sut_subscribes_requested_symbols() -> None:
+    # given
+    quote_stream = FakeQuoteStream()
+    sut = StreamingPriceFetcher(quote_stream, FakePriceFetcher())
+    sut.start()
+    _wait_until(lambda: sut.live)
+
+    # when
+    prices = sut.get_current_prices(["035420"])
+    _wait_until(lambda: quote_stream.subscriptions == [["035420"]])
+    quote_stream.events.put(CurrentPrice(symbol="035420", price=120))
+    _wait_until(lambda: sut.get_current_price("035420").price == 120)
+    sut.stop()
+
+    # then
+    assert prices == {"035420": CurrentPrice(symbol="035420", price=100)}
@@ -0,0 +1,175 @@
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from pyrb.enums import AssetClassEnum, Market
+from pyrb.exceptions import InvalidTargetError, SymbolMasterError
+from pyrb.models.symbol import SymbolInfo, classify_by_name, krx_tick_size
+from pyrb.repositories.brokerages.base.symbols import SymbolListFetcher
+from pyrb.repositories.symbol_master import SymbolMaster, configure_symbol_master
+from pyrb.services.strategy.explicit_target import read_targets_from_source
+from pyrb.services.symbol_master import SymbolMasterService
+
+
+def _symbol(symbol: str, name: str, is_etf: bool = False, price: int = 10000) -> SymbolInfo:
+    return SymbolInfo(
+        symbol=symbol,
+        name=name,
+        market=Market.KOSPI,
+        asset_class=classify_by_name(name, is_etf),
+        is_etf=is_etf,
+        tick_size=krx_tick_size(price, is_etf),
+    )
+
+
+FAKE_SYMBOLS = [
+    _symbol("005930", "삼성전자", price=70000),
+    _symbol("000660", "SK하이닉스", price=150000),
+    _symbol("148070", "KOSEF 국고채10년", is_etf=True, price=110000),
+    _symbol("411060", "ACE KRX금현물", is_etf=True, price=13000),
+] + [_symbol(f"{i:06d}", f"종목{i}") for i in range(100000, 102000)]
+
+
+class FakeSymbolListFetcher(SymbolListFetcher):
+    def __init__(self) -> None:
+        self.fetch_count = 0
+
+    def fetch_symbols(self) -> list[SymbolInfo]:
+        self.fetch_count += 1
+        return FAKE_SYMBOLS
+
+
+@pytest.fixture
+def symbol_master_path(tmp_path: Path) -> Path:
+    path = tmp_path / "symbols.bin"
+    SymbolMaster.write(path, FAKE_SYMBOLS)
+    return path
+
+
+@pytest.fixture
+def default_symbol_master(symbol_master_path: Path) -> Iterator[SymbolMaster]:
+    yield configure_symbol_master(symbol_master_path)
+    configure_symbol_master(symbol_master_path.with_name("missing.bin"))
+
+
+def test_sut_looks_up_symbols_from_the_master_file(symbol_master_path: Path) -> None:
+    # given
+    sut = SymbolMaster(symbol_master_path)
+
+    # when
+    samsung = sut.get("005930")
+    bond_etf = sut.get("148070")
+
+    # then
+    assert len(sut) == len(FAKE_SYMBOLS)
+    assert samsung == FAKE_SYMBOLS[0]
+    assert samsung.tick_size == 100
+    assert bond_etf is not None
+    assert bond_etf.is_etf
+    assert bond_etf.tick_size == 5
+    assert sut.get_asset_class("148070") == AssetClassEnum.BOND
+    assert sut.get_asset_class("411060") == AssetClassEnum.COMMODITY
+    assert all(info.symbol in sut for info in FAKE_SYMBOLS)
+    assert "999999" not in sut
+    assert sut.get("ABCDEFGHIJKLMNOP") is None
+
+
+def test_sut_is_empty_without_a_master_file(tmp_path: Path) -> None:
+    # given
+    sut = SymbolMaster(tmp_path / "missing.bin")
+
+    # when
+    found = sut.get("005930")
+
+    # then
+    assert found is None
+    assert len(sut) == 0
+    assert sut.updated_at is None
+
+
+def test_sut_rejects_a_truncated_master_file(symbol_master_path: Path) -> None:
+    # given
+    data = symbol_master_path.read_bytes()
+    symbol_master_path.write_bytes(data[: len(data) // 2])
+    sut = SymbolMaster(symbol_master_path)
+
+    # when
+    with pytest.raises(SymbolMasterError) as exc_info:
+        sut.get("005930")
+
+    # then
+    assert "pyrb symbols update" in str(exc_info.value)
+
+
+@pytest.mark.parametrize("size", [0, 10])
+def test_sut_rejects_a_master_file_without_a_header(tmp_path: Path, size: int) -> None:
+    # given
+    path = tmp_path / "symbols.bin"
+    path.write_bytes(b"\x00" * size)
+    sut = SymbolMaster(path)
+
+    # when, then
+    with pytest.raises(SymbolMasterError):
+        len(sut)
+
+
+def test_sut_closes_the_replaced_mapping_on_reload(symbol_master_path: Path) -> None:
+    # given
+    sut = SymbolMaster(symbol_master_path)
+    replaced = sut._load()
+    assert replaced is not None
+    os.utime(symbol_master_path, ns=(0, 0))
+
+    # when
+    sut.reload()
+    found = sut.get("005930")
+
+    # then
+    assert replaced.buffer.closed
+    assert found == FAKE_SYMBOLS[0]
+
+
+def test_sut_rebuilds_a_truncated_master(symbol_master_path: Path) -> None:
+    # given
+    symbol_master_path.write_bytes(symbol_master_path.read_bytes()[:100])
+    symbol_master = SymbolMaster(symbol_master_path)
+    sut = SymbolMasterService(symbol_master, FakeSymbolListFetcher())
+
+    # when
+    updated = sut.update()
+
+    # then
+    assert updated
+    assert len(symbol_master) == len(FAKE_SYMBOLS)
+
+
+def test_sut_updates_the_master_at_most_once_a_day(tmp_path: Path) -> None:
+    # given
+    symbol_master = SymbolMaster(tmp_path / "symbols.bin")
+    symbol_list_fetcher = FakeSymbolListFetcher()
+    sut = SymbolMasterService(symbol_master, symbol_list_fetcher)
+
+    # when
+    updated = [sut.update(), sut.update(), sut.update(force=True)]
+
+    # then
+    assert updated == [True, False, True]
+    assert symbol_list_fetcher.fetch_count == 2
+    assert len(symbol_master) == len(FAKE_SYMBOLS)
+
+
+def test_target_reader_rejects_unlisted_symbols(
+    default_symbol_master: SymbolMaster, tmp_path: Path
+) -> None:
+    # given
+    source = tmp_path / "targets.json"
+    source.write_text('{"005930": 0.5, "999999": 0.5}')
+
+    # when
+    with pytest.raises(InvalidTargetError) as exc_info:
+        read_targets_from_source(source)
+
+    # then
+    assert "999999" in str(exc_info.value)
@@ -0,0 +1,166 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+from freezegun import freeze_time
+from pytest_mock import MockerFixture
+
+from pyrb.repositories import target_cache as target_cache_module
+from pyrb.repositories.symbol_master import SymbolMaster, configure_symbol_master
+from pyrb.repositories.target_cache import TargetCache
+from pyrb.services.strategy.explicit_target import (
+    read_targets_from_content,
+    read_targets_from_source,
+)
+from tests.repositories.test_symbol_master import FAKE_SYMBOLS
+
+
+class CountingReader:
+    def __init__(self) -> None:
+        self.read_count = 0
+
+    def __call__(self, source: Path) -> dict[str, float]:
+        self.read_count += 1
+        return read_targets_from_source(source)
+
+
+@pytest.fixture
+def source(tmp_path: Path) -> Path:
+    source = tmp_path / "targets.json"
+    source.write_text('{"005930": 0.6, "000660": 0.4}')
+    return source
+
+
+def test_sut_reads_unchanged_source_from_cache(target_cache: TargetCache, source: Path) -> None:
+    # given
+    reader = CountingReader()
+    sut = TargetCache(target_cache.directory / "cache")
+    expected = sut.read(source, reader)
+
+    # when
+    targets = sut.read(source, reader)
+
+    # then
+    assert targets == expected
+    assert list(targets) == ["005930", "000660"]
+    assert reader.read_count == 1
+
+
+def test_sut_invalidates_edited_source(target_cache: TargetCache, source: Path) -> None:
+    # given
+    reader = CountingReader()
+    sut = TargetCache(target_cache.directory / "cache")
+    sut.read(source, reader)
+    source.write_text('{"005930": 0.5, "000660": 0.5}')
+
+    # when
+    targets = sut.read(source, reader)
+
+    # then
+    assert targets == {"005930": 0.5, "000660": 0.5}
+    assert reader.read_count == 2
+
+
+def test_sut_compares_content_of_touched_source(target_cache: TargetCache, source: Path) -> None:
+    # given
+    reader = CountingReader()
+    sut = TargetCache(target_cache.directory / "cache")
+    sut.read(source, reader)
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    # when
+    sut.read(source, reader)
+    sut.read(source, reader)
+
+    # then
+    assert reader.read_count == 1
+
+
+def test_sut_hashes_touched_and_edited_source_once(
+    mocker: MockerFixture, target_cache: TargetCache, source: Path
+) -> None:
+    # given
+    reader = mocker.Mock(side_effect=lambda path: json.loads(path.read_text()))
+    sut = TargetCache(target_cache.directory / "cache")
+    sut.read(source, reader)
+    stat = source.stat()
+    source.write_text('{"005930": 0.4, "000660": 0.6}')  # 크기는 같고 내용만 다름
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    hash_file = mocker.spy(target_cache_module, "_hash_file")
+
+    # when
+    targets = sut.read(source, reader)
+
+    # then
+    assert targets == {"005930": 0.4, "000660": 0.6}
+    assert reader.call_count == 2
+    assert hash_file.call_count == 1
+
+
+def test_sut_invalidates_entries_when_symbol_master_is_replaced(
+    target_cache: TargetCache, source: Path, tmp_path: Path
+) -> None:
+    # given
+    reader = CountingReader()
+    sut = TargetCache(target_cache.directory / "cache")
+    symbol_master_path = tmp_path / "symbols.bin"
+    with freeze_time("2024-01-02T08:00:00+09:00"):
+        SymbolMaster.write(symbol_master_path, FAKE_SYMBOLS)
+    symbol_master = configure_symbol_master(symbol_master_path)
+    sut.read(source, reader)
+
+    with freeze_time("2024-01-03T08:00:00+09:00"):
+        SymbolMaster.write(symbol_master_path, FAKE_SYMBOLS)
+    symbol_master.reload()
+
+    # when
+    try:
+        sut.read(source, reader)
+    finally:
+        configure_symbol_master(tmp_path / "missing.bin")
+
+    # then
+    assert reader.read_count == 2
+
+
+def test_read_targets_from_content_is_keyed_by_content(target_cache: TargetCache) -> None:
+    # given
+    content = b"symbol,weight\n005930,3\n000660,1\n"
+
+    # when
+    targets = read_targets_from_content(content, ".csv")
+    cached_targets = read_targets_from_content(content, ".csv")
+
+    # then
+    assert targets == cached_targets == {"005930": 0.75, "000660": 0.25}
+    assert len(list(target_cache.directory.glob("content-*.bin"))) == 1
+
+
+def _age_content_entries(directory: Path, seconds: int) -> None:
+    for entry_path in directory.glob("content-*.bin"):
+        mtime = entry_path.stat().st_mtime - seconds
+        os.utime(entry_path, (mtime, mtime))
+
+
+def test_sut_keeps_only_the_most_recently_used_content_entries(
+    target_cache: TargetCache,
+) -> None:
+    # given
+    sut = TargetCache(target_cache.directory / "cache", max_content_entries=2)
+    contents = [f"symbol,weight\n005930,{i}\n000660,1\n".encode() for i in range(1, 4)]
+    for content in contents[:2]:
+        sut.read_content(content, ".csv", read_targets_from_source)
+        _age_content_entries(sut.directory, 60)
+
+    # when
+    reader = CountingReader()
+    sut.read_content(contents[0], ".csv", reader)
+    sut.read_content(contents[2], ".csv", reader)
+    sut.read_content(contents[0], ".csv", reader)
+    sut.read_content(contents[1], ".csv", reader)
+
+    # then
+    assert len(list(sut.directory.glob("content-*.bin"))) == 2
+    assert reader.read_count == 2  # 가장 오래 쓰지 않은 두 번째 파일만 다시 읽습니다.
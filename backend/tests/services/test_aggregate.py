@@ -0,0 +1,76 @@
+import threading
+
+from pyrb.enums import BrokerageType
+from pyrb.models.account import Account, AccountFactory
+from pyrb.repositories.brokerages.context import RebalanceContext
+from pyrb.services.aggregate import PortfolioAggregator
+from tests.conftest import FakeOrderManager, FakePortfolio, FakePriceFetcher
+
+
+class BlockingPortfolio(FakePortfolio):
+    def __init__(self, released: threading.Event) -> None:
+        self.refresh_count = 0
+        self._released = released
+
+    def refresh(self) -> None:
+        self.refresh_count += 1
+        self._released.wait()
+
+
+def _account() -> Account:
+    return AccountFactory.create(brokerage=BrokerageType.EBEST, app_key="key", app_secret="secret")
+
+
+def _context(portfolio: FakePortfolio) -> RebalanceContext:
+    return RebalanceContext(
+        portfolio=portfolio,
+        price_fetcher=FakePriceFetcher(),
+        order_manager=FakeOrderManager(),
+    )
+
+
+def test_sut_merges_positions_of_all_accounts() -> None:
+    # given
+    accounts = [_account(), _account()]
+    sut = PortfolioAggregator(lambda _: _context(FakePortfolio()))
+
+    # when
+    aggregated_portfolio = sut.aggregate(accounts)
+
+    # then
+    assert not aggregated_portfolio.partial
+    assert aggregated_portfolio.total_value == 200000
+    assert [
+        (position.asset.symbol, position.quantity, position.total_amount)
+        for position in aggregated_portfolio.positions
+    ] == [("000660", 200, 20000), ("005930", 100, 15000)]
+    assert aggregated_portfolio.positions[0].account_ids == [account.id for account in accounts]
+    assert [
+        (exposure.asset_class, exposure.total_amount)
+        for exposure in aggregated_portfolio.asset_classes
+    ] == [("STOCK", 35000)]
+
+
+def test_sut_returns_partial_results_when_an_account_times_out() -> None:
+    # given
+    released = threading.Event()
+    slow_account, account = _account(), _account()
+    slow_portfolio = BlockingPortfolio(released)
+
+    def context_factory(target: Account) -> RebalanceContext:
+        return _context(slow_portfolio if target == slow_account else FakePortfolio())
+
+    sut = PortfolioAggregator(context_factory, timeout=0.1)
+
+    # when
+    first = sut.aggregate([slow_account, account])
+    second = sut.aggregate([slow_account, account])
+    released.set()
+
+    # then
+    for aggregated_portfolio in (first, second):
+        assert aggregated_portfolio.partial
+        assert aggregated_portfolio.total_value == 100000
+        assert [status.error is None for status in aggregated_portfolio.accounts] == [False, True]
+    assert slow_portfolio.refresh_count == 1  # the pending load is not requested again
+    sut.close()
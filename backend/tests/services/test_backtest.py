@@ -0,0 +1,134 @@
+import numpy as np
+import pytest
+
+from pyrb.enums import RebalanceFrequency
+from pyrb.exceptions import PriceHistoryError
+from pyrb.models.position import Position
+from pyrb.repositories.brokerages.context import RebalanceContext
+from pyrb.repositories.history import PriceMatrix
+from pyrb.services.backtest import Backtester
+from pyrb.services.rebalance import Rebalancer
+from pyrb.services.strategy.explicit_target import ExplicitTargetRebalanceStrategy
+from tests.conftest import FakeOrderManager, FakePortfolio, FakePriceFetcher
+
+
+def _prices(closes: list[list[float]], start: str = "2024-01-29") -> PriceMatrix:
+    dates = np.arange(np.datetime64(start), np.datetime64(start) + len(closes))
+    return PriceMatrix(dates, ["A", "B"], np.array(closes, dtype=np.float64))
+
+
+def test_sut_holds_the_initial_portfolio_without_rebalancing() -> None:
+    # given
+    sut = Backtester(_prices([[100, 300], [110, 300], [120, 270]]))
+    strategy = ExplicitTargetRebalanceStrategy({"A": 0.5, "B": 0.5})
+
+    # when
+    result = sut.run(strategy, initial_cash=1000, frequency=None)
+
+    # then
+    assert result.values.tolist() == [1000, 1050, 1070]
+    assert result.report.rebalance_count == 0
+    assert result.report.total_return == pytest.approx(0.07)
+    assert result.report.turnover == 0
+
+
+class CashPortfolio(FakePortfolio):
+    @property
+    def total_value(self) -> float:
+        return 10000
+
+    @property
+    def positions(self) -> list[Position]:
+        return []
+
+
+def test_sut_buys_the_same_shares_as_the_rebalancer() -> None:
+    # given
+    # 둘째 날과 셋째 날에 각 종목의 종가만 1원씩 올려, 평가금액의 변화로 보유 수량을 확인합니다.
+    prices = PriceMatrix(
+        np.arange(np.datetime64("2024-01-29"), np.datetime64("2024-02-01")),
+        ["000660", "005930"],
+        np.array([[100, 150], [101, 150], [100, 151]], dtype=np.float64),
+    )
+    strategy = ExplicitTargetRebalanceStrategy({"000660": 0.3, "005930": 0.7})
+    rebalancer = Rebalancer(
+        RebalanceContext(CashPortfolio(), FakePriceFetcher(), FakeOrderManager())
+    )
+    sut = Backtester(prices)
+
+    # when
+    result = sut.run(strategy, initial_cash=10000, frequency=None)
+
+    # then
+    orders = rebalancer.prepare_orders(strategy, investment_amount=10000)
+    values = result.values.tolist()
+    assert {order.symbol: order.quantity for order in orders} == {
+        "000660": values[1] - values[0],
+        "005930": values[2] - values[0],
+    }
+
+
+def test_sut_rebalances_on_the_first_trading_day_of_every_month() -> None:
+    # given
+    closes: list[list[float]] = [[100.0, 100.0]] * 3 + [[200.0, 100.0]] * 4
+    sut = Backtester(_prices(closes))
+    strategy = ExplicitTargetRebalanceStrategy({"A": 0.5, "B": 0.5})
+
+    # when
+    result = sut.run(strategy, initial_cash=1000, frequency=RebalanceFrequency.MONTHLY)
+
+    # then
+    assert result.rebalance_dates.astype(str).tolist() == ["2024-01-29", "2024-02-01"]
+    assert result.values.tolist() == [1000, 1000, 1000, 1500, 1500, 1500, 1500]
+    assert result.report.rebalance_count == 1
+    assert result.report.turnover > 0
+
+
+def test_sut_rebalances_when_a_weight_drifts_out_of_the_band() -> None:
+    # given
+    closes: list[list[float]] = [[100, 100], [104, 100], [130, 100], [130, 100], [100, 100]]
+    sut = Backtester(_prices(closes))
+    strategy = ExplicitTargetRebalanceStrategy({"A": 0.5, "B": 0.5})
+
+    # when
+    result = sut.run(strategy, initial_cash=1000, frequency=None, band=0.05)
+
+    # then
+    assert result.rebalance_dates.astype(str).tolist() == ["2024-01-29", "2024-01-31", "2024-02-02"]
+
+
+def test_sut_reports_drawdown_and_trading_cost() -> None:
+    # given
+    closes: list[list[float]] = [[100, 100], [50, 100], [100, 100]]
+    sut = Backtester(_prices(closes))
+    strategy = ExplicitTargetRebalanceStrategy({"A": 1.0})
+
+    # when
+    result = sut.run(strategy, initial_cash=1000, frequency=None, cost_rate=0.01)
+
+    # then
+    assert result.report.trading_cost == pytest.approx(9.0)
+    assert result.report.max_drawdown == pytest.approx(-450 / 991)
+
+
+def test_sut_starts_when_every_symbol_has_a_close() -> None:
+    # given
+    closes: list[list[float]] = [[100, np.nan], [100, 100], [np.nan, 110]]
+    sut = Backtester(_prices(closes))
+    strategy = ExplicitTargetRebalanceStrategy({"A": 0.5, "B": 0.5})
+
+    # when
+    result = sut.run(strategy, initial_cash=1000, frequency=None)
+
+    # then
+    assert result.report.start.isoformat() == "2024-01-30"
+    assert result.values.tolist() == [1000, 1050]
+
+
+def test_sut_rejects_symbols_without_history() -> None:
+    # given
+    sut = Backtester(_prices([[100, 100]]))
+
+    # when, then
+    with pytest.raises(PriceHistoryError):
+        sut.run(ExplicitTargetRebalanceStrategy({"C": 1.0}), initial_cash=1000)
@@ -0,0 +1,80 @@
+from uuid import uuid4
+
+from pytest_mock import MockerFixture
+
+from pyrb.models.price import CurrentPrice
+from pyrb.repositories.brokerages.context import RebalanceContext
+from pyrb.services.batch import BatchRebalancer
+from pyrb.services.strategy.explicit_target import ExplicitTargetRebalanceStrategy
+from tests.conftest import FakeOrderManager, FakePortfolio, FakePriceFetcher
+
+STRATEGY = ExplicitTargetRebalanceStrategy({"000660": 0.5, "035420": 0.5})
+
+
+def _context(price_fetcher: FakePriceFetcher) -> RebalanceContext:
+    return RebalanceContext(
+        portfolio=FakePortfolio(),
+        price_fetcher=price_fetcher,
+        order_manager=FakeOrderManager(),
+    )
+
+
+def test_sut_fetches_prices_of_all_accounts_at_once(mocker: MockerFixture) -> None:
+    # given
+    price_fetcher = FakePriceFetcher()
+    spy = mocker.spy(price_fetcher, "get_current_prices")
+    contexts = {uuid4(): _context(price_fetcher) for _ in range(3)}
+
+    # when
+    report = BatchRebalancer(contexts).prepare(STRATEGY, investment_ratio=0.9)
+
+    # then
+    assert spy.call_count == 1
+    assert set(spy.call_args.args[0]) == {"000660", "005930", "035420"}
+    assert [account_report.account_id for account_report in report.reports] == list(contexts)
+    assert all(account_report.error is None for account_report in report.reports)
+    assert all(account_report.orders for account_report in report.reports)
+
+
+def test_sut_isolates_failing_accounts(mocker: MockerFixture) -> None:
+    # given
+    price_fetcher = FakePriceFetcher()
+    failing_context = _context(price_fetcher)
+    mocker.patch.object(failing_context.portfolio, "refresh", side_effect=Exception("timeout"))
+    placing_context = _context(price_fetcher)
+    spy = mocker.spy(placing_context.order_manager, "place_order")
+    failing_id, placing_id = uuid4(), uuid4()
+    batch_rebalancer = BatchRebalancer({failing_id: failing_context, placing_id: placing_context})
+
+    # when
+    report = batch_rebalancer.place(batch_rebalancer.prepare(STRATEGY, 0.9))
+
+    # then
+    failing_report, placing_report = report.reports
+    assert failing_report.error == "Failed to load the portfolio: timeout"
+    assert failing_report.placed_orders == []
+    assert placing_report.error is None
+    assert spy.call_count == len(placing_report.orders) > 0
+    assert all(result.success for result in placing_report.placed_orders)
+
+
+def test_sut_reports_a_failed_prefetch(mocker: MockerFixture) -> None:
+    # given
+    price_fetcher = FakePriceFetcher()
+    get_current_prices = price_fetcher.get_current_prices
+    calls = iter([Exception("timeout")])
+
+    def fail_once(symbols: list[str]) -> dict[str, CurrentPrice]:
+        if error := next(calls, None):
+            raise error
+        return get_current_prices(symbols)
+
+    mocker.patch.object(price_fetcher, "get_current_prices", side_effect=fail_once)
+    contexts = {uuid4(): _context(price_fetcher) for _ in range(2)}
+
+    # when
+    report = BatchRebalancer(contexts).prepare(STRATEGY, investment_ratio=0.9)
+
+    # then
+    assert report.prefetch_error == "Failed to prefetch the current prices: timeout"
+    assert all(account_report.orders for account_report in report.reports)
@@ -0,0 +1,53 @@
+from pyrb.models.drift import DriftEvent
+from pyrb.models.price import CurrentPrice
+from pyrb.repositories.brokerages.context import RebalanceContext
+from pyrb.services.drift import DriftMonitor
+from pyrb.services.strategy.explicit_target import ExplicitTargetRebalanceStrategy
+
+
+def _drift_monitor(context: RebalanceContext) -> DriftMonitor:
+    # 000660: 100 shares at 100, 005930: 50 shares at 150, no cash
+    strategy = ExplicitTargetRebalanceStrategy({"000660": 0.5, "005930": 0.5})
+    return DriftMonitor.from_context(context, strategy, threshold=0.1)
+
+
+def test_sut_emits_events_when_drift_crosses_the_threshold(
+    fake_rebalance_context: RebalanceContext,
+) -> None:
+    # given
+    sut = _drift_monitor(fake_rebalance_context)
+    received: list[DriftEvent] = []
+    sut.add_listener(received.append)
+
+    # when
+    breached_events = sut.update(CurrentPrice(symbol="005930", price=100))
+    recovered_events = sut.update(CurrentPrice(symbol="005930", price=150))
+
+    # then
+    assert [(event.symbol_drift.symbol, event.breached) for event in breached_events] == [
+        ("000660", True),
+        ("005930", True),
+    ]
+    assert breached_events[0].total_value == 15000
+    assert [(event.symbol_drift.symbol, event.breached) for event in recovered_events] == [
+        ("000660", False),
+        ("005930", False),
+    ]
+    assert received == breached_events + recovered_events
+
+
+def test_sut_updates_weights_incrementally(fake_rebalance_context: RebalanceContext) -> None:
+    # given
+    sut = _drift_monitor(fake_rebalance_context)
+
+    # when
+    events = sut.update(CurrentPrice(symbol="000660", price=110))
+    ignored_events = sut.update(CurrentPrice(symbol="035420", price=1000))  # not monitored
+
+    # then
+    assert events == []
+    assert ignored_events == []
+    snapshot = sut.snapshot()
+    assert snapshot.total_value == 18500
+    assert [round(drift.current_weight, 4) for drift in snapshot.drifts] == [0.5946, 0.4054]
+    assert snapshot.breached_symbols == []
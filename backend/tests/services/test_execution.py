@@ -0,0 +1,67 @@
+from pytest_mock import MockerFixture
+
+from pyrb.enums import OrderSide, OrderType
+from pyrb.models.order import Order
+from pyrb.repositories.brokerages.context import RebalanceContext
+from pyrb.services.execution import BuyReleasePipeline
+
+
+def _order(symbol: str, side: OrderSide, quantity: int, price: int) -> Order:
+    return Order(
+        symbol=symbol, price=price, quantity=quantity, side=side, order_type=OrderType.MARKET
+    )
+
+
+def test_sut_releases_buy_orders_as_sell_fills_free_up_cash(
+    fake_rebalance_context: RebalanceContext, mocker: MockerFixture
+) -> None:
+    # given
+    spy = mocker.spy(fake_rebalance_context.order_manager, "place_order")
+    sell = _order("000660", OrderSide.SELL, 50, 100)  # 5000 of proceeds
+    first_buy = _order("035420", OrderSide.BUY, 30, 100)  # 3000
+    second_buy = _order("005930", OrderSide.BUY, 20, 150)  # 3000, only 2000 left
+
+    # when
+    results = BuyReleasePipeline(fake_rebalance_context).run([sell, first_buy, second_buy])
+
+    # then
+    assert all(result.success for result in results)
+    assert [call.args[0] for call in spy.call_args_list] == [
+        sell,
+        first_buy,
+        second_buy.model_copy(update={"quantity": 13}),
+    ]
+
+
+def test_sut_does_not_place_buy_orders_without_cash(
+    fake_rebalance_context: RebalanceContext, mocker: MockerFixture
+) -> None:
+    # given
+    spy = mocker.spy(fake_rebalance_context.order_manager, "place_order")
+    buy = _order("035420", OrderSide.BUY, 30, 100)
+
+    # when
+    results = BuyReleasePipeline(fake_rebalance_context).run([buy])
+
+    # then
+    assert spy.call_count == 0
+    assert len(results) == 1
+    assert not results[0].success
+
+
+def test_sut_releases_buy_orders_against_the_net_sell_proceeds(
+    fake_rebalance_context: RebalanceContext, mocker: MockerFixture
+) -> None:
+    # given
+    spy = mocker.spy(fake_rebalance_context.order_manager, "place_order")
+    sell = _order("000660", OrderSide.SELL, 30, 100)  # 3000 before tax and commission
+    buy = _order("035420", OrderSide.BUY, 30, 100)  # 3000
+
+    # when
+    BuyReleasePipeline(fake_rebalance_context, sell_cost_rate=0.002).run([sell, buy])
+
+    # then: 세금과 수수료를 제외한 2994 만큼만 매수합니다.
+    assert [call.args[0] for call in spy.call_args_list] == [
+        sell,
+        buy.model_copy(update={"quantity": 29}),
+    ]
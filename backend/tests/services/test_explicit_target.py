@@ -0,0 +1,125 @@
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from pyrb.exceptions import InvalidTargetError
+from pyrb.services.strategy.explicit_target import iter_json_object, read_targets_from_source
+
+EXPECTED_TARGETS = {"005930": 0.4, "000660": 0.3, "035420": 0.3}
+
+
+@pytest.mark.parametrize("suffix", ["csv", "json", "yaml"])
+def test_read_targets_from_source(suffix: str) -> None:
+    # given
+    source = Path(f"tests/resources/fake_targets.{suffix}")
+
+    # when
+    targets = read_targets_from_source(source)
+
+    # then
+    assert targets == pytest.approx(EXPECTED_TARGETS)
+    assert list(targets) == list(EXPECTED_TARGETS)
+
+
+def test_read_targets_normalizes_and_keeps_last_duplicate(tmp_path: Path) -> None:
+    # given
+    source = tmp_path / "targets.csv"
+    source.write_text("weight,symbol\n2,005930\n1,000660\n3,005930\n")
+
+    # when
+    targets = read_targets_from_source(source)
+
+    # then
+    assert targets == pytest.approx({"005930": 0.75, "000660": 0.25})
+
+
+def test_read_csv_targets_skips_blank_lines(tmp_path: Path) -> None:
+    # given
+    source = tmp_path / "targets.csv"
+    source.write_text("symbol,weight\n005930,0.5\n\n000660,0.5\n")
+
+    # when
+    targets = read_targets_from_source(source)
+
+    # then
+    assert targets == pytest.approx({"005930": 0.5, "000660": 0.5})
+
+
+def test_iter_json_object_across_chunk_boundaries() -> None:
+    # given
+    members: dict[str, object] = {f"{i:06d}": 1.0 / (i + 7) for i in range(200)}
+    members |= {'"quoted"': 1e-3, "nested": {"weight": [1, 2]}, "integer": -12}
+    text = "{\n" + ",\n".join(f"  {json.dumps(s)} : {json.dumps(w)}" for s, w in members.items())
+    text += "\n}"
+
+    # when
+    for chunk_size in [1, 7, 64]:
+        parsed = dict(iter_json_object(io.StringIO(text), chunk_size=chunk_size))
+
+        # then
+        assert parsed == members
+
+
+def test_read_yaml_targets_resolves_scalar_types(tmp_path: Path) -> None:
+    # given
+    source = tmp_path / "targets.yaml"
+    source.write_text("# 종목별 비중\n'005930': 0.5\n000660: 0.5\n")
+
+    # when
+    with pytest.raises(InvalidTargetError) as exc_info:
+        read_targets_from_source(source)
+
+    # then
+    assert str(exc_info.value) == "Target symbol must be a string"
+
+
+@pytest.mark.parametrize(
+    ("filename", "content", "message"),
+    [
+        ("targets.json", '["005930", 0.5]', "Targets must be a dictionary"),
+        ("targets.json", '{"005930": 0.5,}', "Invalid JSON"),
+        ("targets.json", '{"005930": 1}', "Target weight must be a float"),
+        ("targets.yaml", "- 005930\n", "Targets must be a dictionary"),
+        ("targets.yaml", "'005930': [0.5]\n", "Target symbols and weights must be scalars"),
+        ("targets.csv", "symbol,ratio\n005930,0.5\n", "symbol and a weight column"),
+        ("targets.csv", "symbol,weight\n005930,-0.5\n", "Target weight must be positive"),
+        ("targets.toml", "", "Unsupported source file type"),
+    ],
+)
+def test_read_invalid_targets(tmp_path: Path, filename: str, content: str, message: str) -> None:
+    # given
+    source = tmp_path / filename
+    source.write_text(content)
+
+    # when
+    with pytest.raises(InvalidTargetError) as exc_info:
+        read_targets_from_source(source)
+
+    # then
+    assert message in str(exc_info.value)
+
+
+@pytest.mark.parametrize("suffix", ["parquet", "arrow"])
+def test_read_columnar_targets(tmp_path: Path, suffix: str) -> None:
+    # given
+    pyarrow = pytest.importorskip("pyarrow")
+    parquet = pytest.importorskip("pyarrow.parquet")
+    table = pyarrow.table({
+        "symbol": list(EXPECTED_TARGETS),
+        "weight": [w * 10 for w in EXPECTED_TARGETS.values()],
+        "name": ["삼성전자", "SK하이닉스", "NAVER"],
+    })
+    source = tmp_path / f"targets.{suffix}"
+    if suffix == "parquet":
+        parquet.write_table(table, source, row_group_size=2)
+    else:
+        with pyarrow.ipc.new_file(source, table.schema) as writer:
+            writer.write_table(table, max_chunksize=2)
+
+    # when
+    targets = read_targets_from_source(source)
+
+    # then
+    assert targets == pytest.approx(EXPECTED_TARGETS)
@@ -0,0 +1,79 @@
+import datetime
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+from pyrb.models.history import DailyBar
+from pyrb.repositories.brokerages.base.history import DailyBarFetcher
+from pyrb.repositories.history import LocalPriceHistoryRepository
+from pyrb.services.history import PriceHistoryService
+
+AFTER_CLOSE = datetime.datetime(2024, 1, 10, 16, 0, tzinfo=ZoneInfo("Asia/Seoul"))
+
+
+class FakeDailyBarFetcher(DailyBarFetcher):
+    def __init__(self, closes: dict[datetime.date, int]) -> None:
+        self.closes = closes
+        self.requests: list[tuple[datetime.date, datetime.date]] = []
+
+    def fetch_daily_bars(
+        self, symbol: str, start: datetime.date, end: datetime.date
+    ) -> list[DailyBar]:
+        self.requests.append((start, end))
+        return [
+            DailyBar(date=date, open=close, high=close, low=close, close=close, volume=100)
+            for date, close in sorted(self.closes.items())
+            if start <= date <= end
+        ]
+
+
+def _closes(start_day: int, end_day: int, offset: int = 0) -> dict[datetime.date, int]:
+    return {
+        datetime.date(2024, 1, day): 100 + day + offset for day in range(start_day, end_day + 1)
+    }
+
+
+def test_sut_syncs_only_bars_after_the_latest_bar(tmp_path: Path) -> None:
+    # given
+    fetcher = FakeDailyBarFetcher(_closes(1, 5))
+    repository = LocalPriceHistoryRepository(tmp_path)
+    sut = PriceHistoryService(repository, fetcher)
+    sut.sync(["005930"], since=datetime.date(2024, 1, 1), now=AFTER_CLOSE)
+    fetcher.closes = _closes(1, 10)
+
+    # when
+    stored_counts = sut.sync(["005930"], since=datetime.date(2024, 1, 1), now=AFTER_CLOSE)
+
+    # then
+    assert stored_counts == {"005930": 5}
+    assert fetcher.requests[-1] == (datetime.date(2024, 1, 5), datetime.date(2024, 1, 10))
+    assert len(repository.read_bars("005930")) == 10
+
+
+def test_sut_skips_the_bar_of_an_open_session(tmp_path: Path) -> None:
+    # given
+    fetcher = FakeDailyBarFetcher(_closes(1, 10))
+    repository = LocalPriceHistoryRepository(tmp_path)
+    sut = PriceHistoryService(repository, fetcher)
+
+    # when
+    sut.sync(["005930"], since=datetime.date(2024, 1, 1), now=AFTER_CLOSE.replace(hour=10))
+
+    # then
+    assert repository.read_bars("005930")["date"][-1].item() == datetime.date(2024, 1, 9)
+
+
+def test_sut_downloads_again_on_a_price_adjustment(tmp_path: Path) -> None:
+    # given
+    fetcher = FakeDailyBarFetcher(_closes(1, 5))
+    repository = LocalPriceHistoryRepository(tmp_path)
+    sut = PriceHistoryService(repository, fetcher)
+    sut.sync(["005930"], since=datetime.date(2024, 1, 1), now=AFTER_CLOSE)
+    fetcher.closes = _closes(1, 10, offset=-50)
+
+    # when
+    stored_counts = sut.sync(["005930"], since=datetime.date(2024, 1, 1), now=AFTER_CLOSE)
+
+    # then
+    assert stored_counts == {"005930": 10}
+    assert fetcher.requests[-1] == (datetime.date(2024, 1, 1), datetime.date(2024, 1, 10))
+    assert repository.read_bars("005930")["close"].tolist() == list(range(51, 61))
@@ -0,0 +1,72 @@
+import pytest
+
+from pyrb.exceptions import InsufficientFundsException
+from pyrb.models.price import CurrentPrice
+from pyrb.repositories.brokerages.context import RebalanceContext
+from pyrb.services.incremental import IncrementalPlanner
+from pyrb.services.rebalance import Rebalancer
+from pyrb.services.strategy.explicit_target import ExplicitTargetRebalanceStrategy
+from tests.conftest import FakeOrderManager, FakePortfolio, FakePriceFetcher
+
+
+class RecordingPriceFetcher(FakePriceFetcher):
+    def __init__(self) -> None:
+        self.requests: list[list[str]] = []
+
+    def get_current_prices(self, symbols: list[str]) -> dict[str, CurrentPrice]:
+        self.requests.append(symbols)
+        return super().get_current_prices(symbols)
+
+
+def _context(price_fetcher: RecordingPriceFetcher) -> RebalanceContext:
+    return RebalanceContext(FakePortfolio(), price_fetcher, FakeOrderManager())
+
+
+def _full_plan(targets: dict[str, float]) -> list[tuple[str, str, int]]:
+    context = _context(RecordingPriceFetcher())
+    orders = Rebalancer(context).prepare_orders(ExplicitTargetRebalanceStrategy(targets), 50000)
+    return [(order.symbol, order.side, order.quantity) for order in orders]
+
+
+def test_sut_recomputes_only_the_changed_symbols() -> None:
+    # given
+    price_fetcher = RecordingPriceFetcher()
+    sut = IncrementalPlanner(_context(price_fetcher), investment_amount=50000)
+    sut.update({"000660": 0.5, "005930": 0.3, "035420": 0.2})
+    edited_targets = {"000660": 0.5, "005930": 0.2, "035420": 0.3}
+
+    # when
+    update = sut.update(edited_targets)
+
+    # then
+    assert update.changed_symbols == ["005930", "035420"]
+    assert update.removed_symbols == []
+    assert [(order.symbol, order.side, order.quantity) for order in update.orders] == _full_plan(
+        edited_targets
+    )
+    assert price_fetcher.requests == [["000660", "005930", "035420"]]
+
+
+def test_sut_prices_only_the_added_symbols() -> None:
+    # given
+    price_fetcher = RecordingPriceFetcher()
+    sut = IncrementalPlanner(_context(price_fetcher), investment_amount=50000)
+    sut.update({"000660": 0.5, "005930": 0.5})
+    edited_targets = {"000660": 0.5, "035420": 0.5}
+
+    # when
+    update = sut.update(edited_targets)
+
+    # then
+    assert update.changed_symbols == ["035420"]
+    assert update.removed_symbols == ["005930"]
+    assert [(order.symbol, order.side, order.quantity) for order in update.orders] == _full_plan(
+        edited_targets
+    )
+    assert price_fetcher.requests[1:] == [["035420"]]
+
+
+def test_sut_rejects_an_investment_amount_over_the_total_value() -> None:
+    # when, then
+    with pytest.raises(InsufficientFundsException):
+        IncrementalPlanner(_context(RecordingPriceFetcher()), investment_amount=1_000_000)
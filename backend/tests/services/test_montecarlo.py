@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+
+from benchmarks.bench_backtest import create_prices
+from pyrb.enums import RebalanceFrequency
+from pyrb.exceptions import PriceHistoryError
+from pyrb.models.montecarlo import MonteCarloSpec, RebalancePolicy
+from pyrb.services.backtest import Backtester
+from pyrb.services.montecarlo import METRICS, MonteCarloSimulator, evaluate_policies
+from pyrb.services.strategy.explicit_target import ExplicitTargetRebalanceStrategy
+
+POLICIES = [
+    RebalancePolicy(),
+    RebalancePolicy(frequency=RebalanceFrequency.MONTHLY),
+    RebalancePolicy(band=0.05),
+    RebalancePolicy(frequency=RebalanceFrequency.QUARTERLY, band=0.02),
+]
+
+
+def test_sut_trades_like_the_backtester_on_the_historical_path() -> None:
+    # given
+    prices = create_prices(3, 4)
+    weights = dict.fromkeys(prices.symbols, 0.25)
+    target = np.full(4, 0.25)
+    daily_prices = [closes[:, np.newaxis] for closes in prices.closes]
+
+    # when
+    metrics = evaluate_policies(
+        daily_prices, prices.dates, target, POLICIES, 1_000_000, cost_rate=0.001
+    )
+
+    # then
+    for k, policy in enumerate(POLICIES):
+        report = (
+            Backtester(prices)
+            .run(
+                ExplicitTargetRebalanceStrategy(weights),
+                1_000_000,
+                policy.frequency,
+                policy.band,
+                cost_rate=0.001,
+            )
+            .report
+        )
+        expected = [getattr(report, metric) for metric in METRICS]
+        assert metrics[k, :, 0] == pytest.approx(expected)
+
+
+def test_sut_summarizes_the_policies_reproducibly() -> None:
+    # given
+    prices = create_prices(5, 3)
+    spec = MonteCarloSpec(
+        weights=dict.fromkeys(prices.symbols, 1.0),
+        policies=POLICIES,
+        investment_amount=10_000_000,
+        cost_rate=0.00015,
+        path_count=50,
+        years=2,
+    )
+    sut = MonteCarloSimulator(prices, max_workers=1, paths_per_batch=16)
+
+    # when
+    summaries = sut.run(spec)
+
+    # then
+    assert summaries == sut.run(spec)
+    assert [summary.policy for summary in summaries] == POLICIES
+    assert all(summary.path_count == 50 for summary in summaries)
+    buy_and_hold, monthly = summaries[:2]
+    assert buy_and_hold.rebalance_count.p95 == 0
+    assert monthly.rebalance_count.median == 24  # 2년 동안 매월 첫 거래일
+    assert monthly.cagr.p5 <= monthly.cagr.median <= monthly.cagr.p95
+    assert 0 <= monthly.shortfall_probability <= 1
+
+
+def test_sut_raises_without_enough_price_history() -> None:
+    # given
+    prices = create_prices(1, 2)
+    sut = MonteCarloSimulator(prices, max_workers=1)
+
+    # when, then
+    with pytest.raises(PriceHistoryError):
+        sut.run(
+            MonteCarloSpec(
+                weights={"000000": 1.0, "999999": 1.0},
+                policies=POLICIES,
+                investment_amount=10_000,
+            )
+        )
+    with pytest.raises(PriceHistoryError):
+        sut.run(
+            MonteCarloSpec(
+                weights=dict.fromkeys(prices.symbols, 1.0),
+                policies=POLICIES,
+                investment_amount=10_000,
+                block_size=1000,
+            )
+        )
@@ -0,0 +1,26 @@
+import numpy as np
+import numpy.typing as npt
+
+from pyrb.services.parallel import SharedArrays, run_on_shared_arrays
+
+
+def _setup(arrays: SharedArrays) -> npt.NDArray[np.float64]:
+    # 작업 프로세스는 공유 배열을 복사하지 않고 읽기 전용으로 매핑합니다.
+    assert not arrays["values"].flags.writeable
+    return arrays["values"]
+
+
+def _sum(values: npt.NDArray[np.float64], window: tuple[int, int]) -> float:
+    return float(values[window[0] : window[1]].sum())
+
+
+def test_sut_runs_every_item_on_the_shared_arrays() -> None:
+    # given
+    values = np.arange(100, dtype=np.float64)
+    windows = [(i, i + 10) for i in range(0, 100, 10)]
+
+    # when
+    results = dict(run_on_shared_arrays({"values": values}, _setup, _sum, windows, 2))
+
+    # then
+    assert results == {window: float(values[window[0] : window[1]].sum()) for window in windows}
@@ -0,0 +1,73 @@
+from pyrb.enums import OrderSide, OrderType, OrderViolationType
+from pyrb.models.order import Order
+from pyrb.repositories.brokerages.context import RebalanceContext
+from pyrb.services.pretrade import PreTradeChecker
+
+
+def _order(symbol: str, side: OrderSide, quantity: int, price: int = 100) -> Order:
+    return Order(
+        symbol=symbol, price=price, quantity=quantity, side=side, order_type=OrderType.MARKET
+    )
+
+
+def test_sut_reports_all_violations_at_once(fake_rebalance_context: RebalanceContext) -> None:
+    # given
+    orders = [
+        _order("000660", OrderSide.SELL, 120),  # sellable quantity is 100
+        _order("035420", OrderSide.SELL, 10),  # not held
+        _order("005930", OrderSide.SELL, 0),
+        _order("005930", OrderSide.SELL, 10, price=150),  # 1500 of proceeds
+        _order("035420", OrderSide.BUY, 10),  # 1000
+        _order("379800", OrderSide.BUY, 10),  # 1000, only 500 left
+    ]
+
+    # when
+    result = PreTradeChecker(fake_rebalance_context).check(orders)
+
+    # then
+    assert not result.passed
+    assert [violation.violation_type for violation in result.violations] == [
+        OrderViolationType.EXCEEDS_SELLABLE_QUANTITY,
+        OrderViolationType.NOT_HELD,
+        OrderViolationType.NON_POSITIVE_QUANTITY,
+        OrderViolationType.INSUFFICIENT_CASH,
+    ]
+    assert result.orders == [orders[3], orders[4]]
+
+
+def test_sut_clips_sell_orders_to_sellable_quantity(
+    fake_rebalance_context: RebalanceContext,
+) -> None:
+    # given
+    orders = [
+        _order("000660", OrderSide.SELL, 120),  # sellable quantity is 100
+        _order("035420", OrderSide.BUY, 100),  # 10000, covered by the clipped sell order
+    ]
+
+    # when
+    result = PreTradeChecker(fake_rebalance_context).check(orders, clip_to_sellable=True)
+
+    # then
+    assert result.passed
+    assert result.orders == [_order("000660", OrderSide.SELL, 100), orders[1]]
+
+
+def test_sut_shares_the_sellable_quantity_between_sells_of_the_same_symbol(
+    fake_rebalance_context: RebalanceContext,
+) -> None:
+    # given
+    orders = [
+        _order("000660", OrderSide.SELL, 60),  # sellable quantity is 100
+        _order("000660", OrderSide.SELL, 60),  # only 40 left
+        _order("000660", OrderSide.SELL, 10),  # 40 left if the previous sell was rejected
+    ]
+
+    # when
+    result = PreTradeChecker(fake_rebalance_context).check(orders)
+    clipped = PreTradeChecker(fake_rebalance_context).check(orders, clip_to_sellable=True)
+
+    # then
+    assert result.orders == [orders[0], orders[2]]
+    assert [violation.order for violation in result.violations] == [orders[1]]
+    assert clipped.orders == [orders[0], _order("000660", OrderSide.SELL, 40)]
+    assert [violation.order for violation in clipped.violations] == [orders[2]]
@@ -0,0 +1,99 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+from pyrb.exceptions import InitializationError, StrategyNotFoundError
+from pyrb.services.strategy.registry import StrategyParameter, StrategyRegistry
+
+PLUGIN_SOURCE = '''
+from pyrb.services.strategy.base import Strategy
+
+DEFAULT_WEIGHT = 0.6
+STRATEGIES = {"sixty-forty": "SixtyFortyStrategy"}
+
+
+class SixtyFortyStrategy(Strategy):
+    """Stocks and bonds in fixed proportions.
+
+    The rest of the docstring is not part of the description.
+    """
+
+    def __init__(self, stock_weight: float = DEFAULT_WEIGHT, *, stock: str = "069500") -> None:
+        self.stock_weight = stock_weight
+        self.stock = stock
+
+    def create_target_weights(self) -> dict[str, float]:
+        return {self.stock: self.stock_weight, "148070": 1 - self.stock_weight}
+'''
+
+
+def test_sut_reads_the_metadata_of_the_builtin_strategies_without_importing_them(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # given
+    monkeypatch.delitem(sys.modules, "pyrb.services.strategy.risk_parity", raising=False)
+    sut = StrategyRegistry()
+
+    # when
+    metadata = sut.metadata("risk-parity-kr")
+
+    # then
+    assert "pyrb.services.strategy.risk_parity" not in sys.modules
+    assert metadata.source == "builtin"
+    assert metadata.description.startswith("Equal risk contributions")
+    assert metadata.parameters == [StrategyParameter("halflife", 60.0, required=False)]
+    assert metadata.requires == ["price_history"]
+    assert sut.names()[:2] == ["all-weather-kr", "risk-parity-kr"]
+
+
+def test_sut_lists_and_creates_the_strategies_of_the_plugin_directory(tmp_path: Path) -> None:
+    # given
+    (tmp_path / "sixty_forty.py").write_text(PLUGIN_SOURCE)
+    (tmp_path / "broken.py").write_text("STRATEGIES = {")
+    sut = StrategyRegistry(tmp_path)
+
+    # when
+    metadata = sut.metadata("sixty-forty")
+    strategy = sut.create("sixty-forty", stock_weight=0.7)
+
+    # then
+    assert metadata.source == str(tmp_path / "sixty_forty.py")
+    assert metadata.description == "Stocks and bonds in fixed proportions."
+    assert metadata.parameters == [
+        StrategyParameter("stock_weight", 0.6, required=False),
+        StrategyParameter("stock", "069500", required=False),
+    ]
+    assert strategy.create_target_weights() == pytest.approx({"069500": 0.7, "148070": 0.3})
+    assert sut.create("sixty-forty", stock_weight=0.7) is strategy
+
+
+def test_sut_raises_for_unknown_strategies_and_missing_data(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # given
+    monkeypatch.setattr("pyrb.repositories.history._default_price_history", None)
+    sut = StrategyRegistry()
+
+    # when, then
+    with pytest.raises(StrategyNotFoundError):
+        sut.create("unknown")
+    with pytest.raises(InitializationError):
+        sut.create("risk-parity-kr")
+
+
+def test_sut_raises_for_strategies_created_with_the_wrong_parameters(tmp_path: Path) -> None:
+    # given
+    (tmp_path / "sixty_forty.py").write_text(PLUGIN_SOURCE)
+    (tmp_path / "universe.py").write_text(
+        PLUGIN_SOURCE.replace("sixty-forty", "universe").replace(
+            "stock_weight: float = DEFAULT_WEIGHT", "universe: list[str]"
+        )
+    )
+    sut = StrategyRegistry(tmp_path)
+
+    # when, then
+    with pytest.raises(InitializationError, match="universe requires the parameters: universe"):
+        sut.create("universe")
+    with pytest.raises(InitializationError, match="sixty-forty"):
+        sut.create("sixty-forty", stock_wieght=0.7)
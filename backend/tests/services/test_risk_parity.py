@@ -0,0 +1,144 @@
+import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pytest
+from freezegun import freeze_time
+from pytest_mock import MockerFixture
+
+from pyrb.exceptions import InitializationError
+from pyrb.models.history import DailyBar
+from pyrb.repositories.history import LocalPriceHistoryRepository
+from pyrb.services.strategy.risk_parity import (
+    EWMACovariance,
+    RiskParityStrategy,
+    risk_parity_weights,
+)
+
+START = datetime.date(2024, 1, 1)
+
+
+def _store(repository: LocalPriceHistoryRepository, closes: np.ndarray, offset: int = 0) -> None:
+    for column, symbol in enumerate(["069500", "148070"]):
+        repository.append(
+            symbol,
+            [
+                DailyBar(
+                    date=START + datetime.timedelta(days=offset + i),
+                    open=close,
+                    high=close,
+                    low=close,
+                    close=close,
+                    volume=1,
+                )
+                for i, close in enumerate(closes[:, column].tolist())
+            ],
+        )
+
+
+def _closes(day_count: int) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    returns = rng.normal(0, [0.02, 0.005], size=(day_count, 2))
+    return np.round(100_000 * np.exp(np.cumsum(returns, axis=0))).astype(int)
+
+
+def test_risk_parity_weights_equalize_risk_contributions() -> None:
+    # given
+    rng = np.random.default_rng(1)
+    factors = rng.normal(size=(5, 5))
+    covariance = factors @ factors.T / 100 + np.diag(rng.uniform(1e-4, 1e-2, 5))
+
+    # when
+    weights = risk_parity_weights(covariance)
+
+    # then
+    contributions = weights * (covariance @ weights)
+    assert weights.sum() == pytest.approx(1)
+    assert contributions / contributions.sum() == pytest.approx(np.full(5, 0.2))
+    # 상관관계가 없으면 변동성의 역수에 비례합니다.
+    assert risk_parity_weights(np.diag([0.04, 0.01])) == pytest.approx([1 / 3, 2 / 3])
+
+
+def test_sut_updates_the_covariance_only_with_new_days(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    # given
+    closes = _closes(101)
+    repository = LocalPriceHistoryRepository(tmp_path)
+    _store(repository, closes[:100])
+    sut = RiskParityStrategy(repository, ["069500", "148070"])
+    with freeze_time("2024-04-09T16:00:00+09:00"):
+        sut.create_target_weights()
+    _store(repository, closes[100:], offset=100)
+    load_closes_spy = mocker.spy(repository, "load_closes")
+
+    # when
+    with freeze_time("2024-04-10T16:00:00+09:00"):
+        weights = sut.create_target_weights()
+
+    # then
+    expected = EWMACovariance(2, 60)
+    for returns in closes[1:] / closes[:-1] - 1:
+        expected.update(returns)
+    assert sut.covariance.count == 100
+    np.testing.assert_allclose(sut.covariance.covariance, expected.covariance)
+    assert load_closes_spy.call_args.args[1] > START + datetime.timedelta(days=80)
+    assert weights["148070"] > 0.7
+    assert sum(weights.values()) == pytest.approx(1)
+
+
+def test_sut_computes_the_weights_once_per_trading_day(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    # given
+    repository = LocalPriceHistoryRepository(tmp_path)
+    _store(repository, _closes(30))
+    sut = RiskParityStrategy(repository, ["069500", "148070"])
+    load_closes_spy = mocker.spy(repository, "load_closes")
+
+    # when
+    with freeze_time("2024-01-30T16:00:00+09:00"):
+        weights = sut.create_target_weights()
+        expected = dict(weights)
+        weights["069500"] = 1.0
+    with freeze_time("2024-01-31T09:00:00+09:00"):
+        cached_weights = sut.create_target_weights()
+
+    # then: 반환한 비중을 수정해도 캐시는 바뀌지 않습니다.
+    assert cached_weights == expected
+    assert load_closes_spy.call_count == 1
+
+
+def test_sut_applies_each_day_once_when_called_concurrently(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    # given
+    repository = LocalPriceHistoryRepository(tmp_path)
+    _store(repository, _closes(30))
+    sut = RiskParityStrategy(repository, ["069500", "148070"])
+    update = sut.covariance.update
+
+    def slow_update(returns: np.ndarray) -> None:
+        time.sleep(0.001)  # 두 호출이 같은 거래일을 동시에 반영하도록 합니다.
+        update(returns)
+
+    mocker.patch.object(sut.covariance, "update", side_effect=slow_update)
+
+    # when
+    with freeze_time("2024-01-30T16:00:00+09:00"), ThreadPoolExecutor(max_workers=2) as executor:
+        results = list(executor.map(lambda _: sut.create_target_weights(), range(2)))
+
+    # then
+    assert results[0] == results[1]
+    assert sut.covariance.count == 29
+
+
+def test_sut_requires_the_price_history_to_be_synced(tmp_path: Path) -> None:
+    # given
+    sut = RiskParityStrategy(LocalPriceHistoryRepository(tmp_path), ["069500", "148070"])
+
+    # when, then
+    with pytest.raises(InitializationError, match="pyrb history sync"):
+        sut.create_target_weights()
@@ -0,0 +1,79 @@
+from pathlib import Path
+
+import numpy as np
+
+from pyrb.enums import RebalanceFrequency
+from pyrb.models.sweep import SweepResult, SweepSpec
+from pyrb.repositories.history import PriceMatrix
+from pyrb.services.backtest import Backtester
+from pyrb.services.sweep import SweepRunner, run_case
+
+
+def _prices(day_count: int = 300) -> PriceMatrix:
+    rng = np.random.default_rng(0)
+    dates = np.arange(np.datetime64("2023-01-02"), np.datetime64("2023-01-02") + day_count)
+    closes = np.round(10_000 * np.exp(np.cumsum(rng.normal(0, 0.02, (day_count, 3)), axis=0)))
+    return PriceMatrix(dates, ["A", "B", "C"], closes)
+
+
+SPEC = SweepSpec(
+    weights=[{"A": 1, "B": 1}, {"A": 1, "B": 2, "C": 1}],
+    frequencies=[RebalanceFrequency.MONTHLY, RebalanceFrequency.QUARTERLY, None],
+    bands=[None, 0.05],
+    investment_amounts=[1_000_000, 10_000_000],
+    cost_rate=0.001,
+)
+
+
+def test_sut_runs_every_case_like_a_serial_backtest(tmp_path: Path) -> None:
+    # given
+    prices = _prices()
+    output = tmp_path / "sweep.jsonl"
+    sut = SweepRunner(prices, max_workers=2, cases_per_task=3)
+
+    # when
+    results = list(sut.run(SPEC.cases(), output))
+
+    # then
+    backtester = Backtester(prices)
+    assert sorted(result.case_id for result in results) == sorted(
+        case.case_id for case in SPEC.cases()
+    )
+    assert {result.case_id: result for result in results} == {
+        case.case_id: run_case(backtester, case) for case in SPEC.cases()
+    }
+    assert len(output.read_text().splitlines()) == len(SPEC.cases())
+
+
+def test_sut_resumes_an_interrupted_sweep(tmp_path: Path) -> None:
+    # given
+    prices = _prices()
+    output = tmp_path / "sweep.jsonl"
+    sut = SweepRunner(prices, max_workers=2)
+    lines = [result.model_dump_json() for result in sut.run(SPEC.cases(), output)]
+    # 세 번째 결과를 쓰는 도중에 중단된 경우를 흉내냅니다.
+    output.write_text("\n".join(lines[:2]) + "\n" + lines[2][:10])
+
+    # when
+    resumed = list(sut.run(SPEC.cases(), output))
+
+    # then
+    assert len(resumed) == len(SPEC.cases()) - 2
+    case_ids = [
+        SweepResult.model_validate_json(line).case_id for line in output.read_text().splitlines()
+    ]
+    assert sorted(case_ids) == sorted(case.case_id for case in SPEC.cases())
+    assert list(sut.run(SPEC.cases(), output)) == []
+
+
+def test_sut_records_cases_without_price_history(tmp_path: Path) -> None:
+    # given
+    spec = SweepSpec(weights=[{"A": 1, "D": 1}], investment_amounts=[1_000_000])
+    sut = SweepRunner(_prices(), max_workers=1)
+
+    # when
+    results = list(sut.run(spec.cases(), tmp_path / "sweep.jsonl"))
+
+    # then
+    assert results[0].report is None
+    assert results[0].error == "No price history for: D"
@@ -0,0 +1,150 @@
+import asyncio
+import datetime
+
+import pytest
+from pytest_mock import MockerFixture
+
+from pyrb.enums import OrderSide, OrderType, ScheduleStatus, SliceSpacing
+from pyrb.exceptions import ScheduleConflictError
+from pyrb.models.order import Order
+from pyrb.repositories.brokerages.context import RebalanceContext
+from pyrb.repositories.schedule import ScheduleRepository
+from pyrb.services.twap import KST, TWAPScheduler, split_order
+
+PARENT_ORDER = Order(
+    symbol="411060", price=100, quantity=103, side=OrderSide.BUY, order_type=OrderType.MARKET
+)
+
+
+@pytest.mark.parametrize("spacing", [SliceSpacing.EVEN, SliceSpacing.VOLUME])
+def test_sut_splits_order_without_losing_quantity(spacing: SliceSpacing) -> None:
+    # given
+    start = datetime.datetime(2024, 1, 3, 9, 0, tzinfo=KST)
+
+    # when
+    children = split_order(
+        PARENT_ORDER, slices=13, window=6.5 * 60 * 60, spacing=spacing, start=start
+    )
+
+    # then
+    assert sum(child.order.quantity for child in children) == PARENT_ORDER.quantity
+    assert [child.offset for child in children] == sorted(child.offset for child in children)
+
+
+def test_sut_splits_order_by_intraday_volume() -> None:
+    # given
+    start = datetime.datetime(2024, 1, 3, 9, 0, tzinfo=KST)
+
+    # when
+    children = split_order(
+        PARENT_ORDER, slices=13, window=6.5 * 60 * 60, spacing=SliceSpacing.VOLUME, start=start
+    )
+
+    # then: the opening and closing slices are larger than the midday slices
+    quantities = [child.order.quantity for child in children]
+    assert quantities[0] > quantities[6] < quantities[-1]
+
+
+def test_sut_runs_schedule_to_completion(
+    fake_rebalance_context: RebalanceContext,
+    tmp_schedule_repo: ScheduleRepository,
+    mocker: MockerFixture,
+) -> None:
+    # given
+    spy = mocker.spy(fake_rebalance_context.order_manager, "place_order")
+    scheduler = TWAPScheduler(fake_rebalance_context, tmp_schedule_repo)
+    schedule = scheduler.create(PARENT_ORDER, window=0, slices=4, spacing=SliceSpacing.EVEN)
+
+    # when
+    asyncio.run(scheduler.run(schedule.id))
+
+    # then
+    persisted = tmp_schedule_repo.get(schedule.id)
+    assert persisted.status == ScheduleStatus.COMPLETED
+    assert persisted.placed_quantity == PARENT_ORDER.quantity
+    assert spy.call_count == 4
+
+
+def test_sut_resumes_cancelled_schedule(
+    fake_rebalance_context: RebalanceContext,
+    tmp_schedule_repo: ScheduleRepository,
+    mocker: MockerFixture,
+) -> None:
+    # given
+    scheduler = TWAPScheduler(fake_rebalance_context, tmp_schedule_repo)
+    schedule = scheduler.create(PARENT_ORDER, window=0, slices=4, spacing=SliceSpacing.EVEN)
+
+    def _cancel_after_first_child(*_: object) -> None:
+        scheduler.cancel(schedule.id)
+
+    mocker.patch.object(
+        fake_rebalance_context.order_manager, "place_order", side_effect=_cancel_after_first_child
+    )
+    asyncio.run(scheduler.run(schedule.id))
+    assert tmp_schedule_repo.get(schedule.id).status == ScheduleStatus.CANCELLED
+    assert len(tmp_schedule_repo.get(schedule.id).pending_children) == 3
+    mocker.stopall()
+
+    # when
+    scheduler.resume(schedule.id)
+    asyncio.run(scheduler.run(schedule.id))
+
+    # then
+    persisted = tmp_schedule_repo.get(schedule.id)
+    assert persisted.status == ScheduleStatus.COMPLETED
+    assert persisted.placed_quantity == PARENT_ORDER.quantity
+
+
+def test_sut_does_not_resume_running_or_completed_schedule(
+    fake_rebalance_context: RebalanceContext,
+    tmp_schedule_repo: ScheduleRepository,
+    mocker: MockerFixture,
+) -> None:
+    # given
+    spy = mocker.spy(fake_rebalance_context.order_manager, "place_order")
+    scheduler = TWAPScheduler(fake_rebalance_context, tmp_schedule_repo)
+    schedule = scheduler.create(PARENT_ORDER, window=60, slices=4, spacing=SliceSpacing.EVEN)
+
+    async def _resume_while_running() -> None:
+        task = scheduler.start(schedule.id)
+        await asyncio.sleep(0)
+        with pytest.raises(ScheduleConflictError):
+            scheduler.resume(schedule.id)
+        with pytest.raises(ScheduleConflictError):
+            scheduler.start(schedule.id)
+        scheduler.cancel(schedule.id)
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    # when
+    asyncio.run(_resume_while_running())
+
+    # then: 첫 자식 주문만 한 번 제출됩니다.
+    assert spy.call_count <= 1
+    completed = scheduler.create(PARENT_ORDER, window=0, slices=2, spacing=SliceSpacing.EVEN)
+    asyncio.run(scheduler.run(completed.id))
+    with pytest.raises(ScheduleConflictError):
+        scheduler.resume(completed.id)
+
+
+def test_sut_does_not_run_a_schedule_leased_by_another_process(
+    fake_rebalance_context: RebalanceContext,
+    tmp_schedule_repo: ScheduleRepository,
+    mocker: MockerFixture,
+) -> None:
+    # given
+    spy = mocker.spy(fake_rebalance_context.order_manager, "place_order")
+    scheduler = TWAPScheduler(fake_rebalance_context, tmp_schedule_repo)
+    schedule = scheduler.create(PARENT_ORDER, window=0, slices=4, spacing=SliceSpacing.EVEN)
+
+    # when: 다른 프로세스가 스케줄을 실행 중입니다.
+    with tmp_schedule_repo.lease(schedule.id):
+        with pytest.raises(ScheduleConflictError):
+            scheduler.resume(schedule.id)
+        with pytest.raises(ScheduleConflictError):
+            asyncio.run(scheduler.run(schedule.id))
+
+    # then: 실행하던 프로세스가 종료되면 재개할 수 있습니다.
+    assert spy.call_count == 0
+    scheduler.resume(schedule.id)
+    assert asyncio.run(scheduler.run(schedule.id)).status == ScheduleStatus.COMPLETED
@@ -0,0 +1,134 @@
+import asyncio
+
+from pyrb.models.portfolio import PortfolioValuationError
+from pyrb.models.position import Position
+from pyrb.repositories.brokerages.context import RebalanceContext
+from pyrb.services.valuation import ValuationBroadcaster, ValuationEvent
+from tests.conftest import FakeOrderManager, FakePortfolio, FakePriceFetcher
+
+
+class ChangingPortfolio(FakePortfolio):
+    def __init__(self) -> None:
+        self.refresh_count = 0
+
+    @property
+    def cash_balance(self) -> float:
+        return 1000 if self.refresh_count > 1 else 0  # 두 번째 조회부터 현금이 입금됩니다.
+
+    @property
+    def positions(self) -> list[Position]:
+        positions = super().positions
+        return positions if self.refresh_count > 1 else positions[:1]
+
+    def refresh(self) -> None:
+        self.refresh_count += 1
+
+
+class FailingOncePortfolio(ChangingPortfolio):
+    def refresh(self) -> None:
+        super().refresh()
+        if self.refresh_count == 2:
+            raise ConnectionError("The brokerage is unavailable")
+
+
+def _context(portfolio: FakePortfolio) -> RebalanceContext:
+    return RebalanceContext(
+        portfolio=portfolio, price_fetcher=FakePriceFetcher(), order_manager=FakeOrderManager()
+    )
+
+
+def test_sut_shares_one_refresh_loop_and_pushes_only_changes() -> None:
+    # given
+    portfolio = ChangingPortfolio()
+    sut = ValuationBroadcaster(_context(portfolio), interval=0.01)
+
+    async def receive_two_deltas() -> list[list[ValuationEvent]]:
+        queues = [sut.subscribe(), sut.subscribe()]
+        received = [[await queue.get(), await queue.get()] for queue in queues]
+        for queue in queues:
+            sut.unsubscribe(queue)
+        return received
+
+    # when
+    received = asyncio.run(receive_two_deltas())
+
+    # then
+    assert received[0] == received[1]
+    first, second = received[0]
+    assert (first.event, second.event) == ("snapshot", "valuation")
+    assert first.data.model_dump(exclude={"dt"}) == {
+        "total_value": 100000,
+        "cash_balance": 0,
+        "positions": [FakePortfolio().positions[0].model_dump()],
+        "removed_symbols": [],
+    }
+    assert second.data.model_dump(exclude={"dt"}) == {
+        "total_value": None,
+        "cash_balance": 1000,
+        "positions": [FakePortfolio().positions[1].model_dump()],
+        "removed_symbols": [],
+    }
+    assert sut.subscriber_count == 0
+
+
+def test_sut_stops_refreshing_without_subscribers() -> None:
+    # given
+    portfolio = ChangingPortfolio()
+    sut = ValuationBroadcaster(_context(portfolio), interval=0.01)
+
+    async def subscribe_and_leave() -> None:
+        queue = sut.subscribe()
+        await queue.get()
+        sut.unsubscribe(queue)
+        await asyncio.sleep(0.05)
+
+    # when
+    asyncio.run(subscribe_and_leave())
+
+    # then
+    assert portfolio.refresh_count == 1
+
+
+def test_sut_reports_a_failed_refresh_and_resends_the_whole_portfolio() -> None:
+    # given
+    portfolio = FailingOncePortfolio()
+    sut = ValuationBroadcaster(_context(portfolio), interval=0.01)
+
+    async def receive_three_events() -> list[ValuationEvent]:
+        queue = sut.subscribe()
+        received = [await queue.get() for _ in range(3)]
+        sut.unsubscribe(queue)
+        return received
+
+    # when
+    snapshot, error, recovered = asyncio.run(receive_three_events())
+
+    # then
+    assert (snapshot.event, error.event, recovered.event) == ("snapshot", "error", "snapshot")
+    assert isinstance(error.data, PortfolioValuationError)
+    assert error.data.message == "The brokerage is unavailable"
+    assert recovered.data.model_dump(exclude={"dt"}) == {
+        "total_value": 100000,
+        "cash_balance": 1000,
+        "positions": [position.model_dump() for position in FakePortfolio().positions],
+        "removed_symbols": [],
+    }
+
+
+def test_sut_stops_refreshing_when_closed() -> None:
+    # given
+    portfolio = ChangingPortfolio()
+    sut = ValuationBroadcaster(_context(portfolio), interval=0.01)
+
+    async def subscribe_and_close() -> None:
+        queue = sut.subscribe()
+        await queue.get()
+        sut.close()
+        await asyncio.sleep(0.05)
+
+    # when
+    asyncio.run(subscribe_and_close())
+
+    # then
+    assert portfolio.refresh_count == 1
+    assert sut.subscriber_count == 0
@@ -0,0 +1,85 @@
+from pyrb.models.price import CurrentPrice
+from pyrb.repositories.brokerages.context import RebalanceContext
+from pyrb.services.watch import PortfolioWatcher
+from tests.conftest import FakeOrderManager, FakePortfolio, FakePriceFetcher
+
+
+class TickingPriceFetcher(FakePriceFetcher):
+    def __init__(self) -> None:
+        self.prices: dict[str, int] = {"000660": 100, "005930": 150}
+        self.requests: list[list[str]] = []
+
+    def get_current_prices(self, symbols: list[str]) -> dict[str, CurrentPrice]:
+        self.requests.append(symbols)
+        return {
+            symbol: CurrentPrice(symbol=symbol, price=self.prices.get(symbol, 100))
+            for symbol in symbols
+        }
+
+
+def _context(price_fetcher: TickingPriceFetcher) -> RebalanceContext:
+    return RebalanceContext(FakePortfolio(), price_fetcher, FakeOrderManager())
+
+
+def test_sut_returns_only_the_changed_rows() -> None:
+    # given
+    price_fetcher = TickingPriceFetcher()
+    sut = PortfolioWatcher(_context(price_fetcher), interval=0)
+
+    # when
+    first = sut.refresh()
+    unchanged = sut.refresh()
+    price_fetcher.prices["005930"] = 200
+    changed = sut.refresh()
+
+    # then
+    assert first is not None
+    assert [(row.symbol, row.total_amount) for row in first.rows] == [
+        ("000660", 10000),
+        ("005930", 7500),
+    ]
+    assert first.rows[0].drift is None
+    assert unchanged is not None
+    assert unchanged.rows == []
+    assert changed is not None
+    # 총액이 바뀌어 다른 종목도 비중이 바뀝니다.
+    assert [(row.symbol, row.total_amount, row.weight) for row in changed.rows] == [
+        ("000660", 10000, 0.5),
+        ("005930", 10000, 0.5),
+    ]
+    assert changed.total_value == 20000
+    assert price_fetcher.requests == [["000660", "005930"]] * 3
+
+
+def test_sut_skips_refreshes_within_the_interval() -> None:
+    # given
+    price_fetcher = TickingPriceFetcher()
+    sut = PortfolioWatcher(_context(price_fetcher), interval=60)
+    sut.refresh()
+
+    # when
+    update = sut.refresh()
+
+    # then
+    assert update is None
+    assert len(price_fetcher.requests) == 1
+
+
+def test_sut_shows_the_drift_from_the_target_weights() -> None:
+    # given
+    price_fetcher = TickingPriceFetcher()
+    sut = PortfolioWatcher(
+        _context(price_fetcher), {"000660": 0.5, "069500": 0.5}, interval=0, threshold=0.1
+    )
+
+    # when
+    update = sut.refresh()
+
+    # then
+    assert update is not None
+    assert [(row.symbol, row.target_weight, row.breached) for row in update.rows] == [
+        ("000660", 0.5, False),
+        ("005930", 0.0, True),
+        ("069500", 0.5, True),
+    ]
+    assert price_fetcher.requests == [["000660", "005930", "069500"]]